@@ -29,6 +29,10 @@ class DynamicToolDict(Mapping[str, BaseTool]):
     def __init__(self, registry: "ToolRegistry"):
         self._registry = registry
         self._extra_tools: dict[str, BaseTool] = {}
+        # Registry tools + extras, rebuilt only when the registry's generation
+        # moves or extras are added. ToolNode reads values()/items() per call.
+        self._merged: dict[str, BaseTool] | None = None
+        self._merged_generation = -1
 
     def __getitem__(self, key: str) -> BaseTool:
         # Check extra tools first (like handoff)
@@ -52,9 +56,7 @@ class DynamicToolDict(Mapping[str, BaseTool]):
                 yield key
 
     def __len__(self) -> int:
-        return len(
-            set(self._extra_tools.keys()) | set(self._registry._get_tool_dict_internal().keys())
-        )
+        return len(self._all_tools())
 
     def __contains__(self, key: object) -> bool:
         return key in self._extra_tools or key in self._registry._get_tool_dict_internal()
@@ -62,24 +64,27 @@ class DynamicToolDict(Mapping[str, BaseTool]):
     def update(self, other: dict[str, BaseTool]) -> None:
         """Add extra tools (like handoff) that aren't in the registry."""
         self._extra_tools.update(other)
+        self._merged = None
+
+    def _all_tools(self) -> dict[str, BaseTool]:
+        generation = self._registry.generation
+        if self._merged is None or self._merged_generation != generation:
+            merged = dict(self._registry._get_tool_dict_internal())
+            merged.update(self._extra_tools)
+            self._merged, self._merged_generation = merged, generation
+        return self._merged
 
     def values(self) -> ValuesView[BaseTool]:
         """Return all tool values for ToolNode initialization."""
-        all_tools = dict(self._registry._get_tool_dict_internal())
-        all_tools.update(self._extra_tools)
-        return all_tools.values()
+        return self._all_tools().values()
 
     def keys(self) -> KeysView[str]:
         """Return all tool names (registry + extras) as a KeysView."""
-        all_tools = dict(self._registry._get_tool_dict_internal())
-        all_tools.update(self._extra_tools)
-        return all_tools.keys()
+        return self._all_tools().keys()
 
     def items(self) -> ItemsView[str, BaseTool]:
         """Return all (name, tool) pairs from the registry plus extras."""
-        all_tools = dict(self._registry._get_tool_dict_internal())
-        all_tools.update(self._extra_tools)
-        return all_tools.items()
+        return self._all_tools().items()
 
 
 class _CatalogToolMeta:
@@ -201,6 +206,20 @@ class ToolRegistry:
         # it serves the per-tool-call lookups on the HIL gate path without
         # scanning every category.
         self._tools_by_name: dict[str, tuple[str, Tool]] = {}
+        # space -> name of the first-registered category in that space, the
+        # answer get_category_by_space gives. Subagent handoff and retrieval
+        # resolve a space per call, so this avoids scanning every category.
+        self._category_by_space: dict[str, str] = {}
+        # Bumped on every category change; the name -> tool dict the executor's
+        # DynamicToolDict reads per tool call is rebuilt only when it moves.
+        self._generation = 0
+        self._tool_dict: dict[str, BaseTool] = {}
+        self._tool_dict_generation = -1
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever a category is added or replaced."""
+        return self._generation
 
     def setup(self) -> None:
         self._initialize_categories()
@@ -227,6 +246,7 @@ class ToolRegistry:
         """
         replacing = name in self._categories
         prior_tools_count = len(self._categories[name].tools) if replacing else 0
+        prior_space = self._categories[name].space if replacing else None
         category = ToolCategory(
             name=name,
             space=space,
@@ -245,6 +265,15 @@ class ToolRegistry:
             self._tools_by_name = {k: v for k, v in self._tools_by_name.items() if v[0] != name}
         for registered in category.tools:
             self._tools_by_name[registered.name] = (name, registered)
+        if prior_space is not None and prior_space != space:
+            # A replacement that moves spaces keeps its registration position,
+            # so first-match order can change in both spaces; rebuild (rare).
+            self._category_by_space = {}
+            for registered_name, registered_category in self._categories.items():
+                self._category_by_space.setdefault(registered_category.space, registered_name)
+        else:
+            self._category_by_space.setdefault(space, name)
+        self._generation += 1
         log.set(
             tool_category={
                 "name": name,
@@ -630,13 +659,12 @@ class ToolRegistry:
     def get_category_by_space(self, space: str) -> ToolCategory | None:
         """Get a category by its tool space value.
 
-        Searches all categories and returns the first one where category.space matches.
-        This handles dynamic category names like mcp_{integration}_{user_id}.
+        Returns the first-registered category whose ``space`` matches, served
+        from the space index. This handles category names that differ from
+        their space (e.g. a Composio toolkit registered under its tool space).
         """
-        for category in self._categories.values():
-            if category.space == space:
-                return category
-        return None
+        name = self._category_by_space.get(space)
+        return self._categories[name] if name is not None else None
 
     def get_all_category_objects(
         self, ignore_categories: list[str] | None = None
@@ -717,9 +745,15 @@ class ToolRegistry:
         ]
 
     def _get_tool_dict_internal(self) -> dict[str, BaseTool]:
-        """Internal method to get current tool dict (used by DynamicToolDict)."""
-        all_tools = self.get_all_tools_for_search()
-        return {tool.name: tool.tool for tool in all_tools}
+        """Internal method to get current tool dict (used by DynamicToolDict).
+
+        Materialized once per generation and shared; callers must not mutate it.
+        """
+        if self._tool_dict_generation != self._generation:
+            all_tools = self.get_all_tools_for_search()
+            self._tool_dict = {tool.name: tool.tool for tool in all_tools}
+            self._tool_dict_generation = self._generation
+        return self._tool_dict
 
     def get_tool_dict(self) -> DynamicToolDict:
         """Get a dynamic dictionary mapping tool names to tool instances for agent binding.
@@ -731,8 +765,7 @@ class ToolRegistry:
 
     def get_tool_names(self) -> list[str]:
         """Get list of all tool names including delegated ones."""
-        tools = self.get_all_tools_for_search()
-        return [tool.name for tool in tools]
+        return list(self._get_tool_dict_internal())
 
 
 def integration_destructive_tools(name: str) -> set[str] | None:
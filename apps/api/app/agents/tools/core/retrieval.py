@@ -36,6 +36,7 @@ from app.agents.tools.research_tool import deep_research
 from app.agents.tools.webpage_tool import fetch_webpages, web_search_tool
 from app.config.oauth_config import OAUTH_INTEGRATIONS
 from app.constants.log_tags import LogTag
+from app.db.chroma.chroma_store import ChromaStore
 from app.db.chroma.public_integrations_store import search_public_integrations
 from app.models.agent_models import agent_configurable
 from app.models.chat_models import ConversationSource
@@ -312,6 +313,14 @@ async def _get_user_context(
     return user_namespaces, connected_integrations, internal_subagents
 
 
+async def _search_namespaces(
+    store: ChromaStore, query: str, limits: dict[tuple[str, ...], int]
+) -> list[SearchItem]:
+    """Every namespace's hits from one embedding and one vector query."""
+    by_namespace = await store.asearch_namespaces(query, limits)
+    return [item for items in by_namespace.values() for item in items]
+
+
 def _build_search_tasks(
     store: BaseStore,
     query: str,
@@ -329,13 +338,22 @@ def _build_search_tasks(
     user_namespaces contains tool_space whenever the caller is entitled
     to search it (always for platform integrations, only when the user
     has the integration connected for custom MCPs).
+
+    On a ``ChromaStore`` the namespace searches collapse into one
+    ``asearch_namespaces`` task; the public-integrations search shares its
+    query embedding through ``query_embedding_cache``.
     """
-    search_tasks: list[Awaitable[SearchTaskResult]] = []
+    namespace_limits: dict[tuple[str, ...], int] = {}
+
+    def _want(namespace: str, namespace_limit: int) -> None:
+        # A namespace asked for twice (tool_space == desktop) keeps the larger limit.
+        key = (namespace,)
+        namespace_limits[key] = max(namespace_limits.get(key, 0), namespace_limit)
 
     # Search in tool_space
     if tool_space in user_namespaces or tool_space == "general":
         log.info(f"{LogTag.TOOL} Adding search for tool space", tool_space=tool_space)
-        search_tasks.append(store.asearch((tool_space,), query=query, limit=limit))
+        _want(tool_space, limit)
     else:
         # Caller is in a subagent whose namespace they don't own. This is
         # unusual — usually it means a stale cache or a misrouted handoff.
@@ -350,18 +368,28 @@ def _build_search_tasks(
     # so core tools (e.g. webpage tools) are still discoverable.
     if tool_space != "general":
         log.info(f"{LogTag.TOOL} Adding search for general namespace (limited to 5 for core tools)")
-        search_tasks.append(store.asearch(("general",), query=query, limit=5))
+        _want("general", 5)
 
     # Desktop-executed tools are only discoverable for desktop-app sessions
     # (include_desktop is derived from conversation_source upstream).
     if include_desktop:
         log.info(f"{LogTag.TOOL} Adding search for desktop namespace")
-        search_tasks.append(store.asearch((DESKTOP_TOOL_SPACE,), query=query, limit=10))
+        _want(DESKTOP_TOOL_SPACE, 10)
 
     # Search subagents namespace
     if include_subagents:
         log.info(f"{LogTag.TOOL} Adding search for subagents namespace")
-        search_tasks.append(store.asearch(("subagents",), query=query, limit=15))
+        _want("subagents", 15)
+
+    search_tasks: list[Awaitable[SearchTaskResult]] = []
+    if isinstance(store, ChromaStore) and namespace_limits:
+        search_tasks.append(_search_namespaces(store, query, namespace_limits))
+    else:
+        search_tasks.extend(
+            store.asearch(namespace, query=query, limit=namespace_limit)
+            for namespace, namespace_limit in namespace_limits.items()
+        )
+    if include_subagents:
         search_tasks.append(search_public_integrations(query=query, limit=15))
 
     return search_tasks
@@ -7,10 +7,12 @@ This module contains routes related to search functionality and URL metadata fet
 import asyncio
 import re
 
-from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
 
 from app.api.v1.dependencies.oauth_dependencies import get_user_id
 from app.api.v1.middleware.rate_limiter import limiter
+from app.constants.general import MAX_PAGE_NUMBER
+from app.constants.search import SEARCH_RESULTS_MAX_PAGE_SIZE, SEARCH_RESULTS_PAGE_SIZE
 from app.decorators import tiered_rate_limit
 from app.models.search_models import (
     EmailSearchResponse,
@@ -32,13 +34,23 @@ router = APIRouter()
 
 @router.get("/search", response_model=SearchResultsResponse)
 async def search_messages_endpoint(
-    query: str, user_id: str = Depends(get_user_id)
+    query: str,
+    page: int = Query(1, ge=1, le=MAX_PAGE_NUMBER, description="1-based page number"),
+    limit: int = Query(
+        SEARCH_RESULTS_PAGE_SIZE,
+        ge=1,
+        le=SEARCH_RESULTS_MAX_PAGE_SIZE,
+        description="Results per source per page",
+    ),
+    user_id: str = Depends(get_user_id),
 ) -> SearchResultsResponse:
     """
     Search for messages, conversations, and notes by their description or content.
 
     Args:
         query (str): The search query.
+        page (int): 1-based page number.
+        limit (int): Results per source (messages, conversations, notes) per page.
         user_id (str): The authenticated user's id.
 
     Returns:
@@ -53,7 +65,7 @@ async def search_messages_endpoint(
         },
     )
     try:
-        results = await search_messages(query, user_id)
+        results = await search_messages(query, user_id, page=page, limit=limit)
         result_count = len(results.messages) + len(results.conversations) + len(results.notes)
         capture_context_event(
             AnalyticsEvents.SEARCH_PERFORMED,
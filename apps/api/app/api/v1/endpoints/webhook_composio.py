@@ -8,6 +8,11 @@ Each trigger handler implements its own `process_event()` method which handles:
 - Finding matching workflows
 - Queuing workflow execution via WorkflowQueueService
 
+Trigger events are not processed here: the endpoint appends them to the Redis
+ingestion stream and acks, and the ARQ worker's bounded consumer runs the
+handlers (app/services/triggers/webhook_queue.py). With the queue disabled, or
+when the append fails, the event is processed in this process as before.
+
 Connection-lifecycle events take a separate path: they carry none of the trigger
 identifiers, and their only effect is pausing the workflows that needed the dead
 integration and running the shared integration expiry transition.
@@ -22,6 +27,7 @@ from pydantic import ValidationError
 
 from app.config.oauth_config import get_integration_by_config, get_integration_by_toolkit
 from app.constants.integrations import (
+    COMPOSIO_WEBHOOK_QUEUE_ENABLED,
     DEAD_CONNECTION_STATUSES,
     WEBHOOK_TASK_TIMEOUT,
 )
@@ -35,6 +41,8 @@ from app.models.webhook_models import (
 from app.services.integrations.integration_expiry import expire_user_integration
 from app.services.triggers import get_handler_by_event
 from app.services.triggers.base import TriggerHandler
+from app.services.triggers.metrics import COMPOSIO_WEBHOOK_EVENTS_TOTAL
+from app.services.triggers.webhook_queue import dispatch_event, enqueue_event
 from app.services.workflow.integration_pause import pause_workflows_for_expired_integration
 from app.utils.webhook_utils import verify_composio_webhook_signature
 from shared.py.wide_events import log, spawn_logged_task
@@ -43,37 +51,8 @@ router = APIRouter()
 
 
 async def _process_webhook_event(handler: TriggerHandler, event_data: ComposioWebhookEvent) -> None:
-    """Background task: find matching workflows and queue them."""
-    try:
-        await asyncio.wait_for(
-            handler.process_event(
-                event_type=event_data.type,
-                # Handlers match against trigger_config.composio_trigger_ids, which
-                # stores the trigger NANO id (ti_...) returned by triggers.create().
-                # Composio's webhook puts that nano id in `trigger_nano_id` and the
-                # trigger's internal UUID in `trigger_id` — matching against the UUID
-                # never hits, so forward the nano id (falling back to the UUID).
-                trigger_id=event_data.trigger_nano_id or event_data.trigger_id,
-                user_id=event_data.user_id,
-                data=event_data.data,
-            ),
-            timeout=WEBHOOK_TASK_TIMEOUT,
-        )
-    except TimeoutError:
-        log.error(
-            f"{LogTag.COMPOSIO} Webhook background processing timed out",
-            timeout_s=WEBHOOK_TASK_TIMEOUT,
-            event_type=event_data.type,
-            user_id=event_data.user_id,
-        )
-    except Exception as e:
-        log.error(
-            f"{LogTag.COMPOSIO} Webhook background processing failed",
-            event_type=event_data.type,
-            user_id=event_data.user_id,
-            error_type=type(e).__name__,
-            error=str(e),
-        )
+    """Background task: find matching workflows and queue them (in-process path)."""
+    await dispatch_event(handler, event_data)
 
 
 async def _expire_connection(
@@ -179,8 +158,9 @@ async def webhook_composio(request: Request) -> ComposioWebhookAckResponse:
     """Handle incoming Composio webhooks — trigger messages and connection lifecycle.
 
     Routes events to the appropriate handler based on event type.
-    Returns 200 immediately; workflow matching and queueing, and the connection
-    expiry transition, happen in a fire-and-forget background task.
+    Returns 200 immediately; trigger events go to the ingestion stream (or, as a
+    fallback, a background task), and the connection expiry transition runs in a
+    fire-and-forget background task.
     """
     await verify_composio_webhook_signature(request)
 
@@ -240,7 +220,12 @@ async def webhook_composio(request: Request) -> ComposioWebhookAckResponse:
         log.debug(f"{LogTag.COMPOSIO} Unhandled webhook type", event_type=event_data.type)
         return ComposioWebhookAckResponse(message="Webhook received")
 
+    if COMPOSIO_WEBHOOK_QUEUE_ENABLED and await enqueue_event(event_data):
+        log.set(operation="webhook_queued", outcome="success")
+        return ComposioWebhookAckResponse(message="Webhook accepted")
+
     # Fire-and-forget: return 200 immediately, process in background
+    COMPOSIO_WEBHOOK_EVENTS_TOTAL.labels(outcome="inline").inc()
     spawn_logged_task(
         "composio_webhook_processing",
         _process_webhook_event(handler, event_data),
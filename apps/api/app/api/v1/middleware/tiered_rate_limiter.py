@@ -12,7 +12,6 @@ from datetime import UTC, datetime
 from typing import ParamSpec, TypeVar
 
 from fastapi import HTTPException
-import redis.asyncio as redis
 
 from app.config.rate_limits import (
     FEATURE_LIMITS,
@@ -36,8 +35,9 @@ from app.models.usage_models import (
 from app.services.limit_upsell import LimitHitOrigin, current_limit_origin, schedule_limit_upsell
 from app.services.usage_activity import counts_as_activity, record_activity
 from app.services.usage_service import UsageService
+from app.services.usage_snapshot_writer import UsageSnapshotWriter
 from app.utils.background_tasks import spawn_background_task
-from shared.py.wide_events import log, spawn_logged_task
+from shared.py.wide_events import log
 
 # UsageInfo is imported (not defined here) but re-exported for
 # `app.api.v1.middleware.__init__` — explicit re-export required under
@@ -47,6 +47,31 @@ __all__ = ["UsageInfo"]
 P = ParamSpec("P")
 R = TypeVar("R")
 
+# Check-and-increment for every window of one feature, atomically. KEYS are the
+# per-period counters; ARGV holds their limits, then their TTLs (same order).
+# Returns {exceeded, used_1, ..., used_n}: ``exceeded`` is the 1-based index of
+# the first window at or over its limit (0 when all have room) and each
+# ``used_i`` is that window's count BEFORE this call. Nothing is incremented
+# when any window is exhausted. A limit of 0 means counted, not enforced.
+_CHECK_AND_INCREMENT_SCRIPT = """
+local used = {}
+local exceeded = 0
+for i = 1, #KEYS do
+    used[i] = tonumber(redis.call('GET', KEYS[i]) or '0')
+    local limit = tonumber(ARGV[i])
+    if exceeded == 0 and limit > 0 and used[i] >= limit then
+        exceeded = i
+    end
+end
+if exceeded == 0 then
+    for i = 1, #KEYS do
+        redis.call('INCR', KEYS[i])
+        redis.call('EXPIRE', KEYS[i], ARGV[#KEYS + i])
+    end
+end
+return {exceeded, unpack(used)}
+"""
+
 
 class RateLimitExceededException(HTTPException):
     """429 carrying the feature, required plan (when gated), and reset time."""
@@ -110,6 +135,7 @@ class TieredRateLimiter:
 
     def __init__(self) -> None:
         self.redis = redis_cache
+        self.usage_snapshots = UsageSnapshotWriter(self._sync_usage_real_time)
 
     def _get_redis_key(self, user_id: str, feature: str, period: RateLimitPeriod) -> str:
         time_window = get_time_window_key(period)
@@ -158,7 +184,7 @@ class TieredRateLimiter:
         usage_info = {}
 
         # Plan gate: a plan with NO limits at all (day and month both 0) has no
-        # access to the feature — the per-period loop below skips 0 limits, so
+        # access to the feature — the check below never enforces a 0 limit, so
         # without this check a fully-zeroed plan would be unlimited instead of
         # blocked. plan_required is set when a paid plan does have access.
         if current_limits.day <= 0 and current_limits.month <= 0:
@@ -169,93 +195,42 @@ class TieredRateLimiter:
                 feature_key, plan_required, current_plan=user_plan.value
             )
 
-        for period in [RateLimitPeriod.DAY, RateLimitPeriod.MONTH]:
-            limit = getattr(current_limits, period.value)
-            if limit <= 0:
-                continue
-
-            redis_key = self._get_redis_key(user_id, feature_key, period)
-            current_usage = await self.redis.get(redis_key)
-            current_usage = int(current_usage) if current_usage else 0
-            reset_time = get_reset_time(period)
-
-            usage_info[period.value] = UsageInfo(
-                used=current_usage, limit=limit, reset_time=reset_time
-            )
+        if not self.redis.redis:
+            raise Exception("Redis connection not available")
+
+        # One round trip checks every window and, only when all have room,
+        # counts the use in each. Unlimited periods (limit 0) are still COUNTED
+        # — never enforced — so usage charts (e.g. a pro user's day-by-day
+        # messages) have data even where no cap applies.
+        periods = [RateLimitPeriod.DAY, RateLimitPeriod.MONTH]
+        limits = [getattr(current_limits, period.value) for period in periods]
+        result = await self.redis.redis.eval(
+            _CHECK_AND_INCREMENT_SCRIPT,
+            len(periods),
+            *[self._get_redis_key(user_id, feature_key, period) for period in periods],
+            *[str(limit) for limit in limits],
+            *[str(self._get_ttl(period)) for period in periods],
+        )
+        exceeded, *used = (int(value) for value in result)
 
-            if current_usage >= limit:
-                free_limits = get_limits_for_plan(feature_key, PlanType.FREE)
-                is_plan_gated = getattr(free_limits, period.value) == 0
-                plan_required = "pro" if (user_plan == PlanType.FREE and is_plan_gated) else None
-                raise RateLimitExceededException(
-                    feature_key, plan_required, reset_time, current_plan=user_plan.value
+        for period, limit, current_usage in zip(periods, limits, used, strict=True):
+            if limit > 0:
+                usage_info[period.value] = UsageInfo(
+                    used=current_usage, limit=limit, reset_time=get_reset_time(period)
                 )
 
-        # Increment usage atomically. Unlimited periods (limit 0) are still
-        # COUNTED — a plain INCR with no enforcement — so usage charts (e.g. a
-        # pro user's day-by-day messages) have data even where no cap applies.
-        for period in [RateLimitPeriod.DAY, RateLimitPeriod.MONTH]:
-            limit = getattr(current_limits, period.value)
-
-            redis_key = self._get_redis_key(user_id, feature_key, period)
-            ttl = self._get_ttl(period)
-
-            if not self.redis.redis:
-                raise Exception("Redis connection not available")
-
-            if limit <= 0:
-                await self.redis.redis.incr(redis_key)
-                await self.redis.redis.expire(redis_key, ttl)
-                continue
+        if exceeded:
+            period = periods[exceeded - 1]
+            free_limits = get_limits_for_plan(feature_key, PlanType.FREE)
+            is_plan_gated = getattr(free_limits, period.value) == 0
+            plan_required = "pro" if (user_plan == PlanType.FREE and is_plan_gated) else None
+            raise RateLimitExceededException(
+                feature_key, plan_required, get_reset_time(period), current_plan=user_plan.value
+            )
 
-            # Use Redis pipeline with WATCH for atomic check-and-increment
-            async with self.redis.redis.pipeline() as pipe:
-                while True:
-                    try:
-                        # Watch the key for changes
-                        await pipe.watch(redis_key)
-
-                        # Get current value
-                        current_val = await self.redis.get(redis_key)
-                        current_val = int(current_val) if current_val else 0
-
-                        # Double-check limit hasn't been exceeded by concurrent requests
-                        if current_val >= limit:
-                            await pipe.unwatch()
-                            free_limits = get_limits_for_plan(feature_key, PlanType.FREE)
-                            is_plan_gated = getattr(free_limits, period.value) == 0
-                            plan_required = (
-                                "pro" if (user_plan == PlanType.FREE and is_plan_gated) else None
-                            )
-                            raise RateLimitExceededException(
-                                feature_key,
-                                plan_required,
-                                get_reset_time(period),
-                                current_plan=user_plan.value,
-                            )
-
-                        # Execute atomic increment
-                        pipe.multi()
-                        await pipe.incr(redis_key)
-                        await pipe.expire(redis_key, ttl)
-                        await pipe.execute()
-                        break  # Success, exit retry loop
-
-                    except redis.WatchError:
-                        # Key was modified, retry the transaction
-                        continue
-
-        # Real-time usage sync after rate limit usage
-        spawn_logged_task(
-            "usage_sync",
-            self._sync_usage_real_time(
-                user_id=user_id,
-                feature_key=feature_key,
-                user_plan=user_plan,
-            ),
-            user={"id": user_id},
-            feature_key=feature_key,
-        )
+        # Usage-history snapshot, coalesced per user: a burst of tool calls in
+        # one turn becomes one write when the window closes.
+        self.usage_snapshots.schedule(user_id, feature_key, user_plan)
 
         # Durable daily rollup for the activity heatmap (meaningful actions only).
         if counts_as_activity(feature_key):
@@ -271,7 +246,8 @@ class TieredRateLimiter:
     ) -> None:
         """Snapshot every feature that has usage, for the usage-history charts.
 
-        Runs as a background task so it never blocks the request.
+        Runs in the background (via ``usage_snapshots``) so it never blocks the
+        request.
         """
         try:
             all_feature_usage = await self._collect_feature_usage(user_id, user_plan)
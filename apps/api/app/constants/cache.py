@@ -5,6 +5,8 @@ Centralized cache-related constants including TTL values and key prefixes.
 Import these instead of defining local constants in services.
 """
 
+import os
+
 # TTL values (in seconds)
 ONE_YEAR_TTL = 31_536_000
 SIX_MONTH_TTL = 15_552_000
@@ -121,8 +123,29 @@ INTEGRATION_INSTRUCTIONS_CACHE_KEY = "integration_instructions:{user_id}"
 CONV_ARTIFACTS_CACHE_PATTERN = "conv_artifacts:{user_id}:{conv_id}"
 # A user's uploaded-file listings; busted on every file upload/update/delete.
 FILES_CACHE_PATTERN = "files:{user_id}:*"
+# Process-local Composio trigger id -> active workflows routing table
+# (app/db/repositories/workflow_routing.py). A routing write (activate, pause,
+# trigger edit, delete) publishes the workflow and trigger ids it touched on the
+# channel and every process drops those entries; the table only answers while
+# its process is subscribed. The TTL bounds staleness from a missed message or
+# a write made outside the repository.
+WORKFLOW_ROUTING_CACHE_ENABLED = os.getenv("WORKFLOW_ROUTING_CACHE", "1") == "1"
+WORKFLOW_ROUTING_CHANNEL = "workflow:routing:invalidate"
+WORKFLOW_ROUTING_TTL_SECONDS = TEN_MINUTES_TTL
+WORKFLOW_ROUTING_MAX_TRIGGERS = 50_000
+WORKFLOW_ROUTING_RESUBSCRIBE_SECONDS = 5.0
 STREAM_SIGNAL_PREFIX = "stream:signal:"
+# Pub/sub channel carrying the stream_id of every cancel_stream call, so each
+# process can flip a local flag instead of GETting the signal key per chunk.
+STREAM_CANCEL_CHANNEL = "stream:cancel"
 STREAM_PROGRESS_PREFIX = "stream:progress:"
+# Append-only side keys of a stream's progress. The blob above holds only the
+# small, rarely-written turn metadata; the streamed text is APPENDed to a string
+# key, tool-data fields live in a hash and tool_data entries in a list, so a
+# text delta costs O(delta) instead of a read-modify-write of the whole reply.
+STREAM_PROGRESS_TEXT_PREFIX = "stream:progress:text:"
+STREAM_PROGRESS_FIELDS_PREFIX = "stream:progress:fields:"
+STREAM_PROGRESS_ENTRIES_PREFIX = "stream:progress:entries:"
 # Replayable per-stream event log (Redis Stream). Entry ids double as SSE ids,
 # so any subscriber can attach late or reconnect with Last-Event-ID and replay.
 STREAM_EVENTS_PREFIX = "stream:events:"
@@ -1,5 +1,6 @@
 """Chat constants."""
 
+import os
 import re
 
 # Max characters of an uploaded file's summary inlined into the agent's turn
@@ -46,3 +47,9 @@ ARTIFACT_REF_RE = re.compile(
 WORKSPACE_ARTIFACT_RE = re.compile(
     r"/workspace/sessions/[A-Za-z0-9._-]+/artifacts/(?P<path>[A-Za-z0-9._\-/]+)"
 )
+
+# Serve the pinned-messages view from each conversation's ``pinned_message_ids``
+# instead of unwinding every message for ``pinned: true``. ``set_message_pinned``
+# keeps the array in sync whether or not this is on; enable it once
+# ``scripts/backfill_pinned_message_ids.py`` has covered pins made before it.
+PINNED_MESSAGE_IDS_ENABLED = os.getenv("PINNED_MESSAGE_IDS", "0") == "1"
@@ -4,6 +4,8 @@ ChromaDB Constants.
 Tunables for the ChromaDB-backed LangGraph store.
 """
 
+import os
+
 # Caps concurrent ChromaDB HTTP connections process-wide (shared across every
 # _apply_put_ops call, not just within one batch — see loop_bound_semaphore
 # usage in chroma_store.py) to avoid EMFILE 24 (per-process fd limit, not
@@ -11,3 +13,32 @@ Tunables for the ChromaDB-backed LangGraph store.
 # ~72 fds baseline usage, so 20 clears it with wide margin even when startup
 # fans out indexing across every provider toolkit concurrently.
 MAX_CONCURRENT_CHROMA_WRITES = 20
+
+# Top-level string fields up to this length are mirrored into row metadata so
+# equality filters on them run inside Chroma's ``where``; longer strings (tool
+# descriptions) would only bloat the metadata index and stay Python-side.
+MAX_FILTERABLE_VALUE_LENGTH = 256
+
+# Rows per page when backfilling filter metadata onto rows written before it.
+FILTER_METADATA_BACKFILL_PAGE_SIZE = 1_000
+
+# Query embeddings kept by ``query_embedding_cache``. retrieve_tools embeds the
+# same short intent strings turn after turn ("send an email", "create a
+# calendar event"); an entry is 768 floats, so 2k entries stay around 12 MB.
+QUERY_EMBEDDING_CACHE_SIZE = 2_048
+QUERY_EMBEDDING_CACHE_TTL_SECONDS = 3_600
+
+# ChromaStore.asearch_namespaces asks one vector query for this multiple of the
+# summed per-namespace limits, so a namespace ranked below a denser one still
+# gets its share without a follow-up query of its own.
+NAMESPACE_SEARCH_OVERFETCH = 3
+
+# Embedding backend for the tools and triggers stores, per deployment:
+# "google" (Gemini embedding API, 768-dim) or "local" (the memory engine's
+# fastembed model, in-process or via MEMORY_EMBEDDING_SIDECAR_URL). Each backend
+# has its own collections — vectors from the two never share an index — so
+# switching needs scripts/migrate_tool_embeddings.py first.
+TOOLS_EMBEDDING_BACKEND = os.getenv("TOOLS_EMBEDDING_BACKEND", "google")
+TOOLS_EMBEDDING_BACKENDS = ("google", "local")
+TOOLS_COLLECTION = "langgraph_tools_store"
+TRIGGERS_COLLECTION = "langgraph_triggers_store"
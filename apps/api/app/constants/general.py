@@ -73,6 +73,9 @@ CHECKPOINT_PRUNE_MAX_THREADS_PER_RUN = 1000
 CHECKPOINT_PRUNE_MIN_CHECKPOINTS = 2
 # Upper bound on orphan (deleted-conversation) threads swept per run.
 CHECKPOINT_ORPHAN_SWEEP_MAX_THREADS = 2000
+# Checkpoint thread ids the orphan sweep reads, checks against Mongo and deletes
+# per step. Bounds the sweep's memory and each delete transaction.
+CHECKPOINT_ORPHAN_SWEEP_BATCH_SIZE = 500
 
 # How long a finished spawn's thread is kept before the nightly sweep reclaims it.
 # It only has to outlive its parent turn's replay window, and HIL_APPROVAL_TIMEOUT_SECONDS
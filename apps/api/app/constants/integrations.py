@@ -1,5 +1,6 @@
 """Constants for integration tools."""
 
+import os
 from typing import Final
 
 from composio.core.models.webhook_events import ConnectionStatusEnum
@@ -31,6 +32,31 @@ INTEGRATION_STATUS_EXPIRED: Final = "expired"
 # proves nothing.
 WEBHOOK_TASK_TIMEOUT: Final = 120.0  # pragma: no mutate
 
+# Composio trigger webhooks are ingested through a Redis stream consumed by the
+# ARQ worker (app/services/triggers/webhook_queue.py). The endpoint XADDs and
+# acks; each worker process runs one consumer in the group. Set
+# COMPOSIO_WEBHOOK_QUEUE=0 to process in the API process instead (the old path,
+# also the fallback when the XADD itself fails).
+COMPOSIO_WEBHOOK_QUEUE_ENABLED = os.getenv("COMPOSIO_WEBHOOK_QUEUE", "1") == "1"
+COMPOSIO_WEBHOOK_STREAM = "composio:webhook:events"
+COMPOSIO_WEBHOOK_GROUP = "composio-webhook-consumers"
+# Approximate MAXLEN trim; far above any backlog a live consumer lets build up.
+COMPOSIO_WEBHOOK_STREAM_MAXLEN = 100_000
+# Events in flight per worker process. The consumer only reads as many entries as
+# it has free slots, so a burst waits in Redis rather than in memory.
+COMPOSIO_WEBHOOK_CONCURRENCY = max(1, int(os.getenv("COMPOSIO_WEBHOOK_CONCURRENCY", "16")))
+# Upper bound on entries per XREADGROUP (one shared workflow lookup per read).
+COMPOSIO_WEBHOOK_READ_COUNT = 64
+COMPOSIO_WEBHOOK_BLOCK_MS = 5_000
+# A pending entry idle this long belongs to a consumer that died mid-event; any
+# consumer claims and replays it. Must exceed WEBHOOK_TASK_TIMEOUT, or a slow but
+# live handler would have its event replayed underneath it.
+COMPOSIO_WEBHOOK_CLAIM_IDLE_MS = int((WEBHOOK_TASK_TIMEOUT + 60) * 1000)
+COMPOSIO_WEBHOOK_RECLAIM_INTERVAL_SECONDS = 30.0
+# Deliveries after which a pending entry is dropped as poison (logged, acked).
+COMPOSIO_WEBHOOK_MAX_DELIVERIES = 5
+COMPOSIO_WEBHOOK_RECONNECT_SECONDS = 5.0
+
 # Statuses where the user's grant is genuinely dead and only they can fix it —
 # the SDK's own terminal set (``_TERMINAL_CONNECTION_STATES``).
 #
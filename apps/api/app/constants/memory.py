@@ -81,6 +81,27 @@ EMBEDDING_SIDECAR_SLOT_WAIT_SECONDS = max(
     0.0, float(os.getenv("MEMORY_SIDECAR_SLOT_WAIT_SECONDS", "20"))
 )
 
+# Micro-batching: concurrent embed / query-embed / rerank calls that arrive
+# within this window share one forward pass — in the client (one HTTP call or
+# one in-process ONNX call) and again inside the sidecar (one ONNX call across
+# requests) — up to EMBEDDING_SIDECAR_MAX_BATCH_TEXTS texts. A batch that
+# fills up runs immediately; the window only delays a partial one. Set
+# MEMORY_EMBEDDING_MICRO_BATCHING=0 to run every call on its own.
+EMBEDDING_MICRO_BATCHING = os.getenv("MEMORY_EMBEDDING_MICRO_BATCHING", "1") == "1"
+EMBEDDING_BATCH_WINDOW_SECONDS = (
+    max(0.0, float(os.getenv("MEMORY_EMBEDDING_BATCH_WINDOW_MS", "2"))) / 1000
+)
+
+# Content-addressed embedding cache (app.memory.embedding_cache): vectors keyed
+# by model + a hash of the normalized text, in a per-process LRU in front of
+# Redis. Re-extracted facts, re-stored conversation chunks and repeated recall
+# queries skip the model. Redis holds raw float32 (exact) or float16 (half the
+# memory; cosine drift ~1e-4) bytes rather than JSON lists.
+EMBEDDING_CACHE_ENABLED = os.getenv("MEMORY_EMBEDDING_CACHE", "1") == "1"
+EMBEDDING_CACHE_LOCAL_SIZE = 8_192
+EMBEDDING_CACHE_TTL_SECONDS = 30 * 24 * 3600
+EMBEDDING_CACHE_DTYPE = os.getenv("MEMORY_EMBEDDING_CACHE_DTYPE", "float32")
+
 # Persistent on-disk cache for the fastembed model weights. Set in prod (on the
 # embedding sidecar) to a mounted volume so the ~1.85GB download happens ONCE
 # rather than on every restart/redeploy (measured ~148s cold-load). Unset falls
@@ -92,6 +113,24 @@ CHROMA_MEMORIES_COLLECTION = "gaia_memories" + _COLLECTION_SUFFIX
 CHROMA_MEMORY_EPISODES_COLLECTION = "gaia_memory_episodes" + _COLLECTION_SUFFIX
 CHROMA_CONVERSATION_CHUNKS_COLLECTION = "gaia_conversation_chunks" + _COLLECTION_SUFFIX
 
+# How memory-fact vectors are split across Chroma collections:
+#   global    every user in CHROMA_MEMORIES_COLLECTION, filtered by user_id
+#   bucketed  MEMORY_VECTOR_BUCKETS collections, user -> bucket by stable hash
+#   user      one collection per user
+# Filtered HNSW search over one shared index gets slower, and loses recall for
+# small users, as the collection grows. Changing the strategy (or the bucket
+# count) moves every vector: run the ``migrate_memory_partitions`` worker job
+# for the new layout before switching, and its cleanup step after.
+MEMORY_VECTOR_PARTITIONINGS = ("global", "bucketed", "user")
+MEMORY_VECTOR_PARTITIONING = os.getenv("MEMORY_VECTOR_PARTITIONING", "global")
+MEMORY_VECTOR_BUCKETS = max(1, int(os.getenv("MEMORY_VECTOR_BUCKETS", "64")))
+# Open collection handles kept per event loop. Bounded because "user"
+# partitioning has one collection per user.
+MEMORY_COLLECTION_HANDLE_CACHE_SIZE = 4_096
+# Rows copied per page by ``migrate_memory_partitions``; the resume cursor is
+# saved after each page.
+MEMORY_PARTITION_MIGRATION_PAGE_SIZE = 500
+
 # Raw-conversation retention: extracted facts compress a conversation, which
 # loses verbatim micro-details ("the 27th item in that list you gave me").
 # Each ingested transcript is also chunked and embedded so those details stay
@@ -142,6 +181,23 @@ CONFIDENT_COSINE = 0.515
 CONFIDENT_RERANK_LOGIT = -2.5
 MAX_WEAK_RESULTS = 4
 
+# Cross-encoder score cache (app.memory.rerank_cache): raw logits keyed by
+# (query hash, memory id, memory version). Memory rows are immutable per
+# version, so a score never goes stale; a re-asked query after an ingestion
+# (which drops the whole recall cache) only reranks the new candidates.
+RERANK_CACHE_ENABLED = os.getenv("MEMORY_RERANK_CACHE", "1") == "1"
+RERANK_CACHE_LOCAL_SIZE = 16_384
+RERANK_CACHE_TTL_SECONDS = 24 * 3600
+
+# Rerank cascade: candidates whose fused rank is already decisive skip the
+# cross-encoder. Within the top RERANK_CASCADE_DECISIVE_RANK fused positions,
+# a candidate both retrievers found with a CONFIDENT_COSINE match is taken as
+# a top rerank score; of the rest, only the best RERANK_CASCADE_BUDGET (in
+# fused order) are scored and the tail ranks on retrieval alone. 0 disables
+# the cascade — every candidate is scored, as before.
+RERANK_CASCADE_BUDGET = max(0, int(os.getenv("MEMORY_RERANK_CASCADE_BUDGET", "0")))
+RERANK_CASCADE_DECISIVE_RANK = 3
+
 # Recency boost applied after reranking:
 # score *= 1 + RECENCY_BOOST_WEIGHT * e^(-age_days / RECENCY_BOOST_DECAY_DAYS)
 RECENCY_BOOST_WEIGHT = 0.15
@@ -229,6 +285,13 @@ DOCUMENT_TARGET_MAX_CHARS = 2500
 # /workspace/memory projection: journal pages older than this are dropped
 # from the on-disk view (Postgres keeps the full history).
 PROJECTION_JOURNAL_DAYS = 30
+# Memory writes re-project only the pages they touched. A full
+# re-materialization (read back every page, walk the tree for strays) still
+# runs on a user's first sync of each UTC day — when the journal window
+# moves — and at least this often, as the safety net for anything an
+# incremental sync missed.
+MEMORY_VFS_INCREMENTAL = os.getenv("MEMORY_VFS_INCREMENTAL", "1") == "1"
+MEMORY_VFS_RECONCILE_SECONDS = 6 * 60 * 60
 
 # Core-document preview length on the settings-UI overview screen.
 DOCUMENT_PREVIEW_CHARS = 280
@@ -375,3 +438,8 @@ MEMORY_BACKFILL_ACTIVE_DAYS = 30
 MEMORY_BACKFILL_MAX_USERS_PER_RUN = 50
 # Most-recent conversations replayed per user.
 MEMORY_BACKFILL_MAX_CONVERSATIONS = 100
+# Conversations whose extraction LLM calls run concurrently in one backfill
+# job (``ingestion.retain_many``). Embedding is batched across whichever of
+# them are ready; reconcile + apply still run one conversation at a time,
+# oldest first. 1 replays strictly sequentially, exactly like ``retain``.
+MEMORY_BACKFILL_CONCURRENCY = max(1, int(os.getenv("MEMORY_BACKFILL_CONCURRENCY", "4")))
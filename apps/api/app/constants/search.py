@@ -4,6 +4,8 @@ Search Constants.
 Constants for search service operations including content limits and timeouts.
 """
 
+import os
+
 # Request timeouts (seconds)
 URL_TIMEOUT = 20.0
 
@@ -55,3 +57,14 @@ BROWSER_REAPER_INTERVAL_SECONDS = 300.0
 # legally hold one browser for several minutes. 30 minutes is far above any
 # real crawl and far below the multi-day leak ages seen in prod.
 BROWSER_REAPER_MAX_AGE_SECONDS = 1800.0
+
+# Keyword search (GET /search) pagination. Messages, conversations and notes are
+# each paged by ``limit``/``offset``; the endpoint clamps ``limit`` to the max.
+SEARCH_RESULTS_PAGE_SIZE = 50
+SEARCH_RESULTS_MAX_PAGE_SIZE = 200
+
+# Serve message hits from the Postgres trigram index (``app.db.message_search``)
+# instead of the Mongo ``$unwind`` + ``$regex`` scan over every conversation.
+# Conversation writes keep the index in sync whether or not this is on; enable it
+# once ``scripts/backfill_message_search_index.py`` has indexed existing history.
+MESSAGE_SEARCH_INDEX_ENABLED = os.getenv("MESSAGE_SEARCH_INDEX", "0") == "1"
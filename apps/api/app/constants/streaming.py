@@ -6,6 +6,7 @@ Used by:
 - Tests
 """
 
+import os
 from typing import Final
 
 # Special control messages for pub/sub channel
@@ -30,3 +31,25 @@ WS_EVENT_EXECUTOR_CANCELLED = "executor.cancelled"
 # the shape the frontend parser has always received. See models/stream_events.py.
 SSE_KEEPALIVE_INTERVAL_SECONDS: Final[float] = 15.0
 SSE_KEEPALIVE_FRAME: Final[str] = 'data: {"keepalive":true}\n\n'
+
+# Event-log publish coalescing (``StreamManager._publish``).
+#
+# Chunks published within one window are appended to the stream's event log in
+# a single pipeline (N x XADD + one EXPIRE) instead of two round trips each. The
+# window bounds the extra latency a token can pick up before a subscriber sees
+# it; a full batch flushes early. Control signals (DONE/CANCELLED/ERROR) always
+# flush immediately. ``0`` disables the window: every publish is its own pipeline.
+STREAM_PUBLISH_FLUSH_INTERVAL_SECONDS: Final[float] = max(
+    0.0, float(os.getenv("STREAM_PUBLISH_FLUSH_INTERVAL_SECONDS", "0.015"))
+)
+STREAM_PUBLISH_MAX_BATCH: Final[int] = max(1, int(os.getenv("STREAM_PUBLISH_MAX_BATCH", "64")))
+
+# Per-process cancellation watcher (``app/core/stream_cancel_watcher.py``).
+#
+# The pub/sub push is what keeps cancel latency low; the reconcile pass is the
+# safety net for a message missed across a resubscribe — one MGET of every
+# watched stream's signal key per interval, per process. A watch untouched for
+# longer than the idle window (its turn ended elsewhere) is dropped then.
+STREAM_CANCEL_RECONCILE_SECONDS: Final[float] = 2.0
+STREAM_CANCEL_RESUBSCRIBE_SECONDS: Final[float] = 1.0
+STREAM_CANCEL_WATCH_IDLE_SECONDS: Final[float] = 600.0
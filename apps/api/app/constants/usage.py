@@ -0,0 +1,11 @@
+"""Usage-tracking constants."""
+
+import os
+from typing import Final
+
+# Window over which usage-history snapshot writes for one user are coalesced
+# into a single write (see app/services/usage_snapshot_writer.py). Snapshots
+# are hourly-aggregated rows, so a few seconds of lag costs nothing visible.
+USAGE_SNAPSHOT_FLUSH_INTERVAL_SECONDS: Final[float] = float(
+    os.getenv("USAGE_SNAPSHOT_FLUSH_INTERVAL_SECONDS", "10")
+)
@@ -0,0 +1,24 @@
+"""
+ARQ worker lane constants.
+
+Used by:
+- app/workers/config/worker_settings.py
+- app/workers/lanes.py
+"""
+
+import os
+from typing import Final
+
+# Concurrent jobs per job class (``JobClass`` in app/workers/queue.py). Each
+# lane polls its own queue, so a burst in one class waits for that class's
+# slots only. The defaults add up to the worker's memory-bound total of 10 —
+# raise the container limit before raising the sum.
+ARQ_INTERACTIVE_MAX_JOBS: Final = max(1, int(os.getenv("ARQ_INTERACTIVE_MAX_JOBS", "5")))
+ARQ_WORKFLOW_MAX_JOBS: Final = max(1, int(os.getenv("ARQ_WORKFLOW_MAX_JOBS", "3")))
+ARQ_BULK_MAX_JOBS: Final = max(1, int(os.getenv("ARQ_BULK_MAX_JOBS", "2")))
+
+# How often the worker samples every lane's queue depth into Prometheus.
+ARQ_QUEUE_DEPTH_POLL_SECONDS: Final[float] = 15.0
+
+# Pause before a lane whose poller crashed (a Redis drop) starts polling again.
+ARQ_LANE_RESTART_SECONDS: Final[float] = 5.0
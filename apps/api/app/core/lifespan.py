@@ -10,6 +10,8 @@ from app.core.provider_registration import (
     unified_shutdown,
     unified_startup,
 )
+from app.core.stream_cancel_watcher import start_cancel_watcher, stop_cancel_watcher
+from app.core.workflow_routing_listener import start_routing_listener, stop_routing_listener
 from app.services.device.revoke_listener import (
     start_revoke_listener,
     stop_revoke_listener,
@@ -54,12 +56,16 @@ async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
             start_browser_reaper()
             start_revoke_listener()
             start_up_listener()
+            start_cancel_watcher()
+            start_routing_listener()
         yield
 
     except Exception as e:
         raise RuntimeError("Startup failed") from e
 
     finally:
+        await stop_routing_listener()
+        await stop_cancel_watcher()
         await stop_up_listener()
         await stop_revoke_listener()
         await stop_browser_reaper()
@@ -61,6 +61,8 @@ from app.helpers.lifespan_helpers import (
     close_postgresql_async,
     close_publisher_async,
     close_reminder_scheduler,
+    close_stream_publishers,
+    close_usage_snapshots,
     close_websocket_async,
     close_workflow_scheduler,
     init_mongodb_async,
@@ -361,6 +363,10 @@ async def unified_shutdown(context: Literal["main_app", "arq_worker"]) -> None:
         # Both contexts open a RabbitMQ connection at startup (outbound topology
         # declaration + publishing), so close the publisher unconditionally.
         (close_publisher_async, "publisher"),
+        # Chat streams run in both (API turns, worker-side executor runs).
+        (close_stream_publishers, "stream_publishers"),
+        # Rate-limited features are metered in both (API tools, workflow runs).
+        (close_usage_snapshots, "usage_snapshots"),
     ]
 
     # Context-specific cleanup: the WebSocket event consumer only runs in FastAPI.
@@ -0,0 +1,176 @@
+"""One shared per-process watch on chat-stream cancellations.
+
+The chat loop and the graph driver ask ``StreamManager.is_cancelled`` for every
+chunk the agent yields — one Redis GET per token for every active turn. A
+cancel is rare and arrives once, so this watcher subscribes once per process to
+``STREAM_CANCEL_CHANNEL`` (``cancel_stream`` publishes the stream id there) and
+flips a local ``asyncio.Event`` per watched stream; the hot loop then reads an
+in-memory flag.
+
+Pub/sub has no replay, so two things cover a message that was missed: a watch
+reads the signal key once when it is registered, and the listener re-reads the
+signal keys of every watched stream (one MGET) on each (re)subscribe and every
+``STREAM_CANCEL_RECONCILE_SECONDS``. Until the listener is subscribed,
+``is_cancelled`` returns None and the caller falls back to the GET.
+"""
+
+import asyncio
+import contextlib
+import time
+
+from app.constants.cache import STREAM_CANCEL_CHANNEL, STREAM_SIGNAL_PREFIX
+from app.constants.log_tags import LogTag
+from app.constants.streaming import (
+    STREAM_CANCEL_RECONCILE_SECONDS,
+    STREAM_CANCEL_RESUBSCRIBE_SECONDS,
+    STREAM_CANCEL_WATCH_IDLE_SECONDS,
+)
+from app.db.redis import deserialize_any, redis_cache
+from shared.py.wide_events import log, log_context
+
+
+class _Watch:
+    """A stream's local cancel flag plus when the hot loop last read it."""
+
+    __slots__ = ("event", "last_read")
+
+    def __init__(self) -> None:
+        self.event = asyncio.Event()
+        self.last_read = time.monotonic()
+
+
+_watches: dict[str, _Watch] = {}
+_listener_task: asyncio.Task[None] | None = None
+_subscribed = False
+
+
+def _signal_key(stream_id: str) -> str:
+    return f"{STREAM_SIGNAL_PREFIX}{stream_id}"
+
+
+async def is_cancelled(stream_id: str) -> bool | None:
+    """The stream's cancel flag from memory, or None when the watcher can't answer.
+
+    The first call for a stream registers a watch and reads the signal key once
+    (covering a cancel that landed before the watch existed); every later call
+    is a dict lookup. None — listener not subscribed yet, or not running in
+    this process — tells the caller to ask Redis directly.
+    """
+    if not _subscribed:
+        return None
+    watch = _watches.get(stream_id)
+    if watch is None:
+        # Register before reading, so a cancel published during the GET is
+        # still caught by the listener.
+        watch = _watches[stream_id] = _Watch()
+        if await redis_cache.get(_signal_key(stream_id)) == "cancelled":
+            watch.event.set()
+    watch.last_read = time.monotonic()
+    return watch.event.is_set()
+
+
+def mark_cancelled(stream_id: str) -> None:
+    """Set the local flag for a stream cancelled from this process."""
+    watch = _watches.get(stream_id)
+    if watch is not None:
+        watch.event.set()
+
+
+def unwatch(stream_id: str) -> None:
+    """Forget a finished stream's flag."""
+    _watches.pop(stream_id, None)
+
+
+async def _reconcile() -> None:
+    """Re-read every watched signal key in one MGET; drop idle watches."""
+    client = redis_cache.redis
+    if client is None or not _watches:
+        return
+    now = time.monotonic()
+    for stream_id in [
+        sid for sid, w in _watches.items() if now - w.last_read > STREAM_CANCEL_WATCH_IDLE_SECONDS
+    ]:
+        del _watches[stream_id]
+    stream_ids = [sid for sid, w in _watches.items() if not w.event.is_set()]
+    if not stream_ids:
+        return
+    signals = await client.mget([_signal_key(sid) for sid in stream_ids])
+    for stream_id, signal in zip(stream_ids, signals, strict=True):
+        # Raw values: the key is written through RedisCache, i.e. JSON-encoded.
+        if signal and deserialize_any(signal) == "cancelled":
+            mark_cancelled(stream_id)
+
+
+async def _consume() -> None:
+    """Subscribe once and flip local flags until the connection drops."""
+    global _subscribed
+    client = redis_cache.redis
+    if client is None:
+        return
+    pubsub = client.pubsub()
+    await pubsub.subscribe(STREAM_CANCEL_CHANNEL)
+    try:
+        _subscribed = True
+        # Anything cancelled while we were not subscribed.
+        await _reconcile()
+        last_reconcile = time.monotonic()
+        while True:
+            message = await pubsub.get_message(
+                ignore_subscribe_messages=True, timeout=STREAM_CANCEL_RECONCILE_SECONDS
+            )
+            if message is not None and message.get("type") == "message":
+                data = message["data"]
+                if isinstance(data, bytes):
+                    data = data.decode("utf-8")
+                mark_cancelled(data)
+            if time.monotonic() - last_reconcile >= STREAM_CANCEL_RECONCILE_SECONDS:
+                await _reconcile()
+                last_reconcile = time.monotonic()
+    finally:
+        _subscribed = False
+        with contextlib.suppress(Exception):
+            await pubsub.unsubscribe(STREAM_CANCEL_CHANNEL)
+            await pubsub.aclose()
+
+
+async def _listener_loop() -> None:
+    """One wide event per subscription lifetime, resubscribing on a drop."""
+    if not redis_cache.redis:
+        async with log_context("stream_cancel_subscription"):
+            log.warning(f"{LogTag.CHAT} Stream cancel watcher disabled (no Redis connection)")
+        return
+    while True:
+        async with log_context("stream_cancel_subscription"):
+            try:
+                await _consume()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning(
+                    f"{LogTag.CHAT} Stream cancel watcher dropped, resubscribing",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+        await asyncio.sleep(STREAM_CANCEL_RESUBSCRIBE_SECONDS)
+
+
+def start_cancel_watcher() -> None:
+    """Start the shared per-process cancellation watcher (idempotent)."""
+    global _listener_task
+    if _listener_task is not None and not _listener_task.done():
+        return
+    _listener_task = asyncio.get_running_loop().create_task(_listener_loop())
+    log.info(f"{LogTag.CHAT} Stream cancel watcher started")
+
+
+async def stop_cancel_watcher() -> None:
+    """Cancel and await the watcher; callers fall back to per-check GETs."""
+    global _listener_task, _subscribed
+    if _listener_task is None:
+        return
+    _listener_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _listener_task
+    _listener_task = None
+    _subscribed = False
+    _watches.clear()
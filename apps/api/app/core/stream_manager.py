@@ -6,7 +6,7 @@ tasks, decoupled from HTTP request lifecycle. Key features:
 
 1. Background Execution: Stream continues even if client disconnects
 2. Redis Pub/Sub: Chunks published to channel, HTTP endpoint subscribes
-3. Progress Tracking: State saved to Redis for recovery
+3. Progress Tracking: State appended to Redis for recovery
 4. Graceful Cancellation: Cancel signal via Redis + pub/sub notification
 5. Reliable Saving: Conversation always saved to MongoDB on completion
 
@@ -48,9 +48,13 @@ from typing import Any, cast
 
 from app.constants.cache import (
     STREAM_ACTIVE_PREFIX,
+    STREAM_CANCEL_CHANNEL,
     STREAM_EVENTS_MAXLEN,
     STREAM_EVENTS_PREFIX,
+    STREAM_PROGRESS_ENTRIES_PREFIX,
+    STREAM_PROGRESS_FIELDS_PREFIX,
     STREAM_PROGRESS_PREFIX,
+    STREAM_PROGRESS_TEXT_PREFIX,
     STREAM_SIGNAL_PREFIX,
     STREAM_TTL,
 )
@@ -61,7 +65,10 @@ from app.constants.streaming import (
     STREAM_CANCELLED_SIGNAL,
     STREAM_DONE_SIGNAL,
     STREAM_ERROR_SIGNAL,
+    STREAM_PUBLISH_FLUSH_INTERVAL_SECONDS,
+    STREAM_PUBLISH_MAX_BATCH,
 )
+from app.core import stream_cancel_watcher
 from app.db.redis import redis_cache
 from shared.py.wide_events import log
 
@@ -71,7 +78,10 @@ class StreamProgress:
     """
     Tracks streaming progress for a conversation.
 
-    Stored in Redis for recovery and final persistence to MongoDB.
+    Stored in Redis for recovery and final persistence to MongoDB. The blob
+    under ``STREAM_PROGRESS_PREFIX`` carries the metadata only; the streamed
+    ``complete_message`` and ``tool_data`` accumulate in append-only side keys
+    (see ``_progress_side_keys``) and are folded back in by ``get_progress``.
     """
 
     conversation_id: str
@@ -163,7 +173,7 @@ class StreamManager:
             await cls._clear_active_index(progress_data)
 
         # Notify subscribers that stream is done
-        await cls._publish(stream_id, STREAM_DONE_SIGNAL)
+        await cls._publish(stream_id, STREAM_DONE_SIGNAL, flush=True)
 
         log.debug(f"{LogTag.STARTUP} Stream completed", stream_id=stream_id)
 
@@ -180,7 +190,10 @@ class StreamManager:
         if progress_data:
             await cls._clear_active_index(progress_data)
         await redis_cache.delete(f"{STREAM_PROGRESS_PREFIX}{stream_id}")
+        for side_key in _progress_side_keys(stream_id):
+            await redis_cache.delete(side_key)
         await redis_cache.delete(f"{STREAM_SIGNAL_PREFIX}{stream_id}")
+        stream_cancel_watcher.unwatch(stream_id)
 
         log.debug(f"{LogTag.STARTUP} Stream cleaned up", stream_id=stream_id)
 
@@ -231,7 +244,7 @@ class StreamManager:
         stream_id = await cls.get_active_stream_id(user_id, conversation_id)
         if not stream_id:
             return None
-        progress = await cls.get_progress(stream_id)
+        progress = await cls._get_progress_meta(stream_id)
         if not progress or progress.get("is_complete") or progress.get("is_cancelled"):
             return None
         return stream_id
@@ -324,7 +337,7 @@ class StreamManager:
                             log.error(
                                 f"{LogTag.STARTUP} Stream encountered an error", stream_id=stream_id
                             )
-                            progress = await cls.get_progress(stream_id)
+                            progress = await cls._get_progress_meta(stream_id)
                             error_msg = (
                                 progress.get("error", "An unexpected error occurred")
                                 if progress
@@ -357,10 +370,15 @@ class StreamManager:
         """Whether the stream's replayable event log still exists (pre-TTL)."""
         if not redis_cache.redis:
             return False
+        # A frame still sitting in this process's publish window counts: land it
+        # first so the answer reflects everything already published.
+        publisher = _publishers.get(stream_id)
+        if publisher is not None and publisher.loop is asyncio.get_running_loop():
+            await publisher.flush()
         return bool(await redis_cache.redis.exists(f"{STREAM_EVENTS_PREFIX}{stream_id}"))
 
     @classmethod
-    async def _publish(cls, stream_id: str, message: str) -> None:
+    async def _publish(cls, stream_id: str, message: str, *, flush: bool = False) -> None:
         """Append a message to the stream's replayable event log.
 
         Redis Streams (not pub/sub): entries persist until TTL/MAXLEN, and each
@@ -368,16 +386,27 @@ class StreamManager:
         subscribers can attach at any time (or reconnect with ``Last-Event-ID``)
         and replay everything they missed. This is what makes late-attach,
         reload-resume, and the init frame race structurally impossible to lose.
+
+        Appends go through the stream's ``_StreamPublisher``, which coalesces
+        everything published within ``STREAM_PUBLISH_FLUSH_INTERVAL_SECONDS``
+        into one pipeline. ``flush=True`` (control signals) writes the pending
+        batch and this message before returning, so a terminal entry is never
+        left sitting in memory.
         """
-        if redis_cache.redis:
-            key = f"{STREAM_EVENTS_PREFIX}{stream_id}"
-            await redis_cache.redis.xadd(
-                key,
-                {"data": message},
-                maxlen=STREAM_EVENTS_MAXLEN,
-                approximate=True,
-            )
-            await redis_cache.redis.expire(key, STREAM_TTL)
+        if not redis_cache.redis:
+            return
+        publisher = _publishers.get(stream_id)
+        if publisher is None or publisher.loop is not asyncio.get_running_loop():
+            publisher = _publishers[stream_id] = _StreamPublisher(stream_id)
+        await publisher.publish(message, flush=flush)
+
+    @classmethod
+    async def flush_publishers(cls) -> None:
+        """Write every stream's pending event-log batch now (shutdown path)."""
+        loop = asyncio.get_running_loop()
+        for publisher in list(_publishers.values()):
+            if publisher.loop is loop:
+                await publisher.flush()
 
     # -------------------------------------------------------------------------
     # Cancellation
@@ -399,6 +428,11 @@ class StreamManager:
             "cancelled",
             ttl=STREAM_TTL,
         )
+        # Push it to every process's cancel watcher; the key above stays the
+        # source of truth for watchers that missed the message.
+        stream_cancel_watcher.mark_cancelled(stream_id)
+        if redis_cache.redis:
+            await redis_cache.redis.publish(STREAM_CANCEL_CHANNEL, stream_id)
 
         # Update progress
         key = f"{STREAM_PROGRESS_PREFIX}{stream_id}"
@@ -409,7 +443,7 @@ class StreamManager:
             await cls._clear_active_index(progress_data)
 
         # Notify subscribers
-        await cls._publish(stream_id, STREAM_CANCELLED_SIGNAL)
+        await cls._publish(stream_id, STREAM_CANCELLED_SIGNAL, flush=True)
 
         log.info(f"{LogTag.STARTUP} Stream cancelled", stream_id=stream_id)
         return True
@@ -419,8 +453,13 @@ class StreamManager:
         """
         Check if stream has been cancelled.
 
-        Call this periodically in the streaming loop.
+        Call this periodically in the streaming loop. With the process's cancel
+        watcher running this is an in-memory flag read after the first call per
+        stream; otherwise it is a GET of the signal key.
         """
+        local = await stream_cancel_watcher.is_cancelled(stream_id)
+        if local is not None:
+            return local
         signal = await redis_cache.get(f"{STREAM_SIGNAL_PREFIX}{stream_id}")
         return bool(signal == "cancelled")
 
@@ -438,48 +477,126 @@ class StreamManager:
         """
         Update streaming progress in Redis.
 
-        Call this as chunks are processed to track progress.
+        Call this as chunks are processed to track progress. Every write is
+        append-only and lands in one pipelined round trip: the text delta is
+        APPENDed, ``tool_data`` list entries are RPUSHed and any other tool-data
+        key is HSET as its own field. Nothing already accumulated is read back,
+        so a delta costs O(len(delta)) however long the reply has grown — the
+        old GET/concat/SET of the whole blob made each turn quadratic in reply
+        length.
 
         Args:
             stream_id: Stream identifier
             message_chunk: Text to append to complete_message
             tool_data: Tool data to merge with existing
         """
-        key = f"{STREAM_PROGRESS_PREFIX}{stream_id}"
-        progress_data = await redis_cache.get(key)
-
-        if not progress_data:
+        client = redis_cache.redis
+        if not client:
             return
 
+        key = f"{STREAM_PROGRESS_PREFIX}{stream_id}"
+        text_key, fields_key, entries_key = _progress_side_keys(stream_id)
+
+        pipe = client.pipeline(transaction=False)
+        # The metadata blob is small and fixed-size; fetching it in the same
+        # round trip is what tells us the stream still exists and whose resume
+        # index to refresh.
+        pipe.get(key)
         if message_chunk:
-            progress_data["complete_message"] = (
-                progress_data.get("complete_message", "") + message_chunk
+            pipe.append(text_key, message_chunk)
+        if tool_data:
+            fields: dict[str, str] = {}
+            for name, value in tool_data.items():
+                if name == "tool_data" and isinstance(value, list):
+                    if value:
+                        pipe.rpush(entries_key, *(json.dumps(entry) for entry in value))
+                else:
+                    fields[name] = json.dumps(value)
+            if fields:
+                pipe.hset(fields_key, mapping=fields)
+        # EXPIRE on a key that was never written is a no-op, so refreshing all
+        # four unconditionally is safe.
+        for ttl_key in (key, text_key, fields_key, entries_key):
+            pipe.expire(ttl_key, STREAM_TTL)
+
+        try:
+            results = await pipe.execute()
+        except Exception as e:
+            log.error(
+                "redis_op_failed",
+                op="update_progress",
+                key=key,
+                error_type=type(e).__name__,
+                error=str(e),
             )
+            return
 
-        if tool_data:
-            existing = progress_data.get("tool_data", {})
-            # Merge tool_data arrays
-            if "tool_data" in tool_data and "tool_data" in existing:
-                existing["tool_data"] = existing.get("tool_data", []) + tool_data.get(
-                    "tool_data", []
-                )
-            else:
-                existing.update(tool_data)
-            progress_data["tool_data"] = existing
+        raw_meta = results[0]
+        if not raw_meta:
+            # The stream was already cleaned up (or never started): drop what
+            # this straggler just created instead of leaving orphans to expire.
+            if message_chunk or tool_data:
+                await client.delete(text_key, fields_key, entries_key)
+            return
 
-        await redis_cache.set(key, progress_data, ttl=STREAM_TTL)
         # The turn is demonstrably alive, so keep the resume index alive with it
         # — the event log already self-refreshes on every publish_chunk.
-        await cls._refresh_active_index(progress_data)
+        await cls._refresh_active_index(json.loads(raw_meta))
 
     @classmethod
     async def get_progress(cls, stream_id: str) -> dict[str, Any] | None:
         """
         Get current stream progress.
 
+        Folds the append-only side keys back into the ``StreamProgress`` shape
+        callers have always seen: ``complete_message`` is the appended text and
+        ``tool_data`` the merged fields plus the accumulated ``tool_data`` list.
+
         Returns:
             Progress data dict or None if not found
         """
+        client = redis_cache.redis
+        if not client:
+            return None
+
+        key = f"{STREAM_PROGRESS_PREFIX}{stream_id}"
+        text_key, fields_key, entries_key = _progress_side_keys(stream_id)
+
+        pipe = client.pipeline(transaction=False)
+        pipe.get(key)
+        pipe.get(text_key)
+        pipe.hgetall(fields_key)
+        pipe.lrange(entries_key, 0, -1)
+        try:
+            raw_meta, text, fields, entries = await pipe.execute()
+        except Exception as e:
+            log.error(
+                "redis_op_failed",
+                op="get_progress",
+                key=key,
+                error_type=type(e).__name__,
+                error=str(e),
+            )
+            return None
+
+        if not raw_meta:
+            return None
+
+        progress = cast("dict[str, Any]", json.loads(raw_meta))
+        progress["complete_message"] = text or ""
+        merged: dict[str, Any] = {name: json.loads(value) for name, value in fields.items()}
+        if entries:
+            merged["tool_data"] = [json.loads(entry) for entry in entries]
+        progress["tool_data"] = merged
+        return progress
+
+    @classmethod
+    async def _get_progress_meta(cls, stream_id: str) -> dict[str, Any] | None:
+        """The metadata blob alone — flags and error, without the streamed text.
+
+        For readers that only inspect ``is_complete``/``is_cancelled``/``error``
+        and have no use for folding in the (possibly long) accumulated reply.
+        """
         return cast(
             "dict[str, Any] | None", await redis_cache.get(f"{STREAM_PROGRESS_PREFIX}{stream_id}")
         )
@@ -501,7 +618,100 @@ class StreamManager:
             await redis_cache.set(key, progress_data, ttl=STREAM_TTL)
 
         # Notify subscribers of error
-        await cls._publish(stream_id, STREAM_ERROR_SIGNAL)
+        await cls._publish(stream_id, STREAM_ERROR_SIGNAL, flush=True)
+
+
+class _StreamPublisher:
+    """Coalesces one stream's event-log appends into pipelined batches.
+
+    Every SSE chunk used to cost an XADD and an EXPIRE round trip, awaited per
+    token by the chat loop. Here a publish only buffers the message; the first
+    one in a window schedules a flush ``STREAM_PUBLISH_FLUSH_INTERVAL_SECONDS``
+    later that sends the whole batch as N XADDs plus a single EXPIRE. A full
+    batch (``STREAM_PUBLISH_MAX_BATCH``) or a ``flush=True`` publish writes
+    immediately and makes the caller wait for it — that is the backpressure.
+
+    Ordering: batches are taken and executed under one lock, so entries land
+    in publish order and their stream ids stay monotonic — ``Last-Event-ID``
+    resume is unaffected. A publisher drops itself from ``_publishers`` once
+    it has flushed and holds nothing, so idle streams cost no memory.
+    """
+
+    __slots__ = ("_flush_task", "_lock", "_pending", "key", "loop", "stream_id")
+
+    def __init__(self, stream_id: str) -> None:
+        self.stream_id = stream_id
+        # The lock and flush task belong to this loop; a publisher left behind
+        # by a loop that has since closed is replaced rather than reused.
+        self.loop = asyncio.get_running_loop()
+        self.key = f"{STREAM_EVENTS_PREFIX}{stream_id}"
+        self._pending: list[str] = []
+        self._lock = asyncio.Lock()
+        self._flush_task: asyncio.Task[None] | None = None
+
+    async def publish(self, message: str, *, flush: bool) -> None:
+        self._pending.append(message)
+        if (
+            flush
+            or STREAM_PUBLISH_FLUSH_INTERVAL_SECONDS <= 0
+            or len(self._pending) >= STREAM_PUBLISH_MAX_BATCH
+        ):
+            await self.flush()
+        elif self._flush_task is None:
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self) -> None:
+        await asyncio.sleep(STREAM_PUBLISH_FLUSH_INTERVAL_SECONDS)
+        self._flush_task = None
+        try:
+            await self.flush()
+        except Exception as e:
+            # Nobody awaits this task — an unlogged failure would drop the batch
+            # silently. The next explicit flush (a control signal) still raises.
+            log.error(
+                "redis_op_failed",
+                op="stream_publish",
+                key=self.key,
+                error_type=type(e).__name__,
+                error=str(e),
+            )
+
+    async def flush(self) -> None:
+        async with self._lock:
+            try:
+                if not self._pending or not redis_cache.redis:
+                    return
+                batch, self._pending = self._pending, []
+                pipe = redis_cache.redis.pipeline(transaction=False)
+                for message in batch:
+                    pipe.xadd(
+                        self.key,
+                        {"data": message},
+                        maxlen=STREAM_EVENTS_MAXLEN,
+                        approximate=True,
+                    )
+                # One TTL refresh per batch rather than per entry.
+                pipe.expire(self.key, STREAM_TTL)
+                await pipe.execute()
+            finally:
+                if (
+                    not self._pending
+                    and self._flush_task is None
+                    and _publishers.get(self.stream_id) is self
+                ):
+                    del _publishers[self.stream_id]
+
+
+_publishers: dict[str, _StreamPublisher] = {}
+
+
+def _progress_side_keys(stream_id: str) -> tuple[str, str, str]:
+    """The append-only text, tool-data field and tool-data entry keys of a stream."""
+    return (
+        f"{STREAM_PROGRESS_TEXT_PREFIX}{stream_id}",
+        f"{STREAM_PROGRESS_FIELDS_PREFIX}{stream_id}",
+        f"{STREAM_PROGRESS_ENTRIES_PREFIX}{stream_id}",
+    )
 
 
 async def with_heartbeat(
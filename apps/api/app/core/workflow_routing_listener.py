@@ -0,0 +1,111 @@
+"""Keeps this process's workflow routing table live (``app.db.repositories.workflow_routing``).
+
+Subscribes once per process to ``WORKFLOW_ROUTING_CHANNEL``, where the
+workflows repository publishes the workflow and trigger ids each routing write
+touched, and drops those entries locally. The table answers only while this
+listener is subscribed. Pub/sub has no replay, so every (re)subscribe clears it
+and re-warms it with one query for all routable workflows.
+"""
+
+import asyncio
+import contextlib
+import json
+
+from app.constants.cache import (
+    WORKFLOW_ROUTING_CACHE_ENABLED,
+    WORKFLOW_ROUTING_CHANNEL,
+    WORKFLOW_ROUTING_RESUBSCRIBE_SECONDS,
+)
+from app.constants.log_tags import LogTag
+from app.db.redis import redis_cache
+from app.db.repositories.workflow_routing import routing_table
+from app.db.repositories.workflows import workflow_repository
+from shared.py.wide_events import log, log_context
+
+_listener_task: asyncio.Task[None] | None = None
+
+
+def _apply(data: str | bytes) -> None:
+    """Apply one channel message; anything unreadable clears the whole table."""
+    try:
+        message = json.loads(data)
+        routing_table.invalidate(message.get("workflows", ()), message.get("triggers", ()))
+    except (ValueError, AttributeError, TypeError):
+        routing_table.clear()
+
+
+async def _consume() -> None:
+    """Subscribe, re-warm, and apply invalidations until the connection drops."""
+    client = redis_cache.redis
+    if client is None:
+        return
+    pubsub = client.pubsub()
+    await pubsub.subscribe(WORKFLOW_ROUTING_CHANNEL)
+    try:
+        # Whatever changed while we were not subscribed is unknown.
+        routing_table.clear()
+        routing_table.live = True
+        try:
+            log.set(routing={"warmed_triggers": await workflow_repository.warm_composio_routes()})
+        except Exception as e:
+            # Cold but live: lookups miss through to Mongo and fill the table.
+            log.warning(
+                f"{LogTag.WORKFLOW} Workflow routing warm-up failed",
+                error=str(e),
+                error_type=type(e).__name__,
+            )
+        while True:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=None)
+            if message is not None and message.get("type") == "message":
+                _apply(message["data"])
+    finally:
+        routing_table.live = False
+        routing_table.clear()
+        with contextlib.suppress(Exception):
+            await pubsub.unsubscribe(WORKFLOW_ROUTING_CHANNEL)
+            await pubsub.aclose()
+
+
+async def _listener_loop() -> None:
+    """One wide event per subscription lifetime, resubscribing on a drop."""
+    if not redis_cache.redis:
+        async with log_context("workflow_routing_subscription"):
+            log.warning(f"{LogTag.WORKFLOW} Workflow routing table disabled (no Redis connection)")
+        return
+    while True:
+        async with log_context("workflow_routing_subscription"):
+            try:
+                await _consume()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning(
+                    f"{LogTag.WORKFLOW} Workflow routing listener dropped, resubscribing",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+        await asyncio.sleep(WORKFLOW_ROUTING_RESUBSCRIBE_SECONDS)
+
+
+def start_routing_listener() -> None:
+    """Start the per-process routing invalidation listener (idempotent)."""
+    global _listener_task
+    if not WORKFLOW_ROUTING_CACHE_ENABLED:
+        return
+    if _listener_task is not None and not _listener_task.done():
+        return
+    _listener_task = asyncio.get_running_loop().create_task(_listener_loop())
+    log.info(f"{LogTag.WORKFLOW} Workflow routing listener started")
+
+
+async def stop_routing_listener() -> None:
+    """Cancel the listener; trigger lookups go back to Mongo."""
+    global _listener_task
+    if _listener_task is None:
+        return
+    _listener_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _listener_task
+    _listener_task = None
+    routing_table.live = False
+    routing_table.clear()
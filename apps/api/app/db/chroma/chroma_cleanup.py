@@ -1,9 +1,11 @@
 """ChromaDB cleanup utilities for integration lifecycle management."""
 
 from app.constants.cache import HANDOFF_NAME_CACHE_PREFIX, SUBAGENT_CACHE_PREFIX
+from app.constants.chroma import TOOLS_COLLECTION
 from app.constants.log_tags import LogTag
 from app.core.lazy_loader import providers
 from app.db.chroma.chroma_tools_store import delete_tools_by_namespace
+from app.db.chroma.tool_embeddings import tool_collection_name
 from app.db.redis import delete_cache
 from app.helpers.namespace_utils import derive_integration_namespace
 from shared.py.wide_events import VectorContext, log
@@ -30,7 +32,9 @@ async def cleanup_integration_chroma_data(
         - "tools": Whether tools were deleted
         - "cache": Whether cache was invalidated
     """
-    log.set(vector=VectorContext(operation="delete", collection="langgraph_tools_store"))
+    log.set(
+        vector=VectorContext(operation="delete", collection=tool_collection_name(TOOLS_COLLECTION))
+    )
 
     results = {"subagent": False, "tools": False, "cache": False}
 
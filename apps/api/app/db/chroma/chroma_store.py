@@ -5,13 +5,14 @@ using ChromaDB for vector storage and retrieval.
 """
 
 import asyncio
-from collections.abc import Coroutine, Iterable
+from collections.abc import Coroutine, Iterable, Mapping
 from datetime import UTC, datetime
 import pickle  # nosec B403 - Used for internal trusted data serialization only
 from typing import Any, cast
 
 from chromadb.api import AsyncClientAPI
 from chromadb.api.models.AsyncCollection import AsyncCollection
+from chromadb.api.types import Where
 from langchain_core.embeddings import Embeddings
 from langgraph.store.base import (
     BaseStore,
@@ -30,9 +31,15 @@ from langgraph.store.base import (
     tokenize_path,
 )
 
-from app.constants.chroma import MAX_CONCURRENT_CHROMA_WRITES
+from app.constants.chroma import (
+    FILTER_METADATA_BACKFILL_PAGE_SIZE,
+    MAX_CONCURRENT_CHROMA_WRITES,
+    MAX_FILTERABLE_VALUE_LENGTH,
+    NAMESPACE_SEARCH_OVERFETCH,
+)
 from app.constants.log_tags import LogTag
 from app.db.chroma.noop_embedding import NoOpEmbeddingFunction
+from app.db.chroma.query_embedding_cache import query_embedding_cache
 from app.utils.concurrency import loop_bound_semaphore
 from shared.py.wide_events import VectorContext, log
 
@@ -40,6 +47,14 @@ from shared.py.wide_events import VectorContext, log
 # JSON-like scalar/container pulled out of a MongoDB-style query filter dict.
 FilterValue = str | int | float | bool | None | dict[str, Any] | list[Any]
 
+# Filter metadata written next to ``namespace`` on every row. Chroma's ``where``
+# has no prefix operator, so each namespace level gets its own key and a prefix
+# search becomes an equality per level; short top-level string fields are
+# mirrored under ``value.<field>`` so equality filters on them run in Chroma too.
+_NS_DEPTH_KEY = "ns.depth"
+_NS_LEVEL_KEY = "ns.{}"
+_VALUE_KEY = "value.{}"
+
 
 class ChromaStore(BaseStore):
     """ChromaDB-backed store with vector search capabilities.
@@ -50,6 +65,8 @@ class ChromaStore(BaseStore):
 
     __slots__ = (
         "_collection_cache",
+        "_filter_metadata_ready",
+        "_passage_documents",
         "_tokenized_fields",
         "client",
         "collection_name",
@@ -63,6 +80,7 @@ class ChromaStore(BaseStore):
         collection_name: str = "langgraph_store",
         *,
         index: IndexConfig | None = None,
+        embed_documents_as_passages: bool = False,
     ) -> None:
         """Initialize ChromaStore.
 
@@ -70,10 +88,16 @@ class ChromaStore(BaseStore):
             client: ChromaDB async client
             collection_name: Name of the ChromaDB collection
             index: Index configuration with embeddings and fields
+            embed_documents_as_passages: Embed stored items with
+                ``aembed_documents`` instead of ``aembed_query``. Asymmetric
+                models (the local fastembed backend) need it; the Gemini
+                indexes were built with query embeddings and keep them.
         """
         self.client = client
         self.collection_name = collection_name
+        self._passage_documents = embed_documents_as_passages
         self._collection_cache: AsyncCollection | None = None
+        self._filter_metadata_ready = False
 
         self.index_config = index
         if self.index_config:
@@ -177,7 +201,7 @@ class ChromaStore(BaseStore):
     ) -> tuple[
         list[Result],
         dict[tuple[tuple[str, ...], str], PutOp],
-        dict[int, tuple[SearchOp, list[str]]],
+        dict[int, tuple[SearchOp, list[str] | None]],
         Exception | None,
     ]:
         """Prepare operations for execution.
@@ -189,7 +213,7 @@ class ChromaStore(BaseStore):
         ops_list = list(ops)
         results: list[Result] = [None] * len(ops_list)
         put_ops: dict[tuple[tuple[str, ...], str], PutOp] = {}
-        search_ops: dict[int, tuple[SearchOp, list[str]]] = {}
+        search_ops: dict[int, tuple[SearchOp, list[str] | None]] = {}
         search_error: Exception | None = None
 
         # Collect async operations to parallelize
@@ -275,57 +299,196 @@ class ChromaStore(BaseStore):
             )
             return None
 
-    async def _filter_items(self, op: SearchOp, collection: AsyncCollection) -> list[str]:
-        """Filter items by namespace prefix and filter conditions."""
-        try:
-            result = await collection.get(include=["metadatas", "documents"])
-
-            if not result["ids"]:
-                return []
+    def _search_where(self, op: SearchOp) -> tuple[Where | None, dict[str, Any]]:
+        """Split a search into its Chroma ``where`` clause and the filter residue.
 
-            # Pre-filter by namespace (fast operation, no deserialization)
-            filtered_by_ns = []
-            for idx, doc_id in enumerate(result["ids"]):
-                ns, _ = self._id_to_namespace_key(doc_id)
-                if self._matches_namespace_prefix(ns, op.namespace_prefix):
-                    filtered_by_ns.append((idx, doc_id))
+        The namespace prefix and string equality on a top-level field are
+        expressed in ``where``. Everything else (operators, nested dicts,
+        non-string values whose Python equality Chroma can't mirror, e.g.
+        ``1 == 1.0 == True``) is returned for ``_check_filter`` to apply.
+        """
+        clauses = self._namespace_clauses(op.namespace_prefix)
+        residue: dict[str, Any] = {}
+        for key, expected in (op.filter or {}).items():
+            if (
+                not key.startswith("$")
+                and isinstance(expected, str)
+                and len(expected) <= MAX_FILTERABLE_VALUE_LENGTH
+            ):
+                clauses.append({_VALUE_KEY.format(key): {"$eq": expected}})
+            else:
+                residue[key] = expected
 
-            if not filtered_by_ns:
-                return []
+        return self._combine("$and", clauses), residue
 
-            # If no filter, return early (avoid unnecessary pickle deserialization)
-            if not op.filter:
-                return [doc_id for _, doc_id in filtered_by_ns]
+    def _namespace_clauses(self, prefix: tuple[str, ...]) -> list[dict[str, Any]]:
+        return [{_NS_LEVEL_KEY.format(depth): {"$eq": part}} for depth, part in enumerate(prefix)]
 
-            # Apply filter conditions (slower, but only on pre-filtered set)
-            filtered_ids = []
-            for idx, doc_id in filtered_by_ns:
-                document = result["documents"][idx] if result["documents"] else None
-                if not document:
-                    continue
-                try:
-                    value = pickle.loads(document.encode("latin1"))  # nosec B301 - Internal trusted data only
-                except Exception as e:
-                    log.debug(
-                        f"{LogTag.CHROMA} Failed to deserialize document at index",
-                        idx=idx,
-                        error=str(e),
-                        error_type=type(e).__name__,
-                    )
-                    continue
-                if not isinstance(value, dict):
-                    continue
-                if self._check_filter(value, op.filter):
-                    filtered_ids.append(doc_id)
+    def _combine(self, operator: str, clauses: list[dict[str, Any]]) -> Where | None:
+        """Join clauses under ``$and``/``$or``; Chroma rejects either with one operand."""
+        if not clauses:
+            return None
+        where = clauses[0] if len(clauses) == 1 else {operator: clauses}
+        # Same stub limitation as chroma_tools_store._namespace_equals: the
+        # nested operator dict widens to dict[str, str] under mypy.
+        return cast(Where, where)
+
+    async def _filter_items(self, op: SearchOp, collection: AsyncCollection) -> list[str] | None:
+        """Ids passing the filter residue, or ``None`` when ``where`` alone selects.
+
+        Only the rows ``where`` already narrowed to are fetched and unpickled, so
+        the cost follows the searched namespace, not the whole collection. Until
+        the filter-metadata backfill has run, ``where`` would miss older rows, so
+        the whole search is filtered in Python instead.
+        """
+        if not self._filter_metadata_ready:
+            return await self._scan_filter_items(op, collection)
+        try:
+            where, residue = self._search_where(op)
+            if not residue:
+                return None
 
-            return filtered_ids
+            result = await collection.get(where=where, include=["documents"])
+            return self._passing_filter(result["ids"], result["documents"] or [], residue)
         except Exception as e:
             # Re-raise so callers can tell an unreachable ChromaDB apart from an
             # empty namespace (same contract as the write path). Per-document
-            # data issues are already handled item-by-item above.
+            # data issues are already handled item-by-item.
             log.error(f"{LogTag.CHROMA} Error filtering items", error_type=type(e).__name__)
             raise
 
+    async def _scan_filter_items(self, op: SearchOp, collection: AsyncCollection) -> list[str]:
+        """``_filter_items`` without filter metadata: read every row, filter here."""
+        try:
+            result = await collection.get(include=["documents"])
+            in_namespace = [
+                (doc_id, document)
+                for doc_id, document in zip(result["ids"], result["documents"] or [])
+                if self._matches_namespace_prefix(
+                    self._id_to_namespace_key(doc_id)[0], op.namespace_prefix
+                )
+            ]
+            if not op.filter:
+                return [doc_id for doc_id, _ in in_namespace]
+            return self._passing_filter(
+                [doc_id for doc_id, _ in in_namespace],
+                [document for _, document in in_namespace],
+                op.filter,
+            )
+        except Exception as e:
+            log.error(f"{LogTag.CHROMA} Error filtering items", error_type=type(e).__name__)
+            raise
+
+    def _passing_filter(
+        self, ids: list[str], documents: list[str | None], filter_dict: dict[str, Any]
+    ) -> list[str]:
+        """The ids whose unpickled document satisfies ``filter_dict``."""
+        filtered_ids = []
+        for idx, (doc_id, document) in enumerate(zip(ids, documents)):
+            if not document:
+                continue
+            try:
+                value = pickle.loads(document.encode("latin1"))  # nosec B301 - Internal trusted data only
+            except Exception as e:
+                log.debug(
+                    f"{LogTag.CHROMA} Failed to deserialize document at index",
+                    idx=idx,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                continue
+            if not isinstance(value, dict):
+                continue
+            if self._check_filter(value, filter_dict):
+                filtered_ids.append(doc_id)
+        return filtered_ids
+
+    def _filter_metadata(
+        self, namespace: tuple[str, ...], value: dict[str, Any] | None
+    ) -> dict[str, str | int]:
+        """The ``ns.*`` / ``value.*`` metadata ``_search_where`` selects on."""
+        metadata: dict[str, str | int] = {_NS_DEPTH_KEY: len(namespace)}
+        for depth, part in enumerate(namespace):
+            metadata[_NS_LEVEL_KEY.format(depth)] = part
+        if isinstance(value, dict):
+            for field, field_value in value.items():
+                if (
+                    isinstance(field, str)
+                    and isinstance(field_value, str)
+                    and len(field_value) <= MAX_FILTERABLE_VALUE_LENGTH
+                ):
+                    metadata[_VALUE_KEY.format(field)] = field_value
+        return metadata
+
+    async def abackfill_filter_metadata(self) -> int:
+        """Backfill filter metadata onto rows written before it existed.
+
+        A row without ``ns.*`` keys is invisible to every ``where``-narrowed
+        search, so searches filter in Python until this has paged through the
+        collection once. Run it off the request path (the store initializers
+        spawn it at startup). A failure is logged and leaves the Python
+        filtering in place; the next process start tries again.
+
+        Returns the number of rows backfilled.
+        """
+        async with loop_bound_semaphore(f"chroma_filter_backfill:{self.collection_name}", 1):
+            if self._filter_metadata_ready:
+                return 0
+            backfilled = 0
+            try:
+                collection = await self._get_collection()
+                offset = 0
+                while True:
+                    page = await collection.get(
+                        include=["metadatas"],
+                        limit=FILTER_METADATA_BACKFILL_PAGE_SIZE,
+                        offset=offset,
+                    )
+                    if not page["ids"]:
+                        break
+                    stale = [
+                        doc_id
+                        for doc_id, metadata in zip(page["ids"], page["metadatas"] or [])
+                        if not metadata or _NS_DEPTH_KEY not in metadata
+                    ]
+                    if stale:
+                        backfilled += await self._backfill_filter_metadata(stale, collection)
+                    offset += len(page["ids"])
+            except Exception as e:
+                log.warning(
+                    f"{LogTag.CHROMA} Filter metadata backfill failed, filtering in Python",
+                    collection=self.collection_name,
+                    backfilled=backfilled,
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+                return backfilled
+            self._filter_metadata_ready = True
+            log.info(
+                f"{LogTag.CHROMA} Filter metadata ready",
+                collection=self.collection_name,
+                backfilled=backfilled,
+            )
+            return backfilled
+
+    async def _backfill_filter_metadata(self, ids: list[str], collection: AsyncCollection) -> int:
+        result = await collection.get(ids=ids, include=["documents"])
+        documents = result["documents"] or []
+        metadatas = []
+        for doc_id, document in zip(result["ids"], documents):
+            namespace, _ = self._id_to_namespace_key(doc_id)
+            try:
+                value = pickle.loads(document.encode("latin1")) if document else None  # nosec B301 - Internal trusted data only
+            except Exception:
+                # Namespace keys alone still make the row searchable.
+                value = None
+            metadatas.append(self._filter_metadata(namespace, value))
+        if not metadatas:
+            return 0
+        # update() merges into the existing metadata, keeping timestamps.
+        await collection.update(ids=result["ids"], metadatas=metadatas)  # type: ignore[arg-type]
+        return len(metadatas)
+
     def _matches_namespace_prefix(
         self, namespace: tuple[str, ...], prefix: tuple[str, ...]
     ) -> bool:
@@ -385,122 +548,200 @@ class ChromaStore(BaseStore):
 
     async def _batch_search(
         self,
-        ops: dict[int, tuple[SearchOp, list[str]]],
+        ops: dict[int, tuple[SearchOp, list[str] | None]],
         results: list[Result],
         collection: AsyncCollection,
     ) -> None:
         """Perform batch similarity search."""
         for i, (op, candidate_ids) in ops.items():
-            if not candidate_ids:
+            if candidate_ids is not None and not candidate_ids:
                 results[i] = []
                 continue
 
-            if op.query and self.embeddings:
-                # Vector search with ChromaDB's native where filter for namespace
-                query_embedding = await self.embeddings.aembed_query(op.query)
+            # Python-scanned candidates already carry the namespace and filter.
+            where = self._search_where(op)[0] if self._filter_metadata_ready else None
 
-                try:
-                    # Build where filter for namespace prefix
-                    where_filter: dict[str, Any] | None = None
-                    if op.namespace_prefix:
-                        namespace_str = "::".join(op.namespace_prefix)
-                        where_filter = {"namespace": {"$eq": namespace_str}}
-
-                    # Apply additional filters if provided
-                    if op.filter:
-                        # Combine namespace filter with op.filter if both exist
-                        if where_filter:
-                            where_filter = {"$and": [where_filter, op.filter]}
-                        else:
-                            where_filter = op.filter
-
-                    # Use ChromaDB's native query with where filter
-                    search_result = await collection.query(
-                        query_embeddings=[query_embedding],  # type: ignore[arg-type]
-                        n_results=op.limit + op.offset,
-                        include=["metadatas", "distances", "documents"],
-                        where=where_filter,
+            if op.query and self.embeddings:
+                embedding = await query_embedding_cache.aembed(self.embeddings, op.query)
+                # ``where`` narrows by namespace/equality inside Chroma;
+                # ``ids`` carries the Python-side filter residue, if any.
+                items = await self._query(
+                    collection, embedding, op.limit + op.offset, where, candidate_ids
+                )
+                results[i] = items[op.offset : op.offset + op.limit]
+            else:
+                # No query: one paginated get — by ``where`` when it selects
+                # alone, else by the residue-filtered ids.
+                if candidate_ids is None:
+                    page = await collection.get(
+                        where=where,
+                        limit=op.limit,
+                        offset=op.offset,
+                        include=["metadatas", "documents"],
+                    )
+                else:
+                    page = await collection.get(
+                        ids=candidate_ids[op.offset : op.offset + op.limit],
+                        include=["metadatas", "documents"],
                     )
 
-                    items = []
-                    if (
-                        search_result["ids"]
-                        and search_result["ids"][0]
-                        and search_result["metadatas"]
-                        and search_result["metadatas"][0]
-                        and search_result["distances"]
-                        and search_result["distances"][0]
-                    ):
-                        for idx, (doc_id, metadata, distance) in enumerate(
-                            zip(
-                                search_result["ids"][0],
-                                search_result["metadatas"][0],
-                                search_result["distances"][0],
-                            )
-                        ):
-                            ns, key = self._id_to_namespace_key(doc_id)
-
-                            # Get document from search results
-                            documents = search_result.get("documents")
-                            document = documents[0][idx] if documents and documents[0] else None
-                            value = (
-                                pickle.loads(document.encode("latin1"))  # nosec B301 - Internal trusted data only
-                                if document
-                                else {}
-                            )
-
-                            created_at_str = metadata.get("created_at")
-                            updated_at_str = metadata.get("updated_at")
-
-                            # Convert distance to similarity score
-                            score = 1.0 - distance if distance is not None else None
-
-                            items.append(
-                                SearchItem(
-                                    namespace=ns,
-                                    key=key,
-                                    value=value,
-                                    created_at=datetime.fromisoformat(str(created_at_str))
-                                    if created_at_str and isinstance(created_at_str, str)
-                                    else datetime.now(UTC),
-                                    updated_at=datetime.fromisoformat(str(updated_at_str))
-                                    if updated_at_str and isinstance(updated_at_str, str)
-                                    else datetime.now(UTC),
-                                    score=float(score) if score is not None else None,
-                                )
-                            )
-
-                    # Apply pagination
-                    results[i] = items[op.offset : op.offset + op.limit]
-                except Exception as e:
-                    # Re-raise so an unreachable ChromaDB doesn't masquerade as
-                    # zero search hits (same contract as the write path).
-                    log.error(
-                        f"{LogTag.CHROMA} Error in vector search", error_type=type(e).__name__
+                rows = zip(page["ids"], page["metadatas"] or [], page["documents"] or [])
+                items = []
+                for doc_id, row_metadata, row_document in rows:
+                    try:
+                        items.append(self._to_search_item(doc_id, row_metadata, row_document))
+                    except Exception as e:
+                        log.error(
+                            f"{LogTag.CHROMA} Error getting item",
+                            doc_id=doc_id,
+                            error=str(e),
+                            error_type=type(e).__name__,
+                        )
+                results[i] = items
+
+    async def asearch_namespaces(
+        self,
+        query: str,
+        limits: Mapping[tuple[str, ...], int],
+    ) -> dict[tuple[str, ...], list[SearchItem]]:
+        """Vector-search several namespace prefixes with one embedding and one query.
+
+        Returns, per prefix, what ``asearch(prefix, query=query, limit=n)``
+        would: its top ``limits[prefix]`` hits by score. The combined query asks
+        for ``NAMESPACE_SEARCH_OVERFETCH`` times the summed limits; if it comes
+        back full, a prefix left short may have been crowded out by the others
+        and is re-queried on its own.
+        """
+        results: dict[tuple[str, ...], list[SearchItem]] = {prefix: [] for prefix in limits}
+        prefixes = [prefix for prefix, limit in limits.items() if limit > 0]
+        if not prefixes:
+            return results
+        if not self.embeddings or not self._filter_metadata_ready:
+            # The one combined query selects by ``where``, which needs the
+            # filter metadata; each search on its own can filter in Python.
+            searched = await asyncio.gather(
+                *(self.asearch(prefix, query=query, limit=limits[prefix]) for prefix in prefixes)
+            )
+            results.update(zip(prefixes, searched))
+            return results
+
+        collection = await self._get_collection()
+        embedding = await query_embedding_cache.aembed(self.embeddings, query)
+
+        # An empty prefix matches every row, which makes the $or moot.
+        where = (
+            None
+            if any(not prefix for prefix in prefixes)
+            else self._combine(
+                "$or",
+                [
+                    cast(dict[str, Any], self._combine("$and", self._namespace_clauses(prefix)))
+                    for prefix in prefixes
+                ],
+            )
+        )
+        n_results = sum(limits[prefix] for prefix in prefixes) * NAMESPACE_SEARCH_OVERFETCH
+        items = await self._query(collection, embedding, n_results, where)
+
+        for item in items:
+            for prefix in prefixes:
+                if (
+                    self._matches_namespace_prefix(item.namespace, prefix)
+                    and len(results[prefix]) < limits[prefix]
+                ):
+                    results[prefix].append(item)
+
+        if len(items) == n_results:
+            short = [prefix for prefix in prefixes if len(results[prefix]) < limits[prefix]]
+            requeried = await asyncio.gather(
+                *(
+                    self._query(
+                        collection,
+                        embedding,
+                        limits[prefix],
+                        self._combine("$and", self._namespace_clauses(prefix)),
                     )
-                    raise
-            else:
-                # No query, just return filtered items with pagination
-                # Parallelize item retrieval
-                paginated_ids = candidate_ids[op.offset : op.offset + op.limit]
-                item_tasks = [
-                    self._get_item(*self._id_to_namespace_key(doc_id), collection)
-                    for doc_id in paginated_ids
-                ]
-                retrieved_items = await asyncio.gather(*item_tasks)
-
-                items = [
-                    SearchItem(
-                        namespace=item.namespace,
-                        key=item.key,
-                        value=item.value,
-                        created_at=item.created_at,
-                        updated_at=item.updated_at,
+                    for prefix in short
+                )
+            )
+            results.update(zip(short, requeried))
+        return results
+
+    async def _query(
+        self,
+        collection: AsyncCollection,
+        embedding: list[float],
+        n_results: int,
+        where: Where | None,
+        ids: list[str] | None = None,
+    ) -> list[SearchItem]:
+        """One nearest-neighbour query, best match first."""
+        try:
+            search_result = await collection.query(
+                query_embeddings=[embedding],  # type: ignore[arg-type]
+                n_results=n_results,
+                include=["metadatas", "distances", "documents"],
+                where=where,
+                ids=ids,
+            )
+        except Exception as e:
+            # Re-raise so an unreachable ChromaDB doesn't masquerade as
+            # zero search hits (same contract as the write path).
+            log.error(f"{LogTag.CHROMA} Error in vector search", error_type=type(e).__name__)
+            raise
+
+        items: list[SearchItem] = []
+        if (
+            search_result["ids"]
+            and search_result["ids"][0]
+            and search_result["metadatas"]
+            and search_result["metadatas"][0]
+            and search_result["distances"]
+            and search_result["distances"][0]
+        ):
+            documents = search_result.get("documents")
+            for idx, (doc_id, metadata, distance) in enumerate(
+                zip(
+                    search_result["ids"][0],
+                    search_result["metadatas"][0],
+                    search_result["distances"][0],
+                )
+            ):
+                document = documents[0][idx] if documents and documents[0] else None
+                # Convert distance to similarity score
+                score = 1.0 - distance if distance is not None else None
+                items.append(
+                    self._to_search_item(
+                        doc_id, metadata, document, float(score) if score is not None else None
                     )
-                    for item in retrieved_items
-                    if item is not None
-                ]
-                results[i] = items
+                )
+        return items
+
+    def _to_search_item(
+        self,
+        doc_id: str,
+        metadata: Mapping[str, Any] | None,
+        document: str | None,
+        score: float | None = None,
+    ) -> SearchItem:
+        """Build a ``SearchItem`` from one Chroma row."""
+        ns, key = self._id_to_namespace_key(doc_id)
+        value = pickle.loads(document.encode("latin1")) if document else {}  # nosec B301 - Internal trusted data only
+        metadata = metadata or {}
+        created_at_str = metadata.get("created_at")
+        updated_at_str = metadata.get("updated_at")
+        return SearchItem(
+            namespace=ns,
+            key=key,
+            value=value,
+            created_at=datetime.fromisoformat(str(created_at_str))
+            if created_at_str and isinstance(created_at_str, str)
+            else datetime.now(UTC),
+            updated_at=datetime.fromisoformat(str(updated_at_str))
+            if updated_at_str and isinstance(updated_at_str, str)
+            else datetime.now(UTC),
+            score=score,
+        )
 
     async def _apply_put_ops(
         self,
@@ -581,10 +822,11 @@ class ChromaStore(BaseStore):
         now = datetime.now(UTC)
         # Store namespace in metadata for efficient filtering
         namespace_str = "::".join(op.namespace) if op.namespace else "default"
-        metadata = {
+        metadata: dict[str, str | int] = {
             "created_at": now.isoformat(),
             "updated_at": now.isoformat(),
             "namespace": namespace_str,
+            **self._filter_metadata(op.namespace, op.value),
         }
 
         # Add tool_hash to metadata if provided in value
@@ -615,7 +857,10 @@ class ChromaStore(BaseStore):
                     texts.extend(field_texts)
             if texts:
                 try:
-                    embedding = await self.embeddings.aembed_query(" ".join(texts))
+                    if self._passage_documents:
+                        embedding = (await self.embeddings.aembed_documents([" ".join(texts)]))[0]
+                    else:
+                        embedding = await self.embeddings.aembed_query(" ".join(texts))
                 except Exception as embed_err:
                     log.error(
                         f"{LogTag.CHROMA} _upsert_item embedding failed",
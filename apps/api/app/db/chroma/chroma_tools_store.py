@@ -7,15 +7,17 @@ from typing import Any, NotRequired, Protocol, TypedDict, cast
 
 from chromadb.api.models.AsyncCollection import AsyncCollection
 from chromadb.api.types import Where
-from langchain_google_genai import GoogleGenerativeAIEmbeddings
 from langgraph.store.base import PutOp
 
 from app.agents.core.subagents.registry import all_subagents
 from app.agents.tools.core.registry import ToolRegistry, get_tool_registry
+from app.constants.chroma import TOOLS_COLLECTION
 from app.constants.log_tags import LogTag
 from app.core.lazy_loader import MissingKeyStrategy, lazy_provider, providers
 from app.db.chroma.chromadb import ChromaClient
+from app.db.chroma.tool_embeddings import create_tool_store, tool_collection_name
 from app.db.redis import delete_cache, get_cache, set_cache
+from app.utils.background_tasks import spawn_background_task
 from shared.py.wide_events import VectorContext, log
 
 from .chroma_store import ChromaStore
@@ -334,7 +336,7 @@ async def index_tools_to_store(tools_with_space: Sequence[tuple[IndexableTool, s
     log.set(
         vector=VectorContext(
             operation="upsert",
-            collection="langgraph_tools_store",
+            collection=tool_collection_name(TOOLS_COLLECTION),
         )
     )
     log.info(
@@ -474,7 +476,9 @@ async def delete_tools_by_namespace(namespace: str) -> int:
         Number of tools deleted
     """
 
-    log.set(vector=VectorContext(operation="delete", collection="langgraph_tools_store"))
+    log.set(
+        vector=VectorContext(operation="delete", collection=tool_collection_name(TOOLS_COLLECTION))
+    )
 
     raw_store = await providers.aget("chroma_tools_store")
     if not raw_store:
@@ -523,30 +527,21 @@ async def initialize_chroma_tools_store() -> ChromaStore:
     """
     tool_registry = await get_tool_registry()
     chroma_client = await ChromaClient.get_client()
-    raw_embeddings = await providers.aget("google_embeddings")
-
-    if raw_embeddings is None:
-        raise RuntimeError("Embeddings not available")
-
-    # Registered by init_embeddings() in app/agents/tools/core/store.py.
-    embeddings = cast(GoogleGenerativeAIEmbeddings, raw_embeddings)
-
-    store = ChromaStore(
-        client=chroma_client,
-        collection_name="langgraph_tools_store",
-        index={
-            "embed": embeddings,
-            "dims": 768,
-            "fields": ["description"],
-        },
-    )
+    store = await create_tool_store(chroma_client, TOOLS_COLLECTION, ["description"])
 
     collection = await store._get_collection()
+    # Off the request path: searches filter in Python until this has run.
+    spawn_background_task(
+        store.abackfill_filter_metadata(),
+        name=f"chroma_filter_backfill:{tool_collection_name(TOOLS_COLLECTION)}",
+    )
 
     current_tools = _get_current_tools_with_hashes(tool_registry)
 
     managed_namespaces = {tool_data["namespace"] for tool_data in current_tools.values()}
-    log.set(vector=VectorContext(operation="upsert", collection="langgraph_tools_store"))
+    log.set(
+        vector=VectorContext(operation="upsert", collection=tool_collection_name(TOOLS_COLLECTION))
+    )
     log.info(f"{LogTag.CHROMA} Managing namespaces at init", managed_namespaces=managed_namespaces)
 
     existing_tools = await _get_existing_tools_from_chroma(collection, managed_namespaces)
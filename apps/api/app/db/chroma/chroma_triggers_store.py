@@ -12,11 +12,14 @@ from chromadb.api.models.AsyncCollection import AsyncCollection
 from langgraph.store.base import PutOp
 
 from app.config.oauth_config import OAUTH_INTEGRATIONS
+from app.constants.chroma import TRIGGERS_COLLECTION
 from app.constants.log_tags import LogTag
 from app.core.lazy_loader import MissingKeyStrategy, lazy_provider, providers
 from app.db.chroma.chromadb import ChromaClient
+from app.db.chroma.tool_embeddings import create_tool_store, tool_collection_name
 from app.models.oauth_models import OAuthIntegration
 from app.models.trigger_config import TriggerConfig
+from app.utils.background_tasks import spawn_background_task
 from shared.py.wide_events import VectorContext, log
 
 from .chroma_store import ChromaStore
@@ -261,28 +264,20 @@ async def initialize_chroma_triggers_store() -> ChromaStore:
         ChromaStore instance for triggers
     """
     chroma_client = await ChromaClient.get_client()
-    embeddings = await providers.aget("google_embeddings")
-
-    if embeddings is None:
-        raise RuntimeError("Embeddings not available for triggers store")
-
-    store = ChromaStore(
-        client=chroma_client,
-        collection_name="langgraph_triggers_store",
-        index={
-            "embed": embeddings,
-            "dims": 768,
-            "fields": ["rich_description"],
-        },
-    )
+    store = await create_tool_store(chroma_client, TRIGGERS_COLLECTION, ["rich_description"])
 
     collection = await store._get_collection()
+    # Off the request path: searches filter in Python until this has run.
+    spawn_background_task(
+        store.abackfill_filter_metadata(),
+        name=f"chroma_filter_backfill:{tool_collection_name(TRIGGERS_COLLECTION)}",
+    )
 
     current_triggers = _get_current_triggers_with_hashes()
     log.set(
         vector=VectorContext(
             operation="upsert",
-            collection="langgraph_triggers_store",
+            collection=tool_collection_name(TRIGGERS_COLLECTION),
         )
     )
     log.info(
@@ -1,8 +1,11 @@
 """ChromaDB store for public integrations semantic search."""
 
+import asyncio
+
 from app.constants.log_tags import LogTag
 from app.core.lazy_loader import providers
 from app.db.chroma.chromadb import ChromaClient
+from app.db.chroma.query_embedding_cache import query_embedding_cache
 from shared.py.wide_events import VectorContext, log
 
 COLLECTION_NAME = "public_integrations"
@@ -85,17 +88,20 @@ async def search_public_integrations(
             create_if_not_exists=True,
         )
 
-        results = await chroma.asimilarity_search_with_relevance_scores(
-            query=query,
-            k=limit,
+        # Through the shared query cache: retrieve_tools embeds the same query
+        # for the tools store, so a discovery pays for one embedding call.
+        embedding = await query_embedding_cache.aembed(embedding_fn, query)
+        results = await asyncio.to_thread(
+            chroma.similarity_search_by_vector_with_relevance_scores, embedding, k=limit
         )
 
         matches = [
             {
                 "integration_id": doc.metadata.get("integration_id") or getattr(doc, "id", None),
-                "relevance_score": score,
+                # The collection is cosine; same conversion as ChromaStore.
+                "relevance_score": 1.0 - distance,
             }
-            for doc, score in results
+            for doc, distance in results
             if doc.metadata.get("integration_id") or getattr(doc, "id", None)
         ]
         log.set_ns("vector", result_count=len(matches))
@@ -0,0 +1,104 @@
+"""Process-wide LRU + TTL cache for search-query embeddings.
+
+One ``retrieve_tools`` discovery searches several tool namespaces and the
+public-integrations collection for the same query string, and agents repeat
+the same intents across turns. Every search path embeds its query through
+``query_embedding_cache.aembed``: a repeat is served from memory, and
+concurrent requests for the same text share one in-flight embedding call, so a
+discovery pays for at most one embedding however many collections it queries.
+
+Entries are keyed by the embeddings object as well as the text — vectors from
+different models never mix. Failed embeddings are not cached.
+
+Prometheus: ``query_embedding_cache_requests_total`` (Counter, label
+``outcome``: ``hit`` | ``coalesced`` | ``miss``).
+"""
+
+import asyncio
+from collections import OrderedDict
+import time
+
+from langchain_core.embeddings import Embeddings
+from prometheus_client import Counter
+
+from app.constants.chroma import QUERY_EMBEDDING_CACHE_SIZE, QUERY_EMBEDDING_CACHE_TTL_SECONDS
+from app.services.storage.metrics import _register_once
+
+QUERY_EMBEDDING_CACHE_REQUESTS_TOTAL = _register_once(
+    "query_embedding_cache_requests_total",
+    lambda: Counter(
+        name="query_embedding_cache_requests_total",
+        documentation="Search-query embedding requests, by whether they were served from cache",
+        labelnames=("outcome",),
+    ),
+)
+
+
+class _Entry:
+    __slots__ = ("embedding", "embeddings", "expires_at")
+
+    def __init__(self, embeddings: Embeddings, embedding: list[float], expires_at: float) -> None:
+        # Holding the embeddings object keeps its id() from being reused by
+        # another model while the entry lives.
+        self.embeddings = embeddings
+        self.embedding = embedding
+        self.expires_at = expires_at
+
+
+class QueryEmbeddingCache:
+    """LRU of query embeddings with a TTL, coalescing concurrent misses."""
+
+    def __init__(
+        self,
+        max_size: int = QUERY_EMBEDDING_CACHE_SIZE,
+        ttl: float = QUERY_EMBEDDING_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple[int, str], _Entry] = OrderedDict()
+        self._in_flight: dict[tuple[int, str], asyncio.Task[list[float]]] = {}
+
+    async def aembed(self, embeddings: Embeddings, text: str) -> list[float]:
+        """``embeddings.aembed_query(text)``, from cache when possible."""
+        key = (id(embeddings), text)
+        entry = self._entries.get(key)
+        if entry is not None and entry.embeddings is embeddings:
+            if entry.expires_at > time.monotonic():
+                self._entries.move_to_end(key)
+                QUERY_EMBEDDING_CACHE_REQUESTS_TOTAL.labels(outcome="hit").inc()
+                return entry.embedding
+            del self._entries[key]
+
+        pending = self._in_flight.get(key)
+        # A task from a since-closed loop (tests, worker restarts) never finishes.
+        if pending is not None and pending.get_loop() is asyncio.get_running_loop():
+            QUERY_EMBEDDING_CACHE_REQUESTS_TOTAL.labels(outcome="coalesced").inc()
+            return await asyncio.shield(pending)
+
+        QUERY_EMBEDDING_CACHE_REQUESTS_TOTAL.labels(outcome="miss").inc()
+        # A task, not a direct await: a caller cancelled mid-embed must not
+        # cancel the embedding the coalesced callers are waiting on.
+        task = asyncio.ensure_future(embeddings.aembed_query(text))
+        self._in_flight[key] = task
+        task.add_done_callback(lambda done: self._settle(key, embeddings, done))
+        return await asyncio.shield(task)
+
+    def _settle(
+        self, key: tuple[int, str], embeddings: Embeddings, task: asyncio.Task[list[float]]
+    ) -> None:
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        if not task.cancelled() and task.exception() is None:
+            self._store(key, embeddings, task.result())
+
+    def _store(self, key: tuple[int, str], embeddings: Embeddings, embedding: list[float]) -> None:
+        self._entries[key] = _Entry(embeddings, embedding, time.monotonic() + self._ttl)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+query_embedding_cache = QueryEmbeddingCache()
@@ -0,0 +1,106 @@
+"""Embedding backends for the tools and triggers Chroma stores.
+
+``TOOLS_EMBEDDING_BACKEND`` picks one per deployment:
+
+- ``google``  Gemini embeddings through the ``google_embeddings`` provider
+              (768-dim). Every discovery and re-index depends on the remote
+              API's latency and quota.
+- ``local``   the memory engine's fastembed model (``app.memory.embeddings``):
+              in-process ONNX, or the shared embedding sidecar when
+              ``MEMORY_EMBEDDING_SIDECAR_URL`` is set. No remote dependency.
+
+Vector spaces of different models are not comparable and a Chroma collection's
+dimension is fixed by its first row, so each backend reads and writes its own
+collections: ``google`` keeps the historical names, other backends append
+``_<backend>``. ``scripts/migrate_tool_embeddings.py`` fills a backend's
+collections from another's before a deployment switches over.
+"""
+
+import asyncio
+from typing import cast
+
+from chromadb.api import AsyncClientAPI
+from langchain_core.embeddings import Embeddings
+
+from app.constants.chroma import TOOLS_EMBEDDING_BACKEND, TOOLS_EMBEDDING_BACKENDS
+from app.constants.memory import EMBEDDING_DIM
+from app.core.lazy_loader import providers
+from app.db.chroma.chroma_store import ChromaStore
+from app.memory import embeddings as memory_embeddings
+
+GOOGLE_EMBEDDING_DIM = 768
+
+
+class LocalEmbeddings(Embeddings):
+    """LangChain ``Embeddings`` over the memory engine's fastembed backend.
+
+    Queries get the model's retrieval instruction (``embed_query``), stored
+    items are embedded as plain passages (``embed_batch``) — the model is
+    asymmetric, so stores using it set ``embed_documents_as_passages``. The
+    sync methods always run the in-process model; the async ones honour the
+    sidecar. LangChain's interface is plain float lists, so the memory
+    engine's arrays are converted here, at its edge.
+    """
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return cast(list[list[float]], memory_embeddings._embed_sync(texts).tolist())
+
+    def embed_query(self, text: str) -> list[float]:
+        return cast(list[float], memory_embeddings._embed_query_sync(text).tolist())
+
+    async def aembed_documents(self, texts: list[str]) -> list[list[float]]:
+        return cast(list[list[float]], (await memory_embeddings.embed_batch(texts)).tolist())
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return cast(list[float], (await memory_embeddings.embed_query(text)).tolist())
+
+
+# One instance for the process: query_embedding_cache keys entries by the
+# embeddings object, so every store on this backend shares cached queries.
+local_embeddings = LocalEmbeddings()
+
+
+def _check_backend(backend: str) -> None:
+    if backend not in TOOLS_EMBEDDING_BACKENDS:
+        raise ValueError(
+            f"Unknown tools embedding backend {backend!r}; expected one of {TOOLS_EMBEDDING_BACKENDS}"
+        )
+
+
+def tool_collection_name(base: str, backend: str = TOOLS_EMBEDDING_BACKEND) -> str:
+    """The collection ``backend`` keeps ``base``'s rows in."""
+    _check_backend(backend)
+    return base if backend == "google" else f"{base}_{backend}"
+
+
+async def get_tool_embeddings(backend: str = TOOLS_EMBEDDING_BACKEND) -> tuple[Embeddings, int]:
+    """The embeddings object and vector dimension for ``backend``."""
+    _check_backend(backend)
+    if backend == "local":
+        return local_embeddings, EMBEDDING_DIM
+    embeddings = await providers.aget("google_embeddings")
+    if embeddings is None:
+        raise RuntimeError("Embeddings not available")
+    # Registered by init_embeddings() in app/agents/tools/core/store.py.
+    return cast(Embeddings, embeddings), GOOGLE_EMBEDDING_DIM
+
+
+async def create_tool_store(
+    client: AsyncClientAPI,
+    base_collection: str,
+    fields: list[str],
+    backend: str = TOOLS_EMBEDDING_BACKEND,
+) -> ChromaStore:
+    """A ``ChromaStore`` over ``backend``'s copy of ``base_collection``."""
+    embeddings, dims = await get_tool_embeddings(backend)
+    if backend == "local":
+        # Load the ONNX model off the event loop now rather than inside the
+        # first discovery (no-op when the sidecar serves embeddings).
+        if not memory_embeddings._sidecar_url():
+            await asyncio.to_thread(memory_embeddings._get_embedding_model)
+    return ChromaStore(
+        client=client,
+        collection_name=tool_collection_name(base_collection, backend),
+        index={"embed": embeddings, "dims": dims, "fields": fields},
+        embed_documents_as_passages=backend == "local",
+    )
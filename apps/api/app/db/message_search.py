@@ -0,0 +1,175 @@
+"""Postgres keyword index over chat-message responses.
+
+``ConversationRepository`` keeps it in sync from its message writes
+(``append_messages``, including the history it trims, ``set_message_response``)
+and conversation deletes; ``ConversationRepository.search_indexed`` reads it and
+drops rows whose message turns out to be gone. Search matches are
+case-insensitive substrings (``ILIKE``, served by the ``pg_trgm`` GIN index on
+``message_search.response``) — the same semantics as the legacy Mongo regex.
+
+The index is derived data: write failures are logged and swallowed so a
+Postgres hiccup never fails a chat turn, and
+``scripts/backfill_message_search_index.py`` rebuilds any gap.
+"""
+
+from collections.abc import Mapping, Sequence
+from datetime import UTC, datetime
+
+from sqlalchemy import ColumnElement, delete, select, tuple_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.db.postgresql import get_db_session
+from app.models.message_search_db_models import MessageSearchEntry
+from shared.py.wide_events import log
+
+MessageRef = tuple[str, str]
+"""``(conversation_id, message_id)`` of one indexed message."""
+
+
+def _message_at(value: object) -> datetime:
+    """A message's ISO ``date`` as an aware datetime (now when absent or unparseable)."""
+    if isinstance(value, str):
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return datetime.now(UTC)
+        return parsed if parsed.tzinfo is not None else parsed.replace(tzinfo=UTC)
+    return datetime.now(UTC)
+
+
+def entry_rows(
+    user_id: str, conversation_id: str, messages: Sequence[Mapping[str, object]]
+) -> list[dict[str, object]]:
+    """Index rows for stored message documents; messages without text are skipped."""
+    return [
+        {
+            "conversation_id": conversation_id,
+            "message_id": str(message["message_id"]),
+            "user_id": user_id,
+            "response": message["response"],
+            "message_at": _message_at(message.get("date")),
+        }
+        for message in messages
+        if message.get("message_id")
+        and isinstance(message.get("response"), str)
+        and message["response"]
+    ]
+
+
+async def upsert_entries(rows: Sequence[Mapping[str, object]]) -> None:
+    """Insert index rows, overwriting the text of rows already present."""
+    if not rows:
+        return
+    statement = pg_insert(MessageSearchEntry).values(list(rows))
+    statement = statement.on_conflict_do_update(
+        index_elements=[MessageSearchEntry.conversation_id, MessageSearchEntry.message_id],
+        set_={"response": statement.excluded.response},
+    )
+    async with get_db_session() as session:
+        await session.execute(statement)
+        await session.commit()
+
+
+async def index_messages(
+    user_id: str, conversation_id: str, messages: Sequence[Mapping[str, object]]
+) -> None:
+    """Index freshly appended messages. Fails open."""
+    try:
+        await upsert_entries(entry_rows(user_id, conversation_id, messages))
+    except Exception as exc:
+        log.warning(
+            "message_search.index_failed",
+            conversation_id=conversation_id,
+            error=str(exc)[:200],
+        )
+
+
+async def set_response(user_id: str, conversation_id: str, message_id: str, response: str) -> None:
+    """Re-index one message whose response text changed. Fails open."""
+    rows = entry_rows(user_id, conversation_id, [{"message_id": message_id, "response": response}])
+    try:
+        if rows:
+            await upsert_entries(rows)
+        else:
+            await _delete(
+                MessageSearchEntry.conversation_id == conversation_id,
+                MessageSearchEntry.message_id == message_id,
+            )
+    except Exception as exc:
+        log.warning(
+            "message_search.index_failed",
+            conversation_id=conversation_id,
+            error=str(exc)[:200],
+        )
+
+
+async def delete_conversations(user_id: str, conversation_ids: Sequence[str] | None = None) -> None:
+    """Drop the index rows of deleted conversations (all of the user's when
+    ``conversation_ids`` is None). Fails open."""
+    if conversation_ids is not None and not conversation_ids:
+        return
+    criteria = [MessageSearchEntry.user_id == user_id]
+    if conversation_ids is not None:
+        criteria.append(MessageSearchEntry.conversation_id.in_(list(conversation_ids)))
+    try:
+        await _delete(*criteria)
+    except Exception as exc:
+        log.warning("message_search.delete_failed", user_id=user_id, error=str(exc)[:200])
+
+
+async def prune_conversation(
+    user_id: str, conversation_id: str, kept_message_ids: Sequence[str]
+) -> None:
+    """Drop the rows of a conversation's messages that are no longer stored
+    (trimmed off by a capped append). Fails open."""
+    try:
+        await _delete(
+            MessageSearchEntry.user_id == user_id,
+            MessageSearchEntry.conversation_id == conversation_id,
+            MessageSearchEntry.message_id.not_in(list(kept_message_ids)),
+        )
+    except Exception as exc:
+        log.warning(
+            "message_search.delete_failed",
+            conversation_id=conversation_id,
+            error=str(exc)[:200],
+        )
+
+
+async def delete_refs(user_id: str, refs: Sequence[MessageRef]) -> None:
+    """Drop the rows of messages a search found gone from Mongo. Fails open."""
+    if not refs:
+        return
+    try:
+        await _delete(
+            MessageSearchEntry.user_id == user_id,
+            tuple_(MessageSearchEntry.conversation_id, MessageSearchEntry.message_id).in_(
+                list(refs)
+            ),
+        )
+    except Exception as exc:
+        log.warning("message_search.delete_failed", user_id=user_id, error=str(exc)[:200])
+
+
+async def search(user_id: str, query: str, *, limit: int, skip: int = 0) -> list[MessageRef]:
+    """One page of the user's messages containing ``query`` (case-insensitive,
+    taken literally), newest first."""
+    statement = (
+        select(MessageSearchEntry.conversation_id, MessageSearchEntry.message_id)
+        .where(
+            MessageSearchEntry.user_id == user_id,
+            MessageSearchEntry.response.icontains(query, autoescape=True),
+        )
+        .order_by(MessageSearchEntry.message_at.desc(), MessageSearchEntry.message_id.desc())
+        .limit(limit)
+        .offset(skip)
+    )
+    async with get_db_session() as session:
+        result = await session.execute(statement)
+        return [(row.conversation_id, row.message_id) for row in result]
+
+
+async def _delete(*criteria: ColumnElement[bool]) -> None:
+    async with get_db_session() as session:
+        await session.execute(delete(MessageSearchEntry).where(*criteria))
+        await session.commit()
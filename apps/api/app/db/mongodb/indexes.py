@@ -181,8 +181,11 @@ async def create_conversation_indexes() -> None:
             ),
             # For message pinning operations (nested array queries)
             conversations_collection.create_index([("user_id", 1), ("messages.message_id", 1)]),
-            # For message pinning aggregations
+            # For the pinned-messages view on the per-message flags; drop once
+            # PINNED_MESSAGE_IDS is on everywhere
             conversations_collection.create_index([("user_id", 1), ("messages.pinned", 1)]),
+            # For the pinned-messages view (materialized pinned_message_ids)
+            conversations_collection.create_index([("user_id", 1), ("pinned_message_ids", 1)]),
         )
 
     except Exception as e:
@@ -22,6 +22,10 @@ from shared.py.wide_events import log
 # Create a SQLAlchemy base class for declarative models
 Base = declarative_base()
 
+# Extensions the models depend on (pg_trgm: the message_search trigram index).
+# Created before create_all, which would otherwise fail on the operator class.
+_EXTENSIONS: tuple[str, ...] = ("pg_trgm",)
+
 # Datetime columns that must store tz-aware instants (timestamptz). The schema
 # is bootstrapped with create_all, which only CREATEs missing tables and never
 # ALTERs existing ones, so legacy tables still hold naive timestamp columns —
@@ -131,6 +135,8 @@ async def init_postgresql_engine() -> AsyncEngine:
     )
 
     async with engine.begin() as conn:
+        for extension in _EXTENSIONS:
+            await conn.execute(text(f"CREATE EXTENSION IF NOT EXISTS {extension}"))
         await conn.run_sync(Base.metadata.create_all)
         await conn.run_sync(_ensure_timestamptz_columns)
 
@@ -150,6 +150,8 @@ class AsyncRedisCommands(Protocol):
 
     async def getdel(self, name: str) -> str | None: ...
 
+    async def mget(self, keys: list[str]) -> list[str | None]: ...
+
     async def delete(self, *names: str) -> int: ...
 
     async def exists(self, *names: str) -> int: ...
@@ -172,6 +174,8 @@ class AsyncRedisCommands(Protocol):
 
     async def hgetall(self, name: str) -> dict[str, str]: ...
 
+    async def hmget(self, name: str, keys: list[str]) -> list[str | None]: ...
+
     async def publish(self, channel: str, message: str) -> int: ...
 
     async def xadd(
@@ -191,6 +195,45 @@ class AsyncRedisCommands(Protocol):
         block: int | None = None,
     ) -> list[tuple[str, list[tuple[str, dict[str, str]]]]]: ...
 
+    async def xgroup_create(
+        self, name: str, groupname: str, id: str = "$", mkstream: bool = False
+    ) -> bool: ...
+
+    async def xreadgroup(
+        self,
+        groupname: str,
+        consumername: str,
+        streams: Mapping[str, str],
+        count: int | None = None,
+        block: int | None = None,
+    ) -> list[tuple[str, list[tuple[str, dict[str, str]]]]]: ...
+
+    async def xack(self, name: str, groupname: str, *ids: str) -> int: ...
+
+    # One dict per pending entry: message_id, consumer, time_since_delivered,
+    # times_delivered.
+    async def xpending_range(
+        self,
+        name: str,
+        groupname: str,
+        min: str,
+        max: str,
+        count: int,
+        consumername: str | None = None,
+        idle: int | None = None,
+    ) -> list[dict[str, Any]]: ...
+
+    # Entries trimmed from the stream since their delivery come back with None
+    # fields (Redis < 7) or not at all.
+    async def xclaim(
+        self,
+        name: str,
+        groupname: str,
+        consumername: str,
+        min_idle_time: int,
+        message_ids: list[str],
+    ) -> list[tuple[str, dict[str, str] | None]]: ...
+
     # Lua's return type is whatever the script yields — genuinely dynamic, so the
     # caller narrows it (the one call site coerces to bool).
     async def eval(self, script: str, numkeys: int, *keys_and_args: str) -> Any: ...
@@ -15,15 +15,27 @@ later needs no call-site changes.
 ``$currentDate``) are the legacy camelCase timestamp pair; the base's snake_case
 auto-stamp does not apply, so each mutating method that must advance the sync
 clock bumps ``updatedAt`` explicitly.
+
+Pinned messages are materialized as ``pinned_message_ids`` on the conversation,
+maintained by ``set_message_pinned`` in the same update as the message's own
+``pinned`` flag. With ``PINNED_MESSAGE_IDS_ENABLED`` the pinned view reads only
+the conversations holding a pin; until then it still matches the flags.
+
+Message text is mirrored into the Postgres keyword index (``app.db.message_search``)
+by ``append_messages``, ``set_message_response`` and the conversation deletes;
+``search_indexed`` reads it.
 """
 
 from __future__ import annotations
 
-from collections.abc import Mapping, Sequence
+import asyncio
+from collections.abc import Collection, Mapping, Sequence
 from datetime import datetime
 
 from bson import ObjectId
 
+from app.constants.chat import PINNED_MESSAGE_IDS_ENABLED
+from app.db import message_search
 from app.db.repositories.base import UserScopedRepository
 from app.models.chat_models import (
     BOT_CONVERSATION_SOURCES,
@@ -34,6 +46,7 @@ from app.models.chat_models import (
     ToolDataEntry,
 )
 from app.models.conversation_models import (
+    ConversationDescriptionHit,
     ConversationDocument,
     ConversationMessageHit,
     ConversationSearchResults,
@@ -41,6 +54,7 @@ from app.models.conversation_models import (
     ConversationUpdate,
     OnboardingProbe,
     _ConversationIdRow,
+    _MessageIdsRow,
     _MessageProjectionRow,
     _OnboardingProbeRow,
     _SourceRow,
@@ -63,6 +77,13 @@ _SUMMARY_PROJECTION: dict[str, object] = {
 }
 
 
+def _page(limit: int, skip: int) -> list[dict[str, object]]:
+    """``$skip``/``$limit`` stages for one page (``limit=0``: no paging)."""
+    if limit <= 0:
+        return []
+    return [{"$skip": skip}, {"$limit": limit}]
+
+
 class ConversationRepository(UserScopedRepository[ConversationDocument, ConversationUpdate]):
     """The ``conversations`` collection repository (the chat hot path).
 
@@ -216,7 +237,8 @@ class ConversationRepository(UserScopedRepository[ConversationDocument, Conversa
     ) -> list[str] | None:
         """Append messages to a conversation, returning their ids (``None`` if the
         conversation does not exist). ``max_messages`` caps stored history via a
-        negative ``$slice`` so per-workflow threads stay under the 16MB limit."""
+        negative ``$slice`` so per-workflow threads stay under the 16MB limit; the
+        index rows of messages trimmed that way are dropped with them."""
         docs: list[dict[str, object]] = []
         message_ids: list[str] = []
         for message in messages:
@@ -238,15 +260,35 @@ class ConversationRepository(UserScopedRepository[ConversationDocument, Conversa
             doc_id=conversation_id,
             extra_filter={"user_id": user_id},
         )
-        return message_ids if matched > 0 else None
+        if matched == 0:
+            return None
+        await message_search.index_messages(user_id, conversation_id, docs)
+        if max_messages is not None:
+            kept = await self._find_one_projected(
+                {"conversation_id": conversation_id, "user_id": user_id},
+                {"_id": 0, "messages.message_id": 1},
+                _MessageIdsRow,
+            )
+            if kept is not None:
+                await message_search.prune_conversation(
+                    user_id,
+                    conversation_id,
+                    [m.message_id for m in kept.messages if m.message_id],
+                )
+        return message_ids
 
     async def set_message_pinned(
         self, conversation_id: str, *, user_id: str, message_id: str, pinned: bool
     ) -> bool:
-        """Set one message's pinned flag (positional update into the messages array)."""
+        """Set one message's pinned flag (positional update into the messages array)
+        and add/remove its id in the conversation's ``pinned_message_ids``."""
         matched = await self._apply_raw_update_unfetched(
             {"conversation_id": conversation_id, "messages.message_id": message_id},
-            {"$set": {"messages.$.pinned": pinned}, "$currentDate": {"updatedAt": True}},
+            {
+                "$set": {"messages.$.pinned": pinned},
+                ("$addToSet" if pinned else "$pull"): {"pinned_message_ids": message_id},
+                "$currentDate": {"updatedAt": True},
+            },
             scope=user_id,
             doc_id=conversation_id,
             extra_filter={"user_id": user_id},
@@ -333,7 +375,10 @@ class ConversationRepository(UserScopedRepository[ConversationDocument, Conversa
             doc_id=conversation_id,
             extra_filter={"user_id": user_id},
         )
-        return matched > 0
+        if matched == 0:
+            return False
+        await message_search.set_response(user_id, conversation_id, message_id, response)
+        return True
 
     async def set_message_tool_data(
         self, conversation_id: str, *, user_id: str, message_id: str, entries: list[ToolDataEntry]
@@ -494,20 +539,52 @@ class ConversationRepository(UserScopedRepository[ConversationDocument, Conversa
     # ---- search / pinned aggregations ----
 
     async def list_pinned_messages(self, user_id: str) -> list[ConversationMessageHit]:
-        """Every pinned message across the user's conversations."""
+        """Every pinned message across the user's conversations.
+
+        With ``PINNED_MESSAGE_IDS_ENABLED``, served by ``pinned_message_ids``:
+        only conversations holding a pin are read, and only their pinned
+        messages are unwound. Otherwise every message is matched on its own
+        ``pinned`` flag, which pins made before the array existed still carry."""
+        if not PINNED_MESSAGE_IDS_ENABLED:
+            return await self._aggregate(
+                [
+                    {"$match": {"user_id": user_id, "messages.pinned": True}},
+                    {"$unwind": "$messages"},
+                    {"$match": {"messages.pinned": True}},
+                    {"$project": {"_id": 0, "conversation_id": 1, "message": "$messages"}},
+                ],
+                ConversationMessageHit,
+            )
         return await self._aggregate(
             [
-                {"$match": {"user_id": user_id}},
+                # ``$type`` (unlike ``$ne: []``) is answered from the multikey
+                # (user_id, pinned_message_ids) index: docs with at least one id.
+                {"$match": {"user_id": user_id, "pinned_message_ids": {"$type": "string"}}},
+                {
+                    "$project": {
+                        "_id": 0,
+                        "conversation_id": 1,
+                        "messages": {
+                            "$filter": {
+                                "input": "$messages",
+                                "as": "message",
+                                "cond": {"$in": ["$$message.message_id", "$pinned_message_ids"]},
+                            }
+                        },
+                    }
+                },
                 {"$unwind": "$messages"},
-                {"$match": {"messages.pinned": True}},
-                {"$project": {"_id": 0, "conversation_id": 1, "message": "$messages"}},
+                {"$project": {"conversation_id": 1, "message": "$messages"}},
             ],
             ConversationMessageHit,
         )
 
-    async def search(self, user_id: str, *, pattern: str) -> ConversationSearchResults:
+    async def search(
+        self, user_id: str, *, pattern: str, limit: int = 0, skip: int = 0
+    ) -> ConversationSearchResults:
         """Regex search across message responses and conversation descriptions.
-        ``pattern`` is treated as a literal — the caller passes an escaped query."""
+        ``pattern`` is treated as a literal — the caller passes an escaped query.
+        ``limit``/``skip`` page each facet independently (``limit=0``: all)."""
         rows = await self._aggregate(
             [
                 {"$match": {"user_id": user_id}},
@@ -516,10 +593,12 @@ class ConversationRepository(UserScopedRepository[ConversationDocument, Conversa
                         "messages": [
                             {"$unwind": "$messages"},
                             {"$match": {"messages.response": {"$regex": pattern, "$options": "i"}}},
+                            *_page(limit, skip),
                             {"$project": {"_id": 0, "conversation_id": 1, "message": "$messages"}},
                         ],
                         "conversations": [
                             {"$match": {"description": {"$regex": pattern, "$options": "i"}}},
+                            *_page(limit, skip),
                             {"$project": {"_id": 0, "conversation_id": 1, "description": 1}},
                         ],
                     }
@@ -529,26 +608,76 @@ class ConversationRepository(UserScopedRepository[ConversationDocument, Conversa
         )
         return rows[0] if rows else ConversationSearchResults()
 
+    async def search_indexed(
+        self, user_id: str, *, query: str, pattern: str, limit: int, skip: int = 0
+    ) -> ConversationSearchResults:
+        """``search`` with message hits served by the Postgres keyword index.
+
+        The index pages the matching message ids (``query`` taken literally,
+        newest first); only those messages are read back from Mongo. A hit whose
+        message is gone is dropped from the page and its index row deleted;
+        ``matched_messages`` still counts it, so paging stays honest. Descriptions
+        are one short field per conversation and stay a Mongo regex (``pattern``)."""
+        refs, descriptions = await asyncio.gather(
+            message_search.search(user_id, query, limit=limit, skip=skip),
+            self._aggregate(
+                [
+                    {
+                        "$match": {
+                            "user_id": user_id,
+                            "description": {"$regex": pattern, "$options": "i"},
+                        }
+                    },
+                    *_page(limit, skip),
+                    {"$project": {"_id": 0, "conversation_id": 1, "description": 1}},
+                ],
+                ConversationDescriptionHit,
+            ),
+        )
+        messages = await self._messages_by_ref(user_id, refs)
+        if len(messages) < len(refs):
+            found = {(hit.conversation_id, hit.message.message_id) for hit in messages}
+            await message_search.delete_refs(user_id, [ref for ref in refs if ref not in found])
+        return ConversationSearchResults(
+            messages=messages, conversations=descriptions, matched_messages=len(refs)
+        )
+
     # ---- bulk deletes / maintenance sweeps ----
 
+    async def delete(self, doc_id: str, *, user_id: str) -> bool:
+        deleted = await super().delete(doc_id, user_id=user_id)
+        if deleted:
+            await message_search.delete_conversations(user_id, [doc_id])
+        return deleted
+
     async def delete_all_for_user(self, user_id: str) -> list[str]:
         """Delete every conversation for a user, returning the deleted ids so the
         caller can clean up their (non-user-scoped) checkpoint threads."""
         ids = await self._distinct("conversation_id", {"user_id": user_id})
         await self._delete_many({"user_id": user_id}, scope=user_id)
+        await message_search.delete_conversations(user_id)
         return ids
 
     async def delete_onboarding_demos(self, user_id: str) -> int:
         """Delete the user's onboarding-demo conversations."""
-        return await self._delete_many(
-            {"user_id": user_id, "is_onboarding_demo": True}, scope=user_id
+        filter_ = {"user_id": user_id, "is_onboarding_demo": True}
+        ids = await self._distinct("conversation_id", filter_)
+        deleted = await self._delete_many(filter_, scope=user_id)
+        await message_search.delete_conversations(user_id, ids)
+        return deleted
+
+    async def existing_conversation_ids(self, conversation_ids: Collection[str]) -> set[str]:
+        """The subset of ``conversation_ids`` that still exist, across all users —
+        the checkpoint orphan sweep's per-batch source of truth. Intentionally
+        unscoped (a maintenance sweep)."""
+        if not conversation_ids:
+            return set()
+        return set(
+            await self._distinct(
+                "conversation_id", {"conversation_id": {"$in": list(conversation_ids)}}
+            )
         )
 
-    async def all_conversation_ids(self) -> list[str]:
-        """Every live conversation id across all users — the checkpoint orphan
-        sweep's source of truth. Intentionally unscoped (a maintenance sweep)."""
-        return await self._distinct("conversation_id")
-
     async def active_user_ids_since(self, cutoff: datetime) -> list[str]:
         """User ids with a conversation updated since ``cutoff`` — the workspace
         sync sweep's active-user set. Intentionally unscoped (a maintenance sweep)."""
@@ -556,6 +685,29 @@ class ConversationRepository(UserScopedRepository[ConversationDocument, Conversa
 
     # ---- internal helpers ----
 
+    async def _messages_by_ref(
+        self, user_id: str, refs: Sequence[message_search.MessageRef]
+    ) -> list[ConversationMessageHit]:
+        """The messages behind index hits, in ``refs`` order; missing ones dropped."""
+        if not refs:
+            return []
+        hits = await self._aggregate(
+            [
+                {
+                    "$match": {
+                        "user_id": user_id,
+                        "conversation_id": {"$in": list({ref[0] for ref in refs})},
+                    }
+                },
+                {"$unwind": "$messages"},
+                {"$match": {"messages.message_id": {"$in": [ref[1] for ref in refs]}}},
+                {"$project": {"_id": 0, "conversation_id": 1, "message": "$messages"}},
+            ],
+            ConversationMessageHit,
+        )
+        by_ref = {(hit.conversation_id, hit.message.message_id): hit for hit in hits}
+        return [by_ref[ref] for ref in refs if ref in by_ref]
+
     def _non_bot(self) -> dict[str, object]:
         return {"source": {"$nin": _BOT_SOURCE_VALUES}}
 
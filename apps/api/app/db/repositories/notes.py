@@ -26,11 +26,16 @@ class NotesRepository(UserScopedRepository[NoteDocument, NoteUpdate]):
             {"_id": {"$in": [self._id_value(nid) for nid in note_ids]}, "user_id": user_id}
         )
 
-    async def search_by_plaintext(self, user_id: str, *, pattern: str) -> list[NoteSearchHit]:
-        """Notes whose plaintext matches a regex ``pattern`` (caller escapes it)."""
+    async def search_by_plaintext(
+        self, user_id: str, *, pattern: str, limit: int = 0, skip: int = 0
+    ) -> list[NoteSearchHit]:
+        """Notes whose plaintext matches a regex ``pattern`` (caller escapes it),
+        optionally one ``limit``/``skip`` page of them."""
+        page: list[dict[str, object]] = [{"$skip": skip}, {"$limit": limit}] if limit > 0 else []
         return await self._aggregate(
             [
                 {"$match": {"user_id": user_id, "plaintext": {"$regex": pattern, "$options": "i"}}},
+                *page,
                 {"$project": {"_id": 0, "id": {"$toString": "$_id"}, "note_id": 1, "plaintext": 1}},
             ],
             NoteSearchHit,
@@ -0,0 +1,191 @@
+"""Process-local routing table: Composio trigger id -> the active workflows on it.
+
+Every trigger webhook resolves its workflows through
+``WorkflowsRepository.find_active_by_composio_trigger`` — one Mongo query per
+event per handler, for an answer that only changes when a workflow is
+activated, paused, re-pointed or deleted. ``routing_table`` keeps that answer
+in memory per trigger id, empty answers included; a handler's ``trigger_name``
+narrowing is applied to the cached set.
+
+Freshness:
+
+- The repository's routing writes call ``publish_invalidation`` with the
+  workflow ids they touched and the trigger ids those now route from. The local
+  entries go at once; every other process drops its own on the
+  ``WORKFLOW_ROUTING_CHANNEL`` message. A workflow id drops every entry the
+  workflow is cached under, so a pause — which clears its trigger ids — still
+  evicts it.
+- A lookup that raced an invalidation does not store its result (``epoch``).
+- The table answers only while this process's listener
+  (``app.core.workflow_routing_listener``) is subscribed; until then every
+  lookup goes to Mongo. Pub/sub has no replay, so each (re)subscribe clears the
+  table and re-warms it, and entries expire after
+  ``WORKFLOW_ROUTING_TTL_SECONDS``.
+
+A stale entry that still names a paused workflow is harmless — the execution
+claim rejects a fire for a workflow that is no longer ``activated``.
+
+Prometheus: ``workflow_routing_lookups_total`` (Counter, label ``outcome``:
+``hit`` | ``miss`` | ``bypass``) and ``workflow_routing_invalidations_total``.
+"""
+
+from collections import OrderedDict
+from collections.abc import Iterable, Mapping, Sequence
+import json
+import time
+
+from prometheus_client import Counter
+
+from app.constants.cache import (
+    WORKFLOW_ROUTING_CHANNEL,
+    WORKFLOW_ROUTING_MAX_TRIGGERS,
+    WORKFLOW_ROUTING_TTL_SECONDS,
+)
+from app.constants.log_tags import LogTag
+from app.db.redis import redis_cache
+from app.models.workflow_models import WorkflowDocument
+from app.services.storage.metrics import _register_once
+from shared.py.wide_events import log
+
+WORKFLOW_ROUTING_LOOKUPS_TOTAL = _register_once(
+    "workflow_routing_lookups_total",
+    lambda: Counter(
+        name="workflow_routing_lookups_total",
+        documentation="Trigger-id workflow lookups, by whether the routing table answered",
+        labelnames=("outcome",),
+    ),
+)
+WORKFLOW_ROUTING_INVALIDATIONS_TOTAL = _register_once(
+    "workflow_routing_invalidations_total",
+    lambda: Counter(
+        name="workflow_routing_invalidations_total",
+        documentation="Routing-table invalidations applied in this process",
+    ),
+)
+
+
+class _Route:
+    __slots__ = ("expires_at", "workflows")
+
+    def __init__(self, workflows: list[WorkflowDocument], expires_at: float) -> None:
+        self.workflows = workflows
+        self.expires_at = expires_at
+
+
+class WorkflowRoutingTable:
+    """LRU of trigger id -> active workflows, evictable by trigger or workflow id."""
+
+    def __init__(
+        self,
+        max_size: int = WORKFLOW_ROUTING_MAX_TRIGGERS,
+        ttl: float = WORKFLOW_ROUTING_TTL_SECONDS,
+    ) -> None:
+        self._max_size = max_size
+        self._ttl = ttl
+        self._routes: OrderedDict[str, _Route] = OrderedDict()
+        self._triggers_by_workflow: dict[str, set[str]] = {}
+        self._epoch = 0
+        # Set by the listener while subscribed; a table nobody invalidates
+        # must not answer.
+        self.live = False
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    @property
+    def epoch(self) -> int:
+        """Bumped by every invalidation. Read it before a lookup and hand it to
+        ``put_many``, which drops the result if an invalidation landed since."""
+        return self._epoch
+
+    def get_many(
+        self, trigger_ids: Sequence[str]
+    ) -> tuple[dict[str, list[WorkflowDocument]], list[str]]:
+        """The cached routes among ``trigger_ids``, and the ids still to look up."""
+        if not self.live:
+            WORKFLOW_ROUTING_LOOKUPS_TOTAL.labels(outcome="bypass").inc(len(trigger_ids))
+            return {}, list(trigger_ids)
+        found: dict[str, list[WorkflowDocument]] = {}
+        missing: list[str] = []
+        now = time.monotonic()
+        for trigger_id in trigger_ids:
+            route = self._routes.get(trigger_id)
+            if route is not None and route.expires_at > now:
+                self._routes.move_to_end(trigger_id)
+                found[trigger_id] = route.workflows
+                continue
+            if route is not None:
+                self._drop(trigger_id)
+            missing.append(trigger_id)
+        if found:
+            WORKFLOW_ROUTING_LOOKUPS_TOTAL.labels(outcome="hit").inc(len(found))
+        if missing:
+            WORKFLOW_ROUTING_LOOKUPS_TOTAL.labels(outcome="miss").inc(len(missing))
+        return found, missing
+
+    def put_many(self, routes: Mapping[str, list[WorkflowDocument]], epoch: int) -> None:
+        """Store looked-up routes, unless the table was invalidated since ``epoch``."""
+        if not self.live or epoch != self._epoch:
+            return
+        expires_at = time.monotonic() + self._ttl
+        for trigger_id, workflows in routes.items():
+            self._drop(trigger_id)
+            self._routes[trigger_id] = _Route(workflows, expires_at)
+            for workflow in workflows:
+                self._triggers_by_workflow.setdefault(workflow.id, set()).add(trigger_id)
+        while len(self._routes) > self._max_size:
+            self._drop(next(iter(self._routes)))
+
+    def invalidate(self, workflow_ids: Iterable[str] = (), trigger_ids: Iterable[str] = ()) -> None:
+        """Drop the routes of these triggers and every route naming these workflows."""
+        self._epoch += 1
+        doomed = set(trigger_ids)
+        for workflow_id in workflow_ids:
+            doomed |= self._triggers_by_workflow.pop(workflow_id, set())
+        for trigger_id in doomed:
+            self._drop(trigger_id)
+        WORKFLOW_ROUTING_INVALIDATIONS_TOTAL.inc()
+
+    def clear(self) -> None:
+        self._epoch += 1
+        self._routes.clear()
+        self._triggers_by_workflow.clear()
+
+    def _drop(self, trigger_id: str) -> None:
+        route = self._routes.pop(trigger_id, None)
+        if route is None:
+            return
+        for workflow in route.workflows:
+            triggers = self._triggers_by_workflow.get(workflow.id)
+            if triggers is not None:
+                triggers.discard(trigger_id)
+                if not triggers:
+                    del self._triggers_by_workflow[workflow.id]
+
+
+routing_table = WorkflowRoutingTable()
+
+
+async def publish_invalidation(
+    *, workflow_ids: Iterable[str] = (), trigger_ids: Iterable[str] = ()
+) -> None:
+    """Drop these routes here and in every subscribed process."""
+    workflows = sorted(set(workflow_ids))
+    triggers = sorted(set(trigger_ids))
+    if not workflows and not triggers:
+        return
+    routing_table.invalidate(workflows, triggers)
+    client = redis_cache.redis
+    if client is None:
+        return
+    try:
+        await client.publish(
+            WORKFLOW_ROUTING_CHANNEL, json.dumps({"workflows": workflows, "triggers": triggers})
+        )
+    except Exception as e:
+        # Other processes keep the entry until its TTL runs out.
+        log.warning(
+            f"{LogTag.WORKFLOW} Workflow routing invalidation publish failed",
+            error=str(e),
+            error_type=type(e).__name__,
+        )
@@ -18,14 +18,22 @@ claim, re-arm, execution-count ``$inc``), so an entity/generation cache would
 churn its generation constantly for little read benefit, and the cross-user
 scan/routing reads are not keyed by id. Matches the ``workflow_executions``
 repository. Revisit only with evidence of a hot by-id read path.
+
+Webhook routing by Composio trigger id has its own process-local table instead
+(``app.db.repositories.workflow_routing``): every write that can change which
+workflows a trigger id routes to publishes an invalidation for it.
 """
 
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from datetime import UTC, datetime
 import re
 from typing import Any
 
-from app.constants.cache import REPO_GLOBAL_SCOPE
+from app.constants.cache import REPO_GLOBAL_SCOPE, WORKFLOW_ROUTING_MAX_TRIGGERS
 from app.db.repositories.base import MongoRepository
+from app.db.repositories.workflow_routing import publish_invalidation, routing_table
 from app.models.scheduler_models import ScheduledTaskStatus
 from app.models.workflow_models import (
     DeactivationReason,
@@ -61,6 +69,21 @@ _COMMUNITY_MATCH: dict[str, Any] = {
     "$or": [{"is_explore": {"$exists": False}}, {"is_explore": False}],
 }
 
+# The workflows a Composio trigger id routes to — activated, enabled integration
+# workflows. Narrowed by ``composio_trigger_ids`` at each call site.
+_COMPOSIO_ROUTABLE: dict[str, Any] = {
+    "activated": True,
+    "trigger_config.type": TriggerType.INTEGRATION.value,
+    "trigger_config.enabled": True,
+}
+
+
+# Workflows prefetched for a batch of webhook events, keyed by Composio trigger
+# id (see ``composio_trigger_batch``). Unset outside a batch.
+_composio_trigger_batch: ContextVar[Mapping[str, list[WorkflowDocument]] | None] = ContextVar(
+    "composio_trigger_batch", default=None
+)
+
 
 class _Unset:
     """Sentinel for a ``set_status`` field that was not provided — distinct from an
@@ -189,16 +212,80 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
         """Activated integration workflows registered under a Composio ``trigger_id`` —
         the fan-out target when a webhook arrives for that id. ``trigger_name`` narrows
         to a single trigger slug for the caller that must disambiguate (Gmail's poll
-        path, where account-level and poll workflows share the handler)."""
-        query: dict[str, Any] = {
-            "activated": True,
-            "trigger_config.type": TriggerType.INTEGRATION.value,
-            "trigger_config.enabled": True,
-            "trigger_config.composio_trigger_ids": trigger_id,
+        path, where account-level and poll workflows share the handler).
+
+        Inside ``composio_trigger_batch`` a prefetched id is answered from the batch;
+        otherwise from the routing table when it holds the id, else from Mongo."""
+        batch = _composio_trigger_batch.get()
+        if batch is not None and trigger_id in batch:
+            workflows = batch[trigger_id]
+        else:
+            workflows = (await self.find_active_by_composio_triggers([trigger_id]))[trigger_id]
+        return [
+            workflow
+            for workflow in workflows
+            if trigger_name is None or workflow.trigger_config.trigger_name == trigger_name
+        ]
+
+    async def find_active_by_composio_triggers(
+        self, trigger_ids: Sequence[str]
+    ) -> dict[str, list[WorkflowDocument]]:
+        """``find_active_by_composio_trigger`` for many ids, keyed by id (every
+        requested id present, empty when nothing matched). Ids the routing table
+        holds cost nothing; the rest share one query and are stored back."""
+        routes, missing = routing_table.get_many(list(dict.fromkeys(trigger_ids)))
+        if not missing:
+            return routes
+        epoch = routing_table.epoch
+        fetched = self._group_by_trigger(
+            await self._find(
+                {**_COMPOSIO_ROUTABLE, "trigger_config.composio_trigger_ids": {"$in": missing}}
+            ),
+            missing,
+        )
+        routing_table.put_many(fetched, epoch)
+        return {**routes, **fetched}
+
+    async def warm_composio_routes(self) -> int:
+        """Load the routes of every routable workflow into the routing table — run
+        by its listener after each (re)subscribe. Returns the trigger ids loaded."""
+        epoch = routing_table.epoch
+        workflows = await self._find(
+            {**_COMPOSIO_ROUTABLE, "trigger_config.composio_trigger_ids.0": {"$exists": True}},
+            limit=WORKFLOW_ROUTING_MAX_TRIGGERS,
+        )
+        trigger_ids = {
+            trigger_id
+            for workflow in workflows
+            for trigger_id in workflow.trigger_config.composio_trigger_ids or []
         }
-        if trigger_name is not None:
-            query["trigger_config.trigger_name"] = trigger_name
-        return await self._find(query)
+        routing_table.put_many(self._group_by_trigger(workflows, trigger_ids), epoch)
+        return len(trigger_ids)
+
+    @staticmethod
+    def _group_by_trigger(
+        workflows: list[WorkflowDocument], trigger_ids: Iterable[str]
+    ) -> dict[str, list[WorkflowDocument]]:
+        by_trigger: dict[str, list[WorkflowDocument]] = {tid: [] for tid in trigger_ids}
+        for workflow in workflows:
+            for trigger_id in workflow.trigger_config.composio_trigger_ids or []:
+                if trigger_id in by_trigger:
+                    by_trigger[trigger_id].append(workflow)
+        return by_trigger
+
+    @contextmanager
+    def composio_trigger_batch(
+        self, prefetched: Mapping[str, list[WorkflowDocument]]
+    ) -> Iterator[None]:
+        """Serve ``find_active_by_composio_trigger`` from ``prefetched`` (the result
+        of ``find_active_by_composio_triggers``) within this context — and in tasks
+        created inside it, which copy the context. Lets a batch of webhook events
+        share one lookup while each handler still filters on its own payload."""
+        token = _composio_trigger_batch.set(prefetched)
+        try:
+            yield
+        finally:
+            _composio_trigger_batch.reset(token)
 
     async def find_activated_for_user(self, user_id: str) -> list[WorkflowDocument]:
         """Every activated workflow a user owns — the dormancy sweep's pause set."""
@@ -359,14 +446,32 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
 
     # ----------------------------------------------------------------- writes
 
+    async def create(self, doc: WorkflowDocument) -> WorkflowDocument:
+        created = await super().create(doc)
+        await self._rerouted(created)
+        return created
+
+    async def _rerouted(self, workflow: WorkflowDocument | None) -> WorkflowDocument | None:
+        """Invalidate the routes of a workflow a write just returned — wherever it
+        was routed from, and the trigger ids it routes from now. Returns it."""
+        if workflow is not None:
+            await publish_invalidation(
+                workflow_ids=[workflow.id],
+                trigger_ids=workflow.trigger_config.composio_trigger_ids or [],
+            )
+        return workflow
+
     async def update_for_user(
         self, workflow_id: str, user_id: str, update: WorkflowUpdate
     ) -> WorkflowDocument | None:
         """Apply a flat ``$set`` update to the user's workflow. Returns the after
         state, or ``None`` when no matching workflow exists."""
-        return await self._apply_update(
+        updated = await self._apply_update(
             workflow_id, REPO_GLOBAL_SCOPE, {"user_id": user_id}, update
         )
+        if update.model_fields_set & {"activated", "trigger_config"}:
+            await self._rerouted(updated)
+        return updated
 
     async def touch(self, workflow_id: str, user_id: str) -> WorkflowDocument | None:
         """Bump only ``updated_at`` on the user's workflow (execute/generation
@@ -383,9 +488,10 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
         ops: dict[str, dict[str, Any]] = {}
         if deactivate:
             ops["$set"] = {"activated": False}
-        return await self._apply_raw_update(
+        updated = await self._apply_raw_update(
             {"_id": workflow_id, "user_id": user_id}, ops, scope=REPO_GLOBAL_SCOPE
         )
+        return await self._rerouted(updated) if deactivate else updated
 
     async def set_error_message(
         self, workflow_id: str, user_id: str, message: str
@@ -415,11 +521,12 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
         if deactivate:
             set_fields["activated"] = False
             set_fields["trigger_config.enabled"] = False
-        return await self._apply_raw_update(
+        updated = await self._apply_raw_update(
             {"_id": workflow_id, "user_id": user_id},
             {"$set": set_fields},
             scope=REPO_GLOBAL_SCOPE,
         )
+        return await self._rerouted(updated) if deactivate else updated
 
     async def record_execution(
         self, workflow_id: str, user_id: str, *, successful: bool = False
@@ -447,7 +554,7 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
         """Activate the user's workflow: set liveness (``activated``) and re-arm its
         run-state to idle (``status="scheduled"``) with a freshly recomputed run
         time. Returns the after state, or ``None`` when not found."""
-        return await self._apply_raw_update(
+        updated = await self._apply_raw_update(
             {"_id": workflow_id, "user_id": user_id},
             {
                 "$set": {
@@ -462,6 +569,7 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
             },
             scope=REPO_GLOBAL_SCOPE,
         )
+        return await self._rerouted(updated)
 
     async def deactivate(
         self, workflow_id: str, user_id: str, *, reason: DeactivationReason | None = None
@@ -471,7 +579,7 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
         the claim gate. ``reason`` marks a system pause so an automatic resume can
         tell it apart from a user switching the workflow off (which passes none).
         Returns the after state, or ``None`` when not found."""
-        return await self._apply_raw_update(
+        updated = await self._apply_raw_update(
             {"_id": workflow_id, "user_id": user_id},
             {
                 "$set": {
@@ -483,6 +591,7 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
             },
             scope=REPO_GLOBAL_SCOPE,
         )
+        return await self._rerouted(updated)
 
     async def mark_activated_with_triggers(
         self, workflow_id: str, *, trigger_ids: list[str]
@@ -493,9 +602,10 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
         set_fields: dict[str, Any] = {"activated": True, "trigger_config.enabled": True}
         if trigger_ids:
             set_fields["trigger_config.composio_trigger_ids"] = trigger_ids
-        return await self._apply_raw_update(
+        updated = await self._apply_raw_update(
             {"_id": workflow_id}, {"$set": set_fields}, scope=REPO_GLOBAL_SCOPE
         )
+        return await self._rerouted(updated)
 
     async def claim_for_execution(
         self, workflow_id: str, *, expected_next_run: datetime | None = None
@@ -567,11 +677,12 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
         self, workflow_id: str, trigger_ids: list[str]
     ) -> WorkflowDocument | None:
         """Repoint a workflow's registered Composio trigger ids after a resync."""
-        return await self._apply_raw_update(
+        updated = await self._apply_raw_update(
             {"_id": workflow_id},
             {"$set": {"trigger_config.composio_trigger_ids": trigger_ids}},
             scope=REPO_GLOBAL_SCOPE,
         )
+        return await self._rerouted(updated)
 
     async def backfill_public_slug(self, workflow_id: str, slug: str) -> WorkflowDocument | None:
         """Set ``slug`` on a public workflow only while it is still unset — the lazy
@@ -619,7 +730,7 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
         stays a native datetime (python-mode dump), consistent with create/re-arm."""
         trigger_doc = trigger_config.model_dump()
         trigger_doc["composio_trigger_ids"] = composio_trigger_ids
-        return await self._apply_raw_update(
+        updated = await self._apply_raw_update(
             {"_id": workflow_id},
             {
                 "$set": {
@@ -631,19 +742,26 @@ class WorkflowsRepository(MongoRepository[WorkflowDocument, WorkflowUpdate]):
             },
             scope=REPO_GLOBAL_SCOPE,
         )
+        return await self._rerouted(updated)
 
     async def delete_for_user(self, workflow_id: str, user_id: str) -> bool:
         """Delete the user's workflow. Returns whether a document was removed."""
-        return await self._remove(workflow_id, REPO_GLOBAL_SCOPE, {"user_id": user_id})
+        deleted = await self._remove(workflow_id, REPO_GLOBAL_SCOPE, {"user_id": user_id})
+        if deleted:
+            await publish_invalidation(workflow_ids=[workflow_id])
+        return deleted
 
     async def delete_many_for_user(self, workflow_ids: list[str], user_id: str) -> int:
         """Delete many of the user's workflows in one round trip (idempotency purge
         of stale suggestions). Returns the count deleted."""
         if not workflow_ids:
             return 0
-        return await self._delete_many(
+        deleted = await self._delete_many(
             {"_id": {"$in": workflow_ids}, "user_id": user_id}, scope=REPO_GLOBAL_SCOPE
         )
+        if deleted:
+            await publish_invalidation(workflow_ids=workflow_ids)
+        return deleted
 
 
 workflow_repository = WorkflowsRepository()
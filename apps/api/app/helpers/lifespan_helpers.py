@@ -1,7 +1,9 @@
 from collections.abc import Awaitable, Callable
 from typing import NamedTuple
 
+from app.api.v1.middleware.tiered_rate_limiter import tiered_limiter
 from app.core.lazy_loader import providers
+from app.core.stream_manager import stream_manager
 from app.core.websocket_consumer import (
     start_websocket_consumer,
     stop_websocket_consumer,
@@ -122,6 +124,24 @@ async def close_publisher_async() -> None:
         log.error("Error closing publisher", error=str(e), error_type=type(e).__name__)
 
 
+async def close_stream_publishers() -> None:
+    """Write any SSE chunks still held in a stream's publish window."""
+    try:
+        await stream_manager.flush_publishers()
+        log.info("Stream publishers flushed")
+    except Exception as e:
+        log.error("Error flushing stream publishers", error=str(e), error_type=type(e).__name__)
+
+
+async def close_usage_snapshots() -> None:
+    """Write usage snapshots still waiting out their coalescing window."""
+    try:
+        await tiered_limiter.usage_snapshots.flush()
+        log.info("Usage snapshots flushed")
+    except Exception as e:
+        log.error("Error flushing usage snapshots", error=str(e), error_type=type(e).__name__)
+
+
 async def close_checkpointer_manager() -> None:
     """Close checkpointer manager and connection pool."""
     try:
@@ -0,0 +1,153 @@
+"""Dynamic micro-batching for embed / rerank calls.
+
+Concurrent recalls from many chat turns each used to pay their own forward
+pass. A ``MicroBatcher`` instead holds a call for up to
+``EMBEDDING_BATCH_WINDOW_SECONDS``, gathers whatever else arrives in that
+window (up to a weight budget, normally ``EMBEDDING_SIDECAR_MAX_BATCH_TEXTS``
+texts), runs them through one ``run`` call and fans the results back out in
+submission order. A batch that fills up runs at once; an item heavier than the
+whole budget runs alone, exactly as it did before batching.
+
+Used on both sides of the sidecar: ``app.memory.embeddings`` batches callers
+within a process, ``app.services.embedding_sidecar.server`` batches requests
+across processes.
+
+Prometheus (label ``operation`` and ``stage``: ``client`` | ``sidecar``):
+``memory_embedding_batch_size`` (texts per run) and
+``memory_embedding_queue_wait_seconds`` (submit -> run start, per item).
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import time
+from typing import Generic, TypeVar
+
+from prometheus_client import Histogram
+
+from app.constants.memory import EMBEDDING_BATCH_WINDOW_SECONDS, EMBEDDING_MICRO_BATCHING
+from app.services.storage.metrics import _register_once
+
+_ItemT = TypeVar("_ItemT")
+_ResultT = TypeVar("_ResultT")
+
+MEMORY_EMBEDDING_BATCH_SIZE = _register_once(
+    "memory_embedding_batch_size",
+    lambda: Histogram(
+        name="memory_embedding_batch_size",
+        documentation="Texts per micro-batched embed/rerank run",
+        labelnames=("operation", "stage"),
+        buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256),
+    ),
+)
+
+MEMORY_EMBEDDING_QUEUE_WAIT_SECONDS = _register_once(
+    "memory_embedding_queue_wait_seconds",
+    lambda: Histogram(
+        name="memory_embedding_queue_wait_seconds",
+        documentation="Time an embed/rerank call waited in the micro-batch queue",
+        labelnames=("operation", "stage"),
+        buckets=(0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0),
+    ),
+)
+
+
+class _Pending(Generic[_ItemT, _ResultT]):
+    __slots__ = ("future", "item", "submitted_at", "weight")
+
+    def __init__(self, item: _ItemT, weight: int, future: "asyncio.Future[_ResultT]") -> None:
+        self.item = item
+        self.weight = weight
+        self.future = future
+        self.submitted_at = time.perf_counter()
+
+
+class MicroBatcher(Generic[_ItemT, _ResultT]):
+    """Coalesce concurrent ``submit`` calls into batched ``run`` calls.
+
+    ``run`` receives the items in submission order and must return one result
+    per item, in the same order; if it raises, every caller in the batch gets
+    the exception. ``max_weight`` is read on every submit so a patched or
+    reloaded limit takes effect at once.
+
+    State is bound to the running event loop: futures from one loop cannot be
+    resolved from another, so a new loop (tests, worker restarts) starts with
+    an empty queue.
+    """
+
+    def __init__(
+        self,
+        operation: str,
+        stage: str,
+        run: Callable[[list[_ItemT]], Awaitable[list[_ResultT]]],
+        max_weight: Callable[[], int],
+        window_seconds: float = EMBEDDING_BATCH_WINDOW_SECONDS,
+    ) -> None:
+        self._run = run
+        self._max_weight = max_weight
+        self._window = window_seconds
+        self._batch_size = MEMORY_EMBEDDING_BATCH_SIZE.labels(operation=operation, stage=stage)
+        self._queue_wait = MEMORY_EMBEDDING_QUEUE_WAIT_SECONDS.labels(
+            operation=operation, stage=stage
+        )
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: list[_Pending[_ItemT, _ResultT]] = []
+        self._pending_weight = 0
+        self._timer: asyncio.TimerHandle | None = None
+        # Strong references: the loop only keeps weak ones to running tasks.
+        self._running: set[asyncio.Task[None]] = set()
+
+    async def submit(self, item: _ItemT, weight: int = 1) -> _ResultT:
+        """Queue ``item`` for the next batch and wait for its result."""
+        if not EMBEDDING_MICRO_BATCHING:
+            self._batch_size.observe(weight)
+            return (await self._run([item]))[0]
+
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop, self._pending, self._pending_weight, self._timer = loop, [], 0, None
+
+        max_weight = self._max_weight()
+        if self._pending and self._pending_weight + weight > max_weight:
+            self._flush()
+        future: asyncio.Future[_ResultT] = loop.create_future()
+        self._pending.append(_Pending(item, weight, future))
+        self._pending_weight += weight
+        if self._pending_weight >= max_weight:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._window, self._flush)
+        return await future
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending, self._pending_weight = self._pending, [], 0
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._run_batch(batch))
+        self._running.add(task)
+        task.add_done_callback(self._running.discard)
+
+    async def _run_batch(self, batch: list[_Pending[_ItemT, _ResultT]]) -> None:
+        started = time.perf_counter()
+        self._batch_size.observe(sum(pending.weight for pending in batch))
+        for pending in batch:
+            self._queue_wait.observe(started - pending.submitted_at)
+        try:
+            results = await self._run([pending.item for pending in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(f"batch of {len(batch)} returned {len(results)} results")
+        except Exception as exc:
+            for pending in batch:
+                if not pending.future.done():
+                    pending.future.set_exception(exc)
+            return
+        except BaseException:
+            for pending in batch:
+                pending.future.cancel()
+            raise
+        for pending, result in zip(batch, results, strict=True):
+            # A caller cancelled while waiting has no one left to deliver to.
+            if not pending.future.done():
+                pending.future.set_result(result)
@@ -1,43 +1,95 @@
 """ChromaDB vector store for the memory engine.
 
-Owns the two memory collections (``gaia_memories`` for atomic facts,
-``gaia_memory_episodes`` for daily-journal summaries). Embeddings are always
-computed by ``app.memory.embeddings`` and passed explicitly — ChromaDB never
-embeds anything itself.
+Owns the memory collections (``gaia_memories`` for atomic facts,
+``gaia_memory_episodes`` for daily-journal summaries, ``gaia_conversation_chunks``
+for verbatim transcript chunks). Embeddings are always computed by
+``app.memory.embeddings`` and passed explicitly — ChromaDB never embeds
+anything itself. They arrive and are handed over as float32 arrays
+(``app.memory.vectors``), Chroma's own vector type, so nothing is converted
+on the way in.
+
+Fact vectors are partitioned per ``MEMORY_VECTOR_PARTITIONING``: one shared
+collection, hash buckets, or one collection per user
+(``memories_collection_name``). Every fact operation is routed by user id;
+the ``user_id`` metadata filter stays in place under every layout.
 """
 
 import asyncio
+from collections import OrderedDict, defaultdict
 from collections.abc import Mapping, Sequence
+import hashlib
 from typing import Any, TypedDict, cast
 
 from chromadb.api.models.AsyncCollection import AsyncCollection
 from chromadb.api.types import Metadata
+import numpy as np
 
 from app.constants.memory import (
     CHROMA_CONVERSATION_CHUNKS_COLLECTION,
     CHROMA_MEMORIES_COLLECTION,
     CHROMA_MEMORY_EPISODES_COLLECTION,
+    MEMORY_COLLECTION_HANDLE_CACHE_SIZE,
+    MEMORY_VECTOR_BUCKETS,
+    MEMORY_VECTOR_PARTITIONING,
+    MEMORY_VECTOR_PARTITIONINGS,
 )
 from app.db.chroma.chromadb import ChromaClient
 from app.db.chroma.noop_embedding import NoOpEmbeddingFunction
+from app.memory.vectors import EmbeddingArray, as_embeddings
 
 # Collections are cached per event loop: an asyncio.Lock (and Chroma's async
 # client) binds to the loop that first uses it, so sharing one cache/lock
 # across loops raises "bound to a different event loop" in any context that
 # runs multiple loops (test workers, scripts, background runners).
-_loop_collections: dict[int, dict[str, AsyncCollection]] = {}
+# The cache is LRU-bounded: "user" partitioning opens one collection per user.
+_loop_collections: dict[int, OrderedDict[str, AsyncCollection]] = {}
 _loop_locks: dict[int, asyncio.Lock] = {}
 
 
-def _loop_state() -> tuple[dict[str, AsyncCollection], asyncio.Lock]:
+def _loop_state() -> tuple[OrderedDict[str, AsyncCollection], asyncio.Lock]:
     """The collection cache + creation lock for the running event loop."""
     loop_id = id(asyncio.get_running_loop())
     if loop_id not in _loop_locks:
         _loop_locks[loop_id] = asyncio.Lock()
-        _loop_collections[loop_id] = {}
+        _loop_collections[loop_id] = OrderedDict()
     return _loop_collections[loop_id], _loop_locks[loop_id]
 
 
+def memories_collection_name(
+    user_id: str, partitioning: str | None = None, buckets: int | None = None
+) -> str:
+    """The collection holding ``user_id``'s fact vectors under ``partitioning``.
+
+    Users are placed by a stable hash of their id (Python's ``hash`` is salted
+    per process). Per-user names use the hash rather than the raw id, which
+    may hold characters Chroma rejects in collection names; the ``user_id``
+    filter every query keeps makes a collision harmless.
+    """
+    partitioning = partitioning or MEMORY_VECTOR_PARTITIONING
+    if partitioning == "global":
+        return CHROMA_MEMORIES_COLLECTION
+    digest = hashlib.blake2b(user_id.encode(), digest_size=8).hexdigest()
+    if partitioning == "bucketed":
+        bucket = int(digest, 16) % (buckets or MEMORY_VECTOR_BUCKETS)
+        return f"{CHROMA_MEMORIES_COLLECTION}_b{bucket:04d}"
+    if partitioning == "user":
+        return f"{CHROMA_MEMORIES_COLLECTION}_u{digest}"
+    raise ValueError(
+        f"Unknown memory vector partitioning {partitioning!r}; "
+        f"expected one of {MEMORY_VECTOR_PARTITIONINGS}"
+    )
+
+
+def partition_of(name: str) -> str | None:
+    """The partitioning a fact-vector collection name belongs to, if any."""
+    if name == CHROMA_MEMORIES_COLLECTION:
+        return "global"
+    suffix = name.removeprefix(f"{CHROMA_MEMORIES_COLLECTION}_")
+    if suffix == name or not suffix[1:].isalnum():
+        return None
+    return {"b": "bucketed", "u": "user"}.get(suffix[:1])
+
+
 class MemoryVectorMetadata(TypedDict):
     """Metadata stored alongside each memory vector, used for filtering."""
 
@@ -52,7 +104,7 @@ class MemoryVectorItem(TypedDict):
     """One memory fact ready for vector upsert."""
 
     id: str
-    embedding: list[float]
+    embedding: EmbeddingArray
     document: str
     metadata: MemoryVectorMetadata
 
@@ -68,7 +120,7 @@ class EpisodeVectorItem(TypedDict):
     """One daily-episode summary ready for vector upsert."""
 
     id: str
-    embedding: list[float]
+    embedding: EmbeddingArray
     document: str
     metadata: EpisodeVectorMetadata
 
@@ -84,11 +136,16 @@ class ConversationChunkItem(TypedDict):
     """One verbatim conversation chunk ready for vector upsert."""
 
     id: str
-    embedding: list[float]
+    embedding: EmbeddingArray
     document: str
     metadata: ConversationChunkMetadata
 
 
+def _stack(vectors: EmbeddingArray | Sequence[EmbeddingArray]) -> EmbeddingArray:
+    """One contiguous ``(n, dim)`` float32 block for a Chroma call."""
+    return as_embeddings(np.stack(vectors) if isinstance(vectors, Sequence) else vectors)
+
+
 def _as_metadata(metadata: Mapping[str, object]) -> Metadata:
     """Convert a metadata TypedDict to Chroma's Metadata mapping.
 
@@ -102,6 +159,7 @@ async def _get_collection(name: str) -> AsyncCollection:
     """Get (and cache) a memory collection, creating it if missing."""
     _collections, _collections_lock = _loop_state()
     if name in _collections:
+        _collections.move_to_end(name)
         return _collections[name]
 
     async with _collections_lock:
@@ -109,28 +167,28 @@ async def _get_collection(name: str) -> AsyncCollection:
             return _collections[name]
 
         client = await ChromaClient.get_client()
-        existing = [collection.name for collection in await client.list_collections()]
-        if name not in existing:
-            collection = await client.create_collection(
+        try:
+            collection = await client.get_or_create_collection(
                 name=name,
                 metadata={"hnsw:space": "cosine"},
                 embedding_function=NoOpEmbeddingFunction(),
             )
-        else:
-            try:
-                collection = await client.get_collection(
-                    name=name, embedding_function=NoOpEmbeddingFunction()
-                )
-            except ValueError:
-                # ChromaDB 1.x rejects a new embedding function when one is
-                # already persisted in the collection config; embeddings are
-                # passed explicitly anyway, so plain get is safe.
-                collection = await client.get_collection(name=name)
+        except ValueError:
+            # ChromaDB 1.x rejects a new embedding function when one is
+            # already persisted in the collection config; embeddings are
+            # passed explicitly anyway, so plain get is safe.
+            collection = await client.get_collection(name=name)
 
         _collections[name] = collection
+        while len(_collections) > MEMORY_COLLECTION_HANDLE_CACHE_SIZE:
+            _collections.popitem(last=False)
         return collection
 
 
+async def _memories_collection(user_id: str) -> AsyncCollection:
+    return await _get_collection(memories_collection_name(user_id))
+
+
 async def _clamp_n_results(collection: AsyncCollection, n: int) -> int:
     """Clamp a requested result count to what the collection actually holds.
 
@@ -145,21 +203,22 @@ async def _clamp_n_results(collection: AsyncCollection, n: int) -> int:
 
 async def upsert_memories(items: list[MemoryVectorItem]) -> None:
     """Upsert memory vectors with their filterable metadata."""
-    if not items:
-        return
-    collection = await _get_collection(CHROMA_MEMORIES_COLLECTION)
-    embeddings: list[Sequence[float] | Sequence[int]] = [item["embedding"] for item in items]
-    await collection.upsert(
-        ids=[item["id"] for item in items],
-        embeddings=embeddings,
-        documents=[item["document"] for item in items],
-        metadatas=[_as_metadata(item["metadata"]) for item in items],
-    )
+    by_collection: defaultdict[str, list[MemoryVectorItem]] = defaultdict(list)
+    for item in items:
+        by_collection[memories_collection_name(item["metadata"]["user_id"])].append(item)
+    for name, partition in by_collection.items():
+        collection = await _get_collection(name)
+        await collection.upsert(
+            ids=[item["id"] for item in partition],
+            embeddings=_stack([item["embedding"] for item in partition]),
+            documents=[item["document"] for item in partition],
+            metadatas=[_as_metadata(item["metadata"]) for item in partition],
+        )
 
 
 async def query_similar(
     user_id: str,
-    embedding: list[float],
+    embedding: EmbeddingArray,
     n: int,
     only_latest: bool = True,
 ) -> list[tuple[str, float]]:
@@ -168,10 +227,28 @@ async def query_similar(
     Forgotten memories are always excluded; ``only_latest`` additionally
     restricts to the head of each supersession chain.
     """
-    collection = await _get_collection(CHROMA_MEMORIES_COLLECTION)
+    return (await query_similar_many(user_id, [embedding], n, only_latest=only_latest))[0]
+
+
+async def query_similar_many(
+    user_id: str,
+    embeddings: EmbeddingArray | Sequence[EmbeddingArray],
+    n: int,
+    only_latest: bool = True,
+) -> list[list[tuple[str, float]]]:
+    """``query_similar`` for several query vectors, in input order.
+
+    One ``count`` and one multi-vector ``query`` regardless of how many
+    vectors are passed — reconciliation asks for every extracted fact's
+    neighbours at once, and per-fact calls cost two round trips each.
+    ``embeddings`` is an ``(n, dim)`` array or a sequence of vectors.
+    """
+    if not len(embeddings):
+        return []
+    collection = await _memories_collection(user_id)
     n_results = await _clamp_n_results(collection, n)
     if n_results == 0:
-        return []
+        return [[] for _ in embeddings]
 
     conditions: list[dict[str, Any]] = [
         {"user_id": user_id},
@@ -180,20 +257,22 @@ async def query_similar(
     if only_latest:
         conditions.append({"is_latest": True})
 
-    query_embeddings: list[Sequence[float] | Sequence[int]] = [embedding]
     result = await collection.query(
-        query_embeddings=query_embeddings,
+        query_embeddings=_stack(embeddings),
         n_results=n_results,
         where={"$and": conditions},
         include=["distances"],
     )
-    ids = result["ids"][0]
-    distances = (result.get("distances") or [[]])[0]
+    distances = result.get("distances") or [[] for _ in embeddings]
     # Cosine distance -> similarity.
-    return [(memory_id, 1.0 - distance) for memory_id, distance in zip(ids, distances)]
+    return [
+        [(memory_id, 1.0 - distance) for memory_id, distance in zip(ids, row_distances)]
+        for ids, row_distances in zip(result["ids"], distances)
+    ]
 
 
 async def set_memory_flags(
+    user_id: str,
     memory_id: str,
     *,
     is_latest: bool | None = None,
@@ -202,7 +281,7 @@ async def set_memory_flags(
     """Update lineage/forgetting flags on a memory vector's metadata."""
     if is_latest is None and is_forgotten is None:
         return
-    collection = await _get_collection(CHROMA_MEMORIES_COLLECTION)
+    collection = await _memories_collection(user_id)
     existing = await collection.get(ids=[memory_id], include=["metadatas"])
     metadatas = existing.get("metadatas") or []
     if not existing["ids"] or not metadatas:
@@ -216,34 +295,164 @@ async def set_memory_flags(
     await collection.update(ids=[memory_id], metadatas=[metadata])
 
 
-async def delete_ids(ids: list[str]) -> None:
-    """Hard-delete memory vectors by id."""
+async def delete_ids(user_id: str, ids: list[str]) -> None:
+    """Hard-delete a user's memory vectors by id."""
     if not ids:
         return
-    collection = await _get_collection(CHROMA_MEMORIES_COLLECTION)
+    collection = await _memories_collection(user_id)
     await collection.delete(ids=ids)
 
 
 async def delete_user(user_id: str) -> None:
-    """Hard-delete all of a user's vectors from every collection (full wipe)."""
-    for name in (
-        CHROMA_MEMORIES_COLLECTION,
-        CHROMA_MEMORY_EPISODES_COLLECTION,
-        CHROMA_CONVERSATION_CHUNKS_COLLECTION,
-    ):
+    """Hard-delete all of a user's vectors from every collection (full wipe).
+
+    Fact vectors are deleted from every layout's collections, not just the
+    current one: after a layout switch, or during a migration, some of them
+    still live in the other layout. A per-user collection only ever holds its
+    own user's rows, so only that one is visited under ``user``.
+    """
+    names = [CHROMA_MEMORY_EPISODES_COLLECTION, CHROMA_CONVERSATION_CHUNKS_COLLECTION]
+    for partitioning in MEMORY_VECTOR_PARTITIONINGS:
+        existing = await memories_collection_names(partitioning)
+        if partitioning == "user":
+            own = memories_collection_name(user_id, "user")
+            existing = [name for name in existing if name == own]
+        names.extend(existing)
+    for name in names:
         collection = await _get_collection(name)
         await collection.delete(where={"user_id": user_id})
 
 
+async def memories_collection_names(partitioning: str) -> list[str]:
+    """Existing collections holding fact vectors under ``partitioning``."""
+    client = await ChromaClient.get_client()
+    return sorted(
+        collection.name
+        for collection in await client.list_collections()
+        if partition_of(collection.name) == partitioning
+    )
+
+
+async def copy_memories(source: str, partitioning: str, *, offset: int, limit: int) -> int:
+    """Copy one page of fact vectors from collection ``source`` into ``partitioning``.
+
+    Vectors are copied as stored — nothing is re-embedded — and ``source`` is
+    left untouched, so this is safe while it is still the live layout. Rows
+    whose target is ``source`` itself (re-bucketing) are skipped.
+
+    Returns the rows read; fewer than ``limit`` means the source is exhausted.
+    """
+    source_collection = await _get_collection(source)
+    page = await source_collection.get(
+        offset=offset, limit=limit, include=["embeddings", "documents", "metadatas"]
+    )
+    ids = page["ids"]
+    embeddings = page["embeddings"]
+    if embeddings is None:
+        return len(ids)
+    vectors = as_embeddings(embeddings)
+    documents = page["documents"] or []
+    metadatas = page["metadatas"] or []
+    for name, indexes in _by_target(metadatas, partitioning).items():
+        if name == source:
+            continue
+        collection = await _get_collection(name)
+        await collection.upsert(
+            ids=[ids[i] for i in indexes],
+            embeddings=vectors[indexes],
+            documents=[documents[i] for i in indexes],
+            metadatas=[metadatas[i] for i in indexes],
+        )
+    return len(ids)
+
+
+async def retire_memories(
+    source: str, partitioning: str, *, offset: int, limit: int
+) -> tuple[int, int]:
+    """Fold one page of ``source`` into ``partitioning``, then delete it from ``source``.
+
+    Run only once ``partitioning`` is live. Rows missing from their target
+    (written after ``copy_memories`` saw the page) are copied over. Rows
+    already there keep their target copy but take the flags recorded in
+    ``source`` since: flags only ever move one way — a fact stops being the
+    latest, a fact gets forgotten — so ``is_latest`` is and-ed and
+    ``is_forgotten`` or-ed, which keeps changes made in either layout.
+
+    Returns ``(read, kept)``: the rows read, and how many of them are still in
+    ``source`` (re-bucketing leaves rows already in their bucket). The next
+    page starts ``kept`` rows further on; fewer than ``limit`` rows read means
+    the source is exhausted.
+    """
+    source_collection = await _get_collection(source)
+    page = await source_collection.get(
+        offset=offset, limit=limit, include=["embeddings", "documents", "metadatas"]
+    )
+    ids = page["ids"]
+    embeddings = page["embeddings"]
+    if embeddings is None:
+        return len(ids), len(ids)
+    vectors = as_embeddings(embeddings)
+    documents = page["documents"] or []
+    metadatas = page["metadatas"] or []
+
+    moved: list[str] = []
+    for name, indexes in _by_target(metadatas, partitioning).items():
+        if name == source:
+            continue
+        moved.extend(ids[i] for i in indexes)
+        collection = await _get_collection(name)
+        present = await collection.get(ids=[ids[i] for i in indexes], include=["metadatas"])
+        merged = {
+            memory_id: dict(metadata)
+            for memory_id, metadata in zip(present["ids"], present["metadatas"] or [])
+        }
+        missing = [i for i in indexes if ids[i] not in merged]
+        if missing:
+            await collection.upsert(
+                ids=[ids[i] for i in missing],
+                embeddings=vectors[missing],
+                documents=[documents[i] for i in missing],
+                metadatas=[metadatas[i] for i in missing],
+            )
+        changed: list[str] = []
+        for i in indexes:
+            target = merged.get(ids[i])
+            if target is None:
+                continue
+            is_latest = bool(target["is_latest"]) and bool(metadatas[i]["is_latest"])
+            is_forgotten = bool(target["is_forgotten"]) or bool(metadatas[i]["is_forgotten"])
+            if (is_latest, is_forgotten) != (target["is_latest"], target["is_forgotten"]):
+                target.update(is_latest=is_latest, is_forgotten=is_forgotten)
+                changed.append(ids[i])
+        if changed:
+            await collection.update(
+                ids=changed, metadatas=[cast(Metadata, merged[i]) for i in changed]
+            )
+    # Only after every target holds its rows: a crash before this line leaves
+    # the page in both places, and the retried page merges the same flags.
+    if moved:
+        await source_collection.delete(ids=moved)
+    return len(ids), len(ids) - len(moved)
+
+
+def _by_target(metadatas: Sequence[Mapping[str, Any]], partitioning: str) -> dict[str, list[int]]:
+    """Row indexes of a page, grouped by their collection under ``partitioning``."""
+    by_collection: defaultdict[str, list[int]] = defaultdict(list)
+    for index, metadata in enumerate(metadatas):
+        by_collection[memories_collection_name(str(metadata["user_id"]), partitioning)].append(
+            index
+        )
+    return by_collection
+
+
 async def upsert_conversation_chunks(items: list[ConversationChunkItem]) -> None:
     """Upsert raw conversation chunk vectors (verbatim retention tier)."""
     if not items:
         return
     collection = await _get_collection(CHROMA_CONVERSATION_CHUNKS_COLLECTION)
-    embeddings: list[Sequence[float] | Sequence[int]] = [item["embedding"] for item in items]
     await collection.upsert(
         ids=[item["id"] for item in items],
-        embeddings=embeddings,
+        embeddings=_stack([item["embedding"] for item in items]),
         documents=[item["document"] for item in items],
         metadatas=[_as_metadata(item["metadata"]) for item in items],
     )
@@ -251,7 +460,7 @@ async def upsert_conversation_chunks(items: list[ConversationChunkItem]) -> None
 
 async def query_conversation_chunks(
     user_id: str,
-    embedding: list[float],
+    embedding: EmbeddingArray,
     n: int,
 ) -> list[tuple[str, str, float]]:
     """Return up to ``n`` (date, chunk_text, similarity) for a user, best first."""
@@ -259,9 +468,8 @@ async def query_conversation_chunks(
     n_results = await _clamp_n_results(collection, n)
     if n_results == 0:
         return []
-    query_embeddings: list[Sequence[float] | Sequence[int]] = [embedding]
     result = await collection.query(
-        query_embeddings=query_embeddings,
+        query_embeddings=_stack([embedding]),
         n_results=n_results,
         where={"user_id": user_id},
         include=["documents", "metadatas", "distances"],
@@ -278,10 +486,9 @@ async def query_conversation_chunks(
 async def upsert_episode(item: EpisodeVectorItem) -> None:
     """Upsert a daily-episode summary vector."""
     collection = await _get_collection(CHROMA_MEMORY_EPISODES_COLLECTION)
-    embeddings: list[Sequence[float] | Sequence[int]] = [item["embedding"]]
     await collection.upsert(
         ids=[item["id"]],
-        embeddings=embeddings,
+        embeddings=_stack([item["embedding"]]),
         documents=[item["document"]],
         metadatas=[_as_metadata(item["metadata"])],
     )
@@ -289,7 +496,7 @@ async def upsert_episode(item: EpisodeVectorItem) -> None:
 
 async def query_episodes(
     user_id: str,
-    embedding: list[float],
+    embedding: EmbeddingArray,
     n: int,
 ) -> list[tuple[str, float]]:
     """Return up to ``n`` (episode_id, cosine_similarity) for a user, best first."""
@@ -298,9 +505,8 @@ async def query_episodes(
     if n_results == 0:
         return []
 
-    query_embeddings: list[Sequence[float] | Sequence[int]] = [embedding]
     result = await collection.query(
-        query_embeddings=query_embeddings,
+        query_embeddings=_stack([embedding]),
         n_results=n_results,
         where={"user_id": user_id},
         include=["distances"],
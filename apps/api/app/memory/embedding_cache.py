@@ -0,0 +1,157 @@
+"""Content-addressed cache for memory embeddings.
+
+The same strings are embedded over and over: facts re-extracted from repeated
+conversations, conversation chunks stored again on a re-run, identical recall
+queries across turns. ``embed_query`` / ``embed_batch`` in
+``app.memory.embeddings`` consult this cache first, so ingestion and recall
+both skip the model for text it has already seen.
+
+Keys are ``(kind, model, dim, sha256(normalized text))`` — query and passage
+embeddings of the same text differ (the query instruction), and a model or
+dimension change never serves stale vectors. Normalization is Unicode NFC
+plus whitespace collapsing, which the tokenizer would erase anyway.
+
+Two tiers: a bounded per-process LRU of float32 arrays, then Redis with a
+TTL, shared by every API and worker process. Redis holds the raw vector bytes
+(float32, or float16 via ``MEMORY_EMBEDDING_CACHE_DTYPE``) base64-framed,
+because the shared client decodes responses as text — ~5.5 KB per 1024-dim
+float32 vector against ~20 KB as a JSON list. Redis errors fail open: the
+caller just embeds.
+
+Prometheus: ``memory_embedding_cache_requests_total`` (Counter, labels
+``kind``: ``query`` | ``passage`` and ``outcome``: ``local`` | ``redis`` |
+``miss``).
+"""
+
+import base64
+from collections import OrderedDict
+from collections.abc import Sequence
+import hashlib
+import re
+import unicodedata
+
+import numpy as np
+from prometheus_client import Counter
+
+from app.constants.memory import (
+    EMBEDDING_CACHE_DTYPE,
+    EMBEDDING_CACHE_LOCAL_SIZE,
+    EMBEDDING_CACHE_TTL_SECONDS,
+    EMBEDDING_DIM,
+    EMBEDDING_MODEL_NAME,
+)
+from app.db.redis import redis_cache
+from app.memory.vectors import EmbeddingArray
+from app.services.storage.metrics import _register_once
+from shared.py.wide_events import log
+
+MEMORY_EMBEDDING_CACHE_REQUESTS_TOTAL = _register_once(
+    "memory_embedding_cache_requests_total",
+    lambda: Counter(
+        name="memory_embedding_cache_requests_total",
+        documentation="Memory embedding lookups, by the tier that served them",
+        labelnames=("kind", "outcome"),
+    ),
+)
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    """The form texts are keyed by: NFC, whitespace runs collapsed, stripped."""
+    return _WHITESPACE.sub(" ", unicodedata.normalize("NFC", text)).strip()
+
+
+class EmbeddingCache:
+    """Per-process LRU in front of Redis, keyed by kind + model + text hash."""
+
+    def __init__(
+        self,
+        model: str = EMBEDDING_MODEL_NAME,
+        dim: int = EMBEDDING_DIM,
+        max_size: int = EMBEDDING_CACHE_LOCAL_SIZE,
+        ttl: int = EMBEDDING_CACHE_TTL_SECONDS,
+        dtype: str = EMBEDDING_CACHE_DTYPE,
+    ) -> None:
+        self._namespace = hashlib.sha256(f"{model}:{dim}".encode()).hexdigest()[:12]
+        self._max_size = max_size
+        self._ttl = ttl
+        self._dtype = np.dtype(dtype)
+        self._entries: OrderedDict[str, EmbeddingArray] = OrderedDict()
+
+    def key(self, kind: str, text: str) -> str:
+        digest = hashlib.sha256(normalize_text(text).encode()).hexdigest()
+        return f"memory:emb:{kind}:{self._namespace}:{digest}"
+
+    def encode(self, vector: EmbeddingArray) -> str:
+        return base64.b64encode(np.asarray(vector, dtype=self._dtype).tobytes()).decode()
+
+    def decode(self, payload: str) -> EmbeddingArray:
+        vector = np.frombuffer(base64.b64decode(payload), dtype=self._dtype)
+        return vector.astype(np.float32)
+
+    async def get_many(self, kind: str, texts: Sequence[str]) -> list[EmbeddingArray | None]:
+        """Cached vectors aligned with ``texts``; ``None`` where nothing is cached."""
+        keys = [self.key(kind, text) for text in texts]
+        found: list[EmbeddingArray | None] = []
+        for key in keys:
+            vector = self._entries.get(key)
+            if vector is not None:
+                self._entries.move_to_end(key)
+            found.append(vector)
+        local_hits = sum(vector is not None for vector in found)
+
+        missing = [i for i, vector in enumerate(found) if vector is None]
+        redis_hits = 0
+        client = redis_cache.redis
+        if missing and client is not None:
+            try:
+                payloads = await client.mget([keys[i] for i in missing])
+            except Exception as exc:
+                log.warning("memory_embedding_cache.redis_get_failed", error=str(exc)[:200])
+                payloads = [None] * len(missing)
+            for i, payload in zip(missing, payloads, strict=True):
+                if payload is None:
+                    continue
+                vector = self.decode(payload)
+                found[i] = vector
+                self._remember(keys[i], vector)
+                redis_hits += 1
+
+        counter = MEMORY_EMBEDDING_CACHE_REQUESTS_TOTAL
+        if local_hits:
+            counter.labels(kind=kind, outcome="local").inc(local_hits)
+        if redis_hits:
+            counter.labels(kind=kind, outcome="redis").inc(redis_hits)
+        if len(texts) - local_hits - redis_hits:
+            counter.labels(kind=kind, outcome="miss").inc(len(texts) - local_hits - redis_hits)
+        return found
+
+    async def put_many(self, kind: str, texts: Sequence[str], vectors: EmbeddingArray) -> None:
+        """Store freshly computed vectors (one row per text) in both tiers."""
+        keys = [self.key(kind, text) for text in texts]
+        for key, vector in zip(keys, vectors, strict=True):
+            # A copy: a row view would pin its whole batch in memory.
+            self._remember(key, vector.copy())
+        client = redis_cache.redis
+        if not keys or client is None:
+            return
+        pipe = client.pipeline(transaction=False)
+        for key, vector in zip(keys, vectors, strict=True):
+            pipe.setex(key, self._ttl, self.encode(vector))
+        try:
+            await pipe.execute()
+        except Exception as exc:
+            log.warning("memory_embedding_cache.redis_set_failed", error=str(exc)[:200])
+
+    def _remember(self, key: str, vector: EmbeddingArray) -> None:
+        self._entries[key] = vector
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+embedding_cache = EmbeddingCache()
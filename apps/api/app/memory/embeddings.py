@@ -14,13 +14,22 @@ Two backends, chosen at call time:
   reuses these exact ``*_sync`` helpers, so the numbers are identical.
 - **Local** (default / dev): each process loads its own model on first use.
 
+Either way, concurrent calls are micro-batched (``app.memory.batching``):
+embeds, query embeds and reranks arriving within a few milliseconds share one
+HTTP call / one forward pass instead of paying for one each. Text embedded
+before is served from ``app.memory.embedding_cache`` without reaching either.
+
+Vectors are float32 arrays (``app.memory.vectors``) from the model to Chroma:
+``embed_batch`` returns one ``(n, dim)`` array, ``embed_query`` one ``(dim,)``
+vector, and the sidecar sends them as ``.npy`` frames rather than JSON.
+
 fastembed is sync and CPU-bound; the async API runs it in a thread so the
 event loop is never blocked. The locks are ``threading.Lock`` (not
 ``asyncio.Lock``) because loading happens inside ``asyncio.to_thread``.
 """
 
 import asyncio
-from collections.abc import Awaitable
+from collections.abc import Awaitable, Callable, Sequence, Sized
 import os
 import threading
 import time
@@ -29,8 +38,10 @@ from typing import Any, TypedDict, TypeVar, cast
 from fastembed import TextEmbedding
 from fastembed.rerank.cross_encoder import TextCrossEncoder
 import httpx
+import numpy as np
 
 from app.constants.memory import (
+    EMBEDDING_CACHE_ENABLED,
     EMBEDDING_MODEL_NAME,
     EMBEDDING_SIDECAR_MAX_BATCH_CHARS,
     EMBEDDING_SIDECAR_MAX_BATCH_TEXTS,
@@ -43,6 +54,16 @@ from app.constants.memory import (
     ONNX_INTRA_OP_THREADS,
     RERANKER_MODEL_NAME,
 )
+from app.memory.batching import MicroBatcher
+from app.memory.embedding_cache import embedding_cache
+from app.memory.vectors import (
+    NPY_MEDIA_TYPE,
+    EmbeddingArray,
+    as_embeddings,
+    decode_npy,
+    empty_embeddings,
+    split_rows,
+)
 from shared.py.wide_events import log
 
 _embedding_model: TextEmbedding | None = None
@@ -58,36 +79,53 @@ _http_client: tuple[asyncio.AbstractEventLoop, httpx.AsyncClient] | None = None
 _http_client_lock = threading.Lock()
 
 _T = TypeVar("_T")
-
-
-class EmbedQueryResponse(TypedDict):
-    vector: list[float]
-
-
-class EmbedBatchResponse(TypedDict):
-    vectors: list[list[float]]
+_ChunkT = TypeVar("_ChunkT", bound=Sized)
 
 
 class RerankResponse(TypedDict):
     scores: list[float]
 
 
-def chunk_texts(texts: list[str], max_texts: int, max_chars: int) -> list[list[str]]:
-    """Greedy split under both caps; an oversized single text keeps its own chunk."""
-    chunks: list[list[str]] = []
-    current: list[str] = []
+def chunk_texts(
+    texts: Sequence[_ChunkT],
+    max_texts: int,
+    max_chars: int,
+    length: Callable[[_ChunkT], int] = len,
+) -> list[list[_ChunkT]]:
+    """Greedy split under both caps; an oversized single text keeps its own chunk.
+
+    ``length`` measures one entry — rerank pairs count the query and the
+    document both.
+    """
+    chunks: list[list[_ChunkT]] = []
+    current: list[_ChunkT] = []
     current_chars = 0
     for text in texts:
-        if current and (len(current) >= max_texts or current_chars + len(text) > max_chars):
+        size = length(text)
+        if current and (len(current) >= max_texts or current_chars + size > max_chars):
             chunks.append(current)
             current, current_chars = [], 0
         current.append(text)
-        current_chars += len(text)
+        current_chars += size
     if current:
         chunks.append(current)
     return chunks
 
 
+def _pair_length(pair: tuple[str, str]) -> int:
+    return len(pair[0]) + len(pair[1])
+
+
+def split_results(results: Sequence[_T], sizes: Sequence[int]) -> list[list[_T]]:
+    """Cut a flat, batched result list back into one list per caller."""
+    out: list[list[_T]] = []
+    start = 0
+    for size in sizes:
+        out.append(list(results[start : start + size]))
+        start += size
+    return out
+
+
 async def _observed(operation: str, backend: str, count: int, awaitable: Awaitable[_T]) -> _T:
     """Await an embed/rerank call; on failure emit a structured error and re-raise.
 
@@ -154,21 +192,22 @@ def _get_reranker_model() -> TextCrossEncoder:
     return _reranker_model
 
 
-def _embed_sync(texts: list[str]) -> list[list[float]]:
+def _embed_sync(texts: list[str]) -> EmbeddingArray:
     """Embed passage texts synchronously (CPU-bound; call from a thread).
 
     ``batch_size`` bounds the ONNX forward pass — fastembed's default of 256
     texts per pass materializes multi-GB activations and OOM-killed the
     sidecar (#918).
     """
+    if not texts:
+        return empty_embeddings()
     model = _get_embedding_model()
-    return [
-        vector.tolist()
-        for vector in model.embed(texts, batch_size=EMBEDDING_SIDECAR_MAX_BATCH_TEXTS)
-    ]
+    return as_embeddings(
+        np.stack(list(model.embed(texts, batch_size=EMBEDDING_SIDECAR_MAX_BATCH_TEXTS)))
+    )
 
 
-def _embed_query_sync(text: str) -> list[float]:
+def _embed_query_sync(text: str) -> EmbeddingArray:
     """Embed a query with the model's query instruction (CPU-bound).
 
     BGE models are asymmetric: queries must be prefixed with the model's
@@ -178,7 +217,7 @@ def _embed_query_sync(text: str) -> list[float]:
     for queries measurably degrades ANN recall on paraphrased questions.
     """
     model = _get_embedding_model()
-    return cast(list[float], next(iter(model.query_embed([text]))).tolist())
+    return as_embeddings(next(iter(model.query_embed([text]))))
 
 
 def _rerank_sync(query: str, documents: list[str]) -> list[float]:
@@ -190,6 +229,25 @@ def _rerank_sync(query: str, documents: list[str]) -> list[float]:
     ]
 
 
+def _embed_queries_sync(texts: list[str]) -> EmbeddingArray:
+    """Embed several queries in one pass (see ``_embed_query_sync``)."""
+    if not texts:
+        return empty_embeddings()
+    model = _get_embedding_model()
+    return as_embeddings(
+        np.stack(list(model.query_embed(texts, batch_size=EMBEDDING_SIDECAR_MAX_BATCH_TEXTS)))
+    )
+
+
+def _rerank_pairs_sync(pairs: list[tuple[str, str]]) -> list[float]:
+    """Score (query, document) pairs with mixed queries in one pass (CPU-bound)."""
+    model = _get_reranker_model()
+    return [
+        float(score)
+        for score in model.rerank_pairs(pairs, batch_size=EMBEDDING_SIDECAR_MAX_BATCH_TEXTS)
+    ]
+
+
 def _sidecar_url() -> str | None:
     """The shared sidecar base URL, or None to use the in-process model."""
     url = os.getenv(EMBEDDING_SIDECAR_URL_ENV, "").strip()
@@ -222,7 +280,12 @@ def _get_http_client() -> httpx.AsyncClient:
     return _http_client[1]
 
 
-async def _post_with_retry(client: httpx.AsyncClient, url: str, payload: dict) -> httpx.Response:
+async def _post_with_retry(
+    client: httpx.AsyncClient,
+    url: str,
+    payload: dict,
+    headers: dict[str, str] | None = None,
+) -> httpx.Response:
     """POST until success, a non-retryable status, or the retry budget runs
     out — with a short fixed backoff between attempts. A 503 means the sidecar
     was overloaded right now (it already waited out its own slot budget) and a
@@ -231,7 +294,7 @@ async def _post_with_retry(client: httpx.AsyncClient, url: str, payload: dict) -
     remaining = EMBEDDING_SIDECAR_RETRIES
     while True:
         try:
-            response = await client.post(url, json=payload)
+            response = await client.post(url, json=payload, headers=headers)
         except httpx.TransportError:
             if remaining == 0:
                 raise
@@ -253,43 +316,162 @@ async def _sidecar_post(path: str, payload: dict) -> dict[str, Any]:
     return cast(dict[str, Any], response.json())
 
 
-async def embed_query(text: str) -> list[float]:
-    """Embed a single query string (with the model's query instruction)."""
+async def _sidecar_post_vectors(path: str, payload: dict) -> EmbeddingArray:
+    """POST to an embed endpoint, asking for an ``.npy`` frame back.
+
+    A sidecar that predates the binary format ignores ``Accept`` and answers
+    JSON (``vectors`` or ``vector``), which is still understood, so clients
+    and sidecar can be deployed in either order.
+    """
+    client = _get_http_client()
+    response = await _post_with_retry(
+        client, f"{_sidecar_url()}{path}", payload, headers={"Accept": NPY_MEDIA_TYPE}
+    )
+    response.raise_for_status()
+    if response.headers.get("content-type", "").startswith(NPY_MEDIA_TYPE):
+        return decode_npy(response.content)
+    body = response.json()
+    return as_embeddings(body["vectors"] if "vectors" in body else body["vector"])
+
+
+def _batch_limit() -> int:
+    return EMBEDDING_SIDECAR_MAX_BATCH_TEXTS
+
+
+async def _embed_query_once(text: str) -> EmbeddingArray:
     if _sidecar_url():
-        result = await _observed(
-            "embed_query", "sidecar", 1, _sidecar_post("/embed_query", {"text": text})
+        return await _observed(
+            "embed_query", "sidecar", 1, _sidecar_post_vectors("/embed_query", {"text": text})
         )
-        return cast(EmbedQueryResponse, result)["vector"]
     return await _observed("embed_query", "local", 1, asyncio.to_thread(_embed_query_sync, text))
 
 
-async def _sidecar_embed(texts: list[str]) -> list[list[float]]:
-    """POST /embed in bounded chunks; a giant batch can't hold one slot forever
-    (#918) and chunk order preserves vector order."""
-    vectors: list[list[float]] = []
-    for chunk in chunk_texts(
-        texts, EMBEDDING_SIDECAR_MAX_BATCH_TEXTS, EMBEDDING_SIDECAR_MAX_BATCH_CHARS
-    ):
-        result = await _observed(
-            "embed", "sidecar", len(chunk), _sidecar_post("/embed", {"texts": chunk})
+async def _run_embed_queries(texts: list[str]) -> list[EmbeddingArray]:
+    """One batch of concurrent ``embed_query`` calls; a lone query keeps the
+    single-query path."""
+    if len(texts) == 1:
+        return [await _embed_query_once(texts[0])]
+    if _sidecar_url():
+        vectors = await _sidecar_embed("embed_query", "/embed_queries", texts)
+    else:
+        vectors = await _observed(
+            "embed_query", "local", len(texts), asyncio.to_thread(_embed_queries_sync, texts)
         )
-        vectors.extend(cast(EmbedBatchResponse, result)["vectors"])
-    return vectors
+    return list(vectors)
 
 
-async def embed_batch(texts: list[str]) -> list[list[float]]:
-    """Embed a batch of texts in one fastembed pass."""
-    if not texts:
-        return []
+async def _run_embed(requests: list[list[str]]) -> list[EmbeddingArray]:
+    """One batch of concurrent ``embed_batch`` calls, flattened into one embed."""
+    texts = [text for request in requests for text in request]
     if _sidecar_url():
-        return await _sidecar_embed(texts)
-    return await _observed("embed", "local", len(texts), asyncio.to_thread(_embed_sync, texts))
+        vectors = await _sidecar_embed("embed", "/embed", texts)
+    else:
+        vectors = await _observed(
+            "embed", "local", len(texts), asyncio.to_thread(_embed_sync, texts)
+        )
+    return split_rows(vectors, [len(request) for request in requests])
 
 
-async def rerank(query: str, documents: list[str]) -> list[float]:
-    """Return relevance scores for documents, aligned with input order."""
-    if not documents:
-        return []
+async def _run_rerank(requests: list[tuple[str, list[str]]]) -> list[list[float]]:
+    """One batch of concurrent ``rerank`` calls. A lone query keeps the
+    single-query path; mixed queries are scored as (query, document) pairs."""
+    if len(requests) == 1:
+        query, documents = requests[0]
+        return [await _rerank_one(query, documents)]
+    pairs = [(query, document) for query, documents in requests for document in documents]
+    if _sidecar_url():
+        scores: list[float] = []
+        for chunk in chunk_texts(
+            pairs,
+            EMBEDDING_SIDECAR_MAX_BATCH_TEXTS,
+            EMBEDDING_SIDECAR_MAX_BATCH_CHARS,
+            _pair_length,
+        ):
+            result = await _observed(
+                "rerank",
+                "sidecar",
+                len(chunk),
+                _sidecar_post("/rerank_pairs", {"pairs": [list(pair) for pair in chunk]}),
+            )
+            scores.extend(cast(RerankResponse, result)["scores"])
+    else:
+        scores = await _observed(
+            "rerank", "local", len(pairs), asyncio.to_thread(_rerank_pairs_sync, pairs)
+        )
+    return split_results(scores, [len(documents) for _, documents in requests])
+
+
+_query_batcher: MicroBatcher[str, EmbeddingArray] = MicroBatcher(
+    "embed_query", "client", _run_embed_queries, _batch_limit
+)
+_embed_batcher: MicroBatcher[list[str], EmbeddingArray] = MicroBatcher(
+    "embed", "client", _run_embed, _batch_limit
+)
+_rerank_batcher: MicroBatcher[tuple[str, list[str]], list[float]] = MicroBatcher(
+    "rerank", "client", _run_rerank, _batch_limit
+)
+
+
+async def _cached(
+    kind: str,
+    texts: list[str],
+    compute: Callable[[list[str]], Awaitable[EmbeddingArray]],
+) -> EmbeddingArray:
+    """Serve ``texts`` from the embedding cache, computing (once per distinct
+    text) and storing only the misses."""
+    found = await embedding_cache.get_many(kind, texts)
+    missing = [i for i, vector in enumerate(found) if vector is None]
+    if not missing:
+        return as_embeddings(np.stack(cast(list[EmbeddingArray], found)))
+    unique = list(dict.fromkeys(texts[i] for i in missing))
+    vectors = await compute(unique)
+    await embedding_cache.put_many(kind, unique, vectors)
+    row_of = {text: row for row, text in enumerate(unique)}
+    out = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+    for i, vector in enumerate(found):
+        out[i] = vectors[row_of[texts[i]]] if vector is None else vector
+    return out
+
+
+async def _embed_one_query(texts: list[str]) -> EmbeddingArray:
+    return (await _query_batcher.submit(texts[0]))[np.newaxis]
+
+
+async def _embed_passages(texts: list[str]) -> EmbeddingArray:
+    return await _embed_batcher.submit(texts, len(texts))
+
+
+async def embed_query(text: str) -> EmbeddingArray:
+    """Embed a single query string (with the model's query instruction)."""
+    if EMBEDDING_CACHE_ENABLED:
+        return cast(EmbeddingArray, (await _cached("query", [text], _embed_one_query))[0])
+    return await _query_batcher.submit(text)
+
+
+async def _sidecar_embed(operation: str, path: str, texts: list[str]) -> EmbeddingArray:
+    """POST an embed endpoint in bounded chunks; a giant batch can't hold one
+    slot forever (#918) and chunk order preserves vector order."""
+    chunks = [
+        await _observed(
+            operation, "sidecar", len(chunk), _sidecar_post_vectors(path, {"texts": chunk})
+        )
+        for chunk in chunk_texts(
+            texts, EMBEDDING_SIDECAR_MAX_BATCH_TEXTS, EMBEDDING_SIDECAR_MAX_BATCH_CHARS
+        )
+    ]
+    return as_embeddings(np.concatenate(chunks)) if chunks else empty_embeddings()
+
+
+async def embed_batch(texts: list[str]) -> EmbeddingArray:
+    """Embed a batch of texts in one fastembed pass: one ``(n, dim)`` row per text."""
+    if not texts:
+        return empty_embeddings()
+    if EMBEDDING_CACHE_ENABLED:
+        return await _cached("passage", texts, _embed_passages)
+    return await _embed_passages(texts)
+
+
+async def _rerank_one(query: str, documents: list[str]) -> list[float]:
     if _sidecar_url():
         scores: list[float] = []
         # The query is sent with every chunk, so it consumes char budget too.
@@ -306,3 +488,10 @@ async def rerank(query: str, documents: list[str]) -> list[float]:
     return await _observed(
         "rerank", "local", len(documents), asyncio.to_thread(_rerank_sync, query, documents)
     )
+
+
+async def rerank(query: str, documents: list[str]) -> list[float]:
+    """Return relevance scores for documents, aligned with input order."""
+    if not documents:
+        return []
+    return await _rerank_batcher.submit((query, documents), len(documents))
@@ -3,7 +3,8 @@
 All heavy lifting lives in the focused modules; the facade only binds them
 into one object so call sites read ``memory_engine.<operation>(...)``:
 
-- ``ingestion``     — write path: retain / retain_single / summarize_episode
+- ``ingestion``     — write path: retain / retain_many / retain_single /
+                      summarize_episode
 - ``consolidation`` — background: debounced core-document rewrites
 - ``retrieval``     — read path: recall / recall_episodes (hybrid, zero-LLM)
 - ``context``       — hot path: get_core_context (Redis-cached, every turn)
@@ -11,9 +12,9 @@ into one object so call sites read ``memory_engine.<operation>(...)``:
 """
 
 from app.memory import consolidation, context, ingestion, management, retrieval
-from app.memory.ingestion import RetainedMemory, RetainResult
+from app.memory.ingestion import RetainedMemory, RetainResult, RetainSession
 
-__all__ = ["MemoryEngine", "RetainResult", "RetainedMemory", "memory_engine"]
+__all__ = ["MemoryEngine", "RetainResult", "RetainSession", "RetainedMemory", "memory_engine"]
 
 
 class MemoryEngine:
@@ -21,6 +22,7 @@ class MemoryEngine:
 
     # --- write path (plan F2) ------------------------------------------------
     retain = staticmethod(ingestion.retain)
+    retain_many = staticmethod(ingestion.retain_many)
     retain_single = staticmethod(ingestion.retain_single)
     summarize_episode = staticmethod(ingestion.summarize_episode)
     consolidate = staticmethod(consolidation.consolidate)
@@ -5,9 +5,23 @@ after a turn ends — it never raises into callers for LLM failures
 (extraction degrades to an empty batch upstream). Every ingestion schedules
 the hash-gated ``/workspace/memory`` projection sync and a debounced
 core-document consolidation for the docs its changes touch.
+
+It runs as a small stage graph (``_RETAIN_STAGES``): once extraction is
+done, the fact branch (embed -> reconcile -> apply), the journal branch and
+the transcript-chunk branch run concurrently, and ``finalize`` joins them.
+Each retain logs every stage's duration plus the critical path through the
+graph, so the wide event shows which branch bounded the ingestion.
+
+``retain_many`` replays a series of transcripts (backfills) through the same
+stages, overlapping the extraction LLM calls and batching the embeddings of
+several transcripts while still reconciling and applying them in order.
 """
 
-from dataclasses import dataclass
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from datetime import UTC, date as date_type, datetime
 import time
 import uuid
@@ -36,17 +50,31 @@ from app.memory.embeddings import embed_batch, embed_query
 from app.memory.extraction import categorize_fact, extract_memories, summarize_episode_entries
 from app.memory.mappers import row_to_entry
 from app.memory.reconciliation import ReconciledFact, reconcile
-from app.memory.schemas import ExtractedFact
+from app.memory.schemas import ExtractedFact, ExtractedMemoryBatch
+from app.memory.vectors import EmbeddingArray, empty_embeddings, split_rows
 from app.models.memory_db_models import MemoryRecord
 from app.models.memory_models import MemoryEntry
 from app.models.payment_models import PlanType
-from app.services.memory_fs import schedule_memory_vfs_sync
+from app.services.memory_fs import MemoryVfsChange, schedule_memory_vfs_sync
 from app.services.payments.payment_service import payment_service
 from shared.py.wide_events import MemoryContext, UserContext, log
 
 _DEFAULT_USER_NAME = "the user"
 _FALLBACK_CATEGORY_PATH = "general"
 
+# The retain stage graph: stage -> the stages whose output it waits on. The
+# three branches off ``extract`` (facts, episodes, chunks) run concurrently.
+_RETAIN_STAGES: dict[str, tuple[str, ...]] = {
+    "context": (),
+    "extract": ("context",),
+    "embed": ("extract",),
+    "reconcile": ("embed",),
+    "apply": ("reconcile",),
+    "episodes": ("extract",),
+    "chunks": ("extract",),
+    "finalize": ("apply", "episodes", "chunks"),
+}
+
 
 class MemoryLimitReachedError(Exception):
     """An explicit memory add was blocked by the free plan's live-fact cap.
@@ -154,6 +182,78 @@ class RetainedMemory:
     outcome: ReconcileOutcome
 
 
+@dataclass
+class RetainSession:
+    """One transcript queued for ``retain_many``, with ``retain``'s arguments."""
+
+    messages: list[dict[str, str]]
+    source_type: MemorySourceType
+    source_id: str | None = None
+    now: datetime | None = None
+    extraction_hints: str | None = None
+
+
+class _StageClock:
+    """Wall-clock span of every retain stage, for the critical-path report."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._spans: dict[str, tuple[float, float]] = {}
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, start, time.perf_counter())
+
+    def record(self, name: str, start: float, end: float) -> None:
+        self._spans[name] = (start, end)
+
+    def critical_path(self) -> list[str]:
+        """The chain of stages that set the total: from the last stage to
+        finish, back through whichever of its inputs finished last."""
+        if not self._spans:
+            return []
+        name = max(self._spans, key=lambda stage: self._spans[stage][1])
+        path = [name]
+        while inputs := [stage for stage in _RETAIN_STAGES.get(name, ()) if stage in self._spans]:
+            name = max(inputs, key=lambda stage: self._spans[stage][1])
+            path.append(name)
+        path.reverse()
+        return path
+
+    def timings(self) -> dict[str, float]:
+        """``<stage>_ms`` per stage, plus ``total_ms``, ``critical_path_ms``
+        (the stages on the critical path) and ``serial_ms`` (every stage back
+        to back — what the ingestion would cost without the overlap)."""
+        durations = {name: int((end - start) * 1000) for name, (start, end) in self._spans.items()}
+        timings = {f"{name}_ms": float(duration) for name, duration in durations.items()}
+        timings["total_ms"] = float(_elapsed_ms(self.started))
+        timings["critical_path_ms"] = float(sum(durations[name] for name in self.critical_path()))
+        timings["serial_ms"] = float(sum(durations.values()))
+        return timings
+
+
+@dataclass
+class _Extracted:
+    """A transcript that went through extraction and awaits embed + apply."""
+
+    batch: ExtractedMemoryBatch
+    now: datetime
+    clock: _StageClock
+    chunks: list[str] = field(default_factory=list)
+
+    @property
+    def empty(self) -> bool:
+        return (
+            not self.batch.facts
+            and not self.batch.episode_entries
+            and not self.batch.agenda_updates
+        )
+
+
 @dataclass
 class _ApplyResult:
     """Rows written by ``_apply_reconciled`` plus graph counts."""
@@ -165,6 +265,20 @@ class _ApplyResult:
     extended: int
     entities_linked: int = 0
     edges_added: int = 0
+    # Ids of the rows UPDATES chained a new version onto.
+    superseded_ids: list[str] = field(default_factory=list)
+
+    def projection_change(self, days: Sequence[date_type] = ()) -> MemoryVfsChange:
+        """The projected pages these rows (and the journal ``days``) touched.
+
+        A superseded row's page is included by id: its folder may differ
+        from the new version's.
+        """
+        return MemoryVfsChange(
+            memory_ids=set(self.superseded_ids),
+            categories={record.category_path for record, _ in self.inserted},
+            days=set(days),
+        )
 
 
 async def retain(
@@ -184,8 +298,7 @@ async def retain(
     callers replay historical sessions (backfills, benchmarks) at their real
     time. Defaults to the current UTC time.
     """
-    timings: dict[str, int] = {}
-    started = time.perf_counter()
+    clock = _StageClock()
     now = now or datetime.now(UTC)
 
     # Set operation context up front so a mid-ingest failure still attributes
@@ -195,26 +308,171 @@ async def retain(
         memory=MemoryContext(operation="retain", source_type=source_type.value),
     )
 
-    folder_tree = await pg_store.get_folder_tree(user_id)
-    recent_facts = await pg_store.get_recent_facts(user_id, limit=RECENT_FACTS_LIMIT)
-    today_episode = await pg_store.get_episode(user_id, now.date())
+    extracted = await _extract(
+        user_id,
+        messages,
+        source_type=source_type,
+        extraction_hints=extraction_hints,
+        user_name=user_name,
+        now=now,
+        clock=clock,
+    )
+    if extracted.empty:
+        return _log_empty_retain(source_type)
+
+    return await _apply_extracted(
+        user_id, messages, extracted, source_type=source_type, source_id=source_id
+    )
+
+
+async def retain_many(
+    user_id: str,
+    sessions: Sequence[RetainSession],
+    *,
+    user_name: str | None = None,
+    concurrency: int = 1,
+) -> AsyncIterator[tuple[RetainSession, RetainResult]]:
+    """Ingest ``sessions`` in order, yielding each one's result once applied.
+
+    Equivalent to awaiting ``retain`` on each session in turn, pipelined:
+
+    - up to ``concurrency`` extraction LLM calls run ahead of the apply
+      cursor, so the next transcripts are being read while the current
+      one is written;
+    - every transcript whose extraction has finished when the cursor
+      reaches it shares one ``embed_batch`` call (facts and transcript
+      chunks together);
+    - reconcile + apply stay strictly sequential and in input order. Each
+      transcript is reconciled against the store *after* everything before
+      it landed, so dedup and supersession decide exactly as they would
+      one ``retain`` at a time.
+
+    The only thing the overlap changes is the extraction prompt's context
+    (recent facts, folder tree, today's journal), which is read when the
+    extraction starts and so may not yet include the transcripts still in
+    flight ahead of it; reconciliation, not that hint, is what dedups.
+
+    A session's result is yielded after it is fully applied, so a caller
+    can checkpoint progress between yields. Closing the generator early
+    cancels the extractions still running ahead.
+    """
+    remaining = iter(sessions)
+    extracting: deque[tuple[RetainSession, asyncio.Task[_Extracted]]] = deque()
+
+    def _top_up() -> None:
+        while len(extracting) < concurrency:
+            session = next(remaining, None)
+            if session is None:
+                return
+            task = asyncio.ensure_future(_extract_session(user_id, session, user_name))
+            extracting.append((session, task))
+
+    try:
+        _top_up()
+        while extracting:
+            # Apply order is input order, whichever extraction finishes first.
+            session, task = extracting.popleft()
+            window = [(session, await task)]
+            while extracting and extracting[0][1].done():
+                session, task = extracting.popleft()
+                window.append((session, task.result()))
+            _top_up()
+
+            embedded = await _embed_window([extracted for _, extracted in window])
+            for (session, extracted), (fact_embeddings, chunk_embeddings) in zip(
+                window, embedded, strict=True
+            ):
+                if extracted.empty:
+                    yield session, _log_empty_retain(session.source_type)
+                    continue
+                result = await _apply_extracted(
+                    user_id,
+                    session.messages,
+                    extracted,
+                    source_type=session.source_type,
+                    source_id=session.source_id,
+                    fact_embeddings=fact_embeddings,
+                    chunk_embeddings=chunk_embeddings,
+                )
+                yield session, result
+    finally:
+        for _, task in extracting:
+            task.cancel()
+
+
+async def _extract_session(
+    user_id: str, session: RetainSession, user_name: str | None
+) -> _Extracted:
+    """``_extract`` for one ``retain_many`` session, plus its transcript chunks."""
+    extracted = await _extract(
+        user_id,
+        session.messages,
+        source_type=session.source_type,
+        extraction_hints=session.extraction_hints,
+        user_name=user_name,
+        now=session.now or datetime.now(UTC),
+        clock=_StageClock(),
+    )
+    if not extracted.empty:
+        extracted.chunks = _transcript_chunks(session.messages)
+    return extracted
+
+
+async def _embed_window(
+    window: list[_Extracted],
+) -> list[tuple[EmbeddingArray, EmbeddingArray]]:
+    """Embed the facts and transcript chunks of several sessions in one call.
+
+    Returns ``(fact_embeddings, chunk_embeddings)`` per session, in order.
+    """
+    texts: list[str] = []
+    sizes: list[int] = []
+    for extracted in window:
+        texts += [fact.content for fact in extracted.batch.facts]
+        texts += extracted.chunks
+        sizes += [len(extracted.batch.facts), len(extracted.chunks)]
+
+    start = time.perf_counter()
+    matrix = await embed_batch(texts) if texts else empty_embeddings()
+    end = time.perf_counter()
+    for extracted in window:
+        extracted.clock.record("embed", start, end)
+    rows = split_rows(matrix, sizes)
+    return list(zip(rows[0::2], rows[1::2], strict=True))
+
+
+async def _extract(
+    user_id: str,
+    messages: list[dict[str, str]],
+    *,
+    source_type: MemorySourceType,
+    extraction_hints: str | None,
+    user_name: str | None,
+    now: datetime,
+    clock: _StageClock,
+) -> _Extracted:
+    """Read the extraction context and run the extraction LLM call."""
+    with clock.stage("context"):
+        folder_tree, recent_facts, today_episode = await asyncio.gather(
+            pg_store.get_folder_tree(user_id),
+            pg_store.get_recent_facts(user_id, limit=RECENT_FACTS_LIMIT),
+            pg_store.get_episode(user_id, now.date()),
+        )
     journaled_today = (
         [entry.get("text", "") for entry in today_episode.entries] if today_episode else []
     )
-    timings["context_ms"] = _elapsed_ms(started)
 
-    stage = time.perf_counter()
-    batch = await extract_memories(
-        messages,
-        user_id=user_id,
-        user_name=user_name or _DEFAULT_USER_NAME,
-        folder_tree=_format_folder_tree(folder_tree),
-        recent_facts=recent_facts,
-        journaled_today=journaled_today,
-        extraction_hints=extraction_hints,
-        current_date=now,
-    )
-    timings["extract_ms"] = _elapsed_ms(stage)
+    with clock.stage("extract"):
+        batch = await extract_memories(
+            messages,
+            user_id=user_id,
+            user_name=user_name or _DEFAULT_USER_NAME,
+            folder_tree=_format_folder_tree(folder_tree),
+            recent_facts=recent_facts,
+            journaled_today=journaled_today,
+            extraction_hints=extraction_hints,
+            current_date=now,
+        )
 
     if source_type is MemorySourceType.EMAIL:
         # A mailbox (especially a founder's or support address) is not the
@@ -224,85 +482,73 @@ async def retain(
         # extraction prompt is responsible for not storing inbound senders.
         batch.episode_entries = []
         batch.agenda_updates = []
+    return _Extracted(batch=batch, now=now, clock=clock)
 
-    result = RetainResult(facts_extracted=len(batch.facts))
-    if not batch.facts and not batch.episode_entries and not batch.agenda_updates:
-        log.set(
-            memory=MemoryContext(
-                operation="retain",
-                source_type=source_type.value,
-                facts_extracted=0,
-                result_count=0,
-                success=True,
-            )
+
+def _log_empty_retain(source_type: MemorySourceType) -> RetainResult:
+    """Close out a retain whose extraction found nothing to store."""
+    log.set(
+        memory=MemoryContext(
+            operation="retain",
+            source_type=source_type.value,
+            facts_extracted=0,
+            result_count=0,
+            success=True,
         )
-        return result
-
-    stage = time.perf_counter()
-    embeddings = await embed_batch([fact.content for fact in batch.facts])
-    timings["embed_ms"] = _elapsed_ms(stage)
-
-    stage = time.perf_counter()
-    reconciled = await reconcile(user_id, batch.facts, embeddings)
-    timings["reconcile_ms"] = _elapsed_ms(stage)
-
-    # Free-plan cap: passive ingestion admits only as many growth facts
-    # (NEW/EXTENDS) as fit under the cap and silently drops the rest, so a
-    # batch that crosses the cap lands exactly at it rather than overshooting
-    # (48 live + 10 new must not become 58). Concurrent same-user batches can
-    # transiently exceed the cap by a few facts (the check is not a reservation
-    # by design — enforcement stays fail-open), after which growth stops, so
-    # the cap is exact per batch and convergent, not globally atomic. UPDATES
-    # supersede (net count unchanged) so what GAIA knows stays current, and
-    # reads are never gated — the cap blocks growth, it does not lobotomize.
-    # Facts keep reconciliation order (input order), so earlier facts in the
-    # transcript win the remaining slots deterministically.
-    growth = sum(
-        1 for item in reconciled if item.outcome in (ReconcileOutcome.NEW, ReconcileOutcome.EXTENDS)
     )
-    remaining = await _free_cap_remaining(user_id, growth)
-    if remaining is not None:
-        reconciled, dropped = _enforce_free_cap(reconciled, remaining)
-        if dropped:
-            log.info(
-                "memory_cap_reached",
-                event_name="memory_cap_reached",
-                user_id=user_id,
-                dropped=dropped,
-                limit=FREE_MEMORY_FACT_LIMIT,
-            )
+    return RetainResult(facts_extracted=0)
 
-    stage = time.perf_counter()
-    applied = await _apply_reconciled(
-        user_id, reconciled, source_type=source_type, source_id=source_id, mentioned_at=now
-    )
-    result.new = applied.new
-    result.updated = applied.updated
-    result.extended = applied.extended
-    result.duplicates = applied.duplicates
-    result.entities_linked = applied.entities_linked
-    result.edges_added = applied.edges_added
-    timings["apply_ms"] = _elapsed_ms(stage)
-
-    stage = time.perf_counter()
-    result.episode_entries = await _append_episode_entries(
-        user_id, batch.episode_entries, source_type=source_type, now=now
-    )
-    await _summarize_rolled_over_days(user_id, today=now.date())
-    timings["episodes_ms"] = _elapsed_ms(stage)
 
-    stage = time.perf_counter()
-    await _store_conversation_chunks(user_id, messages, source_id=source_id, now=now)
-    timings["chunks_ms"] = _elapsed_ms(stage)
+async def _apply_extracted(
+    user_id: str,
+    messages: list[dict[str, str]],
+    extracted: _Extracted,
+    *,
+    source_type: MemorySourceType,
+    source_id: str | None,
+    fact_embeddings: EmbeddingArray | None = None,
+    chunk_embeddings: EmbeddingArray | None = None,
+) -> RetainResult:
+    """Run the post-extraction stages of one transcript and log the report.
 
-    await invalidate_user_memory_caches(user_id)
-    await _schedule_post_ingest(
-        user_id,
-        inserted_facts=[fact for _, fact in applied.inserted],
-        agenda_updates=batch.agenda_updates,
+    The fact, episode and chunk branches share no data, so they run
+    concurrently; ``finalize`` (cache invalidation, post-ingest scheduling)
+    waits for all three. Embeddings the caller already computed are used
+    as-is, otherwise each branch embeds its own texts.
+    """
+    batch, clock = extracted.batch, extracted.clock
+    applied, (episode_entries, summarized_days), _ = await asyncio.gather(
+        _retain_facts(
+            user_id,
+            extracted,
+            fact_embeddings,
+            source_type=source_type,
+            source_id=source_id,
+        ),
+        _retain_episodes(user_id, extracted, source_type=source_type),
+        _retain_chunks(user_id, messages, extracted, chunk_embeddings, source_id=source_id),
     )
+    result = RetainResult(
+        facts_extracted=len(batch.facts),
+        new=applied.new,
+        updated=applied.updated,
+        extended=applied.extended,
+        duplicates=applied.duplicates,
+        entities_linked=applied.entities_linked,
+        edges_added=applied.edges_added,
+        episode_entries=episode_entries,
+    )
+
+    with clock.stage("finalize"):
+        await invalidate_user_memory_caches(user_id)
+        journal_days = [extracted.now.date()] if episode_entries else []
+        await _schedule_post_ingest(
+            user_id,
+            inserted_facts=[fact for _, fact in applied.inserted],
+            agenda_updates=batch.agenda_updates,
+            vfs_change=applied.projection_change([*journal_days, *summarized_days]),
+        )
 
-    timings["total_ms"] = _elapsed_ms(started)
     log.set(
         memory=MemoryContext(
             operation="retain",
@@ -317,12 +563,102 @@ async def retain(
             edges_added=result.edges_added,
             episode_entries=result.episode_entries,
             success=True,
-            timings={key: float(value) for key, value in timings.items()},
+            timings=clock.timings(),
+            critical_path=clock.critical_path(),
         ),
     )
     return result
 
 
+async def _retain_facts(
+    user_id: str,
+    extracted: _Extracted,
+    embeddings: EmbeddingArray | None,
+    *,
+    source_type: MemorySourceType,
+    source_id: str | None,
+) -> _ApplyResult:
+    """Fact branch: embed -> reconcile -> free-plan cap -> apply."""
+    facts, clock = extracted.batch.facts, extracted.clock
+    if embeddings is None:
+        with clock.stage("embed"):
+            embeddings = await embed_batch([fact.content for fact in facts])
+
+    with clock.stage("reconcile"):
+        reconciled = await reconcile(user_id, facts, embeddings)
+
+    with clock.stage("apply"):
+        # Free-plan cap: passive ingestion admits only as many growth facts
+        # (NEW/EXTENDS) as fit under the cap and silently drops the rest, so a
+        # batch that crosses the cap lands exactly at it rather than overshooting
+        # (48 live + 10 new must not become 58). Concurrent same-user batches can
+        # transiently exceed the cap by a few facts (the check is not a reservation
+        # by design — enforcement stays fail-open), after which growth stops, so
+        # the cap is exact per batch and convergent, not globally atomic. UPDATES
+        # supersede (net count unchanged) so what GAIA knows stays current, and
+        # reads are never gated — the cap blocks growth, it does not lobotomize.
+        # Facts keep reconciliation order (input order), so earlier facts in the
+        # transcript win the remaining slots deterministically.
+        growth = sum(
+            1
+            for item in reconciled
+            if item.outcome in (ReconcileOutcome.NEW, ReconcileOutcome.EXTENDS)
+        )
+        remaining = await _free_cap_remaining(user_id, growth)
+        if remaining is not None:
+            reconciled, dropped = _enforce_free_cap(reconciled, remaining)
+            if dropped:
+                log.info(
+                    "memory_cap_reached",
+                    event_name="memory_cap_reached",
+                    user_id=user_id,
+                    dropped=dropped,
+                    limit=FREE_MEMORY_FACT_LIMIT,
+                )
+
+        return await _apply_reconciled(
+            user_id,
+            reconciled,
+            source_type=source_type,
+            source_id=source_id,
+            mentioned_at=extracted.now,
+        )
+
+
+async def _retain_episodes(
+    user_id: str, extracted: _Extracted, *, source_type: MemorySourceType
+) -> tuple[int, list[date_type]]:
+    """Episode branch: today's journal lines, and summaries of past days.
+
+    The two touch different days (rollover only summarizes days before
+    ``now``), so they run side by side. Returns the journal lines added and
+    the past days rolled over.
+    """
+    now = extracted.now
+    with extracted.clock.stage("episodes"):
+        return await asyncio.gather(
+            _append_episode_entries(
+                user_id, extracted.batch.episode_entries, source_type=source_type, now=now
+            ),
+            _summarize_rolled_over_days(user_id, today=now.date()),
+        )
+
+
+async def _retain_chunks(
+    user_id: str,
+    messages: list[dict[str, str]],
+    extracted: _Extracted,
+    embeddings: EmbeddingArray | None,
+    *,
+    source_id: str | None,
+) -> None:
+    """Chunk branch: the verbatim transcript tier."""
+    with extracted.clock.stage("chunks"):
+        await _store_conversation_chunks(
+            user_id, messages, source_id=source_id, now=extracted.now, embeddings=embeddings
+        )
+
+
 async def retain_single(
     user_id: str,
     content: str,
@@ -364,6 +700,7 @@ async def retain_single(
         user_id,
         inserted_facts=[inserted_fact for _, inserted_fact in applied.inserted],
         agenda_updates=[],
+        vfs_change=applied.projection_change(),
     )
 
     if applied.inserted:
@@ -389,6 +726,8 @@ async def summarize_episode(user_id: str, date: date_type) -> None:
     Lives here (not consolidation.py) because rollover is part of the
     ingestion flow: it fires lazily on the first retain of a new day,
     while consolidation is a separate debounced pass over the core docs.
+    Schedules the day's journal page for the projection, since callers such as
+    the backfill summarize outside any retain.
     """
     episode = await pg_store.get_episode(user_id, date)
     if episode is None or episode.summary or not episode.entries:
@@ -400,6 +739,7 @@ async def summarize_episode(user_id: str, date: date_type) -> None:
         return
 
     await pg_store.set_episode_summary(user_id, date, summary)
+    schedule_memory_vfs_sync(user_id, MemoryVfsChange(days={date}))
     embedding = await embed_query(summary)
     item: EpisodeVectorItem = {
         "id": f"{user_id}:{date.isoformat()}",
@@ -459,6 +799,7 @@ async def _apply_reconciled(
 ) -> _ApplyResult:
     """Write reconciled facts to Postgres + Chroma and wire up the graph."""
     inserted: list[tuple[MemoryRecord, ExtractedFact]] = []
+    superseded_ids: list[str] = []
     new = updated = extended = duplicates = 0
 
     new_and_extends = [
@@ -520,7 +861,8 @@ async def _apply_reconciled(
                 await pg_store.insert_memories([record])
                 new += 1
             else:
-                await chroma_store.set_memory_flags(item.target_memory_id, is_latest=False)
+                await chroma_store.set_memory_flags(user_id, item.target_memory_id, is_latest=False)
+                superseded_ids.append(item.target_memory_id)
                 updated += 1
             inserted.append((record, item.fact))
 
@@ -557,6 +899,7 @@ async def _apply_reconciled(
         extended=extended,
         entities_linked=entities_linked,
         edges_added=edges_added,
+        superseded_ids=superseded_ids,
     )
 
 
@@ -600,6 +943,7 @@ async def _store_conversation_chunks(
     *,
     source_id: str | None,
     now: datetime,
+    embeddings: EmbeddingArray | None = None,
 ) -> None:
     """Embed the raw transcript in chunks (verbatim retention tier).
 
@@ -607,7 +951,31 @@ async def _store_conversation_chunks(
     micro-details ("the exact move GAIA suggested", "the 27th item in that
     list"). Chunking the transcript keeps those details searchable via
     ``recall_transcripts`` without polluting the fact store.
+
+    ``embeddings`` are the chunks' vectors when the caller already embedded
+    ``_transcript_chunks(messages)`` (``retain_many``'s shared batch).
     """
+    chunks = _transcript_chunks(messages)
+    if not chunks:
+        return
+
+    if embeddings is None:
+        embeddings = await embed_batch(chunks)
+    session_key = source_id or uuid.uuid4().hex[:12]
+    items: list[ConversationChunkItem] = [
+        {
+            "id": f"{user_id}:{session_key}:{index}",
+            "embedding": embedding,
+            "document": chunk,
+            "metadata": {"user_id": user_id, "date": now.date().isoformat()},
+        }
+        for index, (chunk, embedding) in enumerate(zip(chunks, embeddings))
+    ]
+    await chroma_store.upsert_conversation_chunks(items)
+
+
+def _transcript_chunks(messages: list[dict[str, str]]) -> list[str]:
+    """Split a transcript into the role-prefixed chunks stored for recall."""
     chunks: list[str] = []
     current: list[str] = []
     current_len = 0
@@ -638,22 +1006,7 @@ async def _store_conversation_chunks(
         if len(current) >= TRANSCRIPT_CHUNK_TURNS or current_len >= TRANSCRIPT_CHUNK_MAX_CHARS:
             _flush()
     _flush()
-    chunks = chunks[:TRANSCRIPT_CHUNKS_PER_SESSION_CAP]
-    if not chunks:
-        return
-
-    embeddings = await embed_batch(chunks)
-    session_key = source_id or uuid.uuid4().hex[:12]
-    items: list[ConversationChunkItem] = [
-        {
-            "id": f"{user_id}:{session_key}:{index}",
-            "embedding": embedding,
-            "document": chunk,
-            "metadata": {"user_id": user_id, "date": now.date().isoformat()},
-        }
-        for index, (chunk, embedding) in enumerate(zip(chunks, embeddings))
-    ]
-    await chroma_store.upsert_conversation_chunks(items)
+    return chunks[:TRANSCRIPT_CHUNKS_PER_SESSION_CAP]
 
 
 async def _append_episode_entries(
@@ -674,10 +1027,15 @@ async def _append_episode_entries(
     return len(episode_entries)
 
 
-async def _summarize_rolled_over_days(user_id: str, today: date_type) -> None:
-    """Lazily summarize any past day that has entries but no summary yet."""
-    for date in await pg_store.get_unsummarized_episode_dates(user_id, today):
+async def _summarize_rolled_over_days(user_id: str, today: date_type) -> list[date_type]:
+    """Lazily summarize any past day that has entries but no summary yet.
+
+    Returns the days attempted.
+    """
+    dates = await pg_store.get_unsummarized_episode_dates(user_id, today)
+    for date in dates:
         await summarize_episode(user_id, date)
+    return dates
 
 
 async def _schedule_post_ingest(
@@ -685,14 +1043,15 @@ async def _schedule_post_ingest(
     *,
     inserted_facts: list[ExtractedFact],
     agenda_updates: list[str],
+    vfs_change: MemoryVfsChange,
 ) -> None:
     """Fire-and-forget follow-ups after every ingestion.
 
-    The projection sync always runs (journal entries change even when no
-    fact landed; the hash gate makes true no-ops ~free). Consolidation is
-    debounced and only scheduled for the docs this ingestion touched.
+    The projection sync rewrites the pages in ``vfs_change``: the folders
+    that gained or lost a fact and the journal days written. Consolidation
+    is debounced and only scheduled for the docs this ingestion touched.
     """
-    schedule_memory_vfs_sync(user_id)
+    schedule_memory_vfs_sync(user_id, vfs_change)
     doc_types = infer_doc_types(inserted_facts, agenda_updates)
     if doc_types:
         await schedule_consolidation(user_id, doc_types, agenda_updates=agenda_updates)
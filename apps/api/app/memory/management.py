@@ -35,7 +35,7 @@ from app.models.memory_models import (
     MemoryTreeNode,
     MemoryTreeResponse,
 )
-from app.services.memory_fs import schedule_memory_vfs_sync
+from app.services.memory_fs import MemoryVfsChange, schedule_memory_vfs_sync
 
 
 async def get_tree(user_id: str) -> MemoryTreeResponse:
@@ -114,7 +114,7 @@ async def update_document(user_id: str, doc_type: MemoryDocType, content: str) -
     """Rewrite a core document (versioned) and refresh the hot context."""
     row = await pg_store.upsert_document(user_id, doc_type, content)
     await invalidate_core_context(user_id)
-    schedule_memory_vfs_sync(user_id)
+    schedule_memory_vfs_sync(user_id, MemoryVfsChange(documents={doc_type}))
     return document_to_model(row)
 
 
@@ -178,7 +178,7 @@ async def update_memory(user_id: str, memory_id: str, content: str) -> MemoryEnt
     await pg_store.link_entities(row.id, [entity.id for entity in entities])
 
     embedding = await embed_query(content)
-    await chroma_store.set_memory_flags(memory_id, is_latest=False)
+    await chroma_store.set_memory_flags(user_id, memory_id, is_latest=False)
     await chroma_store.upsert_memories(
         [
             {
@@ -196,7 +196,7 @@ async def update_memory(user_id: str, memory_id: str, content: str) -> MemoryEnt
         ]
     )
     await invalidate_user_memory_caches(user_id)
-    schedule_memory_vfs_sync(user_id)
+    schedule_memory_vfs_sync(user_id, MemoryVfsChange(categories={row.category_path}))
     return row_to_entry(row, entities)
 
 
@@ -219,9 +219,9 @@ async def forget_memory(user_id: str, memory_id: str, reason: str) -> bool:
         return False
     if was_live:
         await cap_counter.adjust_live_count(user_id, -1)
-    await chroma_store.set_memory_flags(memory_id, is_forgotten=True)
+    await chroma_store.set_memory_flags(user_id, memory_id, is_forgotten=True)
     await invalidate_user_memory_caches(user_id)
-    schedule_memory_vfs_sync(user_id)
+    schedule_memory_vfs_sync(user_id, MemoryVfsChange(memory_ids={memory_id}))
     return True
 
 
@@ -235,6 +235,7 @@ async def delete_all(user_id: str) -> int:
     await chroma_store.delete_user(user_id)
     await cap_counter.set_cached_live_count(user_id, 0)
     await invalidate_user_memory_caches(user_id)
+    # No change set: the whole tree goes, so re-materialize it in full.
     schedule_memory_vfs_sync(user_id)
     return deleted
 
@@ -35,6 +35,7 @@ from app.memory.pg_store.memories import (
     get_chain,
     get_facts_for_consolidation,
     get_folder_tree,
+    get_live_memories_in_categories,
     get_memories_by_ids,
     get_memories_for_entities,
     get_memory,
@@ -63,6 +64,7 @@ __all__ = [
     "get_episodes_range",
     "get_folder_tree",
     "get_graph",
+    "get_live_memories_in_categories",
     "get_memories_by_ids",
     "get_memories_for_entities",
     "get_memory",
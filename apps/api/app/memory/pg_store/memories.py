@@ -316,6 +316,21 @@ async def get_all_live_memories(user_id: str) -> list[MemoryRecord]:
         return list(result.scalars().all())
 
 
+async def get_live_memories_in_categories(
+    user_id: str, category_paths: list[str]
+) -> list[MemoryRecord]:
+    """Live memories filed exactly under these folders, in projection order."""
+    if not category_paths:
+        return []
+    async with memory_session() as session:
+        result = await session.execute(
+            _active_memories_query(user_id)
+            .where(MemoryRecord.category_path.in_(category_paths))
+            .order_by(MemoryRecord.category_path, MemoryRecord.created_at.desc())
+        )
+        return list(result.scalars().all())
+
+
 async def get_recent_facts(user_id: str, limit: int = 10) -> list[str]:
     """Contents of the most recently stored live memories, newest first."""
     async with memory_session() as session:
@@ -12,6 +12,13 @@ Layout under ``<user_root>/memory/``::
     journal/YYYY-MM-DD.md         last 30 days, mode 0444
     facts/<category_path>.md      one file per leaf folder, mode 0444
 
+Two ways in. :func:`materialize_memory` reconciles the whole tree against a
+full projection: it reads every file back and walks the tree for strays.
+:func:`apply_memory_changes` rewrites and removes only the files one write
+touched, without reading or listing anything, and drops the catalog marker.
+Dropping the marker means the next full pass always re-materializes rather
+than trusting a hash that no longer describes the tree.
+
 The Postgres glue lives in :mod:`app.services.memory_fs`.
 """
 
@@ -33,6 +40,7 @@ from app.services.storage._vfs_common import (
 
 MEMORY_DIRNAME = "memory"
 MEMORY_MARKER = ".gaia/memory.v"
+MEMORY_RECONCILED_MARKER = ".gaia/memory.reconciled"
 JOURNAL_DIRNAME = "journal"
 FACTS_DIRNAME = "facts"
 
@@ -63,6 +71,11 @@ def memory_marker_path(user_root: Path) -> Path:
     return user_root / MEMORY_MARKER
 
 
+def memory_reconciled_path(user_root: Path) -> Path:
+    """When the last full materialization ran (unix seconds)."""
+    return user_root / MEMORY_RECONCILED_MARKER
+
+
 # ====================================================================
 # rendering (pure helpers the Postgres glue feeds with primitives)
 # ====================================================================
@@ -121,6 +134,43 @@ def materialize_memory(user_root: Path, docs: list[MemoryFileProjection], guide_
     return written
 
 
+def apply_memory_changes(
+    user_root: Path, docs: list[MemoryFileProjection], removed_paths: list[str]
+) -> int:
+    """Write ``docs`` and delete ``removed_paths`` under ``<user_root>/memory/``.
+
+    Only the named files are touched: nothing is read back and nothing is
+    listed, so the cost is one write per changed page however large the
+    tree is. The catalog marker goes first, so a crash halfway through
+    leaves the next full sync to repair the tree. Returns the file bodies
+    written.
+    """
+    memory_marker_path(user_root).unlink(missing_ok=True)
+    memory_root = user_root / MEMORY_DIRNAME
+    for doc in docs:
+        target = memory_root / doc["path"]
+        target.parent.mkdir(parents=True, exist_ok=True)
+        write_readonly_body(target, doc["content"])
+    for path in removed_paths:
+        target = memory_root / path
+        target.unlink(missing_ok=True)
+        _prune_empty_parents(target.parent, memory_root)
+    return len(docs)
+
+
+def _prune_empty_parents(directory: Path, memory_root: Path) -> None:
+    """Remove ``directory`` and its ancestors below ``memory_root`` while empty.
+
+    ``rmdir`` refuses a non-empty directory, which is the emptiness check.
+    """
+    while directory != memory_root and memory_root in directory.parents:
+        try:
+            directory.rmdir()
+        except OSError:
+            return
+        directory = directory.parent
+
+
 def _remove_stale_paths(memory_root: Path, expected: set[str]) -> None:
     """Drop files no longer projected and prune directories they emptied.
 
@@ -142,9 +192,12 @@ __all__ = [
     "JOURNAL_DIRNAME",
     "MEMORY_DIRNAME",
     "MEMORY_MARKER",
+    "MEMORY_RECONCILED_MARKER",
     "MemoryFileProjection",
+    "apply_memory_changes",
     "materialize_memory",
     "memory_marker_path",
+    "memory_reconciled_path",
     "per_doc_signature",
     "render_facts_page",
     "render_journal_page",
@@ -9,7 +9,6 @@ the only thing allowed to decide UPDATES vs EXTENDS vs DUPLICATE. Similarity
 alone never auto-drops a fact, so an update is never silently lost.
 """
 
-import asyncio
 from dataclasses import dataclass
 from datetime import UTC, datetime
 import re
@@ -23,6 +22,7 @@ from app.constants.memory import (
 from app.memory import chroma_store, pg_store
 from app.memory.extraction import SimilarMemory, reconcile_facts
 from app.memory.schemas import ExtractedFact
+from app.memory.vectors import EmbeddingArray
 
 _WHITESPACE = re.compile(r"\s+")
 
@@ -37,7 +37,7 @@ class ReconciledFact:
     """An extracted fact with its verdict against the existing store."""
 
     fact: ExtractedFact
-    embedding: list[float]
+    embedding: EmbeddingArray
     outcome: ReconcileOutcome
     target_memory_id: str | None = None
 
@@ -45,18 +45,19 @@ class ReconciledFact:
 async def reconcile(
     user_id: str,
     facts: list[ExtractedFact],
-    embeddings: list[list[float]],
+    embeddings: EmbeddingArray,
 ) -> list[ReconciledFact]:
-    """Decide NEW/UPDATES/EXTENDS/DUPLICATE for each fact, in input order."""
+    """Decide NEW/UPDATES/EXTENDS/DUPLICATE for each fact, in input order.
+
+    ``embeddings`` holds one row per fact; each verdict keeps its row as a
+    view, so the batch is never copied on its way to the upsert.
+    """
     if not facts:
         return []
 
-    # One concurrent Chroma scatter rather than N serial roundtrips.
-    similar_lists = await asyncio.gather(
-        *(
-            chroma_store.query_similar(user_id, embedding, n=RECONCILE_CANDIDATES, only_latest=True)
-            for embedding in embeddings
-        )
+    # Every fact's neighbours in one multi-vector Chroma query.
+    similar_lists = await chroma_store.query_similar_many(
+        user_id, embeddings, n=RECONCILE_CANDIDATES, only_latest=True
     )
 
     results: list[ReconciledFact | None] = [None] * len(facts)
@@ -80,7 +81,7 @@ async def reconcile(
 async def _reconcile_ambiguous(
     user_id: str,
     facts: list[ExtractedFact],
-    embeddings: list[list[float]],
+    embeddings: EmbeddingArray,
     ambiguous: list[tuple[int, list[tuple[str, float]]]],
 ) -> dict[int, ReconciledFact]:
     """Resolve the close-match band: exact-text duplicates cheaply, the rest via one LLM call."""
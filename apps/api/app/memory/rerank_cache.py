@@ -0,0 +1,118 @@
+"""Cross-encoder score cache for memory recall.
+
+``recall`` reranks up to ``RERANK_CANDIDATES`` memories (plus graph siblings)
+on every chat turn, and the cross-encoder is the dominant CPU cost of the
+memory block. The same (query, memory) pairs come back constantly: a query
+re-asked after an ingestion dropped the recall cache, follow-up turns that
+share a query, the same memory surfacing for neighbouring queries.
+
+Scores are keyed by ``(model, sha256(normalized query), memory id, memory
+version)``. A memory's content never changes under an id and version —
+updates chain a new row — so a cached score is only ever superseded, never
+wrong.
+
+Two tiers, like ``app.memory.embedding_cache``: a bounded per-process LRU,
+then one Redis hash per query (fields ``{memory_id}:{version}``) so a recall
+reads all of its candidates with a single ``HMGET``. Redis errors fail open:
+the caller scores the pairs itself.
+
+Prometheus: ``memory_rerank_pairs_total`` (Counter, label ``outcome``:
+``cached`` | ``scored`` | ``skipped``) — ``skipped`` counts pairs the recall
+cascade ranked without the cross-encoder.
+"""
+
+from collections import OrderedDict
+from collections.abc import Sequence
+import hashlib
+
+from prometheus_client import Counter
+
+from app.constants.memory import (
+    RERANK_CACHE_LOCAL_SIZE,
+    RERANK_CACHE_TTL_SECONDS,
+    RERANKER_MODEL_NAME,
+)
+from app.db.redis import redis_cache
+from app.memory.embedding_cache import normalize_text
+from app.services.storage.metrics import _register_once
+from shared.py.wide_events import log
+
+MEMORY_RERANK_PAIRS_TOTAL = _register_once(
+    "memory_rerank_pairs_total",
+    lambda: Counter(
+        name="memory_rerank_pairs_total",
+        documentation="Recall (query, memory) pairs, by how their rerank score was obtained",
+        labelnames=("outcome",),
+    ),
+)
+
+
+class RerankScoreCache:
+    """Per-process LRU in front of per-query Redis hashes of raw logits."""
+
+    def __init__(
+        self,
+        model: str = RERANKER_MODEL_NAME,
+        max_size: int = RERANK_CACHE_LOCAL_SIZE,
+        ttl: int = RERANK_CACHE_TTL_SECONDS,
+    ) -> None:
+        self._namespace = hashlib.sha256(model.encode()).hexdigest()[:12]
+        self._max_size = max_size
+        self._ttl = ttl
+        self._entries: OrderedDict[tuple[str, str], float] = OrderedDict()
+
+    def key(self, query: str) -> str:
+        digest = hashlib.sha256(normalize_text(query).encode()).hexdigest()
+        return f"memory:rerank:{self._namespace}:{digest}"
+
+    async def get_many(self, query: str, members: Sequence[str]) -> list[float | None]:
+        """Cached scores aligned with ``members`` (``{memory_id}:{version}``)."""
+        key = self.key(query)
+        found: list[float | None] = []
+        for member in members:
+            score = self._entries.get((key, member))
+            if score is not None:
+                self._entries.move_to_end((key, member))
+            found.append(score)
+
+        missing = [i for i, score in enumerate(found) if score is None]
+        client = redis_cache.redis
+        if missing and client is not None:
+            try:
+                payloads = await client.hmget(key, [members[i] for i in missing])
+            except Exception as exc:
+                log.warning("memory_rerank_cache.redis_get_failed", error=str(exc)[:200])
+                payloads = [None] * len(missing)
+            for i, payload in zip(missing, payloads, strict=True):
+                if payload is not None:
+                    found[i] = float(payload)
+                    self._remember(key, members[i], found[i])
+        return found
+
+    async def put_many(self, query: str, members: Sequence[str], scores: Sequence[float]) -> None:
+        """Store freshly computed scores in both tiers."""
+        key = self.key(query)
+        for member, score in zip(members, scores, strict=True):
+            self._remember(key, member, score)
+        client = redis_cache.redis
+        if not members or client is None:
+            return
+        pipe = client.pipeline(transaction=False)
+        pipe.hset(key, mapping={m: repr(float(s)) for m, s in zip(members, scores, strict=True)})
+        pipe.expire(key, self._ttl)
+        try:
+            await pipe.execute()
+        except Exception as exc:
+            log.warning("memory_rerank_cache.redis_set_failed", error=str(exc)[:200])
+
+    def _remember(self, key: str, member: str, score: float) -> None:
+        self._entries[(key, member)] = score
+        self._entries.move_to_end((key, member))
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+rerank_cache = RerankScoreCache()
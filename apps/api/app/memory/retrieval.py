@@ -42,7 +42,10 @@ from app.constants.memory import (
     RECENCY_BOOST_WEIGHT,
     RELEVANCE_DROPOFF_RATIO,
     RERANK_BLEND_WEIGHT,
+    RERANK_CACHE_ENABLED,
     RERANK_CANDIDATES,
+    RERANK_CASCADE_BUDGET,
+    RERANK_CASCADE_DECISIVE_RANK,
     RRF_K,
     TRANSCRIPT_RECALL_LIMIT,
     MemoryKind,
@@ -53,6 +56,7 @@ from app.decorators.caching import Cacheable
 from app.memory import chroma_store, pg_store
 from app.memory.embeddings import embed_query, rerank
 from app.memory.mappers import row_to_entry
+from app.memory.rerank_cache import MEMORY_RERANK_PAIRS_TOTAL, rerank_cache
 from app.models.memory_db_models import MemoryRecord
 from app.models.memory_models import MemoryEntry, MemorySearchResult
 from shared.py.wide_events import MemoryContext, UserContext, log
@@ -305,11 +309,20 @@ async def _rerank_and_boost(
     rank position. Each candidate also gets an absolute-confidence verdict
     (strong cosine, strong raw logit, or a keyword anchor) used to cap weak
     results downstream.
+
+    Candidates the cascade (``_rerank_scores``) did not send to the
+    cross-encoder have no logit: a decisive one takes the top rerank_norm,
+    a tail one ranks on its retrieval_norm alone.
     """
     if not candidates:
         return []
-    raw_scores = await rerank(query, [row.content for row in candidates])
-    rerank_norm = _min_max_normalize(raw_scores)
+    decisive = [
+        _cascade_decisive(index, row, ann_similarity, fts_ids)
+        for index, row in enumerate(candidates)
+    ]
+    raw_scores = await _rerank_scores(query, candidates, decisive)
+    known_scores = [score for score in raw_scores if score is not None]
+    normalized = iter(_min_max_normalize(known_scores) if known_scores else [])
     total = len(candidates)
     rank_fallback = [1.0 - (index / total) for index in range(total)]
     cosines = [ann_similarity.get(str(row.id)) for row in candidates]
@@ -320,6 +333,10 @@ async def _rerank_and_boost(
         ((cosine - low) / span) if cosine is not None else rank_fallback[index]
         for index, cosine in enumerate(cosines)
     ]
+    rerank_norm = [
+        next(normalized) if raw is not None else 1.0 if is_decisive else rn
+        for raw, is_decisive, rn in zip(raw_scores, decisive, retrieval_norm)
+    ]
     now = datetime.now(UTC)
 
     scored = [
@@ -330,7 +347,7 @@ async def _rerank_and_boost(
             * _importance_boost(row),
             confident=(
                 ann_similarity.get(str(row.id), 0.0) >= CONFIDENT_COSINE
-                or raw >= CONFIDENT_RERANK_LOGIT
+                or (raw is not None and raw >= CONFIDENT_RERANK_LOGIT)
                 or str(row.id) in fts_ids
             ),
         )
@@ -340,6 +357,56 @@ async def _rerank_and_boost(
     return scored
 
 
+def _cascade_decisive(
+    index: int, row: MemoryRecord, ann_similarity: dict[str, float], fts_ids: set[str]
+) -> bool:
+    """Whether the fused rank alone settles this candidate (cascade mode only).
+
+    Near the top of the fused list, found by both retrievers, with a confident
+    cosine: the cross-encoder would only confirm what retrieval agrees on.
+    """
+    memory_id = str(row.id)
+    return (
+        RERANK_CASCADE_BUDGET > 0
+        and index < RERANK_CASCADE_DECISIVE_RANK
+        and memory_id in fts_ids
+        and ann_similarity.get(memory_id, 0.0) >= CONFIDENT_COSINE
+    )
+
+
+async def _rerank_scores(
+    query: str, candidates: list[MemoryRecord], decisive: list[bool]
+) -> list[float | None]:
+    """Raw cross-encoder logits per candidate; ``None`` where the cascade skipped it.
+
+    Cached scores are always used. Of the rest, decisive candidates are
+    skipped and, with a cascade budget, only the first
+    ``RERANK_CASCADE_BUDGET`` (fused order) reach the cross-encoder.
+    """
+    members = [f"{row.id}:{row.version}" for row in candidates]
+    scores: list[float | None] = (
+        await rerank_cache.get_many(query, members)
+        if RERANK_CACHE_ENABLED
+        else [None] * len(candidates)
+    )
+    cached = sum(score is not None for score in scores)
+    pending = [index for index, score in enumerate(scores) if score is None and not decisive[index]]
+    if RERANK_CASCADE_BUDGET:
+        pending = pending[:RERANK_CASCADE_BUDGET]
+    if pending:
+        fresh = await rerank(query, [candidates[index].content for index in pending])
+        for index, score in zip(pending, fresh):
+            scores[index] = score
+        if RERANK_CACHE_ENABLED:
+            await rerank_cache.put_many(query, [members[index] for index in pending], fresh)
+
+    skipped = len(candidates) - cached - len(pending)
+    for outcome, count in (("cached", cached), ("scored", len(pending)), ("skipped", skipped)):
+        if count:
+            MEMORY_RERANK_PAIRS_TOTAL.labels(outcome=outcome).inc(count)
+    return scores
+
+
 def _cap_weak_results(scored: list[_ScoredCandidate]) -> list[tuple[MemoryRecord, float]]:
     """Keep all confident results but at most MAX_WEAK_RESULTS unproven ones.
 
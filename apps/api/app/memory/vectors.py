@@ -0,0 +1,58 @@
+"""Embedding vectors as float32 NumPy arrays, and their binary wire format.
+
+fastembed produces float32 arrays and Chroma stores float32 arrays; the
+memory engine used to convert every vector to a Python ``list[float]`` in
+between (``.tolist()`` in the model helpers, JSON across the sidecar hop,
+back to arrays inside Chroma). Vectors now stay ``EmbeddingArray`` end to
+end: one row per text in a contiguous ``(n, dim)`` batch, or a single
+``(dim,)`` vector.
+
+Between the API and the embedding sidecar they travel as ``.npy`` frames
+(``NPY_MEDIA_TYPE``): a ~128-byte header plus the raw little-endian buffer,
+~4 KB per 1024-dim vector against ~20 KB of JSON text, with no float
+formatting or parsing on either side. ``allow_pickle=False`` on both ends —
+a frame can only ever carry a plain numeric array.
+"""
+
+import io
+
+import numpy as np
+import numpy.typing as npt
+
+from app.constants.memory import EMBEDDING_DIM
+
+EmbeddingArray = npt.NDArray[np.float32]
+
+NPY_MEDIA_TYPE = "application/x-npy"
+
+
+def as_embeddings(vectors: npt.ArrayLike) -> EmbeddingArray:
+    """``vectors`` as a contiguous float32 array (no copy when it already is)."""
+    return np.ascontiguousarray(vectors, dtype=np.float32)
+
+
+def empty_embeddings() -> EmbeddingArray:
+    """A ``(0, EMBEDDING_DIM)`` batch — an empty input's embeddings."""
+    return np.empty((0, EMBEDDING_DIM), dtype=np.float32)
+
+
+def split_rows(matrix: EmbeddingArray, sizes: list[int]) -> list[EmbeddingArray]:
+    """Cut a batched ``(n, dim)`` result back into one row block per caller."""
+    out: list[EmbeddingArray] = []
+    start = 0
+    for size in sizes:
+        out.append(matrix[start : start + size])
+        start += size
+    return out
+
+
+def encode_npy(vectors: EmbeddingArray) -> bytes:
+    """Serialize vectors as one ``.npy`` frame."""
+    buffer = io.BytesIO()
+    np.save(buffer, as_embeddings(vectors), allow_pickle=False)
+    return buffer.getvalue()
+
+
+def decode_npy(frame: bytes) -> EmbeddingArray:
+    """Parse a ``.npy`` frame produced by ``encode_npy``."""
+    return as_embeddings(np.load(io.BytesIO(frame), allow_pickle=False))
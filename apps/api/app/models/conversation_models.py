@@ -135,6 +135,9 @@ class ConversationSearchResults(BaseModel):
 
     messages: list[ConversationMessageHit] = Field(default_factory=list)
     conversations: list[ConversationDescriptionHit] = Field(default_factory=list)
+    # Message hits the page matched before hydration dropped any whose message
+    # is gone (index-backed search only; ``None`` means ``messages`` is exact).
+    matched_messages: int | None = None
 
 
 class _SourceRow(BaseModel):
@@ -161,6 +164,22 @@ class _MessageProjectionRow(BaseModel):
     messages: list[MessageModel] = Field(default_factory=list)
 
 
+class _MessageIdRow(BaseModel):
+    """One element of a ``messages.message_id`` projection."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    message_id: str | None = None
+
+
+class _MessageIdsRow(BaseModel):
+    """Projection of just the ids of a conversation's stored messages."""
+
+    model_config = ConfigDict(extra="ignore")
+
+    messages: list[_MessageIdRow] = Field(default_factory=list)
+
+
 class _OnboardingProbeRow(BaseModel):
     """Projection for the onboarding-demo prompt gate: the flag plus message list."""
 
@@ -0,0 +1,45 @@
+"""SQLAlchemy model for the chat-message keyword search index (Postgres).
+
+MongoDB stays the source of truth for conversations. This table mirrors each
+message's response text so keyword search is an index lookup instead of an
+``$unwind`` + ``$regex`` scan over every conversation a user has.
+"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.db.postgresql import Base
+
+
+class MessageSearchEntry(Base):
+    """One chat message's searchable text, keyed like the Mongo message.
+
+    ``message_at`` is the message's own ``date`` (insert time when it has none)
+    and orders results newest first. Rows can outlive their message — history
+    trimmed by ``$slice`` — so readers hydrate hits from Mongo and drop misses.
+    """
+
+    __tablename__ = "message_search"
+
+    conversation_id: Mapped[str] = mapped_column(String, primary_key=True)
+    message_id: Mapped[str] = mapped_column(String, primary_key=True)
+    user_id: Mapped[str] = mapped_column(String, nullable=False)
+    response: Mapped[str] = mapped_column(Text, nullable=False)
+    message_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        Index("ix_message_search_user_time", "user_id", "message_at"),
+        # Trigram GIN: serves case-insensitive substring ILIKE, so results match
+        # the legacy ``$regex`` search exactly (no stemming, partial words hit).
+        Index(
+            "ix_message_search_response_trgm",
+            "response",
+            postgresql_using="gin",
+            postgresql_ops={"response": "gin_trgm_ops"},
+        ),
+    )
@@ -38,6 +38,8 @@ class SearchResultsResponse(BaseModel):
     messages: list[MessageSearchResult]
     conversations: list[ConversationDescriptionHit]
     notes: list[NoteSearchResult]
+    # True when any of the three sources has results beyond this page.
+    has_more: bool = False
 
 
 class URLResponse(BaseModel):
@@ -1,22 +1,34 @@
 """Shared orchestration for VFS sync glue modules.
 
-The two glue modules (``gaia_tasks_fs``, ``user_todos_fs``) share two
-distinct patterns:
+Three glue modules project Mongo/Postgres state into the VFS:
+``gaia_tasks_fs`` (``/workspace/gaia-tasks/``), ``user_todos_fs``
+(``/workspace/todos/``) and ``memory_fs`` (``/workspace/memory/``). They are
+built from four helpers:
 
-* **Hash-gated sync**: bail on missing mount, fetch active docs from
-  Mongo, hash them, compare against the on-disk catalog marker, run
-  the materializer in a thread only on mismatch, stamp the new marker,
-  log the result. Implemented by :func:`run_hashed_sync`.
+* **Hash-gated sync**: bail on missing mount, fetch active docs, hash them,
+  compare against the on-disk catalog marker, run the materializer in a
+  thread only on mismatch, stamp the new marker, log the result.
+  Implemented by :func:`run_hashed_sync`; all three modules use it.
 
 * **Fire-and-forget scheduling**: turn an async sync function into a
   ``schedule(user_id)`` callable that creates a background task, holds
   a reference so the task isn't garbage-collected, and never raises
-  into the caller. Implemented by :func:`make_scheduler`.
-
-Both helpers are deliberately small. They exist to make the two glue
-modules read top-down and identical in shape — if a third VFS area
-(``/workspace/memory/`` for semantic memory, say) gets added later it
-slots in by providing the same five callbacks.
+  into the caller. Implemented by :func:`make_scheduler`; used by
+  ``gaia_tasks_fs`` and ``user_todos_fs`` (and, for their own syncs,
+  ``integrations_fs`` and ``workspace_sync``).
+
+* **Incremental sync**: re-project only the files a write says it touched,
+  falling back to the hashed sync when a full reconcile is due. Implemented
+  by :func:`run_incremental_sync`; used by ``memory_fs``.
+
+* **Coalescing scheduling**: at most one sync per user in flight, with
+  the changes that arrive meanwhile merged into one follow-up. Implemented
+  by :func:`make_coalescing_scheduler`; used by ``memory_fs``.
+
+Each helper is deliberately small: a glue module supplies the fetch, hash,
+materialize and path callbacks and reads top-down. A new area picks the
+full-rebuild pair, or the incremental pair when its writes can say what
+they changed.
 """
 
 from __future__ import annotations
@@ -24,7 +36,9 @@ from __future__ import annotations
 import asyncio
 from collections.abc import Awaitable, Callable, Mapping
 import contextlib
+from datetime import UTC, datetime
 from pathlib import Path
+import time
 from typing import Any, TypeVar
 
 from app.services.storage._vfs_common import (
@@ -43,6 +57,8 @@ from shared.py.wide_events import UserContext, log, wide_task
 # type), so callers can pass their concrete TypedDict here without any
 # cast, while the helper still gets ``d["id"]`` access.
 ProjectionT = TypeVar("ProjectionT", bound=Mapping[str, Any])
+# Whatever an area's write paths hand the scheduler to say what changed.
+ChangeT = TypeVar("ChangeT")
 
 
 async def run_hashed_sync(
@@ -88,6 +104,62 @@ async def run_hashed_sync(
         return written
 
 
+async def run_incremental_sync(
+    user_id: str,
+    change: ChangeT | None,
+    *,
+    fs_op: str,
+    full_sync_fn: Callable[[str], Awaitable[int]],
+    fetch_changes_fn: Callable[[str, ChangeT], Awaitable[tuple[list[ProjectionT], list[str]]]],
+    apply_fn: Callable[[Path, list[ProjectionT], list[str]], int],
+    reconciled_marker_path_fn: Callable[[Path], Path],
+    reconcile_seconds: float,
+    log_name: str,
+) -> int:
+    """Re-project only what ``change`` touched, or run ``full_sync_fn``.
+
+    The full sync runs instead when ``change`` is ``None`` (the write could
+    not say what it touched), and when the reconciled marker is missing,
+    older than ``reconcile_seconds`` or from an earlier UTC day. Otherwise
+    ``fetch_changes_fn`` returns the files to write and the paths to
+    remove, and ``apply_fn`` writes them off the event loop. Returns the
+    number of file bodies written.
+    """
+    if not _is_mounted():
+        return 0
+    u_root = user_workspace_path(user_id)
+    reconciled_path = reconciled_marker_path_fn(u_root)
+    if change is None or _reconcile_due(read_marker(reconciled_path), reconcile_seconds):
+        written = await full_sync_fn(user_id)
+        write_marker(reconciled_path, str(int(time.time())))
+        return written
+    async with fs_timer(fs_op):
+        docs, removed = await fetch_changes_fn(user_id, change)
+        written = await asyncio.to_thread(apply_fn, u_root, docs, removed)
+        log.set(
+            vfs_sync={
+                "name": log_name,
+                "mode": "incremental",
+                "written": written,
+                "removed": len(removed),
+            }
+        )
+        return written
+
+
+def _reconcile_due(stamp: str | None, reconcile_seconds: float) -> bool:
+    try:
+        reconciled_at = float(stamp) if stamp else None
+    except ValueError:
+        reconciled_at = None
+    if reconciled_at is None:
+        return True
+    now = time.time()
+    if now - reconciled_at >= reconcile_seconds:
+        return True
+    return datetime.fromtimestamp(reconciled_at, UTC).date() != datetime.now(UTC).date()
+
+
 def make_scheduler(
     sync_fn: Callable[[str], Awaitable[int]],
     *,
@@ -126,3 +198,52 @@ def make_scheduler(
         spawn_background_task(_safe(user_id))
 
     return schedule
+
+
+def make_coalescing_scheduler(
+    sync_fn: Callable[[str, ChangeT | None], Awaitable[int]],
+    *,
+    merge_fn: Callable[[ChangeT, ChangeT], ChangeT],
+    log_name: str,
+) -> Callable[[str, ChangeT | None], None]:
+    """Build a ``schedule(user_id, change)`` wrapper around ``sync_fn``.
+
+    Same guarantees as :func:`make_scheduler`. In addition, a user has at
+    most one sync running at a time. Changes scheduled while it runs are
+    merged with ``merge_fn`` and synced together once it finishes. A
+    ``None`` change means "sync everything" and absorbs any other change.
+    Without the merging, a burst of writes would mean a burst of
+    overlapping syncs, and a slower, older one could land last.
+    """
+    queued: dict[str, ChangeT | None] = {}
+    draining: set[str] = set()
+
+    async def _drain(user_id: str) -> None:
+        try:
+            while user_id in queued:
+                change = queued.pop(user_id)
+                with contextlib.suppress(Exception):
+                    async with wide_task(log_name, user=UserContext(id=user_id)):
+                        await sync_fn(user_id, change)
+        finally:
+            draining.discard(user_id)
+
+    def schedule(user_id: str, change: ChangeT | None) -> None:
+        if not _is_mounted():
+            return
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if user_id in queued:
+            pending = queued[user_id]
+            queued[user_id] = (
+                None if pending is None or change is None else merge_fn(pending, change)
+            )
+        else:
+            queued[user_id] = change
+        if user_id not in draining:
+            draining.add(user_id)
+            spawn_background_task(_drain(user_id))
+
+    return schedule
@@ -13,22 +13,48 @@ uses the local models:
 
 The API and worker then set ``MEMORY_EMBEDDING_SIDECAR_URL`` to its address and
 call it instead of loading their own copy.
+
+Requests are micro-batched (``app.memory.batching``): concurrent requests
+arriving within a few milliseconds share one ONNX call and one inference slot.
+``/embed_queries`` and ``/rerank_pairs`` accept the client's own batches;
+deploy the sidecar before clients that call them.
+
+The embed endpoints answer with one ``.npy`` frame (``app.memory.vectors``)
+when the request sends ``Accept: application/x-npy``, and JSON otherwise.
 """
 
 import asyncio
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
-from typing import Any
+from typing import Annotated, Any
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Response
+from fastapi.responses import JSONResponse
+import numpy as np
 from pydantic import BaseModel
 
 from app.constants.memory import (
+    EMBEDDING_SIDECAR_MAX_BATCH_TEXTS,
     EMBEDDING_SIDECAR_MAX_CONCURRENCY,
     EMBEDDING_SIDECAR_MAX_TEXT_CHARS,
     EMBEDDING_SIDECAR_SLOT_WAIT_SECONDS,
 )
-from app.memory.embeddings import _embed_query_sync, _embed_sync, _rerank_sync
+from app.memory.batching import MicroBatcher
+from app.memory.embeddings import (
+    _embed_queries_sync,
+    _embed_query_sync,
+    _embed_sync,
+    _rerank_pairs_sync,
+    _rerank_sync,
+    split_results,
+)
+from app.memory.vectors import (
+    NPY_MEDIA_TYPE,
+    EmbeddingArray,
+    empty_embeddings,
+    encode_npy,
+    split_rows,
+)
 from shared.py.wide_events import log
 
 # fastembed is sync and CPU-bound. Running it directly in these async handlers
@@ -72,6 +98,22 @@ _ERROR_RESPONSES: dict[int | str, dict[str, Any]] = {
     },
 }
 
+_VECTOR_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "description": "JSON, or one float32 .npy frame when the request accepts "
+        f"{NPY_MEDIA_TYPE}.",
+        "content": {NPY_MEDIA_TYPE: {}},
+    },
+    **_ERROR_RESPONSES,
+}
+
+
+def _vectors_response(key: str, vectors: EmbeddingArray, accept: str | None) -> Response:
+    """``vectors`` as a ``.npy`` frame when the client accepts one, else JSON."""
+    if accept and NPY_MEDIA_TYPE in accept:
+        return Response(content=encode_npy(vectors), media_type=NPY_MEDIA_TYPE)
+    return JSONResponse({key: vectors.tolist()})
+
 
 def _reject_oversized(texts: list[str]) -> None:
     """A text beyond EMBEDDING_SIDECAR_MAX_TEXT_CHARS is always a caller bug:
@@ -86,6 +128,47 @@ def _reject_oversized(texts: list[str]) -> None:
             )
 
 
+def _batch_limit() -> int:
+    return EMBEDDING_SIDECAR_MAX_BATCH_TEXTS
+
+
+async def _run_embed(requests: list[list[str]]) -> list[EmbeddingArray]:
+    texts = [text for request in requests for text in request]
+    async with _inference_slot():
+        vectors = await asyncio.to_thread(_embed_sync, texts)
+    return split_rows(vectors, [len(request) for request in requests])
+
+
+async def _run_embed_queries(texts: list[str]) -> list[EmbeddingArray]:
+    async with _inference_slot():
+        if len(texts) == 1:
+            return [await asyncio.to_thread(_embed_query_sync, texts[0])]
+        return list(await asyncio.to_thread(_embed_queries_sync, texts))
+
+
+async def _run_rerank(requests: list[list[tuple[str, str]]]) -> list[list[float]]:
+    pairs = [pair for request in requests for pair in request]
+    async with _inference_slot():
+        if len({query for query, _ in pairs}) == 1:
+            scores = await asyncio.to_thread(
+                _rerank_sync, pairs[0][0], [document for _, document in pairs]
+            )
+        else:
+            scores = await asyncio.to_thread(_rerank_pairs_sync, pairs)
+    return split_results(scores, [len(request) for request in requests])
+
+
+_embed_batcher: MicroBatcher[list[str], EmbeddingArray] = MicroBatcher(
+    "embed", "sidecar", _run_embed, _batch_limit
+)
+_query_batcher: MicroBatcher[str, EmbeddingArray] = MicroBatcher(
+    "embed_query", "sidecar", _run_embed_queries, _batch_limit
+)
+_rerank_batcher: MicroBatcher[list[tuple[str, str]], list[float]] = MicroBatcher(
+    "rerank", "sidecar", _run_rerank, _batch_limit
+)
+
+
 class EmbedRequest(BaseModel):
     """Passage texts to embed; oversized batches are bounded internally."""
 
@@ -105,6 +188,12 @@ class RerankRequest(BaseModel):
     documents: list[str]
 
 
+class RerankPairsRequest(BaseModel):
+    """(query, document) pairs to score, queries free to differ per pair."""
+
+    pairs: list[tuple[str, str]]
+
+
 @asynccontextmanager
 async def _lifespan(_app: FastAPI) -> AsyncIterator[None]:
     # Warm both models at startup so the first real request is fast and a
@@ -125,23 +214,37 @@ async def health() -> dict[str, str]:
 
 
 # evlog-map-disable-next-line wide-event -- standalone uvicorn app without LoggingMiddleware; log.set() would never be emitted
-@app.post("/embed", responses=_ERROR_RESPONSES)
-async def embed(request: EmbedRequest) -> dict[str, list[list[float]]]:
+@app.post("/embed", response_model=None, responses=_VECTOR_RESPONSES)
+async def embed(request: EmbedRequest, accept: Annotated[str | None, Header()] = None) -> Response:
     """Embed a batch of passage texts."""
     if not request.texts:
-        return {"vectors": []}
+        return _vectors_response("vectors", empty_embeddings(), accept)
     _reject_oversized(request.texts)
-    async with _inference_slot():
-        return {"vectors": await asyncio.to_thread(_embed_sync, request.texts)}
+    vectors = await _embed_batcher.submit(request.texts, len(request.texts))
+    return _vectors_response("vectors", vectors, accept)
 
 
 # evlog-map-disable-next-line wide-event -- standalone uvicorn app without LoggingMiddleware; log.set() would never be emitted
-@app.post("/embed_query", responses=_ERROR_RESPONSES)
-async def embed_query(request: EmbedQueryRequest) -> dict[str, list[float]]:
+@app.post("/embed_query", response_model=None, responses=_VECTOR_RESPONSES)
+async def embed_query(
+    request: EmbedQueryRequest, accept: Annotated[str | None, Header()] = None
+) -> Response:
     """Embed a single query with the model's query instruction."""
     _reject_oversized([request.text])
-    async with _inference_slot():
-        return {"vector": await asyncio.to_thread(_embed_query_sync, request.text)}
+    return _vectors_response("vector", await _query_batcher.submit(request.text), accept)
+
+
+# evlog-map-disable-next-line wide-event -- standalone uvicorn app without LoggingMiddleware; log.set() would never be emitted
+@app.post("/embed_queries", response_model=None, responses=_VECTOR_RESPONSES)
+async def embed_queries(
+    request: EmbedRequest, accept: Annotated[str | None, Header()] = None
+) -> Response:
+    """Embed several queries with the model's query instruction."""
+    _reject_oversized(request.texts)
+    vectors = await asyncio.gather(*(_query_batcher.submit(text) for text in request.texts))
+    return _vectors_response(
+        "vectors", np.stack(vectors) if vectors else empty_embeddings(), accept
+    )
 
 
 # evlog-map-disable-next-line wide-event -- standalone uvicorn app without LoggingMiddleware; log.set() would never be emitted
@@ -151,5 +254,15 @@ async def rerank(request: RerankRequest) -> dict[str, list[float]]:
     if not request.documents:
         return {"scores": []}
     _reject_oversized([request.query, *request.documents])
-    async with _inference_slot():
-        return {"scores": await asyncio.to_thread(_rerank_sync, request.query, request.documents)}
+    pairs = [(request.query, document) for document in request.documents]
+    return {"scores": await _rerank_batcher.submit(pairs, len(pairs))}
+
+
+# evlog-map-disable-next-line wide-event -- standalone uvicorn app without LoggingMiddleware; log.set() would never be emitted
+@app.post("/rerank_pairs", responses=_ERROR_RESPONSES)
+async def rerank_pairs(request: RerankPairsRequest) -> dict[str, list[float]]:
+    """Score (query, document) pairs, aligned with input order."""
+    if not request.pairs:
+        return {"scores": []}
+    _reject_oversized([text for pair in request.pairs for text in pair])
+    return {"scores": await _rerank_batcher.submit(request.pairs, len(request.pairs))}
@@ -5,19 +5,29 @@ and live facts grouped by category folder (see ``app.memory.pg_store``).
 
 The VFS side: :mod:`app.memory.projection`.
 
-The shared orchestration (mount check, hash gate, fire-and-forget
-scheduler, structured logging) lives in
+Memory writes describe what they touched with a :class:`MemoryVfsChange`.
+The sync then refetches and rewrites just those pages instead of the whole
+tree. A full, hash-gated re-materialization remains the safety net: it runs
+on a user's first sync of each UTC day, every
+``MEMORY_VFS_RECONCILE_SECONDS``, and whenever no change set is given.
+
+The shared orchestration (mount check, hash gate, reconcile cadence,
+coalescing scheduler, structured logging) lives in
 :mod:`app.services._vfs_scheduler`.
 """
 
 from __future__ import annotations
 
 import asyncio
-from datetime import UTC, datetime, timedelta
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta
 
 from app.agents.workspace.system_docs import MEMORY_GUIDE_MD
 from app.constants.memory import (
     MEMORY_DOC_FILENAMES,
+    MEMORY_VFS_INCREMENTAL,
+    MEMORY_VFS_RECONCILE_SECONDS,
     PROJECTION_JOURNAL_DAYS,
     MemoryDocType,
 )
@@ -26,23 +36,73 @@ from app.memory.projection import (
     FACTS_DIRNAME,
     JOURNAL_DIRNAME,
     MemoryFileProjection,
+    apply_memory_changes,
     materialize_memory,
     memory_marker_path,
+    memory_reconciled_path,
     per_doc_signature,
     render_facts_page,
     render_journal_page,
 )
-from app.services._vfs_scheduler import make_scheduler, run_hashed_sync
+from app.models.memory_db_models import MemoryDocument, MemoryEpisode, MemoryRecord
+from app.services._vfs_scheduler import (
+    make_coalescing_scheduler,
+    run_hashed_sync,
+    run_incremental_sync,
+)
 from app.services.storage.metrics import FsOps
 
 
-async def sync_user_memory_fs(user_id: str) -> int:
+@dataclass
+class MemoryVfsChange:
+    """The projected pages one memory write touched.
+
+    ``memory_ids`` are resolved to their folders at sync time. A forgotten
+    or superseded row still names the folder its page lives in.
+    """
+
+    memory_ids: set[str] = field(default_factory=set)
+    categories: set[str] = field(default_factory=set)
+    documents: set[MemoryDocType] = field(default_factory=set)
+    days: set[date] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        return bool(self.memory_ids or self.categories or self.documents or self.days)
+
+    def __or__(self, other: MemoryVfsChange) -> MemoryVfsChange:
+        return MemoryVfsChange(
+            memory_ids=self.memory_ids | other.memory_ids,
+            categories=self.categories | other.categories,
+            documents=self.documents | other.documents,
+            days=self.days | other.days,
+        )
+
+
+async def sync_user_memory_fs(user_id: str, change: MemoryVfsChange | None = None) -> int:
     """Materialize the user's memory projection to JuiceFS.
 
+    With a ``change``, only the pages it names are refetched and rewritten,
+    unless a full reconcile is due. Without one, the whole projection is
+    hash-gated and materialized.
+
     Returns the number of file bodies rewritten. ``0`` means either the
     mount is missing (native dev) or the on-disk catalog signature
     already matched Postgres — both are no-ops from the caller's POV.
     """
+    return await run_incremental_sync(
+        user_id,
+        change if MEMORY_VFS_INCREMENTAL else None,
+        fs_op=FsOps.SYNC_MEMORY_VFS_INCREMENTAL,
+        full_sync_fn=_sync_all,
+        fetch_changes_fn=_fetch_changed_projections,
+        apply_fn=apply_memory_changes,
+        reconciled_marker_path_fn=memory_reconciled_path,
+        reconcile_seconds=MEMORY_VFS_RECONCILE_SECONDS,
+        log_name="memory_vfs",
+    )
+
+
+async def _sync_all(user_id: str) -> int:
     return await run_hashed_sync(
         user_id,
         fs_op=FsOps.SYNC_MEMORY_VFS,
@@ -55,9 +115,22 @@ async def sync_user_memory_fs(user_id: str) -> int:
     )
 
 
-# Fire-and-forget wrapper for the memory write paths (ingestion, document
-# rewrites, edits, forgets). See the docstring on :func:`make_scheduler`.
-schedule_memory_vfs_sync = make_scheduler(sync_user_memory_fs, log_name="memory_vfs")
+_schedule = make_coalescing_scheduler(
+    sync_user_memory_fs, merge_fn=MemoryVfsChange.__or__, log_name="memory_vfs"
+)
+
+
+def schedule_memory_vfs_sync(user_id: str, change: MemoryVfsChange | None = None) -> None:
+    """Fire-and-forget projection sync for the memory write paths.
+
+    Pass what the write touched. Omit ``change`` only when it can't be
+    known (a full wipe), which forces a full re-materialization. An empty
+    change is dropped. See :func:`make_coalescing_scheduler` for the
+    scheduling guarantees.
+    """
+    if change is not None and not change:
+        return
+    _schedule(user_id, change)
 
 
 async def _fetch_projections(user_id: str) -> list[MemoryFileProjection]:
@@ -71,42 +144,124 @@ async def _fetch_projections(user_id: str) -> list[MemoryFileProjection]:
         pg_store.get_all_live_memories(user_id),
     )
 
+    projections = [_document_projection(document) for document in documents]
+    for episode in episodes:
+        projection = _journal_projection(episode)
+        if projection is not None:
+            projections.append(projection)
+    projections.extend(_facts_projections(memories))
+    return projections
+
+
+async def _fetch_changed_projections(
+    user_id: str, change: MemoryVfsChange
+) -> tuple[list[MemoryFileProjection], list[str]]:
+    """The pages ``change`` touched: those to rewrite, and those now empty.
+
+    Journal days outside the projected window are ignored — the daily
+    reconcile is what moves the window.
+    """
+    categories = set(change.categories)
+    if change.memory_ids:
+        rows = await pg_store.get_memories_by_ids(user_id, sorted(change.memory_ids))
+        categories.update(row.category_path for row in rows)
+    today = datetime.now(UTC).date()
+    window_start = today - timedelta(days=PROJECTION_JOURNAL_DAYS - 1)
+    days = sorted(day for day in change.days if window_start <= day <= today)
+
+    documents, episodes, memories = await asyncio.gather(
+        _changed_documents(user_id, change.documents),
+        _changed_episodes(user_id, days),
+        pg_store.get_live_memories_in_categories(user_id, sorted(categories)),
+    )
+
     projections: list[MemoryFileProjection] = []
+    removed: list[str] = []
 
-    for document in documents:
-        doc_type = MemoryDocType(document.doc_type)
-        projections.append(
-            {
-                "id": f"doc:{document.doc_type}",
-                "path": MEMORY_DOC_FILENAMES[doc_type],
-                "content": document.content.rstrip() + "\n",
-            }
-        )
+    found_documents = {MemoryDocType(document.doc_type): document for document in documents}
+    for doc_type in sorted(change.documents):
+        document = found_documents.get(doc_type)
+        if document is None:
+            removed.append(MEMORY_DOC_FILENAMES[doc_type])
+        else:
+            projections.append(_document_projection(document))
 
-    for episode in episodes:
-        if not episode.entries and not episode.summary:
-            continue
-        day = episode.date.isoformat()
-        projections.append(
-            {
-                "id": f"journal:{day}",
-                "path": f"{JOURNAL_DIRNAME}/{day}.md",
-                "content": render_journal_page(episode.date, episode.entries, episode.summary),
-            }
-        )
+    found_episodes = {episode.date: episode for episode in episodes}
+    for day in days:
+        episode = found_episodes.get(day)
+        projection = _journal_projection(episode) if episode is not None else None
+        if projection is None:
+            removed.append(_journal_path(day))
+        else:
+            projections.append(projection)
+
+    facts = _facts_projections(memories)
+    projections.extend(facts)
+    still_filled = {projection["path"] for projection in facts}
+    removed.extend(
+        path for path in map(_facts_path, sorted(categories)) if path not in still_filled
+    )
+    return projections, removed
+
+
+async def _changed_documents(user_id: str, doc_types: set[MemoryDocType]) -> list[MemoryDocument]:
+    if not doc_types:
+        return []
+    return [
+        document
+        for document in await pg_store.get_documents(user_id)
+        if MemoryDocType(document.doc_type) in doc_types
+    ]
 
+
+async def _changed_episodes(user_id: str, days: list[date]) -> list[MemoryEpisode]:
+    if not days:
+        return []
+    episodes = await pg_store.get_episodes_range(user_id, days[0], days[-1])
+    wanted = set(days)
+    return [episode for episode in episodes if episode.date in wanted]
+
+
+def _document_projection(document: MemoryDocument) -> MemoryFileProjection:
+    return {
+        "id": f"doc:{document.doc_type}",
+        "path": MEMORY_DOC_FILENAMES[MemoryDocType(document.doc_type)],
+        "content": document.content.rstrip() + "\n",
+    }
+
+
+def _journal_projection(episode: MemoryEpisode) -> MemoryFileProjection | None:
+    """A journal day's page, or ``None`` for a day with nothing on it."""
+    if not episode.entries and not episode.summary:
+        return None
+    day = episode.date.isoformat()
+    return {
+        "id": f"journal:{day}",
+        "path": _journal_path(episode.date),
+        "content": render_journal_page(episode.date, episode.entries, episode.summary),
+    }
+
+
+def _facts_projections(memories: Iterable[MemoryRecord]) -> list[MemoryFileProjection]:
+    """One page per folder; ``memories`` arrive grouped by folder, newest first."""
     facts_by_category: dict[str, list[tuple[str, str, float]]] = {}
     for memory in memories:
         facts_by_category.setdefault(memory.category_path, []).append(
             (str(memory.id), memory.content, memory.importance)
         )
-    for category_path, facts in facts_by_category.items():
-        projections.append(
-            {
-                "id": f"facts:{category_path}",
-                "path": f"{FACTS_DIRNAME}/{category_path}.md",
-                "content": render_facts_page(category_path, facts),
-            }
-        )
+    return [
+        {
+            "id": f"facts:{category_path}",
+            "path": _facts_path(category_path),
+            "content": render_facts_page(category_path, facts),
+        }
+        for category_path, facts in facts_by_category.items()
+    ]
 
-    return projections
+
+def _journal_path(day: date) -> str:
+    return f"{JOURNAL_DIRNAME}/{day.isoformat()}.md"
+
+
+def _facts_path(category_path: str) -> str:
+    return f"{FACTS_DIRNAME}/{category_path}.md"
@@ -2,22 +2,40 @@
 Service module for handling search operations and URL metadata fetching.
 """
 
+import asyncio
 import re
 import time
 
 from fastapi import HTTPException, status
 
+from app.constants.search import MESSAGE_SEARCH_INDEX_ENABLED, SEARCH_RESULTS_PAGE_SIZE
 from app.db.repositories.conversations import conversation_repository
 from app.db.repositories.notes import note_repository
+from app.models.conversation_models import ConversationSearchResults
 from app.models.search_models import MessageSearchResult, NoteSearchResult, SearchResultsResponse
 from app.utils.general_utils import get_context_window
 from shared.py.wide_events import log
 
 
-async def search_messages(query: str, user_id: str) -> SearchResultsResponse:
+async def _search_conversations(
+    user_id: str, query: str, pattern: str, *, limit: int, skip: int
+) -> ConversationSearchResults:
+    if MESSAGE_SEARCH_INDEX_ENABLED:
+        return await conversation_repository.search_indexed(
+            user_id, query=query, pattern=pattern, limit=limit, skip=skip
+        )
+    return await conversation_repository.search(user_id, pattern=pattern, limit=limit, skip=skip)
+
+
+async def search_messages(
+    query: str, user_id: str, *, page: int = 1, limit: int = SEARCH_RESULTS_PAGE_SIZE
+) -> SearchResultsResponse:
     """
     Search for messages, conversations, and notes for a given user that match the query.
 
+    Each source is paged by ``page``/``limit``; ``has_more`` is set when any of
+    them has results past this page.
+
     Raises:
         HTTPException: If an error occurs during the search process.
     """
@@ -34,8 +52,22 @@ async def search_messages(query: str, user_id: str) -> SearchResultsResponse:
     search_start = time.monotonic()
     escaped_query = re.escape(query)
     try:
-        conversation_results = await conversation_repository.search(user_id, pattern=escaped_query)
-        note_hits = await note_repository.search_by_plaintext(user_id, pattern=escaped_query)
+        # One extra row per source tells whether a next page exists.
+        skip = (page - 1) * limit
+        conversation_results, note_hits = await asyncio.gather(
+            _search_conversations(user_id, query, escaped_query, limit=limit + 1, skip=skip),
+            note_repository.search_by_plaintext(
+                user_id, pattern=escaped_query, limit=limit + 1, skip=skip
+            ),
+        )
+        # Counted before hydration: an index hit whose message was trimmed away
+        # still means the source has rows past this page.
+        message_hits = conversation_results.matched_messages
+        if message_hits is None:
+            message_hits = len(conversation_results.messages)
+        has_more = (
+            max(message_hits, len(conversation_results.conversations), len(note_hits)) > limit
+        )
 
         messages = [
             MessageSearchResult(
@@ -44,7 +76,7 @@ async def search_messages(query: str, user_id: str) -> SearchResultsResponse:
                 # Snippet for search highlighting, centered on the matched response.
                 snippet=get_context_window(hit.message.response, query, chars_before=30),
             )
-            for hit in conversation_results.messages
+            for hit in conversation_results.messages[:limit]
         ]
 
         notes_with_snippets = [
@@ -54,12 +86,11 @@ async def search_messages(query: str, user_id: str) -> SearchResultsResponse:
                 plaintext=hit.plaintext,
                 snippet=get_context_window(hit.plaintext, query, chars_before=30),
             )
-            for hit in note_hits
+            for hit in note_hits[:limit]
         ]
 
-        result_count = (
-            len(messages) + len(conversation_results.conversations) + len(notes_with_snippets)
-        )
+        conversations = conversation_results.conversations[:limit]
+        result_count = len(messages) + len(conversations) + len(notes_with_snippets)
         duration_ms = int((time.monotonic() - search_start) * 1000)
         log.set(
             search={
@@ -68,13 +99,17 @@ async def search_messages(query: str, user_id: str) -> SearchResultsResponse:
                 "search_type": "keyword",
                 "sources": ["messages", "conversations", "notes"],
                 "result_count": result_count,
+                "page": page,
+                "has_more": has_more,
+                "indexed": MESSAGE_SEARCH_INDEX_ENABLED,
                 "duration_ms": duration_ms,
             }
         )
         return SearchResultsResponse(
             messages=messages,
-            conversations=conversation_results.conversations,
+            conversations=conversations,
             notes=notes_with_snippets,
+            has_more=has_more,
         )
     except Exception as e:
         log.error(
@@ -302,6 +302,7 @@ class FsOps:
     MATERIALIZE_INTEGRATIONS: Final[str] = "materialize_integrations"
     SYNC_GAIA_TASKS_VFS: Final[str] = "sync_gaia_tasks_vfs"
     SYNC_MEMORY_VFS: Final[str] = "sync_memory_vfs"
+    SYNC_MEMORY_VFS_INCREMENTAL: Final[str] = "sync_memory_vfs_incremental"
     SYNC_USER_TODOS_VFS: Final[str] = "sync_user_todos_vfs"
     TOUCH_LAST_ACTIVE: Final[str] = "touch_last_active"
 
@@ -0,0 +1,43 @@
+"""Prometheus collectors for Composio trigger webhook ingestion.
+
+Declared on the default registry (scraped on the API's ``/metrics``) and
+re-registered on the ARQ worker's registry in ``app/workers/metrics.py``, since
+the ingestion consumer runs in the worker.
+
+- ``composio_webhook_events_total`` (Counter, label ``outcome``): ``queued`` /
+  ``inline`` on the producer side; ``processed`` | ``failed`` | ``timed_out`` |
+  ``dropped`` when the consumer settles an entry.
+- ``composio_webhook_replays_total`` (Counter): pending entries claimed back
+  from a consumer that died mid-event.
+- ``composio_webhook_lag_seconds`` (Histogram): webhook receipt to dispatch.
+"""
+
+from prometheus_client import Counter, Histogram
+
+from app.services.storage.metrics import _register_once
+
+COMPOSIO_WEBHOOK_EVENTS_TOTAL = _register_once(
+    "composio_webhook_events_total",
+    lambda: Counter(
+        name="composio_webhook_events_total",
+        documentation="Composio trigger webhook events, by ingestion outcome",
+        labelnames=("outcome",),
+    ),
+)
+
+COMPOSIO_WEBHOOK_REPLAYS_TOTAL = _register_once(
+    "composio_webhook_replays_total",
+    lambda: Counter(
+        name="composio_webhook_replays_total",
+        documentation="Composio webhook stream entries replayed after their consumer died",
+    ),
+)
+
+COMPOSIO_WEBHOOK_LAG_SECONDS = _register_once(
+    "composio_webhook_lag_seconds",
+    lambda: Histogram(
+        name="composio_webhook_lag_seconds",
+        documentation="Time from Composio webhook receipt to handler dispatch",
+        buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 300),
+    ),
+)
@@ -0,0 +1,362 @@
+"""Durable, bounded ingestion of Composio trigger webhooks over a Redis stream.
+
+The webhook endpoint used to ack and then spawn the handler inside the API
+process: no cap on in-flight handlers, and a burst or an API restart could pile
+up or lose events whose dedupe key was already claimed. Now the endpoint only
+appends the parsed event to ``COMPOSIO_WEBHOOK_STREAM`` (``enqueue_event``) and
+acks; every ARQ worker process runs one ``WebhookConsumer`` in the
+``COMPOSIO_WEBHOOK_GROUP`` consumer group.
+
+- Bounded: at most ``COMPOSIO_WEBHOOK_CONCURRENCY`` events in flight per
+  consumer. It reads only as many entries as it has free slots, so a burst
+  waits in Redis, not in memory.
+- Durable: an entry is acked once its handler has settled — including a handler
+  that failed or timed out, which is logged and not retried, as before. Entries
+  of a consumer that died mid-event stay pending; any consumer claims those idle
+  past ``COMPOSIO_WEBHOOK_CLAIM_IDLE_MS`` and replays them (at-least-once). An
+  entry delivered ``COMPOSIO_WEBHOOK_MAX_DELIVERIES`` times is dropped as poison.
+- Batched: the events of one read share a single workflow lookup for all their
+  trigger ids (``workflow_repository.composio_trigger_batch``); each handler
+  still filters on its own payload.
+- Measured: receipt-to-dispatch lag per event (``composio_webhook_lag_seconds``
+  and the event's ``webhook.lag_ms``); see ``app.services.triggers.metrics``.
+"""
+
+import asyncio
+from collections.abc import Callable
+import contextlib
+import os
+import socket
+import time
+
+from pydantic import ValidationError
+from redis.exceptions import ResponseError
+
+from app.constants.integrations import (
+    COMPOSIO_WEBHOOK_BLOCK_MS,
+    COMPOSIO_WEBHOOK_CLAIM_IDLE_MS,
+    COMPOSIO_WEBHOOK_CONCURRENCY,
+    COMPOSIO_WEBHOOK_GROUP,
+    COMPOSIO_WEBHOOK_MAX_DELIVERIES,
+    COMPOSIO_WEBHOOK_READ_COUNT,
+    COMPOSIO_WEBHOOK_RECLAIM_INTERVAL_SECONDS,
+    COMPOSIO_WEBHOOK_RECONNECT_SECONDS,
+    COMPOSIO_WEBHOOK_STREAM,
+    COMPOSIO_WEBHOOK_STREAM_MAXLEN,
+    WEBHOOK_TASK_TIMEOUT,
+)
+from app.constants.log_tags import LogTag
+from app.db.redis import AsyncRedisCommands, redis_cache
+from app.db.repositories.workflows import workflow_repository
+from app.models.webhook_models import ComposioWebhookEvent
+from app.services.triggers import get_handler_by_event
+from app.services.triggers.base import TriggerHandler
+from app.services.triggers.metrics import (
+    COMPOSIO_WEBHOOK_EVENTS_TOTAL,
+    COMPOSIO_WEBHOOK_LAG_SECONDS,
+    COMPOSIO_WEBHOOK_REPLAYS_TOTAL,
+)
+from shared.py.wide_events import log, log_context
+
+StreamEntry = tuple[str, dict[str, str] | None]
+
+_consumer_task: asyncio.Task[None] | None = None
+
+
+def _routing_trigger_id(event: ComposioWebhookEvent) -> str:
+    # Handlers match against trigger_config.composio_trigger_ids, which stores
+    # the trigger NANO id (ti_...) returned by triggers.create(). Composio's
+    # webhook puts that nano id in `trigger_nano_id` and the trigger's internal
+    # UUID in `trigger_id` — matching against the UUID never hits, so forward the
+    # nano id (falling back to the UUID).
+    return event.trigger_nano_id or event.trigger_id
+
+
+async def dispatch_event(handler: TriggerHandler, event_data: ComposioWebhookEvent) -> str:
+    """Find the event's matching workflows and queue them; returns the outcome
+    (``processed`` | ``timed_out`` | ``failed``). Never raises."""
+    try:
+        await asyncio.wait_for(
+            handler.process_event(
+                event_type=event_data.type,
+                trigger_id=_routing_trigger_id(event_data),
+                user_id=event_data.user_id,
+                data=event_data.data,
+            ),
+            timeout=WEBHOOK_TASK_TIMEOUT,
+        )
+    except TimeoutError:
+        log.error(
+            f"{LogTag.COMPOSIO} Webhook background processing timed out",
+            timeout_s=WEBHOOK_TASK_TIMEOUT,
+            event_type=event_data.type,
+            user_id=event_data.user_id,
+        )
+        return "timed_out"
+    except Exception as e:
+        log.error(
+            f"{LogTag.COMPOSIO} Webhook background processing failed",
+            event_type=event_data.type,
+            user_id=event_data.user_id,
+            error_type=type(e).__name__,
+            error=str(e),
+        )
+        return "failed"
+    return "processed"
+
+
+async def enqueue_event(event: ComposioWebhookEvent) -> bool:
+    """Append a trigger event to the ingestion stream.
+
+    False when it could not be (no Redis, or the XADD failed); the caller then
+    processes the event in-process rather than lose it.
+    """
+    client = redis_cache.redis
+    if client is None:
+        return False
+    try:
+        await client.xadd(
+            COMPOSIO_WEBHOOK_STREAM,
+            {"event": event.model_dump_json(), "received_at": repr(time.time())},
+            maxlen=COMPOSIO_WEBHOOK_STREAM_MAXLEN,
+        )
+    except Exception as e:
+        log.warning(
+            f"{LogTag.COMPOSIO} Webhook enqueue failed — processing in-process",
+            error_type=type(e).__name__,
+            error=str(e),
+        )
+        return False
+    COMPOSIO_WEBHOOK_EVENTS_TOTAL.labels(outcome="queued").inc()
+    return True
+
+
+class WebhookConsumer:
+    """One consumer of the ingestion stream's group, with a bounded task pool.
+
+    ``stream``/``group``/``concurrency`` default to the production settings;
+    tests and the load benchmark point them elsewhere. ``handler_for`` resolves
+    an event type to its trigger handler.
+    """
+
+    def __init__(
+        self,
+        client: AsyncRedisCommands,
+        *,
+        name: str | None = None,
+        stream: str = COMPOSIO_WEBHOOK_STREAM,
+        group: str = COMPOSIO_WEBHOOK_GROUP,
+        concurrency: int = COMPOSIO_WEBHOOK_CONCURRENCY,
+        claim_idle_ms: int = COMPOSIO_WEBHOOK_CLAIM_IDLE_MS,
+        handler_for: Callable[[str], TriggerHandler | None] = get_handler_by_event,
+    ) -> None:
+        self.client = client
+        self.name = name or f"{socket.gethostname()}:{os.getpid()}"
+        self.stream = stream
+        self.group = group
+        self.concurrency = concurrency
+        self.claim_idle_ms = claim_idle_ms
+        self.handler_for = handler_for
+        self._in_flight: set[asyncio.Task[None]] = set()
+
+    async def ensure_group(self) -> None:
+        """Create the consumer group (and stream) unless it already exists."""
+        try:
+            await self.client.xgroup_create(self.stream, self.group, id="0", mkstream=True)
+        except ResponseError as e:
+            if "BUSYGROUP" not in str(e):
+                raise
+
+    async def run(self) -> None:
+        """Consume until cancelled. Cancelling abandons in-flight events to the
+        pending list, where a live consumer reclaims them."""
+        await self.ensure_group()
+        last_reclaim = float("-inf")
+        try:
+            while True:
+                free = self.concurrency - len(self._in_flight)
+                if free <= 0:
+                    await asyncio.wait(self._in_flight, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+                entries: list[StreamEntry] = []
+                if time.monotonic() - last_reclaim >= COMPOSIO_WEBHOOK_RECLAIM_INTERVAL_SECONDS:
+                    entries = await self.reclaim(free)
+                    last_reclaim = time.monotonic()
+                if not entries:
+                    entries = await self.read(min(free, COMPOSIO_WEBHOOK_READ_COUNT))
+                await self.start(entries)
+        finally:
+            for task in self._in_flight:
+                task.cancel()
+
+    async def drain(self) -> None:
+        """Wait for every in-flight event to settle."""
+        while self._in_flight:
+            await asyncio.wait(self._in_flight)
+
+    async def read(
+        self, count: int, block_ms: int = COMPOSIO_WEBHOOK_BLOCK_MS
+    ) -> list[StreamEntry]:
+        """New entries for this consumer (blocking up to ``block_ms``)."""
+        response = await self.client.xreadgroup(
+            self.group, self.name, {self.stream: ">"}, count=count, block=block_ms
+        )
+        return [entry for _stream, entries in response for entry in entries]
+
+    async def reclaim(self, count: int) -> list[StreamEntry]:
+        """Claim entries a dead consumer left pending; drop the exhausted ones."""
+        pending = await self.client.xpending_range(
+            self.stream, self.group, "-", "+", count, idle=self.claim_idle_ms
+        )
+        exhausted = [
+            p["message_id"]
+            for p in pending
+            if p["times_delivered"] >= COMPOSIO_WEBHOOK_MAX_DELIVERIES
+        ]
+        if exhausted:
+            log.error(
+                f"{LogTag.COMPOSIO} Webhook events dropped after repeated delivery",
+                entry_ids=exhausted,
+                max_deliveries=COMPOSIO_WEBHOOK_MAX_DELIVERIES,
+            )
+            await self.client.xack(self.stream, self.group, *exhausted)
+            COMPOSIO_WEBHOOK_EVENTS_TOTAL.labels(outcome="dropped").inc(len(exhausted))
+        retry = [p["message_id"] for p in pending if p["message_id"] not in exhausted]
+        if not retry:
+            return []
+        claimed = await self.client.xclaim(
+            self.stream, self.group, self.name, self.claim_idle_ms, retry
+        )
+        if claimed:
+            COMPOSIO_WEBHOOK_REPLAYS_TOTAL.inc(len(claimed))
+        return claimed
+
+    async def start(self, entries: list[StreamEntry]) -> None:
+        """Start one task per entry, all sharing one workflow lookup."""
+        events: list[tuple[str, float, TriggerHandler, ComposioWebhookEvent]] = []
+        settled: list[str] = []
+        for entry_id, fields in entries:
+            parsed = self._parse(entry_id, fields)
+            if parsed is None:
+                settled.append(entry_id)
+            else:
+                events.append((entry_id, *parsed))
+        if settled:
+            await self.client.xack(self.stream, self.group, *settled)
+            COMPOSIO_WEBHOOK_EVENTS_TOTAL.labels(outcome="dropped").inc(len(settled))
+        if not events:
+            return
+
+        trigger_ids = sorted({_routing_trigger_id(event) for *_, event in events} - {""})
+        try:
+            prefetched = await workflow_repository.find_active_by_composio_triggers(trigger_ids)
+        except Exception as e:
+            # Each handler then runs its own lookup, as it would unbatched.
+            log.warning(
+                f"{LogTag.COMPOSIO} Webhook batch workflow prefetch failed",
+                error_type=type(e).__name__,
+                error=str(e),
+            )
+            prefetched = {}
+        with workflow_repository.composio_trigger_batch(prefetched):
+            for entry_id, received_at, handler, event in events:
+                task = asyncio.create_task(self._settle(entry_id, received_at, handler, event))
+                self._in_flight.add(task)
+                task.add_done_callback(self._in_flight.discard)
+
+    def _parse(
+        self, entry_id: str, fields: dict[str, str] | None
+    ) -> tuple[float, TriggerHandler, ComposioWebhookEvent] | None:
+        """An entry's receipt time, handler and event; None when it can't be run."""
+        if not fields:
+            # Trimmed from the stream before it could be replayed.
+            return None
+        try:
+            event = ComposioWebhookEvent.model_validate_json(fields["event"])
+            received_at = float(fields["received_at"])
+        except (KeyError, ValueError, ValidationError) as e:
+            log.error(
+                f"{LogTag.COMPOSIO} Unreadable webhook stream entry — dropped",
+                entry_id=entry_id,
+                error_type=type(e).__name__,
+            )
+            return None
+        handler = self.handler_for(event.type)
+        if handler is None:
+            return None
+        return received_at, handler, event
+
+    async def _settle(
+        self,
+        entry_id: str,
+        received_at: float,
+        handler: TriggerHandler,
+        event: ComposioWebhookEvent,
+    ) -> None:
+        lag = max(0.0, time.time() - received_at)
+        COMPOSIO_WEBHOOK_LAG_SECONDS.observe(lag)
+        async with log_context(
+            "composio_webhook_processing",
+            user={"id": event.user_id},
+            webhook={
+                "event_type": event.type,
+                "trigger_id": event.trigger_id,
+                "entry_id": entry_id,
+                "lag_ms": int(lag * 1000),
+            },
+        ):
+            outcome = await dispatch_event(handler, event)
+        COMPOSIO_WEBHOOK_EVENTS_TOTAL.labels(outcome=outcome).inc()
+        try:
+            await self.client.xack(self.stream, self.group, entry_id)
+        except Exception as e:
+            # Left pending: the event is replayed once it idles past the claim window.
+            log.warning(
+                f"{LogTag.COMPOSIO} Webhook event ack failed",
+                entry_id=entry_id,
+                error_type=type(e).__name__,
+                error=str(e),
+            )
+
+
+async def _consumer_loop() -> None:
+    """Run the consumer, restarting it after a Redis error."""
+    client = redis_cache.redis
+    if client is None:
+        async with log_context("composio_webhook_consumer"):
+            log.warning(f"{LogTag.COMPOSIO} Webhook consumer disabled (no Redis connection)")
+        return
+    consumer = WebhookConsumer(client)
+    while True:
+        async with log_context("composio_webhook_consumer", consumer=consumer.name):
+            try:
+                await consumer.run()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                log.warning(
+                    f"{LogTag.COMPOSIO} Webhook consumer dropped, restarting",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+        await asyncio.sleep(COMPOSIO_WEBHOOK_RECONNECT_SECONDS)
+
+
+def start_webhook_consumer() -> None:
+    """Start this process's ingestion consumer (idempotent)."""
+    global _consumer_task
+    if _consumer_task is not None and not _consumer_task.done():
+        return
+    _consumer_task = asyncio.get_running_loop().create_task(_consumer_loop())
+    log.info(f"{LogTag.COMPOSIO} Webhook consumer started")
+
+
+async def stop_webhook_consumer() -> None:
+    """Cancel the consumer; its unacked events are replayed by another one."""
+    global _consumer_task
+    if _consumer_task is None:
+        return
+    _consumer_task.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await _consumer_task
+    _consumer_task = None
@@ -0,0 +1,125 @@
+"""Debounced, per-user writer for usage-history snapshots.
+
+Every successful ``check_and_increment`` used to spawn its own snapshot write:
+read every feature's Redis counters and upsert the user's hourly
+``usage_snapshots`` row. An agent turn with 15 tool calls wrote 15
+near-identical snapshots.
+
+A snapshot is a read of the counters at write time, so a burst only needs the
+last one. The first request for a user opens a window of
+``USAGE_SNAPSHOT_FLUSH_INTERVAL_SECONDS``; later requests inside it merge into
+the pending entry (latest plan and feature win, touched features accumulate)
+and are counted as coalesced; one write runs when the window closes. ``flush()``
+writes everything still pending — called at shutdown so a closing process
+does not drop the last window.
+
+Prometheus: ``usage_snapshot_requests_total`` (Counter, label ``outcome``:
+``written`` | ``coalesced``). coalesced / (written + coalesced) is the share of
+Mongo writes saved.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from prometheus_client import Counter
+
+from app.constants.usage import USAGE_SNAPSHOT_FLUSH_INTERVAL_SECONDS
+from app.models.payment_models import PlanType
+from app.services.storage.metrics import _register_once
+from shared.py.wide_events import log, spawn_logged_task
+
+USAGE_SNAPSHOT_REQUESTS_TOTAL = _register_once(
+    "usage_snapshot_requests_total",
+    lambda: Counter(
+        name="usage_snapshot_requests_total",
+        documentation="Usage snapshot requests, by whether they wrote or merged into a pending write",
+        labelnames=("outcome",),
+    ),
+)
+
+# (user_id, feature_key, user_plan) -> write one snapshot. Expected not to raise.
+SnapshotWrite = Callable[[str, str, PlanType], Awaitable[None]]
+
+
+class _Pending:
+    """One user's open window: what the write will use, and the task closing it."""
+
+    __slots__ = ("feature_key", "feature_keys", "loop", "requests", "task", "user_plan")
+
+    def __init__(self, user_plan: PlanType, feature_key: str) -> None:
+        self.user_plan = user_plan
+        self.feature_key = feature_key
+        self.feature_keys = {feature_key}
+        self.requests = 1
+        self.loop = asyncio.get_running_loop()
+        self.task: asyncio.Task[None] | None = None
+
+
+class UsageSnapshotWriter:
+    """Coalesces per-user snapshot requests into at most one write per window."""
+
+    def __init__(
+        self, write: SnapshotWrite, interval: float = USAGE_SNAPSHOT_FLUSH_INTERVAL_SECONDS
+    ) -> None:
+        self._write = write
+        self._interval = interval
+        self._pending: dict[str, _Pending] = {}
+        self._writing: set[asyncio.Task[None]] = set()
+
+    def schedule(self, user_id: str, feature_key: str, user_plan: PlanType) -> None:
+        """Request a snapshot for ``user_id``; never blocks, never raises."""
+        pending = self._pending.get(user_id)
+        # An entry left by a since-closed event loop (tests, worker restarts)
+        # will never be written by its task; start over on this loop.
+        if pending is not None and pending.loop is asyncio.get_running_loop():
+            pending.user_plan = user_plan
+            pending.feature_key = feature_key
+            pending.feature_keys.add(feature_key)
+            pending.requests += 1
+            USAGE_SNAPSHOT_REQUESTS_TOTAL.labels(outcome="coalesced").inc()
+            return
+
+        pending = self._pending[user_id] = _Pending(user_plan, feature_key)
+        pending.task = spawn_logged_task(
+            "usage_sync",
+            self._write_after_window(user_id),
+            user={"id": user_id},
+            feature_key=feature_key,
+        )
+
+    async def _write_after_window(self, user_id: str) -> None:
+        await asyncio.sleep(self._interval)
+        pending = self._pending.pop(user_id, None)
+        if pending is None:
+            # flush() already took it.
+            return
+        task = asyncio.current_task()
+        if task is not None:
+            self._writing.add(task)
+            task.add_done_callback(self._writing.discard)
+        await self._write_pending(user_id, pending)
+
+    async def _write_pending(self, user_id: str, pending: _Pending) -> None:
+        log.set(
+            usage_snapshot={
+                "requests": pending.requests,
+                "features": sorted(pending.feature_keys),
+            }
+        )
+        USAGE_SNAPSHOT_REQUESTS_TOTAL.labels(outcome="written").inc()
+        await self._write(user_id, pending.feature_key, pending.user_plan)
+
+    async def flush(self) -> None:
+        """Write every open window now and wait for writes already running."""
+        pending, self._pending = self._pending, {}
+        current = asyncio.get_running_loop()
+        live = {user_id: entry for user_id, entry in pending.items() if entry.loop is current}
+        for entry in live.values():
+            # Still sleeping: its write happens below instead.
+            if entry.task is not None:
+                entry.task.cancel()
+        await asyncio.gather(
+            *(self._write_pending(user_id, entry) for user_id, entry in live.items()),
+            *self._writing,
+            return_exceptions=True,
+        )
@@ -19,6 +19,7 @@ from app.workers.tasks import (
     cleanup_stuck_personalization,
     execute_workflow_by_id,
     generate_workflow_steps,
+    migrate_memory_partitions,
     process_gmail_emails_to_memory,
     process_onboarding_intelligence_task,
     process_onboarding_workflows_task,
@@ -59,6 +60,7 @@ _process_onboarding_workflows_task = arq_task(process_onboarding_workflows_task)
 _cleanup_stuck_personalization = arq_task(cleanup_stuck_personalization)
 _backfill_active_users = arq_task(backfill_active_users)
 _backfill_user_memories = arq_task(backfill_user_memories)
+_migrate_memory_partitions = arq_task(migrate_memory_partitions)
 _sweep_idle_sandboxes = arq_task(sweep_idle_sandboxes)
 _prune_inactive_sessions = arq_task(prune_inactive_sessions)
 _prune_checkpoint_versions = arq_task(prune_checkpoint_versions)
@@ -91,6 +93,7 @@ WorkerSettings.functions = [
     _execute_tracked_todo,
     _backfill_active_users,
     _backfill_user_memories,
+    _migrate_memory_partitions,
     _promote_usage_badges,
     _sweep_dormant_user_workflows,
     _sweep_abandoned_imessage_registrations,
@@ -10,6 +10,12 @@ from arq.cron import CronJob
 from arq.typing import StartupShutdown
 
 from app.config.settings import settings
+from app.constants.workers import (
+    ARQ_BULK_MAX_JOBS,
+    ARQ_INTERACTIVE_MAX_JOBS,
+    ARQ_WORKFLOW_MAX_JOBS,
+)
+from app.workers.queue import JobClass
 
 
 class WorkerSettings:
@@ -42,7 +48,15 @@ class WorkerSettings:
     # ~8 the queue grows without bound. Bursts above 10 are meant to queue.
     # Concurrency here is bounded by worker memory — each job holds agent
     # graphs and LLM contexts — so raise the container limit before raising it.
-    max_jobs = 10
+    #
+    # Those 10 slots are split by job class. This worker is the interactive
+    # lane on ARQ's default queue; ``app.workers.lanes`` runs the others in the
+    # same process with their own limits.
+    max_jobs = ARQ_INTERACTIVE_MAX_JOBS
+    lane_max_jobs: ClassVar[dict[JobClass, int]] = {
+        JobClass.WORKFLOW: ARQ_WORKFLOW_MAX_JOBS,
+        JobClass.BULK: ARQ_BULK_MAX_JOBS,
+    }
     job_timeout = 1800  # 30 minutes
     keep_result = 0  # Don't keep results in Redis
     log_results = True
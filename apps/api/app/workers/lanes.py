@@ -0,0 +1,136 @@
+"""Per-class job lanes inside the one ARQ worker process.
+
+An ARQ worker polls one queue under one ``max_jobs``. ``WorkerSettings`` is
+the interactive lane on ARQ's default queue. :func:`start_job_lanes` runs one
+more ``arq.worker.Worker`` per remaining :class:`JobClass`, each on its own
+queue with its own limit. The lanes share the process's Redis pool, task
+registry and ``ctx``. Only the interactive lane runs cron jobs. Every lane
+registers every task, so a job queued before the split still runs.
+
+A sampler also records each class's queue depth in ``ARQ_QUEUE_DEPTH``.
+"""
+
+import asyncio
+import contextlib
+import signal
+import time
+from typing import Any
+
+from arq.connections import ArqRedis
+from arq.worker import Worker
+
+from app.constants.log_tags import LogTag
+from app.constants.workers import ARQ_LANE_RESTART_SECONDS, ARQ_QUEUE_DEPTH_POLL_SECONDS
+from app.workers.config.worker_settings import WorkerSettings
+from app.workers.metrics import ARQ_QUEUE_DEPTH
+from app.workers.queue import JOB_CLASS_QUEUES, JobClass
+from shared.py.wide_events import log, log_context
+
+_lanes: dict[JobClass, Worker] = {}
+_lane_tasks: list[asyncio.Task[None]] = []
+_depth_task: asyncio.Task[None] | None = None
+
+
+def _lane_worker(job_class: JobClass, pool: ArqRedis, ctx: dict[str, Any]) -> Worker:
+    return Worker(
+        WorkerSettings.functions,
+        queue_name=JOB_CLASS_QUEUES[job_class],
+        redis_pool=pool,
+        # The interactive lane owns the signal handlers and stops us in shutdown.
+        handle_signals=False,
+        ctx=ctx,
+        max_jobs=WorkerSettings.lane_max_jobs[job_class],
+        job_timeout=WorkerSettings.job_timeout,
+        keep_result=WorkerSettings.keep_result,
+        log_results=WorkerSettings.log_results,
+        health_check_interval=WorkerSettings.health_check_interval,
+        health_check_key=f"{WorkerSettings.health_check_key}:{job_class}",
+        allow_abort_jobs=WorkerSettings.allow_abort_jobs,
+    )
+
+
+async def _run_lane(job_class: JobClass, worker: Worker) -> None:
+    """Poll the lane's queue; restart after a crash instead of going quiet."""
+    while True:
+        try:
+            await worker.main()
+        except Exception as e:
+            async with log_context("arq_job_lane", job_class=str(job_class)):
+                log.error(
+                    f"{LogTag.WORKER} Job lane crashed, restarting",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+        await asyncio.sleep(ARQ_LANE_RESTART_SECONDS)
+
+
+async def sample_queue_depths(pool: ArqRedis) -> None:
+    """Record how many jobs are ready and deferred on every class's queue."""
+    now_ms = int(time.time() * 1000)
+    for job_class, queue_name in JOB_CLASS_QUEUES.items():
+        total = await pool.zcard(queue_name)
+        ready = await pool.zcount(queue_name, "-inf", now_ms)
+        ARQ_QUEUE_DEPTH.labels(job_class=job_class, state="ready").set(ready)
+        ARQ_QUEUE_DEPTH.labels(job_class=job_class, state="deferred").set(total - ready)
+
+
+async def _depth_loop(pool: ArqRedis) -> None:
+    while True:
+        try:
+            await sample_queue_depths(pool)
+        except Exception as e:
+            async with log_context("arq_queue_depth_sample"):
+                log.warning(
+                    f"{LogTag.WORKER} Queue depth sample failed",
+                    error=str(e),
+                    error_type=type(e).__name__,
+                )
+        await asyncio.sleep(ARQ_QUEUE_DEPTH_POLL_SECONDS)
+
+
+def start_job_lanes(ctx: dict[str, Any]) -> None:
+    """Start the non-interactive lanes and the depth sampler (idempotent).
+
+    ``ctx`` is the interactive worker's, which already holds its Redis pool.
+    """
+    global _depth_task
+    if _lanes:
+        return
+    pool: ArqRedis | None = ctx.get("redis")
+    if pool is None:
+        log.warning(f"{LogTag.WORKER} Job lanes not started (no ARQ Redis pool in ctx)")
+        return
+    loop = asyncio.get_running_loop()
+    for job_class in WorkerSettings.lane_max_jobs:
+        worker = _lanes[job_class] = _lane_worker(job_class, pool, ctx)
+        worker.main_task = loop.create_task(_run_lane(job_class, worker))
+        _lane_tasks.append(worker.main_task)
+    _depth_task = loop.create_task(_depth_loop(pool))
+    log.info(
+        f"{LogTag.WORKER} Job lanes started",
+        lanes={str(c): WorkerSettings.lane_max_jobs[c] for c in _lanes},
+        interactive_max_jobs=WorkerSettings.max_jobs,
+    )
+
+
+async def stop_job_lanes() -> None:
+    """Cancel the lanes' running jobs and pollers, as ARQ does on a signal.
+
+    Cancelled jobs are retried by whichever worker picks them up next. The
+    shared pool stays open: the interactive lane closes it.
+    """
+    global _depth_task
+    if _depth_task is not None:
+        _depth_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _depth_task
+        _depth_task = None
+    for worker in _lanes.values():
+        worker.handle_sig(signal.SIGTERM)
+    await asyncio.gather(*_lane_tasks, return_exceptions=True)
+    for worker in _lanes.values():
+        await asyncio.gather(*worker.tasks.values(), return_exceptions=True)
+        with contextlib.suppress(Exception):
+            await worker.pool.delete(worker.health_check_key)
+    _lanes.clear()
+    _lane_tasks.clear()
@@ -7,7 +7,11 @@ from typing import Any
 
 from app.constants.log_tags import LogTag
 from app.core.provider_registration import unified_shutdown
+from app.core.stream_cancel_watcher import stop_cancel_watcher
+from app.core.workflow_routing_listener import stop_routing_listener
+from app.services.triggers.webhook_queue import stop_webhook_consumer
 from app.utils.browser_reaper import stop_browser_reaper
+from app.workers.lanes import stop_job_lanes
 from shared.py.wide_events import log, log_context
 
 
@@ -20,7 +24,12 @@ async def shutdown(ctx: dict[str, Any]) -> None:
     async with log_context("worker_shutdown", component="arq_lifecycle"):
         log.info(f"{LogTag.WORKER} ARQ worker shutting down...")
 
+        # Lane jobs still hold the services below; stop them first.
+        await stop_job_lanes()
         await stop_browser_reaper()
+        await stop_cancel_watcher()
+        await stop_webhook_consumer()
+        await stop_routing_listener()
 
         # Use unified shutdown function - handles context-aware service cleanup
         await unified_shutdown("arq_worker")
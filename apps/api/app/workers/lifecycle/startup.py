@@ -26,7 +26,11 @@ from app.core.provider_registration import (
     setup_warnings,
     unified_startup,
 )
+from app.core.stream_cancel_watcher import start_cancel_watcher
+from app.core.workflow_routing_listener import start_routing_listener
+from app.services.triggers.webhook_queue import start_webhook_consumer
 from app.utils.browser_reaper import start_browser_reaper
+from app.workers.lanes import start_job_lanes
 from app.workers.metrics import start_metrics_server
 from shared.py.wide_events import log, log_context
 
@@ -62,3 +66,19 @@ async def startup(ctx: dict[str, Any]) -> None:
         # Reap any crawl4ai browser drivers that escape teardown (worker crawl
         # tasks are routinely cancelled; see app/utils/browser_reaper.py).
         start_browser_reaper()
+
+        # Executor runs check stream cancellation per graph event; serve those
+        # checks from a local flag instead of a Redis GET each.
+        start_cancel_watcher()
+
+        # Composio trigger webhooks arrive on a Redis stream; this process runs
+        # one bounded consumer of it (app/services/triggers/webhook_queue.py).
+        start_webhook_consumer()
+
+        # Trigger handlers route those events by Composio trigger id; answer
+        # from a local table kept fresh by invalidations instead of Mongo.
+        start_routing_listener()
+
+        # Workflow and bulk jobs run in their own lanes with their own slots,
+        # last so they only pick up work once everything above is ready.
+        start_job_lanes(ctx)
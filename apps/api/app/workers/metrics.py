@@ -3,7 +3,8 @@ Prometheus metrics for the ARQ background worker.
 
 Exposes a histogram of task durations and a counter of task outcomes so the
 `arq-worker` dashboard can show real latency percentiles instead of scraping logs.
-The observations are recorded by ``app.workers.task_envelope.arq_task``.
+The observations are recorded by ``app.workers.task_envelope.arq_task``. The
+depth of every job class's queue is sampled by ``app.workers.lanes``.
 
 A standalone HTTP server is started in `startup()` on the port configured via
 ``ARQ_METRICS_PORT`` (default 9100). Prometheus scrapes this endpoint via the
@@ -20,8 +21,14 @@ from __future__ import annotations
 import contextlib
 from typing import ParamSpec, TypeVar
 
-from prometheus_client import CollectorRegistry, Counter, Histogram, start_http_server
+from prometheus_client import CollectorRegistry, Counter, Gauge, Histogram, start_http_server
 
+from app.db.chroma.query_embedding_cache import QUERY_EMBEDDING_CACHE_REQUESTS_TOTAL
+from app.db.repositories.workflow_routing import (
+    WORKFLOW_ROUTING_INVALIDATIONS_TOTAL,
+    WORKFLOW_ROUTING_LOOKUPS_TOTAL,
+)
+from app.memory.embedding_cache import MEMORY_EMBEDDING_CACHE_REQUESTS_TOTAL
 from app.services.storage.metrics import (
     _FS_OP_BYTES_TOTAL,
     _FS_OP_DURATION_SECONDS,
@@ -30,6 +37,12 @@ from app.services.storage.metrics import (
     _FS_OP_TOTAL,
     _SANDBOX_POOL_SIZE,
 )
+from app.services.triggers.metrics import (
+    COMPOSIO_WEBHOOK_EVENTS_TOTAL,
+    COMPOSIO_WEBHOOK_LAG_SECONDS,
+    COMPOSIO_WEBHOOK_REPLAYS_TOTAL,
+)
+from app.services.usage_snapshot_writer import USAGE_SNAPSHOT_REQUESTS_TOTAL
 
 T = TypeVar("T")
 P = ParamSpec("P")
@@ -51,6 +64,16 @@ TASK_TOTAL = Counter(
     registry=REGISTRY,
 )
 
+# ``state`` is ``ready`` (due now, waiting for a slot) or ``deferred``
+# (scheduled for later). A ready depth that keeps growing means the class
+# needs more slots.
+ARQ_QUEUE_DEPTH = Gauge(
+    "arq_queue_depth",
+    "Jobs waiting on each ARQ job-class queue",
+    labelnames=("job_class", "state"),
+    registry=REGISTRY,
+)
+
 # Cross-register the FsOps collectors onto this worker registry so the worker
 # process's /metrics surface mirrors the API's. The same collector instances
 # are registered on both registries — observations from `record_fs_op` flow
@@ -58,7 +81,12 @@ TASK_TOTAL = Counter(
 #
 # The `tool_bash_exit_code_total` counter is NOT mirrored here — bash_tool is
 # only reachable from API request paths, not ARQ tasks, so it would always be
-# zero on the worker side.
+# zero on the worker side. Usage-snapshot coalescing and the query-embedding
+# cache are mirrored: workflow runs meter rate-limited tools and discover tools
+# with retrieve_tools from the worker. So is the memory-embedding cache, which
+# the memory backfill and email-ingestion jobs hit here. The Composio webhook collectors are
+# mirrored because the ingestion consumer runs here, and the workflow routing
+# table because its trigger handlers do.
 for _collector in (
     _FS_OP_DURATION_SECONDS,
     _FS_OP_BYTES_TOTAL,
@@ -66,6 +94,14 @@ for _collector in (
     _FS_OP_LAST_SEEN,
     _FS_OP_IN_FLIGHT,
     _SANDBOX_POOL_SIZE,
+    USAGE_SNAPSHOT_REQUESTS_TOTAL,
+    QUERY_EMBEDDING_CACHE_REQUESTS_TOTAL,
+    MEMORY_EMBEDDING_CACHE_REQUESTS_TOTAL,
+    COMPOSIO_WEBHOOK_EVENTS_TOTAL,
+    COMPOSIO_WEBHOOK_REPLAYS_TOTAL,
+    COMPOSIO_WEBHOOK_LAG_SECONDS,
+    WORKFLOW_ROUTING_LOOKUPS_TOTAL,
+    WORKFLOW_ROUTING_INVALIDATIONS_TOTAL,
 ):
     # Already registered on this registry (re-import under reload).
     with contextlib.suppress(ValueError):
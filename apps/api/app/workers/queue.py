@@ -10,11 +10,18 @@ signature knows about it, and no call site can forget it.
 Deploy note: because the id rides in the job payload, a worker running code
 older than this module would reject the kwarg. API and worker ship from the same
 image, so they only skew during a restart.
+
+The wrapper also routes each job to its :class:`JobClass` queue. Every class has
+its own concurrency limit in the worker (``app.workers.lanes``), so an hourly
+burst of scheduled workflows or a memory backfill cannot take the slots HIL
+sweeps, reminders and executor runs need.
 """
 
+from enum import StrEnum
 from typing import Any
 
 from arq.connections import ArqRedis
+from arq.constants import default_queue_name
 from arq.jobs import Job
 
 from shared.py.wide_events import get_trace_id
@@ -22,17 +29,56 @@ from shared.py.wide_events import get_trace_id
 TRACE_ID_KWARG = "_gaia_trace_id"
 
 
+class JobClass(StrEnum):
+    """Scheduling class of a worker job; each one is drained by its own lane."""
+
+    # Someone is waiting on it: HIL sweeps, reminders, executor runs, generation.
+    INTERACTIVE = "interactive"
+    # User workflow runs. Schedules cluster at the top of the hour.
+    WORKFLOW = "workflow"
+    # Long background ingestion nobody is watching.
+    BULK = "bulk"
+
+
+# Interactive work keeps ARQ's default queue, so cron jobs (enqueued by the
+# worker on its own queue) and anything enqueued without the wrapper land there.
+JOB_CLASS_QUEUES: dict[JobClass, str] = {
+    JobClass.INTERACTIVE: default_queue_name,
+    JobClass.WORKFLOW: f"{default_queue_name}:workflow",
+    JobClass.BULK: f"{default_queue_name}:bulk",
+}
+
+# Task name -> class. Anything not listed is interactive.
+TASK_JOB_CLASSES: dict[str, JobClass] = {
+    "execute_workflow_by_id": JobClass.WORKFLOW,
+    "process_gmail_emails_to_memory": JobClass.BULK,
+    "backfill_user_memories": JobClass.BULK,
+    "migrate_memory_partitions": JobClass.BULK,
+}
+
+
+def job_class_of(function: str) -> JobClass:
+    """The class a task's jobs are queued and run under."""
+    return TASK_JOB_CLASSES.get(function, JobClass.INTERACTIVE)
+
+
 async def enqueue_worker_job(
     pool: ArqRedis, function: str, *args: Any, **kwargs: Any
 ) -> Job | None:
-    """Enqueue an ARQ job stamped with the caller's trace id.
+    """Enqueue an ARQ job stamped with the caller's trace id, on its class's queue.
 
     Returns ``None`` when ARQ deduped the job against an existing ``_job_id``,
     exactly like ``pool.enqueue_job``. Outside a wide-event boundary (a cron
     fire, a process with no inbound trace) there is nothing to propagate, so the
     kwarg is omitted and the worker mints a fresh id for the job.
+
+    Interactive jobs go to the pool's default queue, so their enqueue call is
+    unchanged. An explicit ``_queue_name`` from the caller wins.
     """
     trace_id = get_trace_id()
     if trace_id:
         kwargs[TRACE_ID_KWARG] = trace_id
+    job_class = job_class_of(function)
+    if job_class is not JobClass.INTERACTIVE:
+        kwargs.setdefault("_queue_name", JOB_CLASS_QUEUES[job_class])
     return await pool.enqueue_job(function, *args, **kwargs)
@@ -6,6 +6,7 @@ from .checkpoint_retention_tasks import prune_checkpoint_versions
 from .cleanup_tasks import cleanup_stuck_personalization
 from .memory_backfill_tasks import backfill_active_users, backfill_user_memories
 from .memory_email_tasks import process_gmail_emails_to_memory
+from .memory_partition_tasks import migrate_memory_partitions
 from .nurture_tasks import run_nurture_sequence_task
 from .onboarding_tasks import (
     process_onboarding_intelligence_task,
@@ -45,5 +46,6 @@ __all__ = [
     "prune_inactive_sessions",
     "backfill_active_users",
     "backfill_user_memories",
+    "migrate_memory_partitions",
     "promote_usage_badges",
 ]
@@ -5,10 +5,13 @@
 `AsyncPostgresSaver`:
 
 1. **Orphan sweep** — a thread whose owning conversation no longer exists in
-   Mongo is deleted whole (`checkpointer.adelete_thread`). This is the backstop
-   for the best-effort thread cleanup in `conversation_service.delete_conversation`
-   (a delete that failed while Postgres was unreachable, or a bot conversation
-   abandoned without an explicit delete).
+   Mongo is deleted whole. This is the backstop for the best-effort thread
+   cleanup in `conversation_service.delete_conversation` (a delete that failed
+   while Postgres was unreachable, or a bot conversation abandoned without an
+   explicit delete). It walks thread ids in sorted batches, asks Mongo only
+   about each batch's candidate owners, and saves its position in Redis, so its
+   memory stays flat however many conversations exist and a capped run resumes
+   the next night where it stopped.
 
 2. **Stale spawn sweep** — a spawned subagent's thread is kept past its own run
    so a sibling's approval replay can see that it already finished, then reclaimed
@@ -40,6 +43,7 @@ from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
 import re
+import time
 from typing import Any
 from uuid import UUID
 
@@ -52,6 +56,7 @@ from app.agents.core.graph_builder.checkpointer_manager import get_checkpointer_
 from app.constants.general import (
     CHECKPOINT_EMPTY_BLOB_TYPE,
     CHECKPOINT_MESSAGES_CHANNEL,
+    CHECKPOINT_ORPHAN_SWEEP_BATCH_SIZE,
     CHECKPOINT_ORPHAN_SWEEP_MAX_THREADS,
     CHECKPOINT_PRUNE_MAX_THREADS_PER_RUN,
     CHECKPOINT_PRUNE_MIN_CHECKPOINTS,
@@ -60,6 +65,7 @@ from app.constants.general import (
     SPAWN_THREAD_PREFIX,
 )
 from app.constants.log_tags import LogTag
+from app.db.redis import redis_cache
 from app.db.repositories.conversations import conversation_repository
 from shared.py.wide_events import log
 
@@ -74,23 +80,35 @@ _UUID_RE = re.compile(
 _GREGORIAN_EPOCH = datetime(1582, 10, 15, tzinfo=UTC)
 
 
-def _thread_is_orphan(
-    thread_id: str, live_all: set[str], live_uuid: set[str], live_non_uuid: list[str]
-) -> bool:
-    """True if no live conversation owns this thread.
+# Where the orphan sweep stopped: the last thread id it finished with. Cleared
+# once a run reaches the end of the table, so the next one starts over.
+_ORPHAN_CURSOR_KEY = "checkpoint_retention:orphan_cursor"
+# Outlives a few nights of capped runs; a lost cursor only costs a rescan.
+_ORPHAN_CURSOR_TTL_SECONDS = 7 * 24 * 3600
+
+
+def _owner_candidates(thread_id: str) -> set[str]:
+    """Every conversation id that could own this thread.
 
-    Never returns True for a thread whose owning conversation is live: the
-    conversation_id is always a substring of its derived thread ids, so a uuid
-    conversation is caught by the candidate-uuid intersection and a non-uuid one
-    by the substring scan. Extra uuids in the thread (e.g. a uuid integration
-    id) only make the test more conservative (fewer deletions), never less safe.
+    Derived thread ids join their parts with ``_``, so an embedded conversation
+    id is a run of whole ``_``-separated segments (or a uuid anywhere in the id).
     """
     candidates = set(_UUID_RE.findall(thread_id))
-    if candidates & live_uuid:
-        return False
-    if thread_id in live_all:
-        return False
-    return not any(conv in thread_id for conv in live_non_uuid)
+    segments = thread_id.split("_")
+    for start in range(len(segments)):
+        for end in range(start + 1, len(segments) + 1):
+            candidates.add("_".join(segments[start:end]))
+    return candidates
+
+
+def _thread_is_orphan(thread_id: str, live: set[str]) -> bool:
+    """True if no live conversation owns this thread.
+
+    ``live`` holds whichever of the thread's ``_owner_candidates`` still exist.
+    Extra uuids in the thread (e.g. a uuid integration id) only make the test
+    more conservative (fewer deletions), never less safe.
+    """
+    return not _owner_candidates(thread_id) & live
 
 
 def _prune_ids_for_chain(
@@ -173,39 +191,88 @@ async def _prune_thread_versions(
     }
 
 
-async def sweep_orphan_threads(
-    pool: AsyncConnectionPool, checkpointer: AsyncPostgresSaver
-) -> dict[str, int]:
-    """Delete every checkpoint thread whose conversation is gone from Mongo."""
-    live_ids = await conversation_repository.all_conversation_ids()
-    live_all = {str(c) for c in live_ids if c}
-    live_uuid = {c for c in live_all if _UUID_RE.fullmatch(c)}
-    live_non_uuid = [c for c in live_all if c not in live_uuid]
+async def _delete_threads(cur: AsyncCursor[TupleRow], thread_ids: list[str]) -> dict[str, int]:
+    """Delete whole threads, as `adelete_thread` does, counting rows and bytes."""
+    deleted: dict[str, int] = {}
+    for table, size in (
+        ("checkpoint_writes", "octet_length(blob)"),
+        ("checkpoint_blobs", "octet_length(blob)"),
+        ("checkpoints", "pg_column_size(checkpoint) + pg_column_size(metadata)"),
+    ):
+        await cur.execute(
+            f"WITH d AS (DELETE FROM {table} WHERE thread_id = ANY(%s) RETURNING {size} AS n) "
+            "SELECT count(*), coalesce(sum(n), 0) FROM d",
+            (thread_ids,),
+        )
+        rows, size_bytes = await cur.fetchone()
+        deleted[table] = rows
+        deleted["bytes"] = deleted.get("bytes", 0) + size_bytes
+    return deleted
 
-    async with pool.connection() as conn, conn.cursor() as cur:
-        await cur.execute("SELECT DISTINCT thread_id FROM checkpoints")
-        thread_ids = [row[0] for row in await cur.fetchall()]
 
-    orphans = [
-        tid for tid in thread_ids if _thread_is_orphan(tid, live_all, live_uuid, live_non_uuid)
-    ][:CHECKPOINT_ORPHAN_SWEEP_MAX_THREADS]
+async def sweep_orphan_threads(pool: AsyncConnectionPool) -> dict[str, int]:
+    """Delete every checkpoint thread whose conversation is gone from Mongo.
+
+    Pages through distinct thread ids in order after the saved cursor. Each page
+    costs one `$in` lookup of its candidate owners and one transaction deleting
+    its orphans, and the cursor is saved after it commits.
+    """
+    started = time.monotonic()
+    after: str = await redis_cache.get(_ORPHAN_CURSOR_KEY) or ""
+    totals = {
+        "threads_total": 0,
+        "orphan_threads_deleted": 0,
+        "orphan_checkpoints_deleted": 0,
+        "orphan_bytes_freed": 0,
+        "orphan_sweep_resumed": int(bool(after)),
+    }
 
-    checkpoints_deleted = 0
-    if orphans:
+    finished = False
+    while totals["orphan_threads_deleted"] < CHECKPOINT_ORPHAN_SWEEP_MAX_THREADS:
         async with pool.connection() as conn, conn.cursor() as cur:
             await cur.execute(
-                "SELECT count(*) FROM checkpoints WHERE thread_id = ANY(%s)", (orphans,)
+                "SELECT DISTINCT thread_id FROM checkpoints WHERE thread_id > %s "
+                "ORDER BY thread_id LIMIT %s",
+                (after, CHECKPOINT_ORPHAN_SWEEP_BATCH_SIZE),
             )
-            checkpoints_deleted = (await cur.fetchone())[0]
-
-    for tid in orphans:
-        await checkpointer.adelete_thread(tid)
-
-    return {
-        "threads_total": len(thread_ids),
-        "orphan_threads_deleted": len(orphans),
-        "orphan_checkpoints_deleted": checkpoints_deleted,
-    }
+            batch = [row[0] for row in await cur.fetchall()]
+        if not batch:
+            finished = True
+            break
+
+        candidates = set().union(*(_owner_candidates(tid) for tid in batch))
+        live = await conversation_repository.existing_conversation_ids(candidates)
+        remaining = CHECKPOINT_ORPHAN_SWEEP_MAX_THREADS - totals["orphan_threads_deleted"]
+        orphans = [tid for tid in batch if _thread_is_orphan(tid, live)]
+        capped = len(orphans) > remaining
+        if capped:
+            # Stop at the last orphan deleted so the next run picks up the rest.
+            orphans = orphans[:remaining]
+            batch = batch[: batch.index(orphans[-1]) + 1]
+
+        if orphans:
+            # The checkpointer pool is autocommit; without an explicit transaction
+            # each DELETE would commit on its own.
+            async with pool.connection() as conn, conn.transaction(), conn.cursor() as cur:
+                deleted = await _delete_threads(cur, orphans)
+            totals["orphan_threads_deleted"] += len(orphans)
+            totals["orphan_checkpoints_deleted"] += deleted["checkpoints"]
+            totals["orphan_bytes_freed"] += deleted["bytes"]
+
+        totals["threads_total"] += len(batch)
+        after = batch[-1]
+        if len(batch) < CHECKPOINT_ORPHAN_SWEEP_BATCH_SIZE and not capped:
+            finished = True
+            break
+        await redis_cache.set(_ORPHAN_CURSOR_KEY, after, ttl=_ORPHAN_CURSOR_TTL_SECONDS)
+
+    if finished:
+        await redis_cache.delete(_ORPHAN_CURSOR_KEY)
+    elapsed = time.monotonic() - started
+    totals["threads_scanned_per_second"] = (
+        round(totals["threads_total"] / elapsed) if elapsed else 0
+    )
+    return totals
 
 
 def _checkpoint_written_at(checkpoint_id: str) -> datetime | None:
@@ -351,7 +418,7 @@ async def prune_checkpoint_versions(_ctx: dict[str, Any]) -> str:
     pool = manager.pool
     checkpointer = manager.get_checkpointer()
 
-    orphan = await sweep_orphan_threads(pool, checkpointer)
+    orphan = await sweep_orphan_threads(pool)
     spawn = await sweep_stale_spawn_threads(pool, checkpointer)
     prune = await prune_thread_versions(pool)
 
@@ -363,5 +430,5 @@ async def prune_checkpoint_versions(_ctx: dict[str, Any]) -> str:
         f"stale_spawns={spawn['spawn_threads_deleted']} "
         f"pruned_threads={prune['threads_pruned']} "
         f"checkpoints_deleted={orphan['orphan_checkpoints_deleted'] + prune['checkpoints_deleted']} "
-        f"bytes_estimate={prune['bytes_estimate']}"
+        f"bytes_estimate={orphan['orphan_bytes_freed'] + prune['bytes_estimate']}"
     )
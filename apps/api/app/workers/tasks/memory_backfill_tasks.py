@@ -10,24 +10,32 @@ The ``memory_backfilled`` marker makes the whole thing idempotent and, as a
 free side effect, picks up users who only just became active again: when a
 dormant account logs back in its ``last_active_at`` is bumped, so the next cron
 run sees it as eligible and backfills it.
+
+Conversations go through ``memory_engine.retain_many``, which overlaps up to
+``MEMORY_BACKFILL_CONCURRENCY`` extraction LLM calls while still applying them
+oldest first. Every applied conversation is checkpointed in Redis, so a job
+retried after a worker restart resumes instead of replaying from the start.
 """
 
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+import time
 from typing import Any
 
 from app.constants.memory import (
     MEMORY_BACKFILL_ACTIVE_DAYS,
+    MEMORY_BACKFILL_CONCURRENCY,
     MEMORY_BACKFILL_ELIGIBLE_BEFORE,
     MEMORY_BACKFILL_MAX_CONVERSATIONS,
     MEMORY_BACKFILL_MAX_USERS_PER_RUN,
     MemorySourceType,
 )
+from app.db.redis import redis_cache
 from app.db.repositories.conversations import conversation_repository
 from app.db.repositories.users import user_repository
 from app.memory.consolidation import cancel_consolidation
-from app.memory.engine import memory_engine
+from app.memory.engine import RetainSession, memory_engine
 from app.models.notification.notification_models import (
     ActionConfig,
     ActionStyle,
@@ -46,6 +54,12 @@ from shared.py.wide_events import MemoryContext, UserContext, log
 
 _BACKFILL_TASK = "backfill_user_memories"
 _MEMORY_SETTINGS_URL = "/settings/memory"
+# Long enough to outlive a redeploy and the job's retries, short enough not to linger.
+_CHECKPOINT_TTL_SECONDS = 7 * 24 * 3600
+
+
+def _checkpoint_key(user_id: str) -> str:
+    return f"memory_backfill:{user_id}"
 
 
 def _active_since() -> datetime:
@@ -89,6 +103,10 @@ async def backfill_user_memories(ctx: dict[str, Any], user_id: str) -> str:
     Idempotent: re-checks the marker, and the engine's reconciliation dedups
     facts, so a retry never double-stores. The marker is set even on a zero-fact
     no-op so the cron won't keep re-selecting the user.
+
+    Progress is a ``{conversation_id: facts}`` checkpoint written after every
+    applied conversation; a retry skips those and only replays the rest. The
+    checkpoint is dropped once the marker is set.
     """
     log.set(user=UserContext(id=user_id))
     user = await user_repository.get(user_id)
@@ -107,22 +125,34 @@ async def backfill_user_memories(ctx: dict[str, Any], user_id: str) -> str:
     ]
     docs.reverse()
 
-    facts = 0
-    processed = 0
-    for doc in docs:
-        messages = _conversation_to_messages(doc)
-        if not messages:
-            continue
-        result = await memory_engine.retain(
-            user_id,
-            messages,
+    key = _checkpoint_key(user_id)
+    checkpoint: dict[str, int] = await redis_cache.get(key) or {}
+    sessions = [
+        RetainSession(
+            messages=messages,
             source_type=MemorySourceType.CONVERSATION,
             source_id=doc.get("conversation_id"),
-            user_name=user_name,
             now=_conversation_date(doc),
         )
+        for doc in docs
+        if doc.get("conversation_id") not in checkpoint
+        and (messages := _conversation_to_messages(doc))
+    ]
+
+    facts = sum(checkpoint.values())
+    resumed = len(checkpoint)
+    replayed = 0
+    started = time.perf_counter()
+    async for session, result in memory_engine.retain_many(
+        user_id, sessions, user_name=user_name, concurrency=MEMORY_BACKFILL_CONCURRENCY
+    ):
         facts += result.facts_extracted
-        processed += 1
+        replayed += 1
+        if session.source_id is not None:
+            checkpoint[session.source_id] = result.facts_extracted
+            await redis_cache.set(key, checkpoint, ttl=_CHECKPOINT_TTL_SECONDS)
+    elapsed = time.perf_counter() - started
+    processed = resumed + replayed
 
     if processed:
         # Each retain only *scheduled* a debounced (120s) core-document
@@ -135,9 +165,12 @@ async def backfill_user_memories(ctx: dict[str, Any], user_id: str) -> str:
         await memory_engine.consolidate(user_id)
 
     await user_repository.mark_memory_backfilled(user_id)
+    await redis_cache.delete(key)
     log.set(
         memory=MemoryContext(operation="retain", facts_extracted=facts, result_count=facts),
         conversations=processed,
+        conversations_resumed=resumed,
+        conversations_per_second=round(replayed / elapsed, 3) if replayed and elapsed else 0.0,
     )
 
     # Only tell the user when something was actually learned — a 0-fact
@@ -0,0 +1,89 @@
+"""Move long-term memory vectors between Chroma partitioning layouts.
+
+``MEMORY_VECTOR_PARTITIONING`` decides which collection a user's fact vectors
+live in (see ``chroma_store.memories_collection_name``). Changing it, or the
+bucket count, leaves existing vectors where they were, so this job moves them
+into the new layout. Rollout:
+
+1. enqueue ``migrate_memory_partitions(target, source)`` while the old layout
+   is still live. It only copies: the source rows the app reads and flags
+   stay where they are;
+2. switch ``MEMORY_VECTOR_PARTITIONING`` and restart;
+3. enqueue it again with ``cleanup=True``. Each source row is folded into the
+   new layout — copied if it was written after step 1, otherwise its flags
+   merged into the copy so a fact superseded or forgotten in between stays
+   that way — and then deleted from the source.
+
+Progress is checkpointed per source collection and step in Redis after every
+page, so a failed or restarted job resumes where it stopped. The emptied
+source collections themselves are left in place; drop them once the new
+layout is verified.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from app.constants.memory import (
+    MEMORY_PARTITION_MIGRATION_PAGE_SIZE,
+    MEMORY_VECTOR_PARTITIONINGS,
+)
+from app.db.redis import redis_cache
+from app.memory import chroma_store
+from shared.py.wide_events import log
+
+# Long enough to survive a weekend of retries, short enough not to linger.
+_CURSOR_TTL_SECONDS = 7 * 24 * 3600
+
+
+def _cursor_key(source: str, target: str, cleanup: bool = False) -> str:
+    step = "cleanup" if cleanup else "copy"
+    return f"memory_partition_migration:{source}:{target}:{step}"
+
+
+async def migrate_memory_partitions(
+    _ctx: dict[str, Any], target: str, source: str = "global", cleanup: bool = False
+) -> str:
+    """Copy every fact vector stored under ``source`` into the ``target`` layout.
+
+    With ``cleanup`` (only once ``target`` is live) each source row is folded
+    into ``target`` and deleted from ``source`` instead. Idempotent: vectors
+    keep their ids, so re-running a page is an upsert of identical rows or a
+    re-merge of the same flags. The cursor counts the rows each source still
+    holds ahead of the next page; it is cleared once every source is done.
+    """
+    for partitioning in (source, target):
+        if partitioning not in MEMORY_VECTOR_PARTITIONINGS:
+            raise ValueError(f"Unknown memory vector partitioning {partitioning!r}")
+    if source == target and source != "bucketed":
+        # Re-bucketing (a new MEMORY_VECTOR_BUCKETS) is the only same-layout move.
+        return f"memory partitions: {source} -> {target} is a no-op"
+
+    key = _cursor_key(source, target, cleanup)
+    cursor: dict[str, int] = await redis_cache.get(key) or {}
+    moved = 0
+    sources = await chroma_store.memories_collection_names(source)
+    for name in sources:
+        offset = cursor.get(name, 0)
+        while True:
+            if cleanup:
+                read, kept = await chroma_store.retire_memories(
+                    name, target, offset=offset, limit=MEMORY_PARTITION_MIGRATION_PAGE_SIZE
+                )
+                moved += read - kept
+            else:
+                # Copying leaves every row in the source: step over the page.
+                read = kept = await chroma_store.copy_memories(
+                    name, target, offset=offset, limit=MEMORY_PARTITION_MIGRATION_PAGE_SIZE
+                )
+                moved += read
+            offset += kept
+            cursor[name] = offset
+            await redis_cache.set(key, cursor, ttl=_CURSOR_TTL_SECONDS)
+            if read < MEMORY_PARTITION_MIGRATION_PAGE_SIZE:
+                break
+
+    await redis_cache.delete(key)
+    verb = "retired" if cleanup else "copied"
+    log.set(source=source, target=target, collections=len(sources), cleanup=cleanup, moved=moved)
+    return f"memory partitions: {verb} {moved} vectors from {len(sources)} {source} collections to {target}"
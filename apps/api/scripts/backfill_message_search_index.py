@@ -0,0 +1,77 @@
+"""Index existing chat history into the Postgres keyword-search table.
+
+Conversation writes keep ``message_search`` in sync from the moment the table
+exists; this fills it with messages written before that. Rows are upserted, so
+the script is idempotent and safe to re-run (or to run while chat traffic keeps
+indexing new messages). Enable ``MESSAGE_SEARCH_INDEX=1`` once it has finished.
+
+    uv run python -m scripts.backfill_message_search_index            # all users
+    uv run python -m scripts.backfill_message_search_index --user-id <id>
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.message_search import entry_rows, upsert_entries
+from app.db.mongodb.collections import get_async_collection
+from app.db.postgresql import init_postgresql_engine
+
+# Rows per INSERT: 5 bind params each stays well under asyncpg's 32767 cap.
+_BATCH_ROWS = 1000
+
+
+async def backfill(user_id: str | None) -> None:
+    conversations = get_async_collection("conversations")
+    filter_ = {"user_id": user_id} if user_id else {}
+    total = await conversations.count_documents(filter_)
+    print(f"Indexing messages from {total} conversation(s)...")
+
+    scanned = 0
+    indexed = 0
+    batch: list[dict[str, object]] = []
+    cursor = conversations.find(
+        filter_,
+        {
+            "_id": 0,
+            "conversation_id": 1,
+            "user_id": 1,
+            "messages.message_id": 1,
+            "messages.response": 1,
+            "messages.date": 1,
+        },
+    )
+    async for conversation in cursor:
+        scanned += 1
+        batch.extend(
+            entry_rows(
+                conversation["user_id"],
+                conversation["conversation_id"],
+                conversation.get("messages") or [],
+            )
+        )
+        while len(batch) >= _BATCH_ROWS:
+            await upsert_entries(batch[:_BATCH_ROWS])
+            indexed += _BATCH_ROWS
+            batch = batch[_BATCH_ROWS:]
+        if scanned % 500 == 0:
+            print(f"  {scanned}/{total} conversations, {indexed} messages indexed")
+    await upsert_entries(batch)
+    indexed += len(batch)
+    print(f"\nBackfill complete. Conversations: {scanned}, messages indexed: {indexed}")
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Backfill the message keyword-search index.")
+    parser.add_argument("--user-id", help="Only this user (default: all users)")
+    args = parser.parse_args()
+
+    init_postgresql_engine()
+    await backfill(args.user_id)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
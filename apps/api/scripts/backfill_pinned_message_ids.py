@@ -0,0 +1,58 @@
+"""
+One-time, idempotent migration: materialize `pinned_message_ids` on conversations.
+
+With `PINNED_MESSAGE_IDS=1` the pinned-messages view reads each conversation's
+`pinned_message_ids` array (kept in sync by `set_message_pinned`) instead of
+unwinding every message the user has. Messages pinned before that array
+existed only carry the per-message `pinned: true` flag; this script adds their
+ids to the array. Run it before turning the flag on.
+
+Ids are added with `$addToSet`, never `$set` wholesale, so a pin or unpin
+landing while the script runs is not overwritten, and re-running it is safe.
+
+Run from repo root:
+    cd apps/api && uv run python scripts/backfill_pinned_message_ids.py
+"""
+
+import asyncio
+from pathlib import Path
+import sys
+
+# Ensure app is on path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.db.mongodb.collections import get_async_collection
+
+conversations_collection = get_async_collection("conversations")
+
+
+async def backfill() -> None:
+    """Add every flagged message's id to its conversation's `pinned_message_ids`."""
+    query = {"messages.pinned": True}
+    total = await conversations_collection.count_documents(query)
+    if total == 0:
+        print("No pinned messages found. Nothing to backfill.")
+        return
+
+    print(f"Materializing pinned message ids on {total} conversation(s)...")
+
+    updated = 0
+    async for conversation in conversations_collection.find(
+        query, {"_id": 1, "messages.message_id": 1, "messages.pinned": 1}
+    ):
+        pinned_ids = [
+            message["message_id"]
+            for message in conversation.get("messages", [])
+            if message.get("pinned") is True and message.get("message_id")
+        ]
+        result = await conversations_collection.update_one(
+            {"_id": conversation["_id"]},
+            {"$addToSet": {"pinned_message_ids": {"$each": pinned_ids}}},
+        )
+        updated += result.modified_count
+
+    print(f"\nBackfill complete. Updated: {updated}, Unchanged: {total - updated}")
+
+
+if __name__ == "__main__":
+    asyncio.run(backfill())
@@ -0,0 +1 @@
+"""Search latency benchmark for ``ChromaStore`` as the collection grows."""
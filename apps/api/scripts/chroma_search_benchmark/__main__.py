@@ -0,0 +1,226 @@
+"""Search latency benchmark for ``ChromaStore`` as the collection grows.
+
+The searched namespace stays at ``--namespace-size`` items while the rest of
+the collection grows (per-user MCP namespaces of ``--mcp-size`` tools each)
+through ``--sizes``. At each size:
+
+- legacy  the old ``_filter_items`` scan: fetch every row's metadata and
+          document, keep the searched namespace in Python.
+- query   ``asearch`` with a query (vector search, namespace in ``where``).
+- list    ``asearch`` without a query (paginated ``get`` by ``where``).
+- filter  ``asearch`` with a string equality filter pushed into ``where``.
+
+``legacy`` moves and unpickles the whole collection, so it grows with every
+row. The pushed-down paths move only the searched namespace; what growth is
+left is Chroma's own ``where`` evaluation and filtered HNSW walk. Runs
+in-process against an ephemeral Chroma, no server needed::
+
+    uv run python -m scripts.chroma_search_benchmark --tag baseline
+    uv run python -m scripts.chroma_search_benchmark --tag quick --sizes 1000,10000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from functools import partial
+import hashlib
+import json
+from pathlib import Path
+import pickle  # nosec B403 - benchmark writes the store's own document format
+import statistics
+import time
+from typing import TYPE_CHECKING, Any, cast
+import uuid
+
+import chromadb
+from chromadb.api import AsyncClientAPI
+from chromadb.api.models.AsyncCollection import AsyncCollection
+from chromadb.api.models.Collection import Collection
+from langchain_core.embeddings import Embeddings
+import numpy as np
+
+if TYPE_CHECKING:
+    from app.db.chroma.chroma_store import ChromaStore
+
+RESULTS_DIR = Path(__file__).parent / "results"
+DIMS = 64
+UPSERT_BATCH = 5_000
+SEARCHED_NAMESPACE = ("general",)
+
+
+class _HashEmbeddings(Embeddings):
+    """Deterministic pseudo-random vectors; no model download."""
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [self.embed_query(text) for text in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:8], "big")
+        vector: list[float] = np.random.default_rng(seed).standard_normal(DIMS).tolist()
+        return vector
+
+
+class _AsyncCollection:
+    """The async collection surface ``ChromaStore`` uses, over a sync collection."""
+
+    def __init__(self, sync: Collection) -> None:
+        self._sync = sync
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[object]]:
+        method = getattr(self._sync, name)
+
+        async def call(*args: object, **kwargs: object) -> object:
+            return method(*args, **kwargs)
+
+        return call
+
+
+class _AsyncClient:
+    def __init__(self) -> None:
+        self._sync = chromadb.EphemeralClient()
+
+    async def get_or_create_collection(self, name: str, **_: object) -> _AsyncCollection:
+        from app.db.chroma.noop_embedding import NoOpEmbeddingFunction
+
+        return _AsyncCollection(
+            self._sync.get_or_create_collection(
+                name,
+                metadata={"hnsw:space": "cosine"},
+                embedding_function=NoOpEmbeddingFunction(),
+            )
+        )
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[max(int(len(ordered) * 0.99) - 1, 0)] * 1000, 3),
+    }
+
+
+async def _sample(call: Callable[[], Awaitable[Any]], repeats: int) -> dict[str, float]:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - started)
+    return _percentiles(samples)
+
+
+async def _legacy_scan(collection: AsyncCollection, store: ChromaStore) -> list[str]:
+    result = await collection.get(include=["metadatas", "documents"])
+    return [
+        doc_id
+        for doc_id in result["ids"]
+        if store._matches_namespace_prefix(
+            store._id_to_namespace_key(doc_id)[0], SEARCHED_NAMESPACE
+        )
+    ]
+
+
+async def _fill(
+    store: ChromaStore,
+    collection: AsyncCollection,
+    embeddings: _HashEmbeddings,
+    rows: list[tuple[tuple[str, ...], str, dict[str, Any]]],
+) -> None:
+    for start in range(0, len(rows), UPSERT_BATCH):
+        batch = rows[start : start + UPSERT_BATCH]
+        await collection.upsert(
+            ids=[store._namespace_to_id(ns, key) for ns, key, _ in batch],
+            embeddings=np.array(
+                [embeddings.embed_query(value["description"]) for _, _, value in batch],
+                dtype=np.float32,
+            ),
+            metadatas=[
+                {"namespace": "::".join(ns), **store._filter_metadata(ns, value)}
+                for ns, _, value in batch
+            ],
+            documents=[pickle.dumps(value).decode("latin1") for _, _, value in batch],
+        )
+
+
+def _tool(namespace: tuple[str, ...], index: int) -> tuple[tuple[str, ...], str, dict[str, Any]]:
+    key = f"tool_{index}"
+    return (
+        namespace,
+        key,
+        {
+            "description": f"{namespace[0]} {key} does something useful",
+            "tool_hash": f"hash_{namespace[0]}_{index}",
+        },
+    )
+
+
+async def run_suite(
+    tag: str, sizes: list[int], namespace_size: int, mcp_size: int, repeats: int
+) -> dict[str, Any]:
+    from app.db.chroma.chroma_store import ChromaStore
+
+    embeddings = _HashEmbeddings()
+    store = ChromaStore(
+        cast(AsyncClientAPI, _AsyncClient()),
+        f"bench-{uuid.uuid4().hex[:8]}",
+        index={"embed": embeddings, "dims": DIMS, "fields": ["description"]},
+    )
+    collection = await store._get_collection()
+    # Every row is written with filter metadata, so searches narrow by ``where``.
+    await store.abackfill_filter_metadata()
+    await _fill(
+        store,
+        collection,
+        embeddings,
+        [_tool(SEARCHED_NAMESPACE, i) for i in range(namespace_size)],
+    )
+
+    total, mcp_users = namespace_size, 0
+    results: dict[str, Any] = {}
+    for size in sorted(sizes):
+        rows: list[tuple[tuple[str, ...], str, dict[str, Any]]] = []
+        while total + len(rows) < size:
+            namespace = (f"mcp_user_{mcp_users}",)
+            rows.extend(_tool(namespace, i) for i in range(mcp_size))
+            mcp_users += 1
+        await _fill(store, collection, embeddings, rows)
+        total += len(rows)
+
+        wanted = f"hash_general_{namespace_size // 2}"
+        row = {
+            "items": total,
+            "legacy": await _sample(lambda: _legacy_scan(collection, store), repeats),
+            "query": await _sample(
+                lambda: store.asearch(SEARCHED_NAMESPACE, query="send an email", limit=10),
+                repeats,
+            ),
+            "list": await _sample(lambda: store.asearch(SEARCHED_NAMESPACE, limit=10), repeats),
+            "filter": await _sample(
+                partial(store.asearch, SEARCHED_NAMESPACE, filter={"tool_hash": wanted}),
+                repeats,
+            ),
+        }
+        results[str(size)] = row
+        print(f"  {total:>8} items  {json.dumps(row)}", flush=True)
+
+    out = RESULTS_DIR / tag
+    out.mkdir(parents=True, exist_ok=True)
+    (out / "chroma_search.json").write_text(json.dumps(results, indent=2))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tag", required=True, help="run label, e.g. baseline or fixed")
+    parser.add_argument("--sizes", default="1000,10000,50000,200000")
+    parser.add_argument("--namespace-size", type=int, default=100, help="items searched")
+    parser.add_argument("--mcp-size", type=int, default=50, help="tools per MCP namespace")
+    parser.add_argument("--repeats", type=int, default=50, help="samples per measurement")
+    args = parser.parse_args()
+    sizes = [int(size) for size in args.sizes.split(",")]
+    asyncio.run(run_suite(args.tag, sizes, args.namespace_size, args.mcp_size, args.repeats))
+
+
+if __name__ == "__main__":
+    main()
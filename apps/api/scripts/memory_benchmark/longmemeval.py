@@ -11,6 +11,12 @@ Hindsight 94.6%, mem0 ~68%.
 Notes vs the official setup: oracle variant (evidence sessions only), a
 stratified subset, and the judge runs on the free LLM chain rather than
 GPT-4o — directional, not a leaderboard submission.
+
+Accuracy is reported next to the recall path's cross-encoder work (pairs
+scored, served from the score cache, or skipped by the cascade), so a
+``--rerank-cascade-budget`` run shows what the saved rerank calls cost::
+
+    uv run python -m scripts.memory_benchmark.longmemeval --dataset ... --rerank-cascade-budget 12
 """
 
 import argparse
@@ -36,6 +42,7 @@ from app.db.postgresql import init_postgresql_engine
 from app.memory.engine import memory_engine
 from app.memory.extraction import _invoke_structured
 from app.memory.mappers import entry_to_note
+from app.memory.rerank_cache import MEMORY_RERANK_PAIRS_TOTAL
 
 _DATE_FORMAT = "%Y/%m/%d %H:%M"
 
@@ -284,6 +291,23 @@ async def _print_diagnosis(item_user: str, item: dict, notes: list[str]) -> None
     print(f"    total stored: {stored.total_count} | notes: {len(notes)}", flush=True)
 
 
+def print_rerank_work() -> None:
+    """Cross-encoder pairs the recalls needed, and how many they avoided."""
+    pairs = {
+        outcome: MEMORY_RERANK_PAIRS_TOTAL.labels(outcome=outcome)._value.get()
+        for outcome in ("scored", "cached", "skipped")
+    }
+    total = sum(pairs.values())
+    if not total:
+        return
+    saved = pairs["cached"] + pairs["skipped"]
+    print(
+        f"\n  Rerank pairs: {total:,.0f} — {pairs['scored']:,.0f} scored, "
+        f"{pairs['cached']:,.0f} cached, {pairs['skipped']:,.0f} skipped by cascade "
+        f"({100 * saved / total:.1f}% saved)"
+    )
+
+
 async def main() -> None:
     parser = argparse.ArgumentParser(description="Run LongMemEval against the memory engine.")
     parser.add_argument("--dataset", required=True, help="Path to longmemeval_*.json")
@@ -314,6 +338,11 @@ async def main() -> None:
             "is below this (0 disables). Saves a full run on a config that won't hit target."
         ),
     )
+    parser.add_argument(
+        "--rerank-cascade-budget",
+        type=int,
+        help="Cross-encoder pairs per recall in cascade mode (0 = rerank everything).",
+    )
     parser.add_argument(
         "--warmup",
         type=int,
@@ -326,6 +355,11 @@ async def main() -> None:
     init_chroma()
     register_llm_providers()
 
+    if args.rerank_cascade_budget is not None:
+        import app.memory.retrieval as retrieval_mod
+
+        retrieval_mod.RERANK_CASCADE_BUDGET = max(0, args.rerank_cascade_budget)  # type: ignore[attr-defined]
+
     # Hard budget guard: attach a cost meter to the memory module's silent
     # config so every extraction/reconcile/answer/judge call counts. The run
     # loop stops the moment projected spend reaches --max-usd.
@@ -418,6 +452,7 @@ async def main() -> None:
             f"  {qtype:28} {sum(results)}/{len(results)} = {100 * sum(results) / len(results):.0f}%"
         )
     print(f"  {'OVERALL':28} {total_correct}/{total} = {100 * total_correct / total:.1f}%")
+    print_rerank_work()
     print(
         f"\n  Spend: ~${meter.cost_usd:.2f} "
         f"({meter.input_tokens:,} in / {meter.output_tokens:,} out tokens, "
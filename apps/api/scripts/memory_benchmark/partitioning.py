@@ -0,0 +1,214 @@
+"""Recall and latency benchmark for the memory vector partitioning layouts.
+
+Loads the same synthetic population into each ``MEMORY_VECTOR_PARTITIONING``
+layout and runs ``query_similar`` for a sample of users:
+
+- global    one collection, every query filtered by ``user_id``.
+- bucketed  ``--buckets`` collections, user -> bucket by stable hash.
+- user      one collection per user.
+
+Per-user memory counts are skewed (log-normal, a few heavy users and a long
+tail of light ones) and each user's vectors cluster around their own
+centroid, so filtered ANN search has to work for its neighbours. Recall@k is
+measured against a brute-force cosine search over the user's own vectors.
+
+Runs against an in-process ephemeral Chroma by default; ``--host`` points it
+at a Chroma server::
+
+    uv run python -m scripts.memory_benchmark.partitioning --users 1000,10000,100000
+    uv run python -m scripts.memory_benchmark.partitioning --users 1000 --host localhost
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+import time
+from typing import Any, cast
+from unittest.mock import AsyncMock, patch
+
+import chromadb
+from chromadb.api import AsyncClientAPI, ClientAPI
+from chromadb.api.models.Collection import Collection
+import numpy as np
+
+from scripts.memory_benchmark.reconcile_query import _AsyncCollection
+
+UPSERT_BATCH = 2_000
+
+
+class _AsyncClient:
+    """The async client surface ``chroma_store`` uses, over a sync client."""
+
+    def __init__(self, sync: ClientAPI) -> None:
+        self._sync = sync
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[object]]:
+        method = getattr(self._sync, name)
+
+        async def call(*args: object, **kwargs: object) -> object:
+            result = method(*args, **kwargs)
+            return _AsyncCollection(result) if isinstance(result, Collection) else result
+
+        return call
+
+
+async def _client(host: str | None, port: int) -> AsyncClientAPI:
+    if host:
+        return await chromadb.AsyncHttpClient(host=host, port=port)
+    return cast(AsyncClientAPI, _AsyncClient(chromadb.EphemeralClient()))
+
+
+async def _drop_memory_collections(client: AsyncClientAPI) -> None:
+    from app.memory import chroma_store
+
+    for collection in await client.list_collections():
+        if chroma_store.partition_of(collection.name):
+            await client.delete_collection(collection.name)
+
+
+def _population(
+    users: int, mean_memories: int, dims: int, rng: np.random.Generator
+) -> tuple[list[np.ndarray], np.ndarray]:
+    """Per-user unit vectors plus each user's centroid."""
+    counts = np.clip(rng.lognormal(np.log(mean_memories) - 0.5, 1.0, users), 1, 50 * mean_memories)
+    centroids = rng.standard_normal((users, dims)).astype(np.float32)
+    vectors = []
+    for user, count in enumerate(counts.astype(int)):
+        points = centroids[user] + 0.6 * rng.standard_normal((count, dims)).astype(np.float32)
+        vectors.append(points / np.linalg.norm(points, axis=1, keepdims=True))
+    return vectors, centroids
+
+
+async def _load(vectors: list[np.ndarray]) -> float:
+    from app.memory import chroma_store
+
+    started = time.perf_counter()
+    batch: list[chroma_store.MemoryVectorItem] = []
+    for user, points in enumerate(vectors):
+        for i, point in enumerate(points):
+            batch.append(
+                {
+                    "id": f"u{user}:{i}",
+                    "embedding": point.tolist(),
+                    "document": "",
+                    "metadata": {
+                        "user_id": f"u{user}",
+                        "kind": "fact",
+                        "category_path": "general",
+                        "is_latest": True,
+                        "is_forgotten": False,
+                    },
+                }
+            )
+            if len(batch) >= UPSERT_BATCH:
+                await chroma_store.upsert_memories(batch)
+                batch = []
+    await chroma_store.upsert_memories(batch)
+    return time.perf_counter() - started
+
+
+async def _measure(
+    vectors: list[np.ndarray],
+    centroids: np.ndarray,
+    sample: np.ndarray,
+    k: int,
+    rng: np.random.Generator,
+) -> dict[str, float]:
+    from app.memory import chroma_store
+
+    recalls = []
+    samples = []
+    for user in sample:
+        points = vectors[user]
+        query = centroids[user] + 0.6 * rng.standard_normal(centroids.shape[1])
+        query /= np.linalg.norm(query)
+        expected = {f"u{user}:{i}" for i in np.argsort(-(points @ query))[:k]}
+
+        started = time.perf_counter()
+        similar = await chroma_store.query_similar(f"u{user}", query.tolist(), k)
+        samples.append(time.perf_counter() - started)
+        recalls.append(len(expected & {memory_id for memory_id, _ in similar}) / len(expected))
+    ordered = sorted(samples)
+    return {
+        f"recall@{k}": round(float(np.mean(recalls)), 4),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 3),
+        "p95_ms": round(ordered[max(int(len(ordered) * 0.95) - 1, 0)] * 1000, 3),
+    }
+
+
+async def run_suite(
+    user_counts: list[int],
+    layouts: list[str],
+    mean_memories: int,
+    dims: int,
+    buckets: int,
+    queries: int,
+    k: int,
+    host: str | None,
+    port: int,
+) -> dict[str, Any]:
+    from app.db.chroma.chromadb import ChromaClient
+    from app.memory import chroma_store
+
+    client = await _client(host, port)
+    results: dict[str, Any] = {"dims": dims, "mean_memories": mean_memories, "buckets": buckets}
+    for users in user_counts:
+        rng = np.random.default_rng(users)
+        vectors, centroids = _population(users, mean_memories, dims, rng)
+        sizes = np.array([len(points) for points in vectors])
+        # Sample users by activity: heavy users are queried more often.
+        sample = rng.choice(users, size=queries, p=sizes / sizes.sum())
+        row: dict[str, Any] = {"vectors": int(sizes.sum())}
+        for layout in layouts:
+            await _drop_memory_collections(client)
+            with (
+                patch.object(ChromaClient, "get_client", AsyncMock(return_value=client)),
+                patch.object(chroma_store, "MEMORY_VECTOR_PARTITIONING", layout),
+                patch.object(chroma_store, "MEMORY_VECTOR_BUCKETS", buckets),
+                patch.object(chroma_store, "_loop_collections", {}),
+                patch.object(chroma_store, "_loop_locks", {}),
+            ):
+                load_s = await _load(vectors)
+                row[layout] = {
+                    "load_s": round(load_s, 2),
+                    **await _measure(vectors, centroids, sample, k, rng),
+                }
+            print(json.dumps({"users": users, layout: row[layout]}), flush=True)
+        results[str(users)] = row
+    await _drop_memory_collections(client)
+    print(json.dumps(results, indent=2), flush=True)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--users", default="1000,10000,100000", help="comma-separated user counts")
+    parser.add_argument("--layouts", default="global,bucketed,user")
+    parser.add_argument("--mean-memories", type=int, default=20, help="mean memories per user")
+    parser.add_argument("--dims", type=int, default=64, help="vector dimensions")
+    parser.add_argument("--buckets", type=int, default=64)
+    parser.add_argument("--queries", type=int, default=300, help="queries per layout")
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument("--host", help="Chroma server host (default: in-process)")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    asyncio.run(
+        run_suite(
+            [int(users) for users in args.users.split(",")],
+            args.layouts.split(","),
+            args.mean_memories,
+            args.dims,
+            args.buckets,
+            args.queries,
+            args.k,
+            args.host,
+            args.port,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
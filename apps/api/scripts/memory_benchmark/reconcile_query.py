@@ -0,0 +1,145 @@
+"""Timing benchmark for reconciliation's neighbour lookup.
+
+``reconcile`` needs the nearest existing memories for every extracted fact.
+Compares, for ``--facts`` fact vectors against a user with ``--memories``
+stored memories (among ``--other-users`` users of the same size):
+
+- per_fact  one ``query_similar`` per fact under ``asyncio.gather`` — a
+            ``count`` plus a ``query`` each, the old reconcile path.
+- batched   one ``query_similar_many``: one ``count`` and one multi-vector
+            ``query``.
+
+Runs against an in-process ephemeral Chroma by default; ``--host`` points it
+at a Chroma server so the round trips are real::
+
+    uv run python -m scripts.memory_benchmark.reconcile_query
+    uv run python -m scripts.memory_benchmark.reconcile_query --host localhost --port 8000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+import statistics
+import time
+from typing import Any
+from unittest.mock import AsyncMock, patch
+import uuid
+
+import chromadb
+from chromadb.api.models.Collection import Collection
+import numpy as np
+
+UPSERT_BATCH = 2_000
+
+
+class _AsyncCollection:
+    """The async collection surface ``chroma_store`` uses, over a sync collection."""
+
+    def __init__(self, sync: Collection) -> None:
+        self._sync = sync
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[object]]:
+        method = getattr(self._sync, name)
+
+        async def call(*args: object, **kwargs: object) -> object:
+            return method(*args, **kwargs)
+
+        return call
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[max(int(len(ordered) * 0.99) - 1, 0)] * 1000, 3),
+    }
+
+
+async def _sample(call: Callable[[], Awaitable[object]], repeats: int) -> dict[str, float]:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        await call()
+        samples.append(time.perf_counter() - started)
+    return _percentiles(samples)
+
+
+async def _collection(host: str | None, port: int) -> object:
+    name = f"reconcile-bench-{uuid.uuid4().hex[:8]}"
+    if host:
+        client = await chromadb.AsyncHttpClient(host=host, port=port)
+        return await client.create_collection(name, metadata={"hnsw:space": "cosine"})
+    sync = chromadb.EphemeralClient().create_collection(name, metadata={"hnsw:space": "cosine"})
+    return _AsyncCollection(sync)
+
+
+async def run_suite(
+    facts: int, memories: int, other_users: int, repeats: int, host: str | None, port: int
+) -> dict[str, Any]:
+    from app.constants.memory import EMBEDDING_DIM, RECONCILE_CANDIDATES
+    from app.memory import chroma_store
+
+    rng = np.random.default_rng(7)
+    collection = await _collection(host, port)
+    with patch.object(chroma_store, "_get_collection", AsyncMock(return_value=collection)):
+        items: list[chroma_store.MemoryVectorItem] = [
+            {
+                "id": f"user-{user}:{i}",
+                "embedding": rng.standard_normal(EMBEDDING_DIM).tolist(),
+                "document": f"memory {i}",
+                "metadata": {
+                    "user_id": f"user-{user}",
+                    "kind": "fact",
+                    "category_path": "general",
+                    "is_latest": True,
+                    "is_forgotten": False,
+                },
+            }
+            for user in range(other_users + 1)
+            for i in range(memories)
+        ]
+        for start in range(0, len(items), UPSERT_BATCH):
+            await chroma_store.upsert_memories(items[start : start + UPSERT_BATCH])
+
+        queries = [rng.standard_normal(EMBEDDING_DIM).tolist() for _ in range(facts)]
+
+        async def per_fact() -> object:
+            return await asyncio.gather(
+                *(
+                    chroma_store.query_similar("user-0", query, RECONCILE_CANDIDATES)
+                    for query in queries
+                )
+            )
+
+        async def batched() -> object:
+            return await chroma_store.query_similar_many("user-0", queries, RECONCILE_CANDIDATES)
+
+        results: dict[str, Any] = {
+            "facts": facts,
+            "rows": len(items),
+            "per_fact": {"round_trips": 2 * facts, **await _sample(per_fact, repeats)},
+            "batched": {"round_trips": 2, **await _sample(batched, repeats)},
+        }
+    print(json.dumps(results, indent=2), flush=True)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--facts", type=int, default=20, help="facts per extraction")
+    parser.add_argument("--memories", type=int, default=500, help="stored memories per user")
+    parser.add_argument("--other-users", type=int, default=9, help="other users in the collection")
+    parser.add_argument("--repeats", type=int, default=30, help="samples per path")
+    parser.add_argument("--host", help="Chroma server host (default: in-process)")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    asyncio.run(
+        run_suite(args.facts, args.memories, args.other_users, args.repeats, args.host, args.port)
+    )
+
+
+if __name__ == "__main__":
+    main()
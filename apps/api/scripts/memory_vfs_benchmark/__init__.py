@@ -0,0 +1 @@
+"""Filesystem-operation benchmark for the /workspace/memory projection sync."""
@@ -0,0 +1,244 @@
+"""Filesystem-operation benchmark for the memory projection (``memory_fs``).
+
+On JuiceFS every stat, open, readdir and unlink the projection issues is a
+FUSE round trip, so the cost of a sync is its operation count. This
+projects a synthetic user (``--memories`` live facts over ``--categories``
+folders, the five core documents and a full journal window) into a temp
+directory standing in for the mount, then counts the filesystem calls each
+kind of sync makes:
+
+- full_rewrite    one fact added, whole-tree sync (what every write did
+                  before: hash gate misses, every page is read back, the
+                  tree is walked for strays).
+- full_noop       whole-tree sync with nothing changed (hash gate hit).
+- add_fact        incremental: one fact added to one folder, plus today's
+                  journal line — what a typical ingestion touches.
+- forget_fact     incremental: one fact forgotten by id.
+- edit_document   incremental: one core document rewritten.
+
+Each row reports ``fs_ops`` (by kind and total), ``pages_written``,
+``rows_fetched`` from the stand-in Postgres, and wall time. Only calls on
+paths under the temp root are counted.
+
+Run from ``apps/api``::
+
+    uv run python -m scripts.memory_vfs_benchmark --tag local
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from datetime import UTC, date, datetime, timedelta
+import io
+import json
+import os
+from pathlib import Path
+import random
+import tempfile
+import time
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+import uuid
+
+RESULTS_DIR = Path(__file__).parent / "results"
+USER = "bench-user"
+# Every os-level call pathlib and the projection helpers reach for.
+COUNTED_OS_CALLS = (
+    "stat",
+    "lstat",
+    "scandir",
+    "listdir",
+    "mkdir",
+    "rmdir",
+    "unlink",
+    "chmod",
+    "rename",
+    "replace",
+)
+
+
+class _Store:
+    """The slice of ``pg_store`` the projection reads; counts rows handed back."""
+
+    def __init__(self, memories: int, categories: int, seed: int) -> None:
+        rng = random.Random(seed)
+        folders = [
+            f"area-{i % 12}/topic-{i}" if i % 3 else f"area-{i % 12}" for i in range(categories)
+        ]
+        self.memories = [
+            SimpleNamespace(
+                id=str(uuid.UUID(int=rng.getrandbits(128))),
+                content=f"fact {n}: " + "lorem ipsum " * rng.randint(2, 12),
+                category_path=rng.choice(folders),
+                importance=round(rng.random(), 1),
+                live=True,
+            )
+            for n in range(memories)
+        ]
+        self.documents = {
+            doc_type: f"# {doc_type}\n\n" + "a line of prose\n" * 40
+            for doc_type in ("user_md", "memory_md", "agenda_md", "people_md", "insights_md")
+        }
+        today = datetime.now(UTC).date()
+        self.episodes = {
+            today - timedelta(days=offset): [
+                {"time": f"{h:02d}:00", "text": f"did thing {h}"} for h in range(8)
+            ]
+            for offset in range(30)
+        }
+        self.rows = 0
+
+    def _count(self, rows: list[Any]) -> list[Any]:
+        self.rows += len(rows)
+        return rows
+
+    async def get_documents(self, _user_id: str) -> list[Any]:
+        return self._count(
+            [SimpleNamespace(doc_type=t, content=c) for t, c in self.documents.items()]
+        )
+
+    async def get_episodes_range(self, _user_id: str, start: date, end: date) -> list[Any]:
+        return self._count(
+            [
+                SimpleNamespace(date=day, entries=entries, summary=None)
+                for day, entries in sorted(self.episodes.items())
+                if start <= day <= end
+            ]
+        )
+
+    def _live(self) -> list[Any]:
+        return sorted((m for m in self.memories if m.live), key=lambda m: m.category_path)
+
+    async def get_all_live_memories(self, _user_id: str) -> list[Any]:
+        return self._count(self._live())
+
+    async def get_live_memories_in_categories(
+        self, _user_id: str, category_paths: list[str]
+    ) -> list[Any]:
+        wanted = set(category_paths)
+        return self._count([m for m in self._live() if m.category_path in wanted])
+
+    async def get_memories_by_ids(self, _user_id: str, memory_ids: list[str]) -> list[Any]:
+        wanted = set(memory_ids)
+        return self._count([m for m in self.memories if m.id in wanted])
+
+
+@contextmanager
+def _count_fs_ops(root: Path) -> Iterator[Counter[str]]:
+    """Count os-level calls (and opens) on paths under ``root``."""
+    prefix = str(root)
+    ops: Counter[str] = Counter()
+
+    def _wrap(name: str, fn: Callable[..., object]) -> Callable[..., object]:
+        def counted(path: object, *args: object, **kwargs: object) -> object:
+            if str(path).startswith(prefix):
+                ops[name] += 1
+            return fn(path, *args, **kwargs)
+
+        return counted
+
+    patches = [patch.object(os, name, _wrap(name, getattr(os, name))) for name in COUNTED_OS_CALLS]
+    patches.append(patch.object(io, "open", _wrap("open", io.open)))
+    for p in patches:
+        p.start()
+    try:
+        yield ops
+    finally:
+        for p in reversed(patches):
+            p.stop()
+
+
+async def run_suite(tag: str, *, memories: int, categories: int, seed: int) -> dict[str, Any]:
+    from loguru import logger
+
+    from app.constants.memory import MemoryDocType
+    from app.services import _vfs_scheduler, memory_fs
+    from app.services.memory_fs import MemoryVfsChange, sync_user_memory_fs
+
+    logger.remove()
+    store = _Store(memories, categories, seed)
+    results: dict[str, Any] = {"memories": memories, "categories": categories, "syncs": {}}
+
+    with (
+        tempfile.TemporaryDirectory(prefix="memory-vfs-bench-") as tmp,
+        patch.object(memory_fs, "pg_store", store),
+        patch.object(_vfs_scheduler, "_is_mounted", lambda: True),
+        patch.object(_vfs_scheduler, "user_workspace_path", lambda _user_id: Path(tmp)),
+    ):
+        root = Path(tmp)
+        await sync_user_memory_fs(USER)  # initial materialization, not measured
+        results["pages"] = sum(1 for path in (root / "memory").rglob("*.md"))
+
+        async def _measure(
+            name: str, change: MemoryVfsChange | None, *, full: bool = False
+        ) -> None:
+            store.rows = 0
+            with _count_fs_ops(root) as ops:
+                started = time.perf_counter()
+                if full:
+                    written = await memory_fs._sync_all(USER)
+                else:
+                    written = await sync_user_memory_fs(USER, change)
+                wall = time.perf_counter() - started
+            results["syncs"][name] = {
+                "fs_ops": sum(ops.values()),
+                "by_kind": dict(sorted(ops.items())),
+                "pages_written": written,
+                "rows_fetched": store.rows,
+                "wall_ms": round(wall * 1000, 2),
+            }
+            print(f"  {name:<14} {results['syncs'][name]}", flush=True)
+
+        today = datetime.now(UTC).date()
+        target = store.memories[0]
+
+        def _add_fact() -> None:
+            store.memories.append(
+                SimpleNamespace(
+                    id=str(uuid.uuid4()),
+                    content="a brand new fact",
+                    category_path=target.category_path,
+                    importance=0.5,
+                    live=True,
+                )
+            )
+            store.episodes[today].append({"time": "23:59", "text": "one more thing"})
+
+        _add_fact()
+        await _measure("full_rewrite", None, full=True)
+        await _measure("full_noop", None, full=True)
+
+        _add_fact()
+        await _measure("add_fact", MemoryVfsChange(categories={target.category_path}, days={today}))
+
+        target.live = False
+        await _measure("forget_fact", MemoryVfsChange(memory_ids={target.id}))
+
+        store.documents["agenda_md"] += "a new open loop\n"
+        await _measure("edit_document", MemoryVfsChange(documents={MemoryDocType.AGENDA_MD}))
+
+    out = RESULTS_DIR / tag
+    out.mkdir(parents=True, exist_ok=True)
+    (out / "memory_vfs.json").write_text(json.dumps(results, indent=2))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tag", required=True, help="run label, e.g. baseline or fixed")
+    parser.add_argument("--memories", type=int, default=5_000)
+    parser.add_argument("--categories", type=int, default=120)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    asyncio.run(
+        run_suite(args.tag, memories=args.memories, categories=args.categories, seed=args.seed)
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Copy the tools and triggers Chroma stores into another embedding backend.
+
+Each ``TOOLS_EMBEDDING_BACKEND`` keeps its own collections (vector dimensions
+are fixed per collection, see ``app/db/chroma/tool_embeddings.py``). Run this
+before switching a deployment's backend so the first discovery after the
+switch finds a full catalog instead of re-indexing every namespace — including
+per-user MCP namespaces, which are only indexed when their integration
+connects and would otherwise stay empty until it reconnects.
+
+Every row of the source collections is re-embedded with the target backend
+and upserted under the same namespace and key. Rows already present in the
+target with an identical value are skipped, so re-running after a partial
+run only does the remaining work.
+
+    uv run python -m scripts.migrate_tool_embeddings --to local
+    uv run python -m scripts.migrate_tool_embeddings --from local --to google --dry-run
+"""
+
+import argparse
+import asyncio
+from pathlib import Path
+import pickle  # nosec B403 - the store's own document format
+import sys
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langgraph.store.base import PutOp
+
+from app.agents.tools.core.store import init_embeddings
+from app.constants.chroma import (
+    TOOLS_COLLECTION,
+    TOOLS_EMBEDDING_BACKENDS,
+    TRIGGERS_COLLECTION,
+)
+from app.db.chroma.chromadb import ChromaClient, init_chroma
+from app.db.chroma.tool_embeddings import create_tool_store, tool_collection_name
+
+_PAGE = 500
+_BATCH = 64
+
+# Base collection -> the value fields its store embeds.
+_COLLECTIONS = {
+    TOOLS_COLLECTION: ["description"],
+    TRIGGERS_COLLECTION: ["rich_description"],
+}
+
+
+async def _migrate_collection(
+    base: str, fields: list[str], source_backend: str, target_backend: str, dry_run: bool
+) -> tuple[int, int]:
+    """Returns (rows copied, rows already up to date)."""
+    client = await ChromaClient.get_client()
+    source_name = tool_collection_name(base, source_backend)
+    existing = {collection.name for collection in await client.list_collections()}
+    if source_name not in existing:
+        print(f"{source_name}: not found, skipping")
+        return 0, 0
+
+    source = await client.get_collection(source_name)
+    target_store = await create_tool_store(client, base, fields, target_backend)
+    target = await target_store._get_collection()
+
+    copied = unchanged = 0
+    offset = 0
+    while True:
+        page = await source.get(include=["documents"], limit=_PAGE, offset=offset)
+        ids, documents = page["ids"], page["documents"] or []
+        if not ids:
+            break
+        offset += len(ids)
+
+        current = await target.get(ids=ids, include=["documents"])
+        current_documents = dict(zip(current["ids"], current["documents"] or [], strict=True))
+        pending = [
+            (doc_id, document)
+            for doc_id, document in zip(ids, documents, strict=True)
+            if document and current_documents.get(doc_id) != document
+        ]
+        unchanged += len(ids) - len(pending)
+        if dry_run:
+            copied += len(pending)
+            continue
+
+        for start in range(0, len(pending), _BATCH):
+            ops = []
+            for doc_id, document in pending[start : start + _BATCH]:
+                namespace, key = target_store._id_to_namespace_key(doc_id)
+                value = pickle.loads(document.encode("latin1"))  # nosec B301 - Internal trusted data only
+                ops.append(PutOp(namespace=namespace, key=key, value=value, index=fields))
+            await target_store.abatch(ops)
+            copied += len(ops)
+        print(f"{source_name} -> {target_store.collection_name}: {offset} rows scanned")
+
+    return copied, unchanged
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Copy the tools/triggers stores into another embedding backend."
+    )
+    parser.add_argument("--from", dest="source", default="google", choices=TOOLS_EMBEDDING_BACKENDS)
+    parser.add_argument("--to", dest="target", required=True, choices=TOOLS_EMBEDDING_BACKENDS)
+    parser.add_argument("--dry-run", action="store_true", help="Count rows, write nothing")
+    args = parser.parse_args()
+    if args.source == args.target:
+        parser.error("--from and --to must differ")
+
+    init_embeddings()
+    init_chroma()
+
+    for base, fields in _COLLECTIONS.items():
+        copied, unchanged = await _migrate_collection(
+            base, fields, args.source, args.target, args.dry_run
+        )
+        verb = "would copy" if args.dry_run else "copied"
+        print(f"{base}: {verb} {copied} rows, {unchanged} already up to date")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1 @@
+"""Latency and Redis cost benchmark for ``TieredRateLimiter.check_and_increment``."""
@@ -0,0 +1,192 @@
+"""Latency and Redis cost benchmark for ``TieredRateLimiter.check_and_increment``.
+
+Compares the old per-period GET + WATCH/GET/MULTI/INCR/EXPIRE transaction
+(replayed here as ``legacy``) with the current single-EVAL script (``script``):
+
+- sequential  one user, ``--calls`` calls back to back; p50 / p99 latency.
+- parallel    one user fires ``--parallel`` calls at once (an agent fanning out
+              tool calls) against a day limit of half that; wall time, Redis
+              commands (``INFO stats``), WATCH retries, and the admitted count,
+              which must equal the limit for both.
+
+Needs a real Redis (fakeredis has no INFO counters). Run from ``apps/api``::
+
+    uv run python -m scripts.rate_limit_benchmark --tag baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+from pathlib import Path
+import statistics
+import time
+from typing import Any
+from unittest.mock import patch
+import uuid
+
+import redis.asyncio as redis
+
+RESULTS_DIR = Path(__file__).parent / "results"
+FEATURE = "todo_operations"
+
+
+async def _commands(client: redis.Redis) -> int:
+    info = await client.info("stats")
+    return int(info["total_commands_processed"])
+
+
+class _LegacyLimiter:
+    """The pre-script check-and-increment for a day + month pair, WATCH retries counted."""
+
+    def __init__(self, client: redis.Redis) -> None:
+        self.client = client
+        self.retries = 0
+
+    async def check_and_increment(self, keys: list[str], limits: list[int]) -> bool:
+        for key, limit in zip(keys, limits, strict=True):
+            used = int(await self.client.get(key) or 0)
+            if used >= limit:
+                return False
+        for key, limit in zip(keys, limits, strict=True):
+            async with self.client.pipeline() as pipe:
+                while True:
+                    try:
+                        await pipe.watch(key)
+                        used = int(await self.client.get(key) or 0)
+                        if used >= limit:
+                            await pipe.unwatch()
+                            return False
+                        pipe.multi()
+                        pipe.incr(key)
+                        pipe.expire(key, 86_400)
+                        await pipe.execute()
+                        break
+                    except redis.WatchError:
+                        self.retries += 1
+        return True
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[int(len(ordered) * 0.99) - 1] * 1000, 3),
+    }
+
+
+async def _timed(call: Callable[[], Awaitable[bool]]) -> tuple[float, bool]:
+    started = time.perf_counter()
+    admitted = await call()
+    return time.perf_counter() - started, admitted
+
+
+async def run_suite(tag: str, redis_url: str, calls: int, parallel: int) -> dict[str, Any]:
+    from app.api.v1.middleware.tiered_rate_limiter import (
+        RateLimitExceededException,
+        TieredRateLimiter,
+    )
+    from app.config.rate_limits import RateLimitConfig
+    from app.db.redis import redis_cache
+    from app.models.payment_models import PlanType
+
+    client = redis.from_url(redis_url, decode_responses=True)
+    await client.ping()
+    redis_cache.redis = client
+    limiter = TieredRateLimiter()
+    results: dict[str, Any] = {}
+
+    def _script_call(user_id: str) -> Callable[[], Awaitable[bool]]:
+        async def call() -> bool:
+            try:
+                await limiter._check_and_increment(user_id, FEATURE, PlanType.FREE)
+            except RateLimitExceededException:
+                return False
+            return True
+
+        return call
+
+    def _legacy_call(
+        legacy: _LegacyLimiter, user_id: str, limit: int
+    ) -> Callable[[], Awaitable[bool]]:
+        keys = [f"bench:legacy:{user_id}:day", f"bench:legacy:{user_id}:month"]
+        return lambda: legacy.check_and_increment(keys, [limit, 1_000_000])
+
+    try:
+        # No usage-sync snapshot or activity write — only the limiter's own Redis work.
+        with (
+            patch.object(limiter.usage_snapshots, "schedule"),
+            patch(
+                "app.api.v1.middleware.tiered_rate_limiter.counts_as_activity",
+                return_value=False,
+            ),
+        ):
+            for mode in ("legacy", "script"):
+                user_id = f"bench-{uuid.uuid4().hex}"
+                limits = RateLimitConfig(day=calls * 2, month=1_000_000)
+                with patch(
+                    "app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan",
+                    return_value=limits,
+                ):
+                    legacy = _LegacyLimiter(client)
+                    call = (
+                        _legacy_call(legacy, user_id, limits.day)
+                        if mode == "legacy"
+                        else _script_call(user_id)
+                    )
+                    samples = [(await _timed(call))[0] for _ in range(calls)]
+                results.setdefault("sequential", {})[mode] = _percentiles(samples)
+
+            for mode in ("legacy", "script"):
+                user_id = f"bench-{uuid.uuid4().hex}"
+                limits = RateLimitConfig(day=parallel // 2, month=1_000_000)
+                with patch(
+                    "app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan",
+                    return_value=limits,
+                ):
+                    legacy = _LegacyLimiter(client)
+                    call = (
+                        _legacy_call(legacy, user_id, limits.day)
+                        if mode == "legacy"
+                        else _script_call(user_id)
+                    )
+                    before = await _commands(client)
+                    started = time.perf_counter()
+                    outcomes = await asyncio.gather(*[_timed(call) for _ in range(parallel)])
+                    wall = time.perf_counter() - started
+                    commands = await _commands(client) - before - 1
+                results.setdefault("parallel", {})[mode] = {
+                    "calls": parallel,
+                    "limit": limits.day,
+                    "admitted": sum(admitted for _, admitted in outcomes),
+                    "wall_ms": round(wall * 1000, 1),
+                    "commands": commands,
+                    "watch_retries": legacy.retries,
+                    **_percentiles([latency for latency, _ in outcomes]),
+                }
+    finally:
+        await client.aclose()
+
+    for section, modes in results.items():
+        for mode, row in modes.items():
+            print(f"  {section:<10} {mode:<7} {row}", flush=True)
+    out = RESULTS_DIR / tag
+    out.mkdir(parents=True, exist_ok=True)
+    (out / "rate_limit.json").write_text(json.dumps(results, indent=2))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tag", required=True, help="run label, e.g. baseline or fixed")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--calls", type=int, default=1_000, help="sequential calls")
+    parser.add_argument("--parallel", type=int, default=200, help="concurrent calls")
+    args = parser.parse_args()
+    asyncio.run(run_suite(args.tag, args.redis_url, args.calls, args.parallel))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,8 @@
 """Re-embed every stored memory and episode summary with the current model.
 
 Run after changing EMBEDDING_MODEL_NAME / EMBEDDING_DIM: vector dimensions are
-fixed per Chroma collection, so both memory collections are dropped, recreated,
+fixed per Chroma collection, so the memory collections (every fact partition
+plus episodes) are dropped, recreated,
 and refilled from the canonical Postgres rows (live facts and summarized
 episodes; superseded/forgotten rows are not re-indexed — recall never returns
 them).
@@ -19,10 +20,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from sqlalchemy import select
 
-from app.constants.memory import (
-    CHROMA_MEMORIES_COLLECTION,
-    CHROMA_MEMORY_EPISODES_COLLECTION,
-)
+from app.constants.memory import CHROMA_MEMORY_EPISODES_COLLECTION
 from app.db.chroma.chromadb import ChromaClient, init_chroma
 from app.db.postgresql import init_postgresql_engine
 from app.memory import chroma_store
@@ -36,9 +34,9 @@ _BATCH = 64
 
 async def _drop_collections() -> None:
     client = await ChromaClient.get_client()
-    existing = {collection.name for collection in await client.list_collections()}
-    for name in (CHROMA_MEMORIES_COLLECTION, CHROMA_MEMORY_EPISODES_COLLECTION):
-        if name in existing:
+    for collection in await client.list_collections():
+        name = collection.name
+        if name == CHROMA_MEMORY_EPISODES_COLLECTION or chroma_store.partition_of(name):
             await client.delete_collection(name)
             print(f"dropped collection {name}")
 
@@ -12,6 +12,10 @@ Scenarios:
 - rerank_sweep       latency vs document count for /rerank
 - soak               mixed realistic load; RSS drift over time
 - equivalence        chunked-vs-whole vector identity (quality gate)
+- microbatch_sweep   single-query throughput/latency vs client concurrency,
+                     micro-batching on vs off
+- wire_format        encode/decode time + bytes for a 256-vector batch,
+                     JSON lists vs ``.npy`` frames (no sidecar needed)
 
 Run from ``apps/api``::
 
@@ -22,7 +26,7 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable, Iterator
 from contextlib import asynccontextmanager
 import json
 import os
@@ -35,8 +39,12 @@ import threading
 import time
 
 import httpx
+import numpy as np
 import psutil
 
+from app.constants.memory import EMBEDDING_DIM
+from app.memory.vectors import decode_npy, encode_npy
+
 RESULTS_DIR = Path(__file__).parent / "results"
 API_ROOT = Path(__file__).resolve().parents[2]
 PORT = 8201
@@ -191,10 +199,13 @@ class RssMonitor:
 class Sidecar:
     """A sidecar subprocess under explicit resource knobs."""
 
-    def __init__(self, tag: str, threads: int, concurrency: int) -> None:
+    def __init__(
+        self, tag: str, threads: int, concurrency: int, env: dict[str, str] | None = None
+    ) -> None:
         self.tag = tag
         self.threads = threads
         self.concurrency = concurrency
+        self.env = env or {}
         self.port = _free_port()
         self.proc: asyncio.subprocess.Process | None = None
         self.monitor: RssMonitor | None = None
@@ -206,6 +217,7 @@ class Sidecar:
         env["MEMORY_EMBEDDING_SIDECAR_CONCURRENCY"] = str(self.concurrency)
         env["GAIA_SERVICE_NAME"] = "embedding-sidecar-bench"
         env.setdefault("LOG_FORMAT", "json")
+        env.update(self.env)
         cmd = [
             sys.executable,
             "-m",
@@ -269,8 +281,10 @@ class Sidecar:
 
 
 @asynccontextmanager
-async def running_sidecar(tag: str, threads: int, concurrency: int) -> AsyncIterator[Sidecar]:
-    sidecar = Sidecar(tag, threads, concurrency)
+async def running_sidecar(
+    tag: str, threads: int, concurrency: int, env: dict[str, str] | None = None
+) -> AsyncIterator[Sidecar]:
+    sidecar = Sidecar(tag, threads, concurrency, env)
     try:
         await sidecar.start()
         await sidecar.warmup()
@@ -546,6 +560,109 @@ async def scenario_equivalence() -> dict:
     return result
 
 
+async def _drain_queries(
+    client: httpx.AsyncClient, pending: Iterator[str], latencies: list[float]
+) -> None:
+    """One closed-loop client: next query as soon as the previous one returns."""
+    for text in pending:
+        ms, _ = await timed_post(client, "/embed_query", {"text": text})
+        latencies.append(ms)
+
+
+async def scenario_microbatch_sweep(tag: str) -> dict:
+    """Many concurrent single-query requests — the recall hot path — with the
+    sidecar's micro-batching on and off. Batching shows up as req/s that keeps
+    climbing with concurrency instead of flattening at the inference slots."""
+    grid_conc = (
+        [int(c) for c in os.getenv("BENCH_CONC").split(",")]
+        if os.getenv("BENCH_CONC")
+        else [1, 4, 16, 32, 64]
+    )
+    req_count = 512
+    queries = make_texts(req_count, 80, seed=123)
+    rows: list[dict] = []
+    for batching in ("0", "1"):
+        env = {"MEMORY_EMBEDDING_MICRO_BATCHING": batching}
+        async with running_sidecar(tag, threads=4, concurrency=2, env=env) as sidecar:
+            monitor = sidecar.monitor
+            assert monitor is not None
+            for conc in grid_conc:
+                monitor.reset_peak()
+                latencies: list[float] = []
+                pending = iter(queries)
+                async with httpx.AsyncClient(
+                    timeout=300.0, limits=httpx.Limits(max_connections=conc + 4)
+                ) as client:
+                    wall_start = time.perf_counter()
+                    await asyncio.gather(
+                        *(_drain_queries(client, pending, latencies) for _ in range(conc))
+                    )
+                    wall_s = time.perf_counter() - wall_start
+                row = {
+                    "micro_batching": batching == "1",
+                    "concurrency": conc,
+                    "requests": req_count,
+                    "wall_s": round(wall_s, 2),
+                    "req_per_s": round(req_count / wall_s, 1),
+                    "latency_ms_p50": round(percentile(latencies, 50), 1),
+                    "latency_ms_p95": round(percentile(latencies, 95), 1),
+                    "peak_rss_mb": round(monitor.peak_mb(), 1),
+                }
+                rows.append(row)
+                print(row)
+    return {"rows": rows, "workload": {"requests": req_count, "chars_each": 80}}
+
+
+def _best_ms(fn: Callable[[], object], repeats: int) -> float:
+    """Fastest of ``repeats`` runs, in ms — the least noisy single number."""
+    best = float("inf")
+    for _ in range(repeats):
+        start = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - start) * 1000)
+    return best
+
+
+def scenario_wire_format(batch: int = 256, repeats: int = 20) -> dict:
+    """What one ``/embed`` response costs to serialize, ship and parse: the
+    JSON body the sidecar used to return against the ``.npy`` frame it
+    returns now. Pure CPU + bytes, so it runs without a sidecar or model."""
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((batch, EMBEDDING_DIM)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    json_body = json.dumps({"vectors": vectors.tolist()}).encode()
+    npy_body = encode_npy(vectors)
+    if not np.array_equal(decode_npy(npy_body), vectors):
+        raise AssertionError("npy round trip changed the vectors")
+
+    rows = [
+        {
+            "format": "json",
+            "bytes": len(json_body),
+            "encode_ms": round(
+                _best_ms(lambda: json.dumps({"vectors": vectors.tolist()}).encode(), repeats), 2
+            ),
+            "decode_ms": round(
+                _best_ms(
+                    lambda: np.asarray(json.loads(json_body)["vectors"], dtype=np.float32),
+                    repeats,
+                ),
+                2,
+            ),
+        },
+        {
+            "format": "npy",
+            "bytes": len(npy_body),
+            "encode_ms": round(_best_ms(lambda: encode_npy(vectors), repeats), 2),
+            "decode_ms": round(_best_ms(lambda: decode_npy(npy_body), repeats), 2),
+        },
+    ]
+    for row in rows:
+        print(row)
+    return {"rows": rows, "workload": {"vectors": batch, "dim": EMBEDDING_DIM}}
+
+
 # ---------------------------------------------------------------------------
 # Orchestration
 # ---------------------------------------------------------------------------
@@ -576,18 +693,27 @@ async def run_suite(tag: str, scenarios: set[str]) -> None:
             if "equivalence" in scenarios:
                 save_result(tag, "equivalence", {"meta": meta, **await scenario_equivalence()})
 
+    if "microbatch_sweep" in scenarios:
+        save_result(tag, "microbatch_sweep", {"meta": meta, **await scenario_microbatch_sweep(tag)})
+
     if "concurrency_sweep" in scenarios:
         save_result(
             tag, "concurrency_sweep", {"meta": meta, **await scenario_concurrency_sweep(tag)}
         )
 
+    if "wire_format" in scenarios:
+        save_result(tag, "wire_format", {"meta": meta, **scenario_wire_format()})
+
 
 def main() -> None:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--tag", required=True, help="run label, e.g. baseline or fixed")
     parser.add_argument(
         "--scenarios",
-        default="batch_sweep,rerank_sweep,soak,equivalence,concurrency_sweep",
+        default=(
+            "batch_sweep,rerank_sweep,soak,equivalence,concurrency_sweep,microbatch_sweep,"
+            "wire_format"
+        ),
         help="comma-separated subset to run",
     )
     args = parser.parse_args()
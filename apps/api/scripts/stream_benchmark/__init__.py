@@ -0,0 +1 @@
+"""Redis cost benchmarks for the chat stream manager (progress, publish, cancel)."""
@@ -0,0 +1,251 @@
+"""Redis cost benchmark for ``StreamManager`` hot-path writes.
+
+Measures what one chat turn costs Redis, read straight off the server's own
+``INFO stats`` counters (``total_net_input_bytes`` / ``total_net_output_bytes``
+/ ``total_commands_processed``), so the numbers are wire bytes and commands as
+Redis saw them — not an estimate from argument lengths.
+
+Scenarios:
+- progress   bytes + commands per turn for 2k / 20k / 100k-character replies,
+             streamed as fixed-size text deltas through ``update_progress``.
+             ``legacy`` replays the old GET → concat → SET of the whole blob
+             for comparison; ``append`` is the current append-only store.
+- publish    Redis commands + wall time for a 2,000-chunk turn through
+             ``publish_chunk``. ``legacy`` is the old awaited XADD + EXPIRE
+             per chunk; ``windowed`` is the coalescing publisher at
+             ``--flush-interval`` (chunks arrive ``--chunk-gap-ms`` apart).
+
+Needs a real Redis (fakeredis has no INFO counters). Run from ``apps/api``::
+
+    uv run python -m scripts.stream_benchmark --tag baseline
+    uv run python -m scripts.stream_benchmark --tag local --redis-url redis://localhost:6379/15
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+from dataclasses import asdict, dataclass
+import json
+from pathlib import Path
+import time
+from typing import Any
+import uuid
+
+import redis.asyncio as redis
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+REPLY_SIZES = (2_000, 20_000, 100_000)
+PUBLISH_CHUNKS = 2_000
+
+
+@dataclass
+class RedisCost:
+    """Server-side counter deltas across one measured run."""
+
+    net_input_bytes: int
+    net_output_bytes: int
+    commands: int
+
+    @property
+    def total_bytes(self) -> int:
+        return self.net_input_bytes + self.net_output_bytes
+
+
+async def _stats(client: redis.Redis) -> dict[str, int]:
+    info = await client.info("stats")
+    return {
+        "in": int(info["total_net_input_bytes"]),
+        "out": int(info["total_net_output_bytes"]),
+        "cmds": int(info["total_commands_processed"]),
+    }
+
+
+async def measure(client: redis.Redis, run: Callable[[], Awaitable[None]]) -> RedisCost:
+    """Counter deltas for ``run``, minus the cost of the INFO calls bracketing it."""
+    empty_a = await _stats(client)
+    empty_b = await _stats(client)
+    before = await _stats(client)
+    await run()
+    after = await _stats(client)
+    return RedisCost(
+        net_input_bytes=(after["in"] - before["in"]) - (empty_b["in"] - empty_a["in"]),
+        net_output_bytes=(after["out"] - before["out"]) - (empty_b["out"] - empty_a["out"]),
+        commands=(after["cmds"] - before["cmds"]) - (empty_b["cmds"] - empty_a["cmds"]),
+    )
+
+
+def _deltas(reply_chars: int, delta_chars: int) -> list[str]:
+    text = ("lorem ipsum dolor sit amet " * (reply_chars // 27 + 1))[:reply_chars]
+    return [text[i : i + delta_chars] for i in range(0, len(text), delta_chars)]
+
+
+async def _legacy_update_progress(client: redis.Redis, key: str, chunk: str) -> None:
+    """The pre-append ``update_progress``: read, concat, rewrite the whole blob."""
+    raw = await client.get(key)
+    if not raw:
+        return
+    progress = json.loads(raw)
+    progress["complete_message"] = progress.get("complete_message", "") + chunk
+    await client.setex(key, 300, json.dumps(progress))
+    await client.expire(f"stream:active:{progress['user_id']}:{progress['conversation_id']}", 300)
+
+
+async def scenario_progress(client: redis.Redis, delta_chars: int) -> dict[str, Any]:
+    from app.core.stream_manager import StreamManager
+    from app.db.redis import redis_cache
+
+    redis_cache.redis = client  # type: ignore[assignment]
+    rows: list[dict[str, Any]] = []
+    for reply_chars in REPLY_SIZES:
+        deltas = _deltas(reply_chars, delta_chars)
+
+        stream_id = f"bench-{uuid.uuid4().hex}"
+        await StreamManager.start_stream(stream_id, "conv-bench", "user-bench")
+        legacy_key = f"stream:progress:{stream_id}"
+
+        async def legacy(key: str = legacy_key, chunks: list[str] = deltas) -> None:
+            for chunk in chunks:
+                await _legacy_update_progress(client, key, chunk)
+
+        started = time.perf_counter()
+        legacy_cost = await measure(client, legacy)
+        legacy_s = time.perf_counter() - started
+        await StreamManager.cleanup(stream_id)
+
+        stream_id = f"bench-{uuid.uuid4().hex}"
+        await StreamManager.start_stream(stream_id, "conv-bench", "user-bench")
+
+        async def append(sid: str = stream_id, chunks: list[str] = deltas) -> None:
+            for chunk in chunks:
+                await StreamManager.update_progress(sid, message_chunk=chunk)
+
+        started = time.perf_counter()
+        append_cost = await measure(client, append)
+        append_s = time.perf_counter() - started
+        progress = await StreamManager.get_progress(stream_id)
+        assert progress is not None and len(progress["complete_message"]) == reply_chars
+        await StreamManager.cleanup(stream_id)
+
+        row = {
+            "reply_chars": reply_chars,
+            "deltas": len(deltas),
+            "legacy": {**asdict(legacy_cost), "total_bytes": legacy_cost.total_bytes},
+            "append": {**asdict(append_cost), "total_bytes": append_cost.total_bytes},
+            "legacy_seconds": round(legacy_s, 3),
+            "append_seconds": round(append_s, 3),
+            "bytes_ratio": round(legacy_cost.total_bytes / max(append_cost.total_bytes, 1), 1),
+        }
+        rows.append(row)
+        print(
+            f"  progress {reply_chars:>7} chars: legacy {legacy_cost.total_bytes:>12,} B "
+            f"/ {legacy_cost.commands:>6} cmds   append {append_cost.total_bytes:>10,} B "
+            f"/ {append_cost.commands:>6} cmds   ({row['bytes_ratio']}x fewer bytes)",
+            flush=True,
+        )
+    return {"delta_chars": delta_chars, "rows": rows}
+
+
+async def scenario_publish(
+    client: redis.Redis, flush_interval: float, chunk_gap_ms: float
+) -> dict[str, Any]:
+    import app.core.stream_manager as stream_manager_module
+    from app.core.stream_manager import StreamManager
+    from app.db.redis import redis_cache
+
+    redis_cache.redis = client  # type: ignore[assignment]
+    chunks = [f'data: {{"response": "tok{i} "}}\n\n' for i in range(PUBLISH_CHUNKS)]
+
+    async def legacy() -> None:
+        key = f"stream:events:bench-{uuid.uuid4().hex}"
+        for chunk in chunks:
+            await client.xadd(key, {"data": chunk}, maxlen=4096, approximate=True)
+            await client.expire(key, 300)
+            await asyncio.sleep(chunk_gap_ms / 1000)
+
+    async def windowed() -> None:
+        stream_id = f"bench-{uuid.uuid4().hex}"
+        for chunk in chunks:
+            await StreamManager.publish_chunk(stream_id, chunk)
+            await asyncio.sleep(chunk_gap_ms / 1000)
+        await StreamManager.flush_publishers()
+
+    stream_manager_module.STREAM_PUBLISH_FLUSH_INTERVAL_SECONDS = flush_interval  # type: ignore[misc]
+    started = time.perf_counter()
+    legacy_cost = await measure(client, legacy)
+    legacy_s = time.perf_counter() - started
+    started = time.perf_counter()
+    windowed_cost = await measure(client, windowed)
+    windowed_s = time.perf_counter() - started
+
+    result = {
+        "chunks": PUBLISH_CHUNKS,
+        "flush_interval": flush_interval,
+        "chunk_gap_ms": chunk_gap_ms,
+        "legacy": {**asdict(legacy_cost), "seconds": round(legacy_s, 3)},
+        "windowed": {**asdict(windowed_cost), "seconds": round(windowed_s, 3)},
+    }
+    print(
+        f"  publish {PUBLISH_CHUNKS} chunks: legacy {legacy_cost.commands} cmds "
+        f"{legacy_s:.2f}s   windowed {windowed_cost.commands} cmds {windowed_s:.2f}s",
+        flush=True,
+    )
+    return result
+
+
+def save_result(tag: str, scenario: str, data: dict[str, Any]) -> None:
+    out = RESULTS_DIR / tag
+    out.mkdir(parents=True, exist_ok=True)
+    (out / f"{scenario}.json").write_text(json.dumps(data, indent=2))
+
+
+async def run_suite(tag: str, redis_url: str, wanted: set[str], args: argparse.Namespace) -> None:
+    client = redis.from_url(redis_url, decode_responses=True)
+    try:
+        await client.ping()
+        if "progress" in wanted:
+            save_result(tag, "progress", await scenario_progress(client, args.delta_chars))
+        if "publish" in wanted:
+            save_result(
+                tag,
+                "publish",
+                await scenario_publish(client, args.flush_interval, args.chunk_gap_ms),
+            )
+    finally:
+        await client.aclose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tag", required=True, help="run label, e.g. baseline or fixed")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument(
+        "--delta-chars",
+        type=int,
+        default=16,
+        help="characters per streamed text delta (a few tokens)",
+    )
+    parser.add_argument(
+        "--flush-interval",
+        type=float,
+        default=0.015,
+        help="publish window in seconds for the publish scenario",
+    )
+    parser.add_argument(
+        "--chunk-gap-ms",
+        type=float,
+        default=1.0,
+        help="simulated model inter-token gap for the publish scenario",
+    )
+    parser.add_argument(
+        "--scenarios", default="progress,publish", help="comma-separated subset to run"
+    )
+    args = parser.parse_args()
+    wanted = {s.strip() for s in args.scenarios.split(",") if s.strip()}
+    asyncio.run(run_suite(args.tag, args.redis_url, wanted, args))
+
+
+if __name__ == "__main__":
+    main()
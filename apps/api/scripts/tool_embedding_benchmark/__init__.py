@@ -0,0 +1 @@
+"""Recall@k of the tools-store embedding backends on the tool catalog."""
@@ -0,0 +1,230 @@
+"""Recall@k of the tools-store embedding backends on the tool catalog.
+
+Reads the indexed tool catalog (every namespace except ``subagents``) from the
+deployment's tools collection, indexes it into an in-process ephemeral Chroma
+once per backend in ``--backends`` through ``create_tool_store`` — the exact
+store the API builds — and runs one namespace-scoped search per labelled
+query, as ``retrieve_tools`` does for a subagent:
+
+- recall@k   share of queries whose expected tool is in the top k (1, 5, 10).
+- mrr        mean reciprocal rank of the expected tool (0 past the top 10).
+- query_ms   p50 / p99 search latency, query embedding included.
+- index_s    wall time to embed and index the catalog.
+
+Queries come from ``--queries`` (a JSON list of ``{"namespace": [...],
+"query": "...", "expected": "<tool key>"}``) or, by default, are synthesized
+from each tool's key with the toolkit prefix dropped (``GMAIL_SEND_EMAIL`` in
+``("gmail",)`` asks "send email") — the wording an agent reaches for, matched
+against the description the store embeds. The ``google`` backend needs
+``GOOGLE_API_KEY``; ``local`` uses the sidecar when configured. Run from
+``apps/api``::
+
+    uv run python -m scripts.tool_embedding_benchmark --tag baseline
+    uv run python -m scripts.tool_embedding_benchmark --tag quick --limit 300 --backends local
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+from pathlib import Path
+import pickle  # nosec B403 - the store's own document format
+import statistics
+import time
+from typing import Any, TypedDict, cast
+import uuid
+
+import chromadb
+from chromadb.api import AsyncClientAPI
+from chromadb.api.models.Collection import Collection
+from langgraph.store.base import PutOp
+
+RESULTS_DIR = Path(__file__).parent / "results"
+KS = (1, 5, 10)
+
+
+class CatalogRow(TypedDict):
+    namespace: list[str]
+    key: str
+    description: str
+
+
+class LabelledQuery(TypedDict):
+    namespace: list[str]
+    query: str
+    expected: str
+
+
+class _AsyncCollection:
+    """The async collection surface ``ChromaStore`` uses, over a sync collection."""
+
+    def __init__(self, sync: Collection) -> None:
+        self._sync = sync
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[object]]:
+        method = getattr(self._sync, name)
+
+        async def call(*args: object, **kwargs: object) -> object:
+            return method(*args, **kwargs)
+
+        return call
+
+
+class _AsyncClient:
+    def __init__(self) -> None:
+        self._sync = chromadb.EphemeralClient()
+
+    async def get_or_create_collection(self, name: str, **_: object) -> _AsyncCollection:
+        from app.db.chroma.noop_embedding import NoOpEmbeddingFunction
+
+        return _AsyncCollection(
+            self._sync.get_or_create_collection(
+                name,
+                metadata={"hnsw:space": "cosine"},
+                embedding_function=NoOpEmbeddingFunction(),
+            )
+        )
+
+
+async def _load_catalog(source_backend: str, limit: int | None) -> list[CatalogRow]:
+    from app.constants.chroma import TOOLS_COLLECTION
+    from app.db.chroma.chromadb import ChromaClient
+    from app.db.chroma.tool_embeddings import tool_collection_name
+
+    client = await ChromaClient.get_client()
+    collection = await client.get_collection(tool_collection_name(TOOLS_COLLECTION, source_backend))
+    result = await collection.get(include=["documents"])
+    rows: list[CatalogRow] = []
+    for doc_id, document in zip(result["ids"], result["documents"] or [], strict=True):
+        # ChromaStore ids are "<ns part>::...::<key>".
+        *namespace, key = doc_id.split("::")
+        if not document or namespace == ["subagents"]:
+            continue
+        value = pickle.loads(document.encode("latin1"))  # nosec B301 - Internal trusted data only
+        if isinstance(value, dict) and value.get("description"):
+            rows.append({"namespace": namespace, "key": key, "description": value["description"]})
+    rows.sort(key=lambda row: (row["namespace"], row["key"]))
+    return rows[:limit] if limit else rows
+
+
+def _synthesize_queries(catalog: list[CatalogRow]) -> list[LabelledQuery]:
+    queries: list[LabelledQuery] = []
+    for row in catalog:
+        words = row["key"].lower().split("_")
+        toolkit = row["namespace"][-1].lower() if row["namespace"] else ""
+        if len(words) > 1 and words[0] == toolkit:
+            words = words[1:]
+        queries.append(
+            {"namespace": row["namespace"], "query": " ".join(words), "expected": row["key"]}
+        )
+    return queries
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p99_ms": round(ordered[max(int(len(ordered) * 0.99) - 1, 0)] * 1000, 3),
+    }
+
+
+async def _evaluate(
+    backend: str, catalog: list[CatalogRow], queries: list[LabelledQuery]
+) -> dict[str, Any]:
+    from app.db.chroma.tool_embeddings import create_tool_store
+
+    store = await create_tool_store(
+        cast(AsyncClientAPI, _AsyncClient()),
+        f"tool-eval-{uuid.uuid4().hex[:8]}",
+        ["description"],
+        backend,
+    )
+    started = time.perf_counter()
+    await store.abatch(
+        [
+            PutOp(
+                namespace=tuple(row["namespace"]),
+                key=row["key"],
+                value={"description": row["description"]},
+            )
+            for row in catalog
+        ]
+    )
+    index_seconds = time.perf_counter() - started
+
+    hits = dict.fromkeys(KS, 0)
+    reciprocal_ranks: list[float] = []
+    latencies: list[float] = []
+    for labelled in queries:
+        started = time.perf_counter()
+        items = await store.asearch(
+            tuple(labelled["namespace"]), query=labelled["query"], limit=max(KS)
+        )
+        latencies.append(time.perf_counter() - started)
+        keys = [item.key for item in items]
+        rank = keys.index(labelled["expected"]) + 1 if labelled["expected"] in keys else None
+        for k in KS:
+            hits[k] += rank is not None and rank <= k
+        reciprocal_ranks.append(1 / rank if rank else 0.0)
+
+    return {
+        **{f"recall@{k}": round(hits[k] / len(queries), 4) for k in KS},
+        "mrr": round(statistics.fmean(reciprocal_ranks), 4),
+        "query_ms": _percentiles(latencies),
+        "index_s": round(index_seconds, 1),
+    }
+
+
+async def run_suite(
+    tag: str,
+    backends: list[str],
+    source_backend: str,
+    queries_path: Path | None,
+    limit: int | None,
+) -> dict[str, Any]:
+    from app.agents.tools.core.store import init_embeddings
+    from app.db.chroma.chromadb import init_chroma
+
+    init_embeddings()
+    init_chroma()
+
+    catalog = await _load_catalog(source_backend, limit)
+    queries: list[LabelledQuery] = (
+        json.loads(queries_path.read_text()) if queries_path else _synthesize_queries(catalog)
+    )
+    print(f"  {len(catalog)} tools, {len(queries)} queries", flush=True)
+
+    results: dict[str, Any] = {"tools": len(catalog), "queries": len(queries)}
+    for backend in backends:
+        results[backend] = await _evaluate(backend, catalog, queries)
+        print(f"  {backend:<7} {json.dumps(results[backend])}", flush=True)
+
+    out = RESULTS_DIR / tag
+    out.mkdir(parents=True, exist_ok=True)
+    (out / "tool_embedding.json").write_text(json.dumps(results, indent=2))
+    return results
+
+
+def main() -> None:
+    from app.constants.chroma import TOOLS_EMBEDDING_BACKENDS
+
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tag", required=True, help="run label, e.g. baseline or fixed")
+    parser.add_argument("--backends", default=",".join(TOOLS_EMBEDDING_BACKENDS))
+    parser.add_argument(
+        "--source",
+        default="google",
+        choices=TOOLS_EMBEDDING_BACKENDS,
+        help="backend whose tools collection holds the catalog",
+    )
+    parser.add_argument("--queries", type=Path, help="labelled queries JSON (default: synthesized)")
+    parser.add_argument("--limit", type=int, help="first N catalog tools only")
+    args = parser.parse_args()
+    backends = args.backends.split(",")
+    asyncio.run(run_suite(args.tag, backends, args.source, args.queries, args.limit))
+
+
+if __name__ == "__main__":
+    main()
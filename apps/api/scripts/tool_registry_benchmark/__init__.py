@@ -0,0 +1 @@
+"""Lookup latency benchmark for ``ToolRegistry``'s executor tool dict."""
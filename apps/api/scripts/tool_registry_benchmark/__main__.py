@@ -0,0 +1,118 @@
+"""Lookup latency benchmark for ``ToolRegistry``'s executor tool dict.
+
+Loads a registry shaped like a deployment with the whole provider catalog
+registered — ``--toolkits`` delegated categories of ``--tools`` tools each on
+top of ``--core`` built-in tools — and times the lookups the executor makes per
+tool call, each ``--repeats`` times:
+
+- getitem / contains   ``DynamicToolDict[name]`` / ``name in DynamicToolDict``.
+- values               ``DynamicToolDict.values()`` (ToolNode's tool list).
+- names                ``ToolRegistry.get_tool_names()``.
+
+``legacy`` replays the old behaviour, rebuilding the name -> tool dict from
+every category on each lookup; ``cached`` is the current generation-keyed
+dict. No services needed::
+
+    uv run python -m scripts.tool_registry_benchmark --tag baseline
+"""
+
+from __future__ import annotations
+
+import argparse
+from collections.abc import Callable
+import json
+from pathlib import Path
+import statistics
+import time
+from typing import Any
+
+from langchain_core.tools import BaseTool, StructuredTool
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+def _stub(name: str) -> BaseTool:
+    def run() -> str:
+        return name
+
+    return StructuredTool.from_function(run, name=name, description=f"{name} does one thing")
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "p50_us": round(statistics.median(ordered) * 1e6, 2),
+        "p99_us": round(ordered[max(int(len(ordered) * 0.99) - 1, 0)] * 1e6, 2),
+    }
+
+
+def _sample(call: Callable[[], object], repeats: int) -> dict[str, float]:
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+    return _percentiles(samples)
+
+
+def run_suite(tag: str, toolkits: int, tools: int, core: int, repeats: int) -> dict[str, Any]:
+    from app.agents.tools.core.registry import ToolRegistry
+
+    registry = ToolRegistry()
+    registry._add_category("general", core_tools=[_stub(f"core_tool_{i}") for i in range(core)])
+    for toolkit in range(toolkits):
+        registry._add_category(
+            f"toolkit_{toolkit}",
+            tools=[_stub(f"TOOLKIT_{toolkit}_ACTION_{i}") for i in range(tools)],
+            require_integration=True,
+            is_delegated=True,
+            space=f"toolkit_{toolkit}",
+        )
+    tool_dict = registry.get_tool_dict()
+    tool_dict.update({"handoff": _stub("handoff")})
+    wanted = f"TOOLKIT_{toolkits // 2}_ACTION_{tools // 2}"
+
+    def legacy_dict() -> dict[str, BaseTool]:
+        return {tool.name: tool.tool for tool in registry.get_all_tools_for_search()}
+
+    def legacy_values() -> object:
+        merged = legacy_dict()
+        merged.update({"handoff": tool_dict["handoff"]})
+        return merged.values()
+
+    results: dict[str, Any] = {"tools": len(registry.get_tool_names())}
+    results["legacy"] = {
+        "getitem": _sample(lambda: legacy_dict()[wanted], repeats),
+        "contains": _sample(lambda: wanted in legacy_dict(), repeats),
+        "values": _sample(legacy_values, repeats),
+        "names": _sample(lambda: [t.name for t in registry.get_all_tools_for_search()], repeats),
+    }
+    results["cached"] = {
+        "getitem": _sample(lambda: tool_dict[wanted], repeats),
+        "contains": _sample(lambda: wanted in tool_dict, repeats),
+        "values": _sample(tool_dict.values, repeats),
+        "names": _sample(registry.get_tool_names, repeats),
+    }
+
+    print(f"  {results['tools']} tools", flush=True)
+    for mode in ("legacy", "cached"):
+        print(f"  {mode:<7} {json.dumps(results[mode])}", flush=True)
+    out = RESULTS_DIR / tag
+    out.mkdir(parents=True, exist_ok=True)
+    (out / "tool_registry.json").write_text(json.dumps(results, indent=2))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tag", required=True, help="run label, e.g. baseline or fixed")
+    parser.add_argument("--toolkits", type=int, default=60, help="provider categories")
+    parser.add_argument("--tools", type=int, default=27, help="tools per provider")
+    parser.add_argument("--core", type=int, default=120, help="built-in tools")
+    parser.add_argument("--repeats", type=int, default=2_000, help="samples per lookup")
+    args = parser.parse_args()
+    run_suite(args.tag, args.toolkits, args.tools, args.core, args.repeats)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Load benchmark for the Composio webhook ingestion stream and its consumers."""
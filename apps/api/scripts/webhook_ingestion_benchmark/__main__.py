@@ -0,0 +1,250 @@
+"""Load benchmark for the Composio webhook ingestion stream (``webhook_queue``).
+
+Pushes ``--events`` synthetic trigger events through ``enqueue_event`` onto a
+throwaway stream, then drains them with real ``WebhookConsumer`` instances
+against a stub handler that sleeps ``--handler-ms`` per event:
+
+- ingest    enqueue wall time and events/s (the endpoint's share of the work).
+- consume   drain wall time, events/s, receipt-to-handler lag p50 / p99, and
+            the peak number of handlers in flight, which must never exceed
+            ``--concurrency``.
+- batching  workflow lookups issued against events dispatched — one
+            ``find_active_by_composio_triggers`` per read instead of one
+            lookup per event.
+- crash     the first consumer is cancelled halfway through, abandoning its
+            in-flight events to the pending list; a second consumer reclaims
+            them. ``lost`` (events never handled) must be 0; ``replayed``
+            counts events handled twice (finished, but cancelled before the
+            ack) — the at-least-once cost of a crash.
+
+Run from ``apps/api`` against a local Redis, or ``--fakeredis`` in-process::
+
+    uv run python -m scripts.webhook_ingestion_benchmark --tag local
+    uv run python -m scripts.webhook_ingestion_benchmark --tag fake --fakeredis
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+from collections import Counter
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+import json
+from pathlib import Path
+import statistics
+import time
+from typing import Any
+from unittest.mock import patch
+import uuid
+
+from loguru import logger
+import redis.asyncio as redis
+
+RESULTS_DIR = Path(__file__).parent / "results"
+MODULE = "app.services.triggers.webhook_queue"
+TRIGGERS = 200  # distinct trigger ids the events are spread over
+ENQUEUE_BURST = 500  # deliveries in flight at the endpoint at once
+
+
+class _Repository:
+    """Stands in for ``workflow_repository``: counts batch lookups, matches nothing."""
+
+    def __init__(self) -> None:
+        self.lookups = 0
+
+    async def find_active_by_composio_triggers(
+        self, trigger_ids: Sequence[str]
+    ) -> dict[str, list[Any]]:
+        self.lookups += 1
+        return {trigger_id: [] for trigger_id in trigger_ids}
+
+    @contextmanager
+    def composio_trigger_batch(self, _prefetched: Mapping[str, list[Any]]) -> Iterator[None]:
+        yield
+
+
+class _Handler:
+    """A trigger handler whose work is a sleep; records lag, overlap and completions."""
+
+    def __init__(self, delay: float) -> None:
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.lags: list[float] = []
+        self.completed: Counter[int] = Counter()
+        self.halfway = asyncio.Event()
+        self.done = asyncio.Event()
+        self.target = 0
+
+    async def process_event(self, *, data: dict[str, Any], **_ids: str) -> None:
+        self.lags.append(time.time() - data["sent_at"])
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        self.completed[data["seq"]] += 1
+        if len(self.completed) >= self.target // 2:
+            self.halfway.set()
+        if len(self.completed) >= self.target:
+            self.done.set()
+
+
+def _percentiles(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(samples)
+    return {
+        "lag_p50_ms": round(statistics.median(ordered) * 1000, 1),
+        "lag_p99_ms": round(ordered[max(0, int(len(ordered) * 0.99) - 1)] * 1000, 1),
+    }
+
+
+async def run_suite(
+    tag: str,
+    redis_url: str,
+    *,
+    use_fakeredis: bool,
+    events: int,
+    concurrency: int,
+    handler_ms: float,
+) -> dict[str, Any]:
+    from app.db.redis import redis_cache
+    from app.models.webhook_models import ComposioWebhookEvent
+    from app.services.triggers.webhook_queue import WebhookConsumer, enqueue_event
+
+    if use_fakeredis:
+        import fakeredis.aioredis
+
+        client: Any = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    else:
+        client = redis.from_url(redis_url, decode_responses=True)
+        await client.ping()
+    # One wide event per webhook would bury the report.
+    logger.remove()
+
+    run_id = uuid.uuid4().hex[:8]
+    stream = f"bench:composio:webhook:{run_id}"
+    group = f"bench-consumers-{run_id}"
+    repository = _Repository()
+    handler = _Handler(handler_ms / 1000)
+    handler.target = events
+    redis_cache.redis = client
+    results: dict[str, Any] = {"events": events, "concurrency": concurrency}
+
+    def _consumer(name: str, claim_idle_ms: int) -> WebhookConsumer:
+        return WebhookConsumer(
+            client,
+            name=name,
+            stream=stream,
+            group=group,
+            concurrency=concurrency,
+            claim_idle_ms=claim_idle_ms,
+            handler_for=lambda _type: handler,  # type: ignore[arg-type,return-value]
+        )
+
+    try:
+        with (
+            patch(f"{MODULE}.COMPOSIO_WEBHOOK_STREAM", stream),
+            patch(f"{MODULE}.COMPOSIO_WEBHOOK_STREAM_MAXLEN", events * 2),
+            patch(f"{MODULE}.COMPOSIO_WEBHOOK_BLOCK_MS", 100),
+            patch(f"{MODULE}.COMPOSIO_WEBHOOK_RECLAIM_INTERVAL_SECONDS", 0.2),
+            patch(f"{MODULE}.workflow_repository", repository),
+        ):
+            first = _consumer("bench-first", claim_idle_ms=60_000)
+            await first.ensure_group()
+
+            async def _deliver(seq: int) -> bool:
+                return await enqueue_event(
+                    ComposioWebhookEvent(
+                        connection_id="conn",
+                        connection_nano_id="conn-nano",
+                        trigger_nano_id=f"ti_{seq % TRIGGERS}",
+                        trigger_id=f"uuid-{seq % TRIGGERS}",
+                        user_id=f"user-{seq % TRIGGERS}",
+                        data={"seq": seq, "sent_at": time.time()},
+                        timestamp="2026-08-10T05:44:33Z",
+                        type="gmail_new_gmail_message",
+                    )
+                )
+
+            started = time.perf_counter()
+            queued = 0
+            for offset in range(0, events, ENQUEUE_BURST):
+                burst = range(offset, min(offset + ENQUEUE_BURST, events))
+                queued += sum(await asyncio.gather(*(_deliver(seq) for seq in burst)))
+            ingest_wall = time.perf_counter() - started
+            results["ingest"] = {
+                "queued": queued,
+                "wall_ms": round(ingest_wall * 1000, 1),
+                "events_per_s": round(events / ingest_wall),
+            }
+            print(f"  ingest   {results['ingest']}", flush=True)
+
+            started = time.perf_counter()
+            first_run = asyncio.create_task(first.run())
+            await handler.halfway.wait()
+            abandoned = len(first._in_flight)
+            first_run.cancel()
+            await asyncio.gather(first_run, return_exceptions=True)
+
+            second = _consumer("bench-second", claim_idle_ms=100)
+            second_run = asyncio.create_task(second.run())
+            await asyncio.wait_for(handler.done.wait(), timeout=max(60.0, events / 50))
+            await second.drain()
+            consume_wall = time.perf_counter() - started
+            second_run.cancel()
+            await asyncio.gather(second_run, return_exceptions=True)
+
+            pending = (await client.xpending(stream, group))["pending"]
+            results["consume"] = {
+                "wall_ms": round(consume_wall * 1000, 1),
+                "events_per_s": round(events / consume_wall),
+                "peak_in_flight": handler.peak,
+                **_percentiles(handler.lags),
+            }
+            results["batching"] = {
+                "dispatched": len(handler.lags),
+                "workflow_lookups": repository.lookups,
+            }
+            results["crash"] = {
+                "abandoned_in_flight": abandoned,
+                "lost": events - len(handler.completed),
+                "replayed": sum(1 for count in handler.completed.values() if count > 1),
+                "left_pending": pending,
+            }
+            for section in ("consume", "batching", "crash"):
+                print(f"  {section:<8} {results[section]}", flush=True)
+    finally:
+        await client.delete(stream)
+        await client.aclose()
+
+    out = RESULTS_DIR / tag
+    out.mkdir(parents=True, exist_ok=True)
+    (out / "webhook_ingestion.json").write_text(json.dumps(results, indent=2))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--tag", required=True, help="run label, e.g. baseline or fixed")
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--fakeredis", action="store_true", help="run in-process, no server")
+    parser.add_argument("--events", type=int, default=10_000)
+    parser.add_argument("--concurrency", type=int, default=16, help="handlers per consumer")
+    parser.add_argument("--handler-ms", type=float, default=2.0, help="simulated handler time")
+    args = parser.parse_args()
+    asyncio.run(
+        run_suite(
+            args.tag,
+            args.redis_url,
+            use_fakeredis=args.fakeredis,
+            events=args.events,
+            concurrency=args.concurrency,
+            handler_ms=args.handler_ms,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -42,6 +42,10 @@ os.environ["DEV_AUTH_BYPASS_EMAIL"] = ""
 # parseable — "" is a pydantic bool_parsing error, not an "off".
 os.environ["DEV_UNLIMITED_RATE_LIMITS"] = "false"
 os.environ["GAIA_SIM_MODE"] = "false"
+# The memory embedding and rerank caches would carry results from one test
+# into the next (and reach for Redis); their own tests switch them back on.
+os.environ["MEMORY_EMBEDDING_CACHE"] = "0"
+os.environ["MEMORY_RERANK_CACHE"] = "0"
 os.environ.setdefault(
     "MONGO_DB",
     "mongodb://localhost:27017/gaia_test?serverSelectionTimeoutMS=100&connectTimeoutMS=100",
@@ -576,6 +580,7 @@ _ENQUEUE_CALL_SITES = (
     "app.services.tracked_todo_service",
     "app.services.scheduler_service",
     "app.services.onboarding.intelligence_job",
+    "app.services.onboarding.intelligence_service",
     "app.workers.tasks.memory_backfill_tasks",
 )
 
@@ -9,10 +9,12 @@ concrete values against real Mongo.
 from __future__ import annotations
 
 from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
 import uuid
 
 import pytest
 
+from app.db.repositories import conversations as conversations_module
 from app.db.repositories.conversations import ConversationRepository
 from app.models.chat_models import ConversationSource, MessageModel, SystemPurpose
 from app.models.conversation_models import ConversationDocument
@@ -37,6 +39,38 @@ def _doc(**overrides: object) -> ConversationDocument:
     return ConversationDocument.model_validate(data)
 
 
+class _FakeMessageIndex:
+    """In-memory stand-in for ``app.db.message_search`` (newest row first)."""
+
+    def __init__(self) -> None:
+        self.rows: dict[tuple[str, str], tuple[str, str]] = {}
+
+    async def index_messages(self, user_id: str, conversation_id: str, messages: list) -> None:
+        for message in messages:
+            if message.get("response"):
+                key = (conversation_id, message["message_id"])
+                self.rows[key] = (user_id, message["response"])
+
+    async def prune_conversation(
+        self, user_id: str, conversation_id: str, kept_message_ids: list[str]
+    ) -> None:
+        for key in [k for k in self.rows if k[0] == conversation_id]:
+            if key[1] not in kept_message_ids:
+                del self.rows[key]
+
+    async def delete_refs(self, user_id: str, refs: list[tuple[str, str]]) -> None:
+        for ref in refs:
+            self.rows.pop(ref, None)
+
+    async def search(
+        self, user_id: str, query: str, *, limit: int, skip: int = 0
+    ) -> list[tuple[str, str]]:
+        hits = [
+            key for key, (owner, text) in self.rows.items() if owner == user_id and query in text
+        ]
+        return list(reversed(hits))[skip : skip + limit]
+
+
 @pytest.fixture
 def repo(raw_collection) -> ConversationRepository:
     return ConversationRepository()
@@ -215,6 +249,27 @@ class TestMessages:
         assert fetched is not None
         assert [m.response for m in fetched.messages] == ["m1", "m2"]  # oldest sliced off
 
+    async def test_trimmed_messages_leave_the_search_index(self, repo):
+        doc = _doc()
+        await repo.create(doc)
+        index = _FakeMessageIndex()
+        with patch.object(conversations_module, "message_search", index):
+            for i in range(5):
+                await repo.append_messages(
+                    doc.conversation_id,
+                    user_id=doc.user_id,
+                    messages=[MessageModel(type="bot", response=f"report {i}")],
+                    max_messages=2,
+                )
+            # A row left behind by an older write that never pruned.
+            index.rows[(doc.conversation_id, "gone")] = (doc.user_id, "report stale")
+
+            page = await repo.search_indexed(doc.user_id, query="report", pattern="report", limit=3)
+
+        assert [hit.message.response for hit in page.messages] == ["report 4", "report 3"]
+        assert page.matched_messages == 3
+        assert sorted(text for _, text in index.rows.values()) == ["report 3", "report 4"]
+
     async def test_pin_and_list_and_get_message(self, repo):
         doc = _doc()
         await repo.create(doc)
@@ -717,12 +772,16 @@ class TestSearchAndSweeps:
         assert never.conversation_id in found
         assert seen.conversation_id not in found
 
-    async def test_all_conversation_ids_and_active_users(self, repo):
+    async def test_existing_conversation_ids_and_active_users(self, repo):
         user = _uid()
         doc = _doc(user_id=user)
         await repo.create(doc)
         await repo.set_starred(doc.conversation_id, user_id=user, starred=True)  # sets updatedAt
-        assert doc.conversation_id in await repo.all_conversation_ids()
+        gone = _cid()
+        assert await repo.existing_conversation_ids([doc.conversation_id, gone]) == {
+            doc.conversation_id
+        }
+        assert await repo.existing_conversation_ids([]) == set()
         since = datetime.now(UTC) - timedelta(minutes=5)
         assert user in await repo.active_user_ids_since(since)
 
@@ -400,6 +400,36 @@ class TestWorkflowsTriggersAndSystem:
         assert await repo.find_active_by_composio_trigger(tid, trigger_name="other") == []
         assert await repo.find_active_by_composio_trigger(_uid("none")) == []
 
+    async def test_find_active_by_composio_triggers_batches_the_lookup(self, repo):
+        first, second, idle = _uid("tid"), _uid("tid"), _uid("tid")
+        both = await repo.create(
+            _workflow(
+                activated=True,
+                trigger_config=TriggerConfig(
+                    type=TriggerType.INTEGRATION,
+                    enabled=True,
+                    trigger_name="gmail_poll_inbox",
+                    composio_trigger_ids=[first, second],
+                ),
+            )
+        )
+        found = await repo.find_active_by_composio_triggers([first, second, idle])
+        assert {tid: [w.id for w in wfs] for tid, wfs in found.items()} == {
+            first: [both.id],
+            second: [both.id],
+            idle: [],
+        }
+        assert await repo.find_active_by_composio_triggers([]) == {}
+
+        # Inside a batch the single-id finder answers from the prefetch, still
+        # narrowing by trigger_name.
+        with repo.composio_trigger_batch({first: found[first], idle: []}):
+            await repo.delete(both.id)
+            assert [w.id for w in await repo.find_active_by_composio_trigger(first)] == [both.id]
+            assert await repo.find_active_by_composio_trigger(first, trigger_name="other") == []
+            assert await repo.find_active_by_composio_trigger(second) == []
+        assert await repo.find_active_by_composio_trigger(first) == []
+
     async def test_set_composio_trigger_ids(self, repo):
         wf = await repo.create(
             _workflow(
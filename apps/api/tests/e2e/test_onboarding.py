@@ -49,7 +49,7 @@ from typing import Any
 from unittest.mock import AsyncMock, patch
 
 from arq.connections import ArqRedis
-from arq.constants import abort_jobs_ss, default_queue_name, job_key_prefix
+from arq.constants import abort_jobs_ss, job_key_prefix
 from arq.jobs import Job
 import fakeredis.aioredis
 from httpx import AsyncClient
@@ -79,6 +79,7 @@ from app.services.onboarding.intelligence_service import (
     _WorkflowSpec,
 )
 from app.utils.redis_utils import RedisPoolManager
+from app.workers.queue import JOB_CLASS_QUEUES
 from app.workers.tasks.onboarding_tasks import (
     process_onboarding_intelligence_task,
     process_onboarding_workflows_task,
@@ -690,6 +691,15 @@ _TASKS: dict[str, Any] = {
 }
 
 
+async def _queued_jobs(pool: ArqRedis) -> list[tuple[str, str]]:
+    """``(queue, job id)`` for every job on every job-class queue."""
+    queued = []
+    for queue_name in JOB_CLASS_QUEUES.values():
+        for raw in await pool.zrange(queue_name, 0, -1):
+            queued.append((queue_name, raw.decode() if isinstance(raw, bytes) else raw))
+    return queued
+
+
 async def run_queued_jobs(pool: ArqRedis, externals: _Externals) -> list[str]:
     """Drain the arq queue through the real task functions, worker-style.
 
@@ -699,14 +709,13 @@ async def run_queued_jobs(pool: ArqRedis, externals: _Externals) -> list[str]:
     """
     ran: list[str] = []
     for _ in range(4):  # a job may enqueue another; bounded so a loop cannot hang
-        queued = await pool.zrange(default_queue_name, 0, -1)
+        queued = await _queued_jobs(pool)
         if not queued:
             break
-        for raw in queued:
-            job_id = raw.decode() if isinstance(raw, bytes) else raw
+        for queue_name, job_id in queued:
             info = await Job(job_id, redis=pool).info()
             assert info is not None, f"queued job {job_id} has no definition"
-            await pool.zrem(default_queue_name, job_id)
+            await pool.zrem(queue_name, job_id)
             await pool.delete(job_key_prefix + job_id)
             if info.function in _TASKS:
                 ran.append(info.function)
@@ -718,9 +727,8 @@ async def run_queued_jobs(pool: ArqRedis, externals: _Externals) -> list[str]:
 
 async def drop_queued_jobs(pool: ArqRedis) -> None:
     """Discard whatever is queued without running it — a worker that died."""
-    for raw in await pool.zrange(default_queue_name, 0, -1):
-        job_id = raw.decode() if isinstance(raw, bytes) else raw
-        await pool.zrem(default_queue_name, job_id)
+    for queue_name, job_id in await _queued_jobs(pool):
+        await pool.zrem(queue_name, job_id)
         await pool.delete(job_key_prefix + job_id)
 
 
@@ -747,8 +755,7 @@ async def wait_for_stage(stages: _StageSink, stage: OnboardingStage, timeout: fl
 
 async def queued_job_names(pool: ArqRedis) -> list[str]:
     names = []
-    for raw in await pool.zrange(default_queue_name, 0, -1):
-        job_id = raw.decode() if isinstance(raw, bytes) else raw
+    for _queue_name, job_id in await _queued_jobs(pool):
         info = await Job(job_id, redis=pool).info()
         if info is not None:
             names.append(info.function)
@@ -124,10 +124,14 @@ def _webhook_secret(monkeypatch: pytest.MonkeyPatch) -> None:
 
 @pytest.fixture
 def _redis():
-    """Dedupe seam: every key is unclaimed unless a test says otherwise."""
+    """Dedupe seam: every key is unclaimed unless a test says otherwise. The
+    ingestion stream is off, so trigger events run in-process through spawn."""
     redis = MagicMock()
     redis.client.set = AsyncMock(return_value=True)
-    with patch(f"{MODULE}.redis_cache", redis):
+    with (
+        patch(f"{MODULE}.redis_cache", redis),
+        patch(f"{MODULE}.COMPOSIO_WEBHOOK_QUEUE_ENABLED", False),
+    ):
         yield redis
 
 
@@ -30,6 +30,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import chromadb
+from langchain_core.embeddings import Embeddings
 from langgraph.store.base import GetOp, PutOp, SearchOp
 import pytest
 
@@ -103,6 +104,9 @@ class _AsyncCollectionWrapper:
     async def delete(self, *args, **kwargs):
         return self._sync.delete(*args, **kwargs)
 
+    async def update(self, *args, **kwargs):
+        return self._sync.update(*args, **kwargs)
+
     async def query(self, *args, **kwargs):
         return self._sync.query(*args, **kwargs)
 
@@ -461,6 +465,129 @@ class TestChromaStoreSearch:
         # Exactly 2 items should be returned — not 0, not 3.
         assert len(results[0]) == 2
 
+    async def test_prefix_search_includes_nested_namespaces(self, populated_store):
+        await populated_store.abatch(
+            [PutOp(namespace=("other",), key="unrelated", value={"description": "x"})]
+        )
+        results = await populated_store.abatch(
+            [SearchOp(namespace_prefix=("tools",), query=None, limit=10, offset=0)]
+        )
+        assert {item.key for item in results[0]} == {"web_search", "calculator", "send_email"}
+
+    async def test_string_equality_filter(self, populated_store):
+        results = await populated_store.abatch(
+            [
+                SearchOp(
+                    namespace_prefix=("tools",),
+                    filter={"tool_hash": "hash_calc"},
+                    query=None,
+                    limit=10,
+                    offset=0,
+                )
+            ]
+        )
+        assert [item.key for item in results[0]] == ["calculator"]
+
+    async def test_operator_filter_applies_python_side(self, chroma_store):
+        await chroma_store.abatch(
+            [
+                PutOp(
+                    namespace=("ranked",),
+                    key=f"tool_{i}",
+                    value={"kind": "tool", "rank": i, "meta": {"owner": f"o{i % 2}"}},
+                )
+                for i in range(4)
+            ]
+        )
+        results = await chroma_store.abatch(
+            [
+                SearchOp(
+                    namespace_prefix=("ranked",),
+                    filter={"kind": "tool", "rank": 2},
+                    query=None,
+                    limit=10,
+                    offset=0,
+                ),
+                SearchOp(
+                    namespace_prefix=("ranked",),
+                    filter={"meta": {"owner": "o1"}},
+                    query=None,
+                    limit=10,
+                    offset=0,
+                ),
+            ]
+        )
+        assert [item.key for item in results[0]] == ["tool_2"]
+        assert {item.key for item in results[1]} == {"tool_1", "tool_3"}
+
+    async def test_search_does_not_scan_collection(self, populated_store):
+        """Every read a search makes is scoped by ``where`` or by ids."""
+        await populated_store.abackfill_filter_metadata()
+        collection = await populated_store._get_collection()
+        with patch.object(collection, "get", wraps=collection.get) as get:
+            await populated_store.abatch(
+                [
+                    SearchOp(namespace_prefix=("tools", "gmail"), query=None, limit=10, offset=0),
+                    SearchOp(
+                        namespace_prefix=("tools",),
+                        filter={"description": {"$ne": None}},
+                        query=None,
+                        limit=10,
+                        offset=0,
+                    ),
+                ]
+            )
+        assert get.await_count > 0
+        for call in get.await_args_list:
+            assert call.kwargs.get("where") or call.kwargs.get("ids")
+
+    async def test_rows_without_filter_metadata_are_backfilled(self, chroma_store):
+        """Rows written before the ``ns.*`` keys existed stay searchable."""
+        await chroma_store.abatch(
+            [PutOp(namespace=("legacy", "ns"), key="old", value={"kind": "tool"})]
+        )
+        collection = await chroma_store._get_collection()
+        # Recreate the pre-filter-metadata row shape.
+        row = await collection.get(ids=["legacy::ns::old"], include=["documents"])
+        await collection.delete(ids=["legacy::ns::old"])
+        await collection.upsert(
+            ids=["legacy::ns::old"],
+            metadatas=[{"namespace": "legacy::ns", "created_at": "2025-01-01T00:00:00+00:00"}],
+            documents=row["documents"],
+        )
+
+        fresh = ChromaStore(
+            client=chroma_store.client, collection_name=chroma_store.collection_name
+        )
+        search = SearchOp(
+            namespace_prefix=("legacy",),
+            filter={"kind": "tool"},
+            query=None,
+            limit=10,
+            offset=0,
+        )
+
+        # Before the backfill has run, the search filters in Python.
+        assert [item.key for item in (await fresh.abatch([search]))[0]] == ["old"]
+
+        assert await fresh.abackfill_filter_metadata() == 1
+        assert [item.key for item in (await fresh.abatch([search]))[0]] == ["old"]
+        metadata = (await collection.get(ids=["legacy::ns::old"]))["metadatas"][0]
+        assert metadata["ns.0"] == "legacy"
+        assert metadata["created_at"] == "2025-01-01T00:00:00+00:00"
+
+    async def test_failed_backfill_keeps_python_filtering(self, populated_store):
+        """A backfill that fails leaves searches on the Python-side filter."""
+        collection = await populated_store._get_collection()
+        with patch.object(collection, "get", side_effect=RuntimeError("chroma down")):
+            assert await populated_store.abackfill_filter_metadata() == 0
+
+        results = await populated_store.abatch(
+            [SearchOp(namespace_prefix=("tools", "gmail"), query=None, limit=10, offset=0)]
+        )
+        assert [item.key for item in results[0]] == ["send_email"]
+        assert populated_store._filter_metadata_ready is False
+
     async def test_partial_failure_in_gather_does_not_block_successful_puts(self, chroma_store):
         """_apply_put_ops uses asyncio.gather(return_exceptions=True).
 
@@ -566,6 +693,101 @@ class TestChromaStoreSearch:
 # ---------------------------------------------------------------------------
 
 
+class _QueryEmbeddings(Embeddings):
+    """Every query embeds to the x axis; rows carry explicit ``embedding`` values."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return [[1.0, 0.0] for _ in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls += 1
+        return [1.0, 0.0]
+
+
+def _row(namespace: tuple[str, ...], key: str, x: float) -> PutOp:
+    """A row at angle ``x`` from the query: smaller ``x`` ranks higher."""
+    return PutOp(namespace=namespace, key=key, value={"embedding": [1.0, x], "name": key})
+
+
+@pytest.fixture
+async def vector_store(ephemeral_client, collection_prefix: str):
+    embeddings = _QueryEmbeddings()
+    store = ChromaStore(
+        client=ephemeral_client,
+        collection_name=f"{collection_prefix}vectors",
+        index={"embed": embeddings, "dims": 2, "fields": ["name"]},
+    )
+    await store.abatch(
+        [_row(("general",), f"general_{i}", 0.1 * i) for i in range(6)]
+        + [_row(("gmail",), f"gmail_{i}", 0.05 + 0.1 * i) for i in range(6)]
+        + [_row(("subagents",), f"subagent_{i}", 5.0 + i) for i in range(3)]
+    )
+    await store.abackfill_filter_metadata()
+    return store, embeddings
+
+
+@pytest.mark.integration
+class TestChromaStoreSearchNamespaces:
+    """One embedding and one vector query across several namespaces."""
+
+    async def test_matches_per_namespace_searches(self, vector_store):
+        store, _ = vector_store
+        limits = {("general",): 2, ("gmail",): 3, ("subagents",): 1}
+        query = f"q-{uuid4().hex}"
+
+        combined = await store.asearch_namespaces(query, limits)
+
+        for namespace, limit in limits.items():
+            single = await store.asearch(namespace, query=query, limit=limit)
+            assert [item.key for item in combined[namespace]] == [item.key for item in single]
+            assert [item.score for item in combined[namespace]] == pytest.approx(
+                [item.score for item in single]
+            )
+
+    async def test_embeds_and_queries_once(self, vector_store):
+        store, embeddings = vector_store
+        await store.asearch_namespaces("warm", {("general",): 1})
+        collection = await store._get_collection()
+        calls_before = embeddings.calls
+
+        with patch.object(collection, "query", wraps=collection.query) as query:
+            await store.asearch_namespaces(
+                f"q-{uuid4().hex}", {("general",): 2, ("gmail",): 2, ("subagents",): 2}
+            )
+
+        assert embeddings.calls - calls_before == 1
+        assert query.await_count == 1
+
+    async def test_crowded_out_namespace_is_requeried(self, vector_store):
+        """The 9 best rows overall are general/gmail; subagents still gets its hit."""
+        store, _ = vector_store
+        collection = await store._get_collection()
+
+        with patch.object(collection, "query", wraps=collection.query) as query:
+            results = await store.asearch_namespaces(
+                f"q-{uuid4().hex}", {("general",): 1, ("gmail",): 1, ("subagents",): 1}
+            )
+
+        assert [item.key for item in results[("general",)]] == ["general_0"]
+        assert [item.key for item in results[("gmail",)]] == ["gmail_0"]
+        assert [item.key for item in results[("subagents",)]] == ["subagent_0"]
+        assert query.await_count == 2
+
+    async def test_repeated_query_is_embedded_once(self, vector_store):
+        store, embeddings = vector_store
+        query = f"q-{uuid4().hex}"
+        await store.asearch(("general",), query=query, limit=1)
+        calls_before = embeddings.calls
+
+        await store.asearch(("gmail",), query=query, limit=1)
+        await store.asearch_namespaces(query, {("general",): 1, ("gmail",): 1})
+
+        assert embeddings.calls == calls_before
+
+
 @pytest.mark.integration
 class TestChromaStoreCollectionResolution:
     """Regression: _get_collection resolving a not-yet-created collection."""
@@ -32,8 +32,12 @@ def workspace_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
     monkeypatch.setattr(
         _vfs_scheduler, "user_workspace_path", lambda user_id: tmp_path / "users" / user_id
     )
-    monkeypatch.setattr("app.memory.ingestion.schedule_memory_vfs_sync", lambda user_id: None)
-    monkeypatch.setattr("app.memory.management.schedule_memory_vfs_sync", lambda user_id: None)
+    monkeypatch.setattr(
+        "app.memory.ingestion.schedule_memory_vfs_sync", lambda user_id, change=None: None
+    )
+    monkeypatch.setattr(
+        "app.memory.management.schedule_memory_vfs_sync", lambda user_id, change=None: None
+    )
     return tmp_path
 
 
@@ -84,6 +84,10 @@ class _FakeStreamsRedis:
     async def expire(self, name: str, time: int) -> bool:
         return name in self._keys or name in self._streams
 
+    async def publish(self, channel: str, message: str) -> int:
+        # No cancel watcher subscribes in these tests; is_cancelled reads the key.
+        return 0
+
     async def get(self, name: str) -> str | None:
         return self._keys.get(name)
 
@@ -106,6 +110,29 @@ class _FakeStreamsRedis:
             removed += self._streams.pop(name, None) is not None
         return removed
 
+    def pipeline(self, transaction: bool = True) -> "_FakePipeline":
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    """Queues commands and applies them in order on ``execute`` — one round trip."""
+
+    def __init__(self, client: _FakeStreamsRedis) -> None:
+        self._client = client
+        self._calls: list[tuple[Any, tuple[Any, ...], dict[str, Any]]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._client, name)
+
+        def queue(*args: Any, **kwargs: Any) -> "_FakePipeline":
+            self._calls.append((method, args, kwargs))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        return [await method(*args, **kwargs) for method, args, kwargs in self._calls]
+
 
 class _FakeGraph:
     """A CompiledAgentGraph stand-in whose astream() yields custom events.
@@ -136,6 +163,9 @@ async def _publish_full_stream(fake: _FakeStreamsRedis) -> None:
         await stream_manager.publish_chunk(STREAM_ID, "data: chunk-2\n\n")
         await stream_manager.publish_chunk(STREAM_ID, "data: chunk-3\n\n")
         await stream_manager.publish_chunk(STREAM_ID, STREAM_DONE_SIGNAL)
+        # Chunks are coalesced per publish window; land them while the fake is
+        # still the patched client.
+        await stream_manager.flush_publishers()
 
 
 class TestStreamResumeFromCursor:
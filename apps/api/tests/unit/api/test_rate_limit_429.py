@@ -60,9 +60,10 @@ async def test_rate_limit_exceeded_returns_429(
             new_callable=AsyncMock,
         ) as create,
     ):
-        # notes FREE = 30/day: usage 30 exhausts the window, so the real
-        # decision loop raises RateLimitExceededException.
-        fake_redis.get = AsyncMock(return_value="30")
+        # notes FREE = 30/day: the check-and-increment script reports the day
+        # window (index 1) exhausted at 30, so the real decision logic raises
+        # RateLimitExceededException.
+        fake_redis.redis.eval = AsyncMock(return_value=[1, 30, 30])
         response = await client.post(NOTES_BASE, json=_NOTE_BODY)
 
     assert response.status_code == 429
@@ -75,7 +76,7 @@ async def test_rate_limit_exceeded_returns_429(
     # The limiter read the pre-seeded usage for the authenticated FREE user
     # (the root conftest's subscription patch), and the handler never ran —
     # the 429 comes from the real decision logic, not from a raised mock.
-    assert fake_redis.get.await_count >= 1
+    assert fake_redis.redis.eval.await_count >= 1
     create.assert_not_awaited()
 
 
@@ -9,6 +9,7 @@ from unittest.mock import AsyncMock, patch
 from httpx import AsyncClient
 import pytest
 
+from app.constants.search import SEARCH_RESULTS_MAX_PAGE_SIZE, SEARCH_RESULTS_PAGE_SIZE
 from app.models.chat_models import MessageModel
 from app.models.search_models import MessageSearchResult, SearchResultsResponse
 from app.services.analytics_service import AnalyticsEvents
@@ -70,8 +71,31 @@ class TestSearchMessages:
         mock_search.assert_awaited_once_with(
             "test",
             "507f1f77bcf86cd799439011",  # pragma: allowlist secret
+            page=1,
+            limit=SEARCH_RESULTS_PAGE_SIZE,
         )
 
+    @patch(
+        "app.api.v1.endpoints.search.search_messages",
+        new_callable=AsyncMock,
+    )
+    async def test_search_passes_pagination(self, mock_search: AsyncMock, client: AsyncClient):
+        mock_search.return_value = SearchResultsResponse(
+            messages=[], conversations=[], notes=[], has_more=True
+        )
+        response = await client.get(
+            f"{SEARCH_BASE}/search", params={"query": "test", "page": 2, "limit": 5}
+        )
+        assert response.json()["has_more"] is True
+        assert mock_search.await_args.kwargs == {"page": 2, "limit": 5}
+
+    async def test_search_limit_above_max_returns_422(self, client: AsyncClient):
+        response = await client.get(
+            f"{SEARCH_BASE}/search",
+            params={"query": "test", "limit": SEARCH_RESULTS_MAX_PAGE_SIZE + 1},
+        )
+        assert response.status_code == 422
+
     async def test_search_missing_query_returns_422(self, client: AsyncClient):
         response = await client.get(f"{SEARCH_BASE}/search")
         assert response.status_code == 422
@@ -1,17 +1,18 @@
 """Tests for tiered rate limiter middleware."""
 
-from collections.abc import Coroutine
+import asyncio
+from collections.abc import AsyncIterator, Coroutine
 from datetime import UTC, datetime
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import ANY, AsyncMock, MagicMock, call, patch
 
+import fakeredis.aioredis
 import pytest
-import redis.asyncio as aioredis
 
 from app.api.v1.middleware.tiered_rate_limiter import (
     RateLimitExceededException,
     TieredRateLimiter,
 )
-from app.config.rate_limits import FeatureInfo, RateLimitPeriod
+from app.config.rate_limits import FeatureInfo, RateLimitConfig, RateLimitPeriod
 from app.decorators import tiered_rate_limit
 from app.models.payment_models import PlanType
 from app.models.usage_models import FeatureUsage, UsagePeriod
@@ -93,228 +94,143 @@ class TestTieredRateLimiterHelpers:
 
 @pytest.mark.asyncio
 class TestCheckAndIncrement:
-    def setup_method(self) -> None:
+    """Against fakeredis (with Lua): the check-and-increment script is what is
+    under test, and a mock would only echo the EVAL back."""
+
+    @pytest.fixture(autouse=True)
+    async def _fake_redis(self) -> AsyncIterator[None]:
+        self.fake_redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
         self.limiter = TieredRateLimiter()
-        self.limiter.redis = AsyncMock()
+        self.limiter.redis = MagicMock(redis=self.fake_redis)
+        with (
+            patch(
+                "app.api.v1.middleware.tiered_rate_limiter.get_reset_time",
+                return_value=datetime(2099, 4, 1, tzinfo=UTC),
+            ),
+            patch(
+                "app.api.v1.middleware.tiered_rate_limiter.get_time_window_key",
+                side_effect=lambda period: f"{period.value}-window",
+            ),
+            patch.object(self.limiter.usage_snapshots, "schedule") as self.schedule_snapshot,
+            patch(
+                "app.api.v1.middleware.tiered_rate_limiter.spawn_background_task",
+                side_effect=_noop_create_task,
+            ),
+        ):
+            yield
+        await self.fake_redis.aclose()
 
-    @patch("app.api.v1.middleware.tiered_rate_limiter.get_reset_time")
-    @patch("app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan")
-    @patch(
-        "app.api.v1.middleware.tiered_rate_limiter.get_time_window_key",
-        return_value="20260320",
-    )
-    async def test_under_limit_increments(
-        self,
-        mock_twk: MagicMock,
-        mock_limits: MagicMock,
-        mock_reset: MagicMock,
-    ) -> None:
-        """When usage is under the limit, it should increment and return usage info."""
-        from app.config.rate_limits import RateLimitConfig
+    def _key(self, period: RateLimitPeriod) -> str:
+        return self.limiter._get_redis_key("user1", "chat_messages", period)
+
+    async def _seed(self, day: int, month: int) -> None:
+        await self.fake_redis.set(self._key(RateLimitPeriod.DAY), day)
+        await self.fake_redis.set(self._key(RateLimitPeriod.MONTH), month)
+
+    async def _counts(self) -> tuple[int, int]:
+        day = await self.fake_redis.get(self._key(RateLimitPeriod.DAY))
+        month = await self.fake_redis.get(self._key(RateLimitPeriod.MONTH))
+        return int(day or 0), int(month or 0)
 
+    @patch("app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan")
+    async def test_under_limit_increments(self, mock_limits: MagicMock) -> None:
+        """Under both limits: both windows count the use; usage is pre-increment."""
         mock_limits.return_value = RateLimitConfig(day=100, month=1000)
-        mock_reset.return_value = datetime(2026, 4, 1, tzinfo=UTC)
-        self.limiter.redis.get = AsyncMock(return_value="5")
+        await self._seed(day=5, month=50)
 
-        # Mock pipeline
-        pipe_mock = AsyncMock()
-        pipe_mock.watch = AsyncMock()
-        pipe_mock.multi = MagicMock()
-        pipe_mock.incr = AsyncMock()
-        pipe_mock.expire = AsyncMock()
-        pipe_mock.execute = AsyncMock()
-        pipe_mock.__aenter__ = AsyncMock(return_value=pipe_mock)
-        pipe_mock.__aexit__ = AsyncMock(return_value=False)
-
-        redis_mock = MagicMock()
-        redis_mock.pipeline = MagicMock(return_value=pipe_mock)
-        self.limiter.redis.redis = redis_mock
-
-        with patch(
-            "app.api.v1.middleware.tiered_rate_limiter.spawn_background_task",
-            side_effect=_noop_create_task,
-        ):
-            result = await self.limiter.check_and_increment("user1", "chat_messages", PlanType.PRO)
+        result = await self.limiter.check_and_increment("user1", "chat_messages", PlanType.PRO)
 
-        assert "day" in result or "month" in result
+        assert result["day"].used == 5
+        assert result["day"].limit == 100
+        assert result["month"].used == 50
+        assert await self._counts() == (6, 51)
+        assert await self.fake_redis.ttl(self._key(RateLimitPeriod.DAY)) > 0
+        self.schedule_snapshot.assert_called_once_with("user1", "chat_messages", PlanType.PRO)
 
-    @patch("app.api.v1.middleware.tiered_rate_limiter.get_reset_time")
     @patch("app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan")
-    @patch(
-        "app.api.v1.middleware.tiered_rate_limiter.get_time_window_key",
-        return_value="20260320",
-    )
-    async def test_over_limit_raises(
-        self,
-        mock_twk: MagicMock,
-        mock_limits: MagicMock,
-        mock_reset: MagicMock,
-    ) -> None:
-        from app.config.rate_limits import RateLimitConfig
-
+    async def test_over_limit_raises(self, mock_limits: MagicMock) -> None:
         mock_limits.return_value = RateLimitConfig(day=10, month=100)
-        mock_reset.return_value = datetime(2026, 4, 1, tzinfo=UTC)
-        # Current usage already at limit
-        self.limiter.redis.get = AsyncMock(return_value="10")
+        await self._seed(day=10, month=10)
 
         with pytest.raises(RateLimitExceededException):
             await self.limiter.check_and_increment("user1", "chat_messages", PlanType.FREE)
 
-    @patch("app.api.v1.middleware.tiered_rate_limiter.get_reset_time")
     @patch("app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan")
-    @patch(
-        "app.api.v1.middleware.tiered_rate_limiter.get_time_window_key",
-        return_value="20260320",
-    )
-    async def test_zero_limit_counted_not_enforced(
-        self,
-        mock_twk: MagicMock,
-        mock_limits: MagicMock,
-        mock_reset: MagicMock,
+    async def test_exhausted_month_blocks_without_counting_day(
+        self, mock_limits: MagicMock
     ) -> None:
-        """A zero-limit period is still COUNTED (plain INCR, so usage charts have
-        data) but never enforced — it must not appear in the returned usage info."""
-        from app.config.rate_limits import RateLimitConfig
+        """One window over its limit blocks the use in every window — the day
+        counter must not creep up on calls the month window rejects."""
+        mock_limits.return_value = RateLimitConfig(day=10, month=100)
+        await self._seed(day=3, month=100)
+
+        with pytest.raises(RateLimitExceededException) as exc_info:
+            await self.limiter.check_and_increment("user1", "chat_messages", PlanType.PRO)
+
+        assert exc_info.value.detail["reset_time"]  # type: ignore[index]
+        assert await self._counts() == (3, 100)
 
+    @patch("app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan")
+    async def test_zero_limit_counted_not_enforced(self, mock_limits: MagicMock) -> None:
+        """A zero-limit period is still COUNTED (so usage charts have data) but
+        never enforced — it must not appear in the returned usage info."""
         # day=0 is counted-only; month=1000 is enforced.
         mock_limits.return_value = RateLimitConfig(day=0, month=1000)
-        mock_reset.return_value = datetime(2026, 4, 1, tzinfo=UTC)
-        self.limiter.redis.get = AsyncMock(return_value="5")
+        await self._seed(day=5000, month=5)
 
-        pipe_mock = AsyncMock()
-        pipe_mock.watch = AsyncMock()
-        pipe_mock.multi = MagicMock()
-        pipe_mock.incr = AsyncMock()
-        pipe_mock.expire = AsyncMock()
-        pipe_mock.execute = AsyncMock()
-        pipe_mock.__aenter__ = AsyncMock(return_value=pipe_mock)
-        pipe_mock.__aexit__ = AsyncMock(return_value=False)
-        redis_mock = MagicMock()
-        redis_mock.pipeline = MagicMock(return_value=pipe_mock)
-        redis_mock.incr = AsyncMock()
-        redis_mock.expire = AsyncMock()
-        self.limiter.redis.redis = redis_mock
-
-        with patch(
-            "app.api.v1.middleware.tiered_rate_limiter.spawn_background_task",
-            side_effect=_noop_create_task,
-        ):
-            result = await self.limiter.check_and_increment("user1", "chat_messages", PlanType.PRO)
+        result = await self.limiter.check_and_increment("user1", "chat_messages", PlanType.PRO)
 
-        # day period (limit=0) must be absent from enforcement info but still counted.
         assert "day" not in result
         assert "month" in result
-        redis_mock.incr.assert_awaited_once()
+        assert await self._counts() == (5001, 6)
 
-    @patch("app.api.v1.middleware.tiered_rate_limiter.get_reset_time")
     @patch("app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan")
-    @patch(
-        "app.api.v1.middleware.tiered_rate_limiter.get_time_window_key",
-        return_value="20260320",
-    )
-    async def test_no_redis_connection_raises(
-        self,
-        mock_twk: MagicMock,
-        mock_limits: MagicMock,
-        mock_reset: MagicMock,
-    ) -> None:
-        from app.config.rate_limits import RateLimitConfig
+    async def test_first_use_creates_counters(self, mock_limits: MagicMock) -> None:
+        mock_limits.return_value = RateLimitConfig(day=100, month=1000)
+
+        result = await self.limiter.check_and_increment("user1", "chat_messages", PlanType.PRO)
+
+        assert result["day"].used == 0
+        assert await self._counts() == (1, 1)
 
+    @patch("app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan")
+    async def test_no_redis_connection_raises(self, mock_limits: MagicMock) -> None:
         mock_limits.return_value = RateLimitConfig(day=100, month=1000)
-        mock_reset.return_value = datetime(2026, 4, 1, tzinfo=UTC)
-        self.limiter.redis.get = AsyncMock(return_value="5")
         self.limiter.redis.redis = None
 
         with pytest.raises(Exception, match="Redis connection not available"):
             await self.limiter.check_and_increment("user1", "chat_messages", PlanType.FREE)
 
-    @patch("app.api.v1.middleware.tiered_rate_limiter.get_reset_time")
     @patch("app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan")
-    @patch(
-        "app.api.v1.middleware.tiered_rate_limiter.get_time_window_key",
-        return_value="20260320",
-    )
-    async def test_watch_error_retries(
-        self,
-        mock_twk: MagicMock,
-        mock_limits: MagicMock,
-        mock_reset: MagicMock,
-    ) -> None:
-        """WatchError should cause a retry in the pipeline loop."""
-        from app.config.rate_limits import RateLimitConfig
-
-        mock_limits.return_value = RateLimitConfig(day=100, month=0)
-        mock_reset.return_value = datetime(2026, 4, 1, tzinfo=UTC)
-        self.limiter.redis.get = AsyncMock(return_value="5")
+    async def test_single_round_trip(self, mock_limits: MagicMock) -> None:
+        """The whole check-and-increment is one EVAL — no GETs, no WATCH retries."""
+        mock_limits.return_value = RateLimitConfig(day=100, month=1000)
+        client = MagicMock()
+        client.eval = AsyncMock(return_value=[0, 5, 50])
+        self.limiter.redis = MagicMock(redis=client)
 
-        pipe_mock = AsyncMock()
-        call_count = 0
-
-        async def watch_side_effect(*args: object, **kwargs: object) -> None:
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:
-                raise aioredis.WatchError()
-
-        pipe_mock.watch = AsyncMock(side_effect=watch_side_effect)
-        pipe_mock.multi = MagicMock()
-        pipe_mock.incr = AsyncMock()
-        pipe_mock.expire = AsyncMock()
-        pipe_mock.execute = AsyncMock()
-        pipe_mock.__aenter__ = AsyncMock(return_value=pipe_mock)
-        pipe_mock.__aexit__ = AsyncMock(return_value=False)
-
-        redis_mock = MagicMock()
-        redis_mock.pipeline = MagicMock(return_value=pipe_mock)
-        # month=0 takes the counted-not-enforced plain INCR path.
-        redis_mock.incr = AsyncMock()
-        redis_mock.expire = AsyncMock()
-        self.limiter.redis.redis = redis_mock
-
-        with patch(
-            "app.api.v1.middleware.tiered_rate_limiter.spawn_background_task",
-            side_effect=_noop_create_task,
-        ):
-            await self.limiter.check_and_increment("user1", "chat_messages", PlanType.FREE)
+        await self.limiter.check_and_increment("user1", "chat_messages", PlanType.PRO)
 
-        assert call_count == 2  # First attempt fails, second succeeds
+        client.eval.assert_awaited_once()
+        assert client.method_calls == [call.eval(ANY, 2, *[ANY] * 6)]
 
-    @patch("app.api.v1.middleware.tiered_rate_limiter.get_reset_time")
     @patch("app.api.v1.middleware.tiered_rate_limiter.get_limits_for_plan")
-    @patch(
-        "app.api.v1.middleware.tiered_rate_limiter.get_time_window_key",
-        return_value="20260320",
-    )
-    async def test_concurrent_limit_exceeded_in_pipeline(
-        self,
-        mock_twk: MagicMock,
-        mock_limits: MagicMock,
-        mock_reset: MagicMock,
-    ) -> None:
-        """If current val hits limit inside pipeline, it should raise."""
-        from app.config.rate_limits import RateLimitConfig
-
-        mock_limits.return_value = RateLimitConfig(day=10, month=0)
-        mock_reset.return_value = datetime(2026, 4, 1, tzinfo=UTC)
-        # First check returns 9 (under limit), but pipeline read returns 10
-        self.limiter.redis.get = AsyncMock(side_effect=["9", "10"])
-
-        pipe_mock = AsyncMock()
-        pipe_mock.watch = AsyncMock()
-        pipe_mock.unwatch = AsyncMock()
-        pipe_mock.__aenter__ = AsyncMock(return_value=pipe_mock)
-        pipe_mock.__aexit__ = AsyncMock(return_value=False)
-
-        redis_mock = MagicMock()
-        redis_mock.pipeline = MagicMock(return_value=pipe_mock)
-        self.limiter.redis.redis = redis_mock
-
-        with patch(
-            "app.api.v1.middleware.tiered_rate_limiter.spawn_background_task",
-            side_effect=_noop_create_task,
-        ):
-            with pytest.raises(RateLimitExceededException):
-                await self.limiter.check_and_increment("user1", "chat_messages", PlanType.FREE)
+    async def test_parallel_calls_never_exceed_limit(self, mock_limits: MagicMock) -> None:
+        """200 parallel calls from one user against a 50/day limit: exactly 50
+        get through and the counter lands on the limit, never past it."""
+        mock_limits.return_value = RateLimitConfig(day=50, month=1000)
+
+        async def _attempt() -> bool:
+            try:
+                await self.limiter.check_and_increment("user1", "chat_messages", PlanType.PRO)
+            except RateLimitExceededException:
+                return False
+            return True
+
+        results = await asyncio.gather(*[_attempt() for _ in range(200)])
+
+        assert sum(results) == 50
+        assert await self._counts() == (50, 50)
 
 
 # ---------------------------------------------------------------------------
@@ -70,12 +70,16 @@ def _expired_connection_event(
 
 @pytest.fixture
 def _accepted_delivery():
-    """Signature verified and the dedupe key unclaimed, so the body reaches the router."""
+    """Signature verified and the dedupe key unclaimed, so the body reaches the router.
+
+    Trigger events take the in-process path; ``TestQueuedIngestion`` covers the
+    stream."""
     redis = MagicMock()
     redis.client.set = AsyncMock(return_value=True)
     with (
         patch(f"{MODULE}.verify_composio_webhook_signature", AsyncMock()),
         patch(f"{MODULE}.redis_cache", redis),
+        patch(f"{MODULE}.COMPOSIO_WEBHOOK_QUEUE_ENABLED", False),
     ):
         yield
 
@@ -488,6 +492,40 @@ class TestTriggerEventRouting:
         spawn.assert_called_once()
 
 
+@pytest.mark.usefixtures("_accepted_delivery")
+class TestQueuedIngestion:
+    async def test_a_queued_event_is_acked_without_running_in_the_api(
+        self, unauthed_client: AsyncClient
+    ) -> None:
+        with (
+            patch(f"{MODULE}.COMPOSIO_WEBHOOK_QUEUE_ENABLED", True),
+            patch(f"{MODULE}.get_handler_by_event", return_value=MagicMock()),
+            patch(f"{MODULE}.enqueue_event", AsyncMock(return_value=True)) as enqueue,
+            patch(f"{MODULE}.spawn_logged_task") as spawn,
+        ):
+            response = await _post_event(unauthed_client, _trigger_event(), "queued-1")
+
+        assert response.json()["message"] == "Webhook accepted"
+        assert enqueue.await_args.args[0].trigger_nano_id == "trig-nano-1"
+        spawn.assert_not_called()
+
+    async def test_an_event_the_stream_refused_is_processed_in_process(
+        self, unauthed_client: AsyncClient
+    ) -> None:
+        """A Redis outage must not lose the event: the API runs it itself."""
+        with (
+            patch(f"{MODULE}.COMPOSIO_WEBHOOK_QUEUE_ENABLED", True),
+            patch(f"{MODULE}.get_handler_by_event", return_value=MagicMock()),
+            patch(f"{MODULE}.enqueue_event", AsyncMock(return_value=False)),
+            patch(f"{MODULE}.spawn_logged_task") as spawn,
+            patch(f"{MODULE}._process_webhook_event", MagicMock()),
+        ):
+            response = await _post_event(unauthed_client, _trigger_event(), "queued-2")
+
+        assert response.json()["message"] == "Webhook accepted"
+        spawn.assert_called_once()
+
+
 @pytest.mark.usefixtures("_accepted_delivery")
 class TestDeliveryWithoutAnId:
     async def test_a_delivery_with_no_id_header_is_processed_without_claiming_a_key(
@@ -18,8 +18,12 @@ def _boot_patches(mocker: MockerFixture) -> None:
     mocker.patch("app.core.lifespan.start_browser_reaper")
     mocker.patch("app.core.lifespan.start_revoke_listener")
     mocker.patch("app.core.lifespan.start_up_listener")
+    mocker.patch("app.core.lifespan.start_cancel_watcher")
+    mocker.patch("app.core.lifespan.start_routing_listener")
     mocker.patch("app.core.lifespan.unified_shutdown", new=mocker.AsyncMock())
     mocker.patch("app.core.lifespan.stop_up_listener", new=mocker.AsyncMock())
+    mocker.patch("app.core.lifespan.stop_cancel_watcher", new=mocker.AsyncMock())
+    mocker.patch("app.core.lifespan.stop_routing_listener", new=mocker.AsyncMock())
     mocker.patch("app.core.lifespan.stop_revoke_listener", new=mocker.AsyncMock())
     mocker.patch("app.core.lifespan.stop_browser_reaper")
     mocker.patch("app.core.lifespan._CONTEXT_EXECUTOR.shutdown")
@@ -0,0 +1,127 @@
+"""Unit tests for the per-process stream cancellation watcher.
+
+Run against fakeredis so the pub/sub delivery and the signal-key fallbacks are
+real: the per-chunk ``is_cancelled`` check must stop costing a Redis GET per
+token, and a cancel from any process must still stop the turn promptly.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+import time
+from unittest.mock import patch
+
+import fakeredis.aioredis
+import pytest
+
+from app.constants.cache import STREAM_CANCEL_CHANNEL, STREAM_SIGNAL_PREFIX
+from app.core import stream_cancel_watcher
+from app.core.stream_manager import StreamManager
+from app.db.redis import redis_cache
+
+CHUNKS_PER_TURN = 2_000
+
+
+async def _wait_subscribed() -> None:
+    for _ in range(200):
+        if stream_cancel_watcher._subscribed:
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("cancel watcher never subscribed")
+
+
+class _CountingRedis(fakeredis.aioredis.FakeRedis):
+    """FakeRedis that counts GET round trips."""
+
+    gets = 0
+
+    async def get(self, name):  # type: ignore[no-untyped-def, override]
+        type(self).gets += 1
+        return await super().get(name)
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[_CountingRedis]:
+    _CountingRedis.gets = 0
+    fake = _CountingRedis(decode_responses=True)
+    with patch.object(redis_cache, "redis", fake):
+        yield fake
+        await stream_cancel_watcher.stop_cancel_watcher()
+    await fake.flushall()
+    await fake.connection_pool.disconnect()
+
+
+async def _turn(stream_id: str) -> int:
+    """Drive one turn's worth of per-chunk checks; the GETs it cost."""
+    before = _CountingRedis.gets
+    for _ in range(CHUNKS_PER_TURN):
+        assert await StreamManager.is_cancelled(stream_id) is False
+    return _CountingRedis.gets - before
+
+
+async def test_watcher_removes_per_chunk_gets(client: _CountingRedis) -> None:
+    legacy_gets = await _turn("legacy")
+    assert legacy_gets == CHUNKS_PER_TURN
+
+    stream_cancel_watcher.start_cancel_watcher()
+    await _wait_subscribed()
+    watched_gets = await _turn("watched")
+    # One GET when the watch is registered, then memory only.
+    assert watched_gets == 1
+
+
+async def test_cancel_reaches_watched_stream_within_100ms(client: _CountingRedis) -> None:
+    stream_cancel_watcher.start_cancel_watcher()
+    await _wait_subscribed()
+    await StreamManager.start_stream("s1", "conv-1", "user-1")
+    assert await StreamManager.is_cancelled("s1") is False
+
+    # The cancel comes from another process: the key write and the channel
+    # publish ``cancel_stream`` does, without this process's local mark.
+    started = time.monotonic()
+    await redis_cache.set(f"{STREAM_SIGNAL_PREFIX}s1", "cancelled")
+    await client.publish(STREAM_CANCEL_CHANNEL, "s1")
+    while not await StreamManager.is_cancelled("s1"):
+        assert time.monotonic() - started < 0.1
+        await asyncio.sleep(0.001)
+
+
+async def test_watch_registered_after_cancel_reads_signal_key(client: _CountingRedis) -> None:
+    stream_cancel_watcher.start_cancel_watcher()
+    await _wait_subscribed()
+    await redis_cache.set(f"{STREAM_SIGNAL_PREFIX}s1", "cancelled")
+
+    assert await StreamManager.is_cancelled("s1") is True
+
+
+async def test_reconcile_catches_missed_publish(client: _CountingRedis) -> None:
+    stream_cancel_watcher.start_cancel_watcher()
+    await _wait_subscribed()
+    assert await StreamManager.is_cancelled("s1") is False
+
+    # Key written, message lost.
+    await redis_cache.set(f"{STREAM_SIGNAL_PREFIX}s1", "cancelled")
+    assert await StreamManager.is_cancelled("s1") is False
+
+    await stream_cancel_watcher._reconcile()
+    assert await StreamManager.is_cancelled("s1") is True
+
+
+async def test_cleanup_forgets_watch(client: _CountingRedis) -> None:
+    stream_cancel_watcher.start_cancel_watcher()
+    await _wait_subscribed()
+    await StreamManager.start_stream("s1", "conv-1", "user-1")
+    await StreamManager.is_cancelled("s1")
+    assert "s1" in stream_cancel_watcher._watches
+
+    await StreamManager.cleanup("s1")
+    assert "s1" not in stream_cancel_watcher._watches
+
+
+async def test_falls_back_to_get_once_stopped(client: _CountingRedis) -> None:
+    stream_cancel_watcher.start_cancel_watcher()
+    await _wait_subscribed()
+    await stream_cancel_watcher.stop_cancel_watcher()
+
+    assert await stream_cancel_watcher.is_cancelled("s1") is None
+    await redis_cache.set(f"{STREAM_SIGNAL_PREFIX}s1", "cancelled")
+    assert await StreamManager.is_cancelled("s1") is True
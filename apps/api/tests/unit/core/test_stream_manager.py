@@ -6,19 +6,25 @@ lines, cursor resume, control signals, keepalives), cancel, is_cancelled,
 get_active_stream_id, progress tracking, and error recording.
 """
 
-from collections.abc import Generator
+import asyncio
+from collections.abc import AsyncIterator, Generator
 from dataclasses import asdict
 import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import fakeredis.aioredis
 import pytest
 
 from app.constants.cache import (
     STREAM_ACTIVE_PREFIX,
+    STREAM_CANCEL_CHANNEL,
     STREAM_EVENTS_MAXLEN,
     STREAM_EVENTS_PREFIX,
+    STREAM_PROGRESS_ENTRIES_PREFIX,
+    STREAM_PROGRESS_FIELDS_PREFIX,
     STREAM_PROGRESS_PREFIX,
+    STREAM_PROGRESS_TEXT_PREFIX,
     STREAM_SIGNAL_PREFIX,
     STREAM_TTL,
 )
@@ -28,6 +34,7 @@ from app.constants.streaming import (
     STREAM_ERROR_SIGNAL,
 )
 from app.core.stream_manager import StreamManager, StreamProgress
+from app.db.redis import redis_cache
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -35,6 +42,10 @@ from app.core.stream_manager import StreamManager, StreamProgress
 
 EVENTS_KEY = f"{STREAM_EVENTS_PREFIX}s1"
 ACTIVE_KEY = f"{STREAM_ACTIVE_PREFIX}user-1:conv-1"
+PROGRESS_KEY = f"{STREAM_PROGRESS_PREFIX}s1"
+TEXT_KEY = f"{STREAM_PROGRESS_TEXT_PREFIX}s1"
+FIELDS_KEY = f"{STREAM_PROGRESS_FIELDS_PREFIX}s1"
+ENTRIES_KEY = f"{STREAM_PROGRESS_ENTRIES_PREFIX}s1"
 
 XReadBatch = list[tuple[str, list[tuple[str, dict[str, str]]]]]
 
@@ -67,10 +78,16 @@ def _entries_batch(*entries: tuple[str, str]) -> XReadBatch:
 
 
 def _stream_client(xread_batches: list[XReadBatch] | None = None) -> MagicMock:
-    """Mock redis.asyncio client exposing the Streams commands StreamManager uses."""
+    """Mock redis.asyncio client exposing the Streams commands StreamManager uses.
+
+    Appends go through a non-transactional pipeline; ``client.pipe`` is that
+    pipeline, whose queued ``xadd``/``expire`` calls are what the tests assert.
+    """
     client = MagicMock()
-    client.xadd = AsyncMock()
-    client.expire = AsyncMock()
+    client.pipe = MagicMock()
+    client.pipe.execute = AsyncMock(return_value=[])
+    client.pipeline = MagicMock(return_value=client.pipe)
+    client.publish = AsyncMock(return_value=0)
     if xread_batches is not None:
         client.xread = AsyncMock(side_effect=xread_batches)
     return client
@@ -183,13 +200,13 @@ class TestCompleteStream:
         self.mock_delete.assert_awaited_once_with(ACTIVE_KEY)
 
         # DONE signal appended to the event log with retention + TTL
-        self.mock_redis_client.xadd.assert_awaited_once_with(
+        self.mock_redis_client.pipe.xadd.assert_called_once_with(
             EVENTS_KEY,
             {"data": STREAM_DONE_SIGNAL},
             maxlen=STREAM_EVENTS_MAXLEN,
             approximate=True,
         )
-        self.mock_redis_client.expire.assert_awaited_once_with(EVENTS_KEY, STREAM_TTL)
+        self.mock_redis_client.pipe.expire.assert_called_once_with(EVENTS_KEY, STREAM_TTL)
 
     async def test_appends_done_even_when_progress_missing(self) -> None:
         self.mock_get.return_value = None
@@ -199,7 +216,7 @@ class TestCompleteStream:
         self.mock_set.assert_not_awaited()
         self.mock_delete.assert_not_awaited()
         # but the DONE signal should still be appended
-        self.mock_redis_client.xadd.assert_awaited_once()
+        self.mock_redis_client.pipe.xadd.assert_called_once()
 
 
 # ---------------------------------------------------------------------------
@@ -302,8 +319,9 @@ class TestPublishChunk:
 
     async def test_appends_chunk_to_event_log(self) -> None:
         await StreamManager.publish_chunk("s1", "data: hello\n\n")
+        await StreamManager.flush_publishers()
 
-        self.mock_redis_client.xadd.assert_awaited_once_with(
+        self.mock_redis_client.pipe.xadd.assert_called_once_with(
             EVENTS_KEY,
             {"data": "data: hello\n\n"},
             maxlen=STREAM_EVENTS_MAXLEN,
@@ -312,8 +330,9 @@ class TestPublishChunk:
 
     async def test_refreshes_event_log_ttl(self) -> None:
         await StreamManager.publish_chunk("s1", "data: hello\n\n")
+        await StreamManager.flush_publishers()
 
-        self.mock_redis_client.expire.assert_awaited_once_with(EVENTS_KEY, STREAM_TTL)
+        self.mock_redis_client.pipe.expire.assert_called_once_with(EVENTS_KEY, STREAM_TTL)
 
     async def test_noop_when_redis_unavailable(self) -> None:
         with patch(
@@ -323,6 +342,55 @@ class TestPublishChunk:
             # Should not raise
             await StreamManager.publish_chunk("s1", "data: hello\n\n")
 
+    async def test_chunks_within_a_window_share_one_pipeline(self) -> None:
+        """A burst of tokens is one round trip with one TTL refresh, in order."""
+        for i in range(5):
+            await StreamManager.publish_chunk("s1", f"data: {i}\n\n")
+        self.mock_redis_client.pipe.execute.assert_not_awaited()
+
+        await StreamManager.flush_publishers()
+
+        pipe = self.mock_redis_client.pipe
+        pipe.execute.assert_awaited_once()
+        assert [c.args[1]["data"] for c in pipe.xadd.call_args_list] == [
+            f"data: {i}\n\n" for i in range(5)
+        ]
+        pipe.expire.assert_called_once_with(EVENTS_KEY, STREAM_TTL)
+
+    async def test_window_flushes_on_its_own(self) -> None:
+        with patch("app.core.stream_manager.STREAM_PUBLISH_FLUSH_INTERVAL_SECONDS", 0.001):
+            await StreamManager.publish_chunk("s1", "data: hello\n\n")
+            await asyncio.sleep(0.05)
+
+        self.mock_redis_client.pipe.execute.assert_awaited_once()
+
+    async def test_full_batch_flushes_immediately(self) -> None:
+        with patch("app.core.stream_manager.STREAM_PUBLISH_MAX_BATCH", 3):
+            for i in range(3):
+                await StreamManager.publish_chunk("s1", f"data: {i}\n\n")
+
+        self.mock_redis_client.pipe.execute.assert_awaited_once()
+        assert self.mock_redis_client.pipe.xadd.call_count == 3
+
+    async def test_control_signal_flushes_pending_chunks_first(self) -> None:
+        self.mock_redis_client.pipe.xadd.reset_mock()
+        await StreamManager.publish_chunk("s1", "data: last\n\n")
+        with patch(
+            "app.core.stream_manager.redis_cache",
+            new=MagicMock(
+                get=AsyncMock(return_value=None),
+                set=AsyncMock(),
+                delete=AsyncMock(),
+                redis=self.mock_redis_client,
+            ),
+        ):
+            await StreamManager.complete_stream("s1")
+
+        assert [c.args[1]["data"] for c in self.mock_redis_client.pipe.xadd.call_args_list] == [
+            "data: last\n\n",
+            STREAM_DONE_SIGNAL,
+        ]
+
 
 # ---------------------------------------------------------------------------
 # subscribe_stream
@@ -526,7 +594,7 @@ class TestCancelStream:
     async def test_appends_cancelled_signal(self) -> None:
         await StreamManager.cancel_stream("s1")
 
-        self.mock_redis_client.xadd.assert_awaited_once_with(
+        self.mock_redis_client.pipe.xadd.assert_called_once_with(
             EVENTS_KEY,
             {"data": STREAM_CANCELLED_SIGNAL},
             maxlen=STREAM_EVENTS_MAXLEN,
@@ -544,7 +612,12 @@ class TestCancelStream:
         assert self.mock_set.await_count == 1
         self.mock_delete.assert_not_awaited()
         # Cancelled signal still appended so subscribers terminate
-        self.mock_redis_client.xadd.assert_awaited_once()
+        self.mock_redis_client.pipe.xadd.assert_called_once()
+
+    async def test_publishes_to_cancel_watchers(self) -> None:
+        await StreamManager.cancel_stream("s1")
+
+        self.mock_redis_client.publish.assert_awaited_once_with(STREAM_CANCEL_CHANNEL, "s1")
 
 
 # ---------------------------------------------------------------------------
@@ -588,62 +661,72 @@ class TestIsCancelled:
 
 
 class TestUpdateProgress:
+    """Against fakeredis: the append-only layout (APPEND / HSET / RPUSH side keys)
+    is what is under test, and a mock would only echo the calls back."""
+
     @pytest.fixture(autouse=True)
-    def _patch_redis(self) -> Generator[None, None, None]:
-        self.progress = _progress_dict()
-        self.mock_get = AsyncMock(return_value=self.progress)
-        self.mock_set = AsyncMock()
-        patcher = patch(
-            "app.core.stream_manager.redis_cache",
-            # ``redis`` must be async: update_progress also refreshes the resume
-            # index through it (see _refresh_active_index). TTL behaviour itself
-            # is covered against a real client in tests/unit/core/test_stream_resume.py.
-            new=MagicMock(get=self.mock_get, set=self.mock_set, redis=AsyncMock()),
-        )
-        patcher.start()
-        yield
-        patcher.stop()
+    async def _fake_redis(self) -> AsyncIterator[fakeredis.aioredis.FakeRedis]:
+        self.client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        with patch.object(redis_cache, "redis", self.client):
+            await StreamManager.start_stream("s1", "conv-1", "user-1")
+            yield self.client
+        await self.client.flushall()
+        await self.client.connection_pool.disconnect()
 
     async def test_appends_message_chunk(self) -> None:
-        self.progress["complete_message"] = "Hello "
+        await StreamManager.update_progress("s1", message_chunk="Hello ")
         await StreamManager.update_progress("s1", message_chunk="World")
 
-        saved = self.mock_set.call_args[0][1]
-        assert saved["complete_message"] == "Hello World"
+        progress = await StreamManager.get_progress("s1")
+        assert progress is not None
+        assert progress["complete_message"] == "Hello World"
+
+    async def test_text_is_appended_not_rewritten(self) -> None:
+        """The metadata blob is never rewritten by a text delta — that rewrite
+        was the quadratic cost this layout removes."""
+        before = await self.client.get(PROGRESS_KEY)
+        await StreamManager.update_progress("s1", message_chunk="x" * 10_000)
+
+        assert await self.client.get(PROGRESS_KEY) == before
+        assert await self.client.get(TEXT_KEY) == "x" * 10_000
 
     async def test_merges_tool_data(self) -> None:
-        self.progress["tool_data"] = {"existing": "data"}
+        await StreamManager.update_progress("s1", tool_data={"existing": "data"})
         await StreamManager.update_progress("s1", tool_data={"new_key": "new_value"})
 
-        saved = self.mock_set.call_args[0][1]
-        assert saved["tool_data"]["existing"] == "data"
-        assert saved["tool_data"]["new_key"] == "new_value"
+        progress = await StreamManager.get_progress("s1")
+        assert progress is not None
+        assert progress["tool_data"]["existing"] == "data"
+        assert progress["tool_data"]["new_key"] == "new_value"
 
     async def test_merges_tool_data_arrays(self) -> None:
-        """When both existing and new have 'tool_data' key, arrays are concatenated."""
-        self.progress["tool_data"] = {"tool_data": [{"id": 1}]}
+        """``tool_data`` lists are concatenated across updates, in order."""
+        await StreamManager.update_progress("s1", tool_data={"tool_data": [{"id": 1}]})
         await StreamManager.update_progress("s1", tool_data={"tool_data": [{"id": 2}]})
 
-        saved = self.mock_set.call_args[0][1]
-        assert saved["tool_data"]["tool_data"] == [{"id": 1}, {"id": 2}]
+        progress = await StreamManager.get_progress("s1")
+        assert progress is not None
+        assert progress["tool_data"]["tool_data"] == [{"id": 1}, {"id": 2}]
 
     async def test_noop_when_progress_missing(self) -> None:
-        self.mock_get.return_value = None
+        await self.client.delete(PROGRESS_KEY)
         await StreamManager.update_progress("s1", message_chunk="hello")
-        self.mock_set.assert_not_awaited()
 
-    async def test_no_update_when_no_chunk_or_tool_data(self) -> None:
-        """Even with empty args, set is still called (progress_data exists)."""
+        assert await StreamManager.get_progress("s1") is None
+        assert await self.client.exists(TEXT_KEY) == 0
+
+    async def test_refreshes_ttls_without_payload(self) -> None:
+        await self.client.expire(PROGRESS_KEY, 5)
         await StreamManager.update_progress("s1")
-        # set is still called because progress_data was found
-        self.mock_set.assert_awaited_once()
+
+        assert await self.client.ttl(PROGRESS_KEY) > 5
 
     async def test_message_chunk_appends_to_empty(self) -> None:
-        self.progress["complete_message"] = ""
         await StreamManager.update_progress("s1", message_chunk="first")
 
-        saved = self.mock_set.call_args[0][1]
-        assert saved["complete_message"] == "first"
+        progress = await StreamManager.get_progress("s1")
+        assert progress is not None
+        assert progress["complete_message"] == "first"
 
 
 # ---------------------------------------------------------------------------
@@ -652,27 +735,37 @@ class TestUpdateProgress:
 
 
 class TestGetProgress:
+    @pytest.fixture(autouse=True)
+    async def _fake_redis(self) -> AsyncIterator[fakeredis.aioredis.FakeRedis]:
+        self.client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+        with patch.object(redis_cache, "redis", self.client):
+            yield self.client
+        await self.client.flushall()
+        await self.client.connection_pool.disconnect()
+
     async def test_returns_progress_data(self) -> None:
-        expected = _progress_dict()
-        mock_get = AsyncMock(return_value=expected)
-        with patch(
-            "app.core.stream_manager.redis_cache",
-            new=MagicMock(get=mock_get),
-        ):
-            result = await StreamManager.get_progress("s1")
+        await StreamManager.start_stream("s1", "conv-1", "user-1")
+
+        result = await StreamManager.get_progress("s1")
 
-        assert result == expected
-        mock_get.assert_awaited_once_with(f"{STREAM_PROGRESS_PREFIX}s1")
+        assert result is not None
+        assert result["conversation_id"] == "conv-1"
+        assert result["user_id"] == "user-1"
+        assert result["complete_message"] == ""
+        assert result["tool_data"] == {}
 
     async def test_returns_none_when_not_found(self) -> None:
-        mock_get = AsyncMock(return_value=None)
-        with patch(
-            "app.core.stream_manager.redis_cache",
-            new=MagicMock(get=mock_get),
-        ):
-            result = await StreamManager.get_progress("s1")
+        assert await StreamManager.get_progress("s1") is None
 
-        assert result is None
+    async def test_cleanup_removes_side_keys(self) -> None:
+        await StreamManager.start_stream("s1", "conv-1", "user-1")
+        await StreamManager.update_progress(
+            "s1", message_chunk="hi", tool_data={"tool_data": [{"id": 1}], "k": "v"}
+        )
+
+        await StreamManager.cleanup("s1")
+
+        assert await self.client.exists(TEXT_KEY, FIELDS_KEY, ENTRIES_KEY) == 0
 
 
 # ---------------------------------------------------------------------------
@@ -706,7 +799,7 @@ class TestSetError:
         saved = self.mock_set.call_args[0][1]
         assert saved["error"] == "kaboom"
 
-        self.mock_redis_client.xadd.assert_awaited_once_with(
+        self.mock_redis_client.pipe.xadd.assert_called_once_with(
             EVENTS_KEY,
             {"data": STREAM_ERROR_SIGNAL},
             maxlen=STREAM_EVENTS_MAXLEN,
@@ -719,4 +812,4 @@ class TestSetError:
 
         self.mock_set.assert_not_awaited()
         # Error signal should still be appended
-        self.mock_redis_client.xadd.assert_awaited_once()
+        self.mock_redis_client.pipe.xadd.assert_called_once()
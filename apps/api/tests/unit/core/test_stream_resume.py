@@ -69,6 +69,8 @@ async def _keep_streaming() -> None:
     """One more chunk of a turn that is still very much alive."""
     await StreamManager.update_progress(SID, "still working ")
     await StreamManager.publish_chunk(SID, 'data: {"response": "still working "}\n\n')
+    # Publishes are coalesced per window; land this one before inspecting TTLs.
+    await StreamManager.flush_publishers()
 
 
 class TestActiveIndexLifetime:
@@ -0,0 +1,80 @@
+"""Unit tests for the workflow routing invalidation listener.
+
+Run against fakeredis so the pub/sub delivery is real: a routing write in one
+process must evict the route everywhere else.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from unittest.mock import AsyncMock, patch
+
+import fakeredis.aioredis
+import pytest
+
+from app.constants.cache import WORKFLOW_ROUTING_CHANNEL
+from app.core import workflow_routing_listener
+from app.db.redis import redis_cache
+from app.db.repositories.workflow_routing import routing_table
+
+
+async def _until(condition: Callable[[], bool]) -> None:
+    for _ in range(200):
+        if condition():
+            return
+        await asyncio.sleep(0.005)
+    raise AssertionError("condition never held")
+
+
+@pytest.fixture
+async def client() -> AsyncIterator[fakeredis.aioredis.FakeRedis]:
+    fake = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    with (
+        patch.object(redis_cache, "redis", fake),
+        patch.object(workflow_routing_listener, "WORKFLOW_ROUTING_CACHE_ENABLED", True),
+        patch.object(
+            workflow_routing_listener.workflow_repository,
+            "warm_composio_routes",
+            AsyncMock(return_value=0),
+        ) as warm,
+    ):
+        yield fake
+        await workflow_routing_listener.stop_routing_listener()
+        assert warm.await_count >= 1
+    await fake.connection_pool.disconnect()
+
+
+async def test_the_table_answers_only_while_subscribed(
+    client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    assert routing_table.live is False
+
+    workflow_routing_listener.start_routing_listener()
+    await _until(lambda: routing_table.live)
+    await workflow_routing_listener.stop_routing_listener()
+
+    assert routing_table.live is False
+
+
+async def test_another_processes_invalidation_evicts_the_route(
+    client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    workflow_routing_listener.start_routing_listener()
+    await _until(lambda: routing_table.live)
+    routing_table.put_many({"ti_1": [], "ti_2": []}, routing_table.epoch)
+
+    await client.publish(WORKFLOW_ROUTING_CHANNEL, '{"workflows": [], "triggers": ["ti_1"]}')
+
+    await _until(lambda: len(routing_table) == 1)
+    assert routing_table.get_many(["ti_2"])[1] == []
+
+
+async def test_an_unreadable_message_clears_the_table(
+    client: fakeredis.aioredis.FakeRedis,
+) -> None:
+    workflow_routing_listener.start_routing_listener()
+    await _until(lambda: routing_table.live)
+    routing_table.put_many({"ti_1": []}, routing_table.epoch)
+
+    await client.publish(WORKFLOW_ROUTING_CHANNEL, "not json")
+
+    await _until(lambda: len(routing_table) == 0)
@@ -0,0 +1,110 @@
+"""Unit tests for the process-wide query-embedding cache.
+
+A discovery embeds the same query for several collections at once and agents
+repeat intents across turns; both must cost one embedding call.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from langchain_core.embeddings import Embeddings
+import pytest
+
+from app.db.chroma.query_embedding_cache import QueryEmbeddingCache
+
+
+class _CountingEmbeddings(Embeddings):
+    def __init__(self, delay: float = 0.0, fail: bool = False) -> None:
+        self.calls: list[str] = []
+        self.delay = delay
+        self.fail = fail
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        raise NotImplementedError
+
+    def embed_query(self, text: str) -> list[float]:
+        raise NotImplementedError
+
+    async def aembed_query(self, text: str) -> list[float]:
+        self.calls.append(text)
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("embedding API down")
+        return [float(len(text)), float(len(self.calls))]
+
+
+async def test_repeat_query_is_served_from_cache() -> None:
+    cache, embeddings = QueryEmbeddingCache(), _CountingEmbeddings()
+
+    first = await cache.aembed(embeddings, "send an email")
+    second = await cache.aembed(embeddings, "send an email")
+
+    assert first == second
+    assert embeddings.calls == ["send an email"]
+
+
+async def test_concurrent_requests_share_one_call() -> None:
+    cache, embeddings = QueryEmbeddingCache(), _CountingEmbeddings(delay=0.01)
+
+    results = await asyncio.gather(*(cache.aembed(embeddings, "create event") for _ in range(5)))
+
+    assert embeddings.calls == ["create event"]
+    assert all(result == results[0] for result in results)
+
+
+async def test_cancelled_caller_does_not_cancel_shared_call() -> None:
+    cache, embeddings = QueryEmbeddingCache(), _CountingEmbeddings(delay=0.02)
+
+    leader = asyncio.create_task(cache.aembed(embeddings, "q"))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.aembed(embeddings, "q"))
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await follower == [1.0, 1.0]
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_entries_expire() -> None:
+    cache, embeddings = QueryEmbeddingCache(ttl=60), _CountingEmbeddings()
+
+    with patch("app.db.chroma.query_embedding_cache.time.monotonic", return_value=0.0):
+        await cache.aembed(embeddings, "q")
+    with patch("app.db.chroma.query_embedding_cache.time.monotonic", return_value=61.0):
+        await cache.aembed(embeddings, "q")
+
+    assert embeddings.calls == ["q", "q"]
+
+
+async def test_least_recently_used_is_evicted() -> None:
+    cache, embeddings = QueryEmbeddingCache(max_size=2), _CountingEmbeddings()
+
+    await cache.aembed(embeddings, "a")
+    await cache.aembed(embeddings, "b")
+    await cache.aembed(embeddings, "a")
+    await cache.aembed(embeddings, "c")
+    await cache.aembed(embeddings, "a")
+    await cache.aembed(embeddings, "b")
+
+    assert embeddings.calls == ["a", "b", "c", "b"]
+
+
+async def test_models_do_not_share_entries() -> None:
+    cache = QueryEmbeddingCache()
+    first, second = _CountingEmbeddings(), _CountingEmbeddings()
+
+    await cache.aembed(first, "q")
+    await cache.aembed(second, "q")
+
+    assert first.calls == ["q"]
+    assert second.calls == ["q"]
+
+
+async def test_failures_are_not_cached() -> None:
+    cache, embeddings = QueryEmbeddingCache(), _CountingEmbeddings(fail=True)
+
+    with pytest.raises(RuntimeError):
+        await cache.aembed(embeddings, "q")
+    embeddings.fail = False
+    assert await cache.aembed(embeddings, "q") == [1.0, 2.0]
@@ -0,0 +1,128 @@
+"""Unit tests for the tools/triggers store embedding backends."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from langchain_core.embeddings import Embeddings
+from langgraph.store.base import PutOp
+import numpy as np
+import pytest
+
+from app.constants.chroma import TOOLS_COLLECTION, TRIGGERS_COLLECTION
+from app.constants.memory import EMBEDDING_DIM
+from app.db.chroma import tool_embeddings
+from app.db.chroma.chroma_store import ChromaStore
+from app.db.chroma.tool_embeddings import (
+    GOOGLE_EMBEDDING_DIM,
+    create_tool_store,
+    get_tool_embeddings,
+    local_embeddings,
+    tool_collection_name,
+)
+
+
+class _RecordingEmbeddings(Embeddings):
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        self.calls.append("documents")
+        return [[1.0, 0.0] for _ in texts]
+
+    def embed_query(self, text: str) -> list[float]:
+        self.calls.append("query")
+        return [0.0, 1.0]
+
+
+def test_google_keeps_the_historical_collection_names() -> None:
+    assert tool_collection_name(TOOLS_COLLECTION, "google") == "langgraph_tools_store"
+    assert tool_collection_name(TRIGGERS_COLLECTION, "google") == "langgraph_triggers_store"
+
+
+def test_other_backends_get_their_own_collection() -> None:
+    assert tool_collection_name(TOOLS_COLLECTION, "local") == "langgraph_tools_store_local"
+
+
+def test_unknown_backend_is_rejected() -> None:
+    with pytest.raises(ValueError, match="openai"):
+        tool_collection_name(TOOLS_COLLECTION, "openai")
+
+
+async def test_local_backend_uses_the_memory_embedding_model() -> None:
+    embeddings, dims = await get_tool_embeddings("local")
+
+    assert embeddings is local_embeddings
+    assert dims == EMBEDDING_DIM
+
+
+async def test_google_backend_uses_the_gemini_provider() -> None:
+    gemini = MagicMock()
+    with patch.object(tool_embeddings.providers, "aget", AsyncMock(return_value=gemini)):
+        embeddings, dims = await get_tool_embeddings("google")
+
+    assert embeddings is gemini
+    assert dims == GOOGLE_EMBEDDING_DIM
+
+
+async def test_google_backend_without_provider_raises() -> None:
+    with (
+        patch.object(tool_embeddings.providers, "aget", AsyncMock(return_value=None)),
+        pytest.raises(RuntimeError),
+    ):
+        await get_tool_embeddings("google")
+
+
+async def test_local_embeddings_split_queries_from_passages() -> None:
+    with (
+        patch.object(
+            tool_embeddings.memory_embeddings,
+            "embed_query",
+            AsyncMock(return_value=np.array([0.5], dtype=np.float32)),
+        ) as embed_query,
+        patch.object(
+            tool_embeddings.memory_embeddings,
+            "embed_batch",
+            AsyncMock(return_value=np.array([[0.25]], dtype=np.float32)),
+        ) as embed_batch,
+    ):
+        assert await local_embeddings.aembed_query("send an email") == [0.5]
+        assert await local_embeddings.aembed_documents(["Sends an email"]) == [[0.25]]
+
+    embed_query.assert_awaited_once_with("send an email")
+    embed_batch.assert_awaited_once_with(["Sends an email"])
+
+
+async def test_create_local_store() -> None:
+    with (
+        patch.object(
+            tool_embeddings.memory_embeddings, "_sidecar_url", return_value="http://sidecar"
+        ),
+        patch.object(tool_embeddings.memory_embeddings, "_get_embedding_model") as load,
+    ):
+        store = await create_tool_store(MagicMock(), TOOLS_COLLECTION, ["description"], "local")
+
+    # The sidecar serves embeddings, so the process does not load the model.
+    load.assert_not_called()
+    assert store.collection_name == "langgraph_tools_store_local"
+    assert store.embeddings is local_embeddings
+    assert store._passage_documents
+
+
+@pytest.mark.parametrize(("passages", "expected"), [(True, "documents"), (False, "query")])
+async def test_upsert_embedding_kind(passages: bool, expected: str) -> None:
+    embeddings = _RecordingEmbeddings()
+    store = ChromaStore(
+        MagicMock(),
+        "tools",
+        index={"embed": embeddings, "dims": 2, "fields": ["description"]},
+        embed_documents_as_passages=passages,
+    )
+    collection = AsyncMock()
+
+    await store._upsert_item(
+        "general::send_email",
+        PutOp(namespace=("general",), key="send_email", value={"description": "Sends an email"}),
+        collection,
+    )
+
+    assert embeddings.calls == [expected]
+    collection.upsert.assert_awaited_once()
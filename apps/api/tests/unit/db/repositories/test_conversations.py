@@ -19,7 +19,7 @@ import pytest
 
 from app.db.repositories.cache import CachePolicy
 from app.db.repositories.conversations import ConversationRepository
-from app.models.chat_models import ToolDataEntry
+from app.models.chat_models import MessageModel, ToolDataEntry
 
 CONVERSATION_ID = "conv-1"
 USER_ID = "user-1"
@@ -41,6 +41,18 @@ def collection() -> Iterator[MagicMock]:
         yield mock
 
 
+@pytest.fixture(autouse=True)
+def search_index() -> Iterator[MagicMock]:
+    """The Postgres keyword index the message writes mirror into."""
+    with patch("app.db.repositories.conversations.message_search") as index:
+        index.index_messages = AsyncMock()
+        index.set_response = AsyncMock()
+        index.delete_conversations = AsyncMock()
+        index.prune_conversation = AsyncMock()
+        index.delete_refs = AsyncMock()
+        yield index
+
+
 @pytest.fixture
 def repo() -> ConversationRepository:
     return ConversationRepository()
@@ -112,6 +124,65 @@ class TestSetMessageResponse:
         )
 
 
+class TestSetMessagePinned:
+    """``set_message_pinned`` — the flag and the materialized pinned-id array move together."""
+
+    async def test_pinning_adds_the_id_in_the_same_update(
+        self, repo: ConversationRepository, collection: MagicMock
+    ) -> None:
+        await repo.set_message_pinned(
+            CONVERSATION_ID, user_id=USER_ID, message_id=MESSAGE_ID, pinned=True
+        )
+
+        _, update, _ = _update_call(collection)
+        assert update["$set"] == {"messages.$.pinned": True}
+        assert update["$addToSet"] == {"pinned_message_ids": MESSAGE_ID}
+        assert "$pull" not in update
+
+    async def test_unpinning_pulls_the_id(
+        self, repo: ConversationRepository, collection: MagicMock
+    ) -> None:
+        await repo.set_message_pinned(
+            CONVERSATION_ID, user_id=USER_ID, message_id=MESSAGE_ID, pinned=False
+        )
+
+        _, update, _ = _update_call(collection)
+        assert update["$set"] == {"messages.$.pinned": False}
+        assert update["$pull"] == {"pinned_message_ids": MESSAGE_ID}
+        assert "$addToSet" not in update
+
+
+class TestListPinnedMessages:
+    """``list_pinned_messages`` — the materialized ids serve reads only once enabled."""
+
+    @pytest.fixture
+    def aggregate(self, repo: ConversationRepository) -> Iterator[AsyncMock]:
+        with patch.object(repo, "_aggregate", AsyncMock(return_value=[])) as mock:
+            yield mock
+
+    async def test_matches_the_message_flags_until_enabled(
+        self, repo: ConversationRepository, aggregate: AsyncMock
+    ) -> None:
+        with patch("app.db.repositories.conversations.PINNED_MESSAGE_IDS_ENABLED", False):
+            await repo.list_pinned_messages(USER_ID)
+
+        pipeline = aggregate.await_args.args[0]
+        assert pipeline[0] == {"$match": {"user_id": USER_ID, "messages.pinned": True}}
+        assert {"$match": {"messages.pinned": True}} in pipeline
+
+    async def test_reads_pinned_message_ids_when_enabled(
+        self, repo: ConversationRepository, aggregate: AsyncMock
+    ) -> None:
+        with patch("app.db.repositories.conversations.PINNED_MESSAGE_IDS_ENABLED", True):
+            await repo.list_pinned_messages(USER_ID)
+
+        pipeline = aggregate.await_args.args[0]
+        assert pipeline[0] == {
+            "$match": {"user_id": USER_ID, "pinned_message_ids": {"$type": "string"}}
+        }
+        assert "messages.pinned" not in str(pipeline)
+
+
 class TestSetMessageToolData:
     """``set_message_tool_data`` — delivery re-persisting a message's whole frame list."""
 
@@ -316,3 +387,112 @@ class TestSettlementWritesRefreshTheCache:
 
         delete_cache.assert_not_awaited()
         bump_generation.assert_not_awaited()
+
+
+class TestSearchIndexSync:
+    """Message writes and conversation deletes keep the keyword index in step."""
+
+    async def test_appended_messages_are_indexed_with_their_assigned_ids(
+        self, repo: ConversationRepository, collection: MagicMock, search_index: MagicMock
+    ) -> None:
+        ids = await repo.append_messages(
+            CONVERSATION_ID,
+            user_id=USER_ID,
+            messages=[MessageModel(type="user", response="hello there")],
+        )
+
+        assert ids is not None
+        user_id, conversation_id, docs = search_index.index_messages.await_args.args
+        assert (user_id, conversation_id) == (USER_ID, CONVERSATION_ID)
+        assert [(doc["message_id"], doc["response"]) for doc in docs] == [(ids[0], "hello there")]
+
+    async def test_a_capped_append_prunes_the_trimmed_rows(
+        self, repo: ConversationRepository, collection: MagicMock, search_index: MagicMock
+    ) -> None:
+        collection.find_one = AsyncMock(
+            return_value={"messages": [{"message_id": "m2"}, {"message_id": "m3"}]}
+        )
+
+        await repo.append_messages(
+            CONVERSATION_ID,
+            user_id=USER_ID,
+            messages=[MessageModel(type="user", response="x")],
+            max_messages=2,
+        )
+
+        search_index.prune_conversation.assert_awaited_once_with(
+            USER_ID, CONVERSATION_ID, ["m2", "m3"]
+        )
+
+    async def test_an_uncapped_append_prunes_nothing(
+        self, repo: ConversationRepository, collection: MagicMock, search_index: MagicMock
+    ) -> None:
+        await repo.append_messages(
+            CONVERSATION_ID, user_id=USER_ID, messages=[MessageModel(type="user", response="x")]
+        )
+
+        search_index.prune_conversation.assert_not_awaited()
+
+    async def test_search_deletes_refs_that_no_longer_hydrate(
+        self, repo: ConversationRepository, collection: MagicMock, search_index: MagicMock
+    ) -> None:
+        search_index.search = AsyncMock(
+            return_value=[(CONVERSATION_ID, "kept"), (CONVERSATION_ID, "trimmed")]
+        )
+        hydrated = [
+            {
+                "conversation_id": CONVERSATION_ID,
+                "message": {"type": "bot", "response": "q", "message_id": "kept"},
+            }
+        ]
+        collection.aggregate = MagicMock(
+            side_effect=[
+                MagicMock(to_list=AsyncMock(return_value=[])),
+                MagicMock(to_list=AsyncMock(return_value=hydrated)),
+            ]
+        )
+
+        page = await repo.search_indexed(USER_ID, query="q", pattern="q", limit=2)
+
+        assert [hit.message.message_id for hit in page.messages] == ["kept"]
+        assert page.matched_messages == 2
+        search_index.delete_refs.assert_awaited_once_with(USER_ID, [(CONVERSATION_ID, "trimmed")])
+
+    async def test_nothing_is_indexed_for_a_missing_conversation(
+        self, repo: ConversationRepository, collection: MagicMock, search_index: MagicMock
+    ) -> None:
+        _matched(collection, 0)
+
+        ids = await repo.append_messages(
+            CONVERSATION_ID, user_id=USER_ID, messages=[MessageModel(type="user", response="x")]
+        )
+
+        assert ids is None
+        search_index.index_messages.assert_not_awaited()
+
+    async def test_a_settled_response_is_reindexed(
+        self, repo: ConversationRepository, collection: MagicMock, search_index: MagicMock
+    ) -> None:
+        await _write_response(repo)
+
+        search_index.set_response.assert_awaited_once_with(
+            USER_ID, CONVERSATION_ID, MESSAGE_ID, "the answer"
+        )
+
+    async def test_an_unmatched_response_write_leaves_the_index_alone(
+        self, repo: ConversationRepository, collection: MagicMock, search_index: MagicMock
+    ) -> None:
+        _matched(collection, 0)
+
+        await _write_response(repo)
+
+        search_index.set_response.assert_not_awaited()
+
+    async def test_deleting_a_conversation_drops_its_rows(
+        self, repo: ConversationRepository, collection: MagicMock, search_index: MagicMock
+    ) -> None:
+        collection.delete_one = AsyncMock(return_value=MagicMock(deleted_count=1))
+
+        assert await repo.delete(CONVERSATION_ID, user_id=USER_ID)
+
+        search_index.delete_conversations.assert_awaited_once_with(USER_ID, [CONVERSATION_ID])
@@ -0,0 +1,52 @@
+"""Unit tests for the message keyword-index row builder (app.db.message_search)."""
+
+from datetime import UTC, datetime
+
+from app.db.message_search import entry_rows
+
+
+def test_rows_carry_the_message_identity_text_and_time() -> None:
+    rows = entry_rows(
+        "user-1",
+        "conv-1",
+        [{"message_id": "m1", "response": "hello", "date": "2026-03-01T10:00:00+00:00"}],
+    )
+
+    assert rows == [
+        {
+            "conversation_id": "conv-1",
+            "message_id": "m1",
+            "user_id": "user-1",
+            "response": "hello",
+            "message_at": datetime(2026, 3, 1, 10, tzinfo=UTC),
+        }
+    ]
+
+
+def test_messages_without_text_or_id_are_skipped() -> None:
+    rows = entry_rows(
+        "user-1",
+        "conv-1",
+        [
+            {"message_id": "m1", "response": ""},
+            {"response": "orphan"},
+            {"message_id": "m3", "response": None},
+        ],
+    )
+
+    assert rows == []
+
+
+def test_naive_and_unparseable_dates_become_aware() -> None:
+    rows = entry_rows(
+        "user-1",
+        "conv-1",
+        [
+            {"message_id": "m1", "response": "a", "date": "2026-03-01T10:00:00"},
+            {"message_id": "m2", "response": "b", "date": "yesterday"},
+        ],
+    )
+
+    assert rows[0]["message_at"] == datetime(2026, 3, 1, 10, tzinfo=UTC)
+    assert isinstance(rows[1]["message_at"], datetime)
+    assert rows[1]["message_at"].tzinfo is not None
@@ -0,0 +1,216 @@
+"""Unit tests for the workflow routing table (app.db.repositories.workflow_routing)
+and the repository paths that read and invalidate it."""
+
+from collections.abc import Iterator
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.db.repositories import workflow_routing
+from app.db.repositories.workflow_routing import WorkflowRoutingTable, publish_invalidation
+from app.db.repositories.workflows import WorkflowsRepository
+from app.models.workflow_models import (
+    TriggerConfig,
+    TriggerType,
+    WorkflowDocument,
+    WorkflowStep,
+)
+
+
+def _workflow(workflow_id: str, *trigger_ids: str, trigger_name: str = "slack_message") -> Any:
+    return WorkflowDocument(
+        id=workflow_id,
+        user_id="user-1",
+        title="Routed",
+        prompt="do the thing",
+        steps=[WorkflowStep(title="step", category="slack", description="d")],
+        activated=True,
+        trigger_config=TriggerConfig(
+            type=TriggerType.INTEGRATION,
+            enabled=True,
+            trigger_name=trigger_name,
+            composio_trigger_ids=list(trigger_ids),
+        ),
+    )
+
+
+def _live(**kwargs: Any) -> WorkflowRoutingTable:
+    table = WorkflowRoutingTable(**kwargs)
+    table.live = True
+    return table
+
+
+class TestRoutingTable:
+    def test_a_table_nobody_invalidates_never_answers(self) -> None:
+        table = WorkflowRoutingTable()
+        table.put_many({"ti_1": [_workflow("wf_1", "ti_1")]}, table.epoch)
+
+        assert table.get_many(["ti_1"]) == ({}, ["ti_1"])
+
+    def test_stored_routes_and_empty_answers_are_both_hits(self) -> None:
+        table = _live()
+        routed = [_workflow("wf_1", "ti_1")]
+        table.put_many({"ti_1": routed, "ti_idle": []}, table.epoch)
+
+        found, missing = table.get_many(["ti_1", "ti_idle", "ti_new"])
+
+        assert found == {"ti_1": routed, "ti_idle": []}
+        assert missing == ["ti_new"]
+
+    def test_invalidating_a_workflow_drops_every_trigger_it_was_routed_from(self) -> None:
+        """A pause clears the workflow's trigger ids, so the invalidation can only
+        name the workflow — its old routes must go anyway."""
+        table = _live()
+        workflow = _workflow("wf_1", "ti_1", "ti_2")
+        table.put_many({"ti_1": [workflow], "ti_2": [workflow], "ti_3": []}, table.epoch)
+
+        table.invalidate(workflow_ids=["wf_1"])
+
+        assert table.get_many(["ti_1", "ti_2", "ti_3"]) == ({"ti_3": []}, ["ti_1", "ti_2"])
+
+    def test_invalidating_a_trigger_drops_a_cached_empty_answer(self) -> None:
+        table = _live()
+        table.put_many({"ti_1": []}, table.epoch)
+
+        table.invalidate(trigger_ids=["ti_1"])
+
+        assert table.get_many(["ti_1"]) == ({}, ["ti_1"])
+
+    def test_a_lookup_that_raced_an_invalidation_is_not_stored(self) -> None:
+        table = _live()
+        epoch = table.epoch
+        table.invalidate(trigger_ids=["ti_other"])
+
+        table.put_many({"ti_1": []}, epoch)
+
+        assert len(table) == 0
+
+    def test_expired_routes_miss(self) -> None:
+        table = _live(ttl=0)
+        table.put_many({"ti_1": []}, table.epoch)
+
+        assert table.get_many(["ti_1"]) == ({}, ["ti_1"])
+        assert len(table) == 0
+
+    def test_the_least_recently_used_trigger_is_evicted_past_the_cap(self) -> None:
+        table = _live(max_size=2)
+        table.put_many({"ti_1": [], "ti_2": []}, table.epoch)
+        table.get_many(["ti_1"])
+        table.put_many({"ti_3": []}, table.epoch)
+
+        assert table.get_many(["ti_1", "ti_2", "ti_3"])[1] == ["ti_2"]
+
+
+class TestPublishInvalidation:
+    async def test_it_drops_locally_and_tells_every_other_process(self) -> None:
+        table = _live()
+        table.put_many({"ti_1": [_workflow("wf_1", "ti_1")]}, table.epoch)
+        client = MagicMock()
+        client.publish = AsyncMock()
+        with (
+            patch.object(workflow_routing, "routing_table", table),
+            patch.object(workflow_routing, "redis_cache", MagicMock(redis=client)),
+        ):
+            await publish_invalidation(workflow_ids=["wf_1"], trigger_ids=["ti_9", "ti_9"])
+
+        assert len(table) == 0
+        channel, payload = client.publish.await_args.args
+        assert channel == "workflow:routing:invalidate"
+        assert payload == '{"workflows": ["wf_1"], "triggers": ["ti_9"]}'
+
+    async def test_nothing_to_invalidate_publishes_nothing(self) -> None:
+        client = MagicMock()
+        client.publish = AsyncMock()
+        with patch.object(workflow_routing, "redis_cache", MagicMock(redis=client)):
+            await publish_invalidation()
+
+        client.publish.assert_not_awaited()
+
+
+@pytest.fixture
+def table() -> Iterator[WorkflowRoutingTable]:
+    """A live table behind the repository; invalidations stay in-process."""
+    table = _live()
+    with (
+        patch("app.db.repositories.workflows.routing_table", table),
+        patch.object(workflow_routing, "routing_table", table),
+        patch.object(workflow_routing, "redis_cache", MagicMock(redis=None)),
+    ):
+        yield table
+
+
+class TestRepositoryRouting:
+    async def test_a_repeat_lookup_is_answered_without_mongo(
+        self, table: WorkflowRoutingTable
+    ) -> None:
+        repo = WorkflowsRepository()
+        routed = _workflow("wf_1", "ti_1")
+        with patch.object(repo, "_find", AsyncMock(return_value=[routed])) as find:
+            first = await repo.find_active_by_composio_trigger("ti_1")
+            second = await repo.find_active_by_composio_trigger("ti_1")
+            narrowed = await repo.find_active_by_composio_trigger("ti_1", trigger_name="other")
+
+        assert first == second == [routed]
+        assert narrowed == []
+        find.assert_awaited_once()
+
+    async def test_a_batch_queries_only_the_triggers_the_table_lacks(
+        self, table: WorkflowRoutingTable
+    ) -> None:
+        repo = WorkflowsRepository()
+        table.put_many({"ti_1": []}, table.epoch)
+        routed = _workflow("wf_2", "ti_2")
+        with patch.object(repo, "_find", AsyncMock(return_value=[routed])) as find:
+            routes = await repo.find_active_by_composio_triggers(["ti_1", "ti_2", "ti_3"])
+
+        assert routes == {"ti_1": [], "ti_2": [routed], "ti_3": []}
+        query = find.await_args.args[0]
+        assert query["trigger_config.composio_trigger_ids"] == {"$in": ["ti_2", "ti_3"]}
+
+    async def test_warming_loads_every_routable_workflow(self, table: WorkflowRoutingTable) -> None:
+        repo = WorkflowsRepository()
+        workflows = [_workflow("wf_1", "ti_1", "ti_2"), _workflow("wf_2", "ti_2")]
+        with patch.object(repo, "_find", AsyncMock(return_value=workflows)):
+            assert await repo.warm_composio_routes() == 2
+
+        found, missing = table.get_many(["ti_1", "ti_2"])
+        assert [w.id for w in found["ti_2"]] == ["wf_1", "wf_2"]
+        assert missing == []
+
+    async def test_activating_a_workflow_drops_the_cached_empty_answer(
+        self, table: WorkflowRoutingTable
+    ) -> None:
+        """Otherwise a freshly activated workflow would not fire until the TTL."""
+        repo = WorkflowsRepository()
+        table.put_many({"ti_new": []}, table.epoch)
+        with patch.object(
+            repo, "_apply_raw_update", AsyncMock(return_value=_workflow("wf_1", "ti_new"))
+        ):
+            await repo.activate("wf_1", "user-1", trigger_ids=["ti_new"], next_run=None)
+
+        assert table.get_many(["ti_new"]) == ({}, ["ti_new"])
+
+    async def test_deactivating_a_workflow_drops_its_routes(
+        self, table: WorkflowRoutingTable
+    ) -> None:
+        repo = WorkflowsRepository()
+        workflow = _workflow("wf_1", "ti_1")
+        table.put_many({"ti_1": [workflow]}, table.epoch)
+        paused = _workflow("wf_1")
+        with patch.object(repo, "_apply_raw_update", AsyncMock(return_value=paused)):
+            await repo.deactivate("wf_1", "user-1")
+
+        assert table.get_many(["ti_1"]) == ({}, ["ti_1"])
+
+    async def test_a_run_state_write_leaves_the_routes_alone(
+        self, table: WorkflowRoutingTable
+    ) -> None:
+        repo = WorkflowsRepository()
+        workflow = _workflow("wf_1", "ti_1")
+        table.put_many({"ti_1": [workflow]}, table.epoch)
+        with patch.object(repo, "_apply_raw_update", AsyncMock(return_value=workflow)):
+            await repo.record_execution("wf_1", "user-1", successful=True)
+            await repo.mark_error("wf_1", "user-1")
+
+        assert table.get_many(["ti_1"])[0] == {"ti_1": [workflow]}
@@ -4,20 +4,21 @@ The root conftest pins ``tiered_limiter.check_and_increment`` to a mock that
 always returns ``{}``, so no test exercises the real plan-to-limit decision or
 the limit-exceeded signal. These tests run the real ``TieredRateLimiter`` with
 the real ``FEATURE_LIMITS`` / ``get_limits_for_plan`` — only the Redis storage
-seam is mocked, following tests/unit/api/test_tiered_rate_limiter.py.
+seam is faked (fakeredis), following tests/unit/api/test_tiered_rate_limiter.py.
 """
 
 import asyncio
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import fakeredis.aioredis
 import pytest
 
 from app.api.v1.middleware.tiered_rate_limiter import (
     RateLimitExceededException,
     TieredRateLimiter,
 )
-from app.config.rate_limits import get_limits_for_plan
+from app.config.rate_limits import RateLimitPeriod, get_limits_for_plan
 from app.models.payment_models import PlanType
 from app.services.limit_upsell import LimitHitOrigin
 
@@ -28,21 +29,6 @@ def _noop_create_task(coro: object, **kwargs: object) -> MagicMock:
     return MagicMock()
 
 
-def _pipeline_mock() -> MagicMock:
-    """Redis pipeline with WATCH that always succeeds on the first attempt."""
-    pipe = AsyncMock()
-    pipe.watch = AsyncMock()
-    pipe.multi = MagicMock()
-    pipe.incr = AsyncMock()
-    pipe.expire = AsyncMock()
-    pipe.execute = AsyncMock()
-    pipe.__aenter__ = AsyncMock(return_value=pipe)
-    pipe.__aexit__ = AsyncMock(return_value=False)
-    redis = MagicMock()
-    redis.pipeline = MagicMock(return_value=pipe)
-    return redis
-
-
 # ---------------------------------------------------------------------------
 # Real plan-tier limits from FEATURE_LIMITS
 # ---------------------------------------------------------------------------
@@ -85,8 +71,9 @@ class TestPlanTierLimits:
 @pytest.mark.asyncio
 class TestTieredLimiterRealDecision:
     def setup_method(self) -> None:
+        self.fake_redis = fakeredis.aioredis.FakeRedis(decode_responses=True)
         self.limiter = TieredRateLimiter()
-        self.limiter.redis = AsyncMock()
+        self.limiter.redis = MagicMock(redis=self.fake_redis)
 
     @patch(
         "app.api.v1.middleware.tiered_rate_limiter.asyncio.create_task",
@@ -96,9 +83,6 @@ class TestTieredLimiterRealDecision:
         self, mock_create_task: MagicMock
     ) -> None:
         """A PRO user at zero usage gets the real PRO numbers in usage_info."""
-        self.limiter.redis.get = AsyncMock(return_value=None)
-        self.limiter.redis.redis = _pipeline_mock()
-
         result = await self.limiter.check_and_increment("user1", "generate_image", PlanType.PRO)
 
         assert result["day"].used == 0
@@ -110,7 +94,8 @@ class TestTieredLimiterRealDecision:
         """generate_image free = 1/day: at 1 use, the limiter must raise the
         signal the endpoint layer turns into a 429."""
         reset_time = datetime.now(UTC) + timedelta(days=1)
-        self.limiter.redis.get = AsyncMock(return_value="1")
+        day_key = self.limiter._get_redis_key("user1", "generate_image", RateLimitPeriod.DAY)
+        await self.fake_redis.set(day_key, 1)
         with patch(
             "app.api.v1.middleware.tiered_rate_limiter.get_reset_time",
             return_value=reset_time,
@@ -135,7 +120,7 @@ class TestTieredLimiterRealDecision:
         exc = exc_info.value
         assert exc.status_code == 429
         assert exc.detail["plan_required"] == "pro"
-        self.limiter.redis.get.assert_not_called()
+        assert await self.fake_redis.dbsize() == 0
 
     @patch(
         "app.api.v1.middleware.tiered_rate_limiter.asyncio.create_task",
@@ -143,9 +128,6 @@ class TestTieredLimiterRealDecision:
     )
     async def test_pro_user_passes_pro_only_feature(self, mock_create_task: MagicMock) -> None:
         """The same voice_mode feature is enforceable for a PRO subscriber."""
-        self.limiter.redis.get = AsyncMock(return_value=None)
-        self.limiter.redis.redis = _pipeline_mock()
-
         result = await self.limiter.check_and_increment("user1", "voice_mode", PlanType.PRO)
 
         assert result["day"].limit == 200
@@ -0,0 +1,109 @@
+"""Unit tests for the embed/rerank micro-batcher (app.memory.batching)."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from unittest.mock import patch
+
+import pytest
+
+from app.memory import batching
+from app.memory.batching import MicroBatcher
+
+
+class _Recorder:
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def __call__(self, items: list[str]) -> list[str]:
+        self.batches.append(items)
+        return [item.upper() for item in items]
+
+
+def _batcher(
+    run: Callable[[list[str]], Awaitable[list[str]]], max_weight: int = 4, window: float = 0.01
+) -> MicroBatcher:
+    return MicroBatcher("embed", "client", run, lambda: max_weight, window_seconds=window)
+
+
+async def test_concurrent_calls_share_one_run() -> None:
+    run = _Recorder()
+    batcher = _batcher(run)
+
+    results = await asyncio.gather(*(batcher.submit(text) for text in ("a", "b", "c")))
+
+    assert results == ["A", "B", "C"]
+    assert run.batches == [["a", "b", "c"]]
+
+
+async def test_full_batch_runs_without_waiting_for_the_window() -> None:
+    run = _Recorder()
+    batcher = _batcher(run, max_weight=2, window=60)
+
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(text) for text in "abcd")), timeout=1
+    )
+
+    assert results == ["A", "B", "C", "D"]
+    assert run.batches == [["a", "b"], ["c", "d"]]
+
+
+async def test_heavy_item_runs_alone() -> None:
+    run = _Recorder()
+    batcher = _batcher(run, max_weight=4)
+
+    await asyncio.gather(batcher.submit("a"), batcher.submit("big", weight=10), batcher.submit("b"))
+
+    assert run.batches == [["a"], ["big"], ["b"]]
+
+
+async def test_failure_reaches_every_caller_in_the_batch() -> None:
+    async def run(items: list[str]) -> list[str]:
+        raise RuntimeError("model failed")
+
+    batcher = _batcher(run)
+
+    results = await asyncio.gather(batcher.submit("a"), batcher.submit("b"), return_exceptions=True)
+
+    assert [str(result) for result in results] == ["model failed", "model failed"]
+
+
+async def test_short_result_list_is_an_error() -> None:
+    async def run(items: list[str]) -> list[str]:
+        return items[:1]
+
+    batcher = _batcher(run)
+
+    with pytest.raises(RuntimeError, match="returned 1 results"):
+        await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+
+async def test_cancelled_caller_does_not_break_the_batch() -> None:
+    run = _Recorder()
+    batcher = _batcher(run)
+
+    cancelled = asyncio.ensure_future(batcher.submit("a"))
+    kept = asyncio.ensure_future(batcher.submit("b"))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+
+    assert await kept == "B"
+    assert run.batches == [["a", "b"]]
+
+
+async def test_disabled_runs_each_call_alone() -> None:
+    run = _Recorder()
+    batcher = _batcher(run)
+
+    with patch.object(batching, "EMBEDDING_MICRO_BATCHING", False):
+        await asyncio.gather(batcher.submit("a"), batcher.submit("b"))
+
+    assert run.batches == [["a"], ["b"]]
+
+
+def test_state_does_not_leak_across_event_loops() -> None:
+    run = _Recorder()
+    batcher = _batcher(run)
+
+    assert asyncio.run(batcher.submit("a")) == "A"
+    assert asyncio.run(batcher.submit("b")) == "B"
+    assert run.batches == [["a"], ["b"]]
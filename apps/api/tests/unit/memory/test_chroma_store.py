@@ -0,0 +1,332 @@
+"""Unit tests for the memory vector store's similarity queries.
+
+Runs against an in-process ephemeral Chroma collection behind a thin async
+shim that counts backend calls.
+"""
+
+from collections import Counter
+from collections.abc import Awaitable, Callable
+from unittest.mock import AsyncMock, patch
+from uuid import uuid4
+
+import chromadb
+from chromadb.api.models.Collection import Collection
+import pytest
+
+from app.memory import chroma_store, reconciliation
+from app.memory.schemas import ExtractedFact
+
+USER = "user-1"
+
+
+class _CountingCollection:
+    def __init__(self, sync: Collection) -> None:
+        self._sync = sync
+        self.calls: Counter[str] = Counter()
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[object]]:
+        method = getattr(self._sync, name)
+
+        async def call(*args: object, **kwargs: object) -> object:
+            self.calls[name] += 1
+            return method(*args, **kwargs)
+
+        return call
+
+
+def _vector(x: float) -> list[float]:
+    return [x, 1.0 - x, 0.5]
+
+
+def _memory(memory_id: str, x: float, user_id: str = USER, **flags: bool) -> dict:
+    return {
+        "id": memory_id,
+        "embedding": _vector(x),
+        "document": memory_id,
+        "metadata": {
+            "user_id": user_id,
+            "kind": "fact",
+            "category_path": "general",
+            "is_latest": flags.get("is_latest", True),
+            "is_forgotten": flags.get("is_forgotten", False),
+        },
+    }
+
+
+@pytest.fixture
+def collection():
+    sync = chromadb.EphemeralClient().create_collection(
+        f"memories-{uuid4().hex[:8]}", metadata={"hnsw:space": "cosine"}
+    )
+    wrapped = _CountingCollection(sync)
+    with patch.object(chroma_store, "_get_collection", AsyncMock(return_value=wrapped)):
+        yield wrapped
+
+
+async def _seed(collection: _CountingCollection, *items: dict) -> None:
+    await chroma_store.upsert_memories(list(items))
+    collection.calls.clear()
+
+
+async def test_query_similar_many_is_one_count_and_one_query(collection):
+    await _seed(collection, *(_memory(f"m{i}", i / 10) for i in range(10)))
+
+    results = await chroma_store.query_similar_many(USER, [_vector(i / 20) for i in range(20)], n=3)
+
+    assert len(results) == 20
+    assert all(len(similar) == 3 for similar in results)
+    assert collection.calls == Counter(count=1, query=1)
+
+
+async def test_query_similar_many_matches_per_vector_queries(collection):
+    await _seed(collection, *(_memory(f"m{i}", i / 10) for i in range(10)))
+    queries = [_vector(0.0), _vector(0.55), _vector(0.9)]
+
+    batched = await chroma_store.query_similar_many(USER, queries, n=4)
+    single = [await chroma_store.query_similar(USER, query, n=4) for query in queries]
+
+    assert batched == single
+    assert batched[0][0][0] == "m0"
+    assert batched[2][0][0] == "m9"
+
+
+async def test_query_similar_many_filters_user_and_flags(collection):
+    await _seed(
+        collection,
+        _memory("mine", 0.5),
+        _memory("other_user", 0.5, user_id="user-2"),
+        _memory("forgotten", 0.5, is_forgotten=True),
+        _memory("superseded", 0.5, is_latest=False),
+    )
+
+    latest = await chroma_store.query_similar_many(USER, [_vector(0.5)], n=10)
+    history = await chroma_store.query_similar_many(USER, [_vector(0.5)], n=10, only_latest=False)
+
+    assert [memory_id for memory_id, _ in latest[0]] == ["mine"]
+    assert sorted(memory_id for memory_id, _ in history[0]) == ["mine", "superseded"]
+
+
+async def test_query_similar_many_empty_collection(collection):
+    results = await chroma_store.query_similar_many(USER, [_vector(0.1), _vector(0.2)], n=5)
+
+    assert results == [[], []]
+    assert collection.calls == Counter(count=1)
+
+
+async def test_query_similar_many_no_vectors(collection):
+    assert await chroma_store.query_similar_many(USER, [], n=5) == []
+    assert not collection.calls
+
+
+async def test_reconcile_queries_chroma_once_for_all_facts(collection):
+    """A 20-fact extraction used to cost 40 Chroma round trips."""
+    await _seed(collection, *(_memory(f"m{i}", i / 10) for i in range(10)))
+    facts = [
+        ExtractedFact(
+            content=f"fact {i}",
+            kind="fact",
+            category_path="general",
+            importance=0.5,
+            entities=[],
+            edges=[],
+            occurred_start=None,
+            occurred_end=None,
+            forget_after=None,
+        )
+        for i in range(20)
+    ]
+    # Far from every stored vector: all NEW, no reconcile LLM call.
+    embeddings = [[-1.0, -1.0, -1.0 - i] for i in range(20)]
+
+    reconciled = await reconciliation.reconcile(USER, facts, embeddings)
+
+    assert len(reconciled) == 20
+    assert collection.calls == Counter(count=1, query=1)
+
+
+class _AsyncClient:
+    """The async client surface ``chroma_store`` uses, over an ephemeral client."""
+
+    def __init__(self) -> None:
+        self._sync = chromadb.EphemeralClient()
+        for existing in self._sync.list_collections():
+            self._sync.delete_collection(existing.name)
+
+    def __getattr__(self, name: str) -> Callable[..., Awaitable[object]]:
+        method = getattr(self._sync, name)
+
+        async def call(*args: object, **kwargs: object) -> object:
+            result = method(*args, **kwargs)
+            return _CountingCollection(result) if isinstance(result, Collection) else result
+
+        return call
+
+    def count(self, name: str, user_id: str | None = None) -> int:
+        rows = self._sync.get_collection(name).get(
+            where={"user_id": user_id} if user_id else None, include=[]
+        )
+        return len(rows["ids"])
+
+
+@pytest.fixture
+def chroma_client():
+    client = _AsyncClient()
+    with (
+        patch.object(chroma_store.ChromaClient, "get_client", AsyncMock(return_value=client)),
+        patch.object(chroma_store, "_loop_collections", {}),
+        patch.object(chroma_store, "_loop_locks", {}),
+    ):
+        yield client
+
+
+def test_global_partitioning_keeps_the_shared_collection():
+    assert chroma_store.memories_collection_name(USER, "global") == "gaia_memories"
+
+
+def test_partition_names_are_stable_and_valid():
+    bucketed = chroma_store.memories_collection_name(USER, "bucketed", buckets=8)
+    per_user = chroma_store.memories_collection_name(USER, "user")
+
+    assert bucketed == chroma_store.memories_collection_name(USER, "bucketed", buckets=8)
+    assert bucketed.startswith("gaia_memories_b000")
+    assert per_user != chroma_store.memories_collection_name("user-2", "user")
+    for name in (bucketed, per_user):
+        assert chroma_store.partition_of(name) in ("bucketed", "user")
+    assert chroma_store.partition_of("gaia_memory_episodes") is None
+
+
+def test_unknown_partitioning_is_rejected():
+    with pytest.raises(ValueError, match="sharded"):
+        chroma_store.memories_collection_name(USER, "sharded")
+
+
+async def test_user_partitioning_routes_every_operation(chroma_client):
+    with patch.object(chroma_store, "MEMORY_VECTOR_PARTITIONING", "user"):
+        mine = chroma_store.memories_collection_name(USER)
+        theirs = chroma_store.memories_collection_name("user-2")
+        await chroma_store.upsert_memories(
+            [_memory("a", 0.1), _memory("b", 0.9), _memory("c", 0.5, user_id="user-2")]
+        )
+
+        assert (chroma_client.count(mine), chroma_client.count(theirs)) == (2, 1)
+        similar = await chroma_store.query_similar(USER, _vector(0.1), n=5)
+        assert [memory_id for memory_id, _ in similar] == ["a", "b"]
+
+        await chroma_store.set_memory_flags(USER, "a", is_forgotten=True)
+        assert [m for m, _ in await chroma_store.query_similar(USER, _vector(0.1), n=5)] == ["b"]
+
+        await chroma_store.delete_user(USER)
+        assert (chroma_client.count(mine), chroma_client.count(theirs)) == (0, 1)
+
+
+async def test_collection_handle_cache_is_bounded(chroma_client):
+    with patch.object(chroma_store, "MEMORY_COLLECTION_HANDLE_CACHE_SIZE", 2):
+        for name in ("gaia_memories_a", "gaia_memories_b", "gaia_memories_c"):
+            await chroma_store._get_collection(name)
+        await chroma_store._get_collection("gaia_memories_b")
+        await chroma_store._get_collection("gaia_memories_d")
+
+        cached, _ = chroma_store._loop_state()
+        assert list(cached) == ["gaia_memories_b", "gaia_memories_d"]
+
+
+async def test_copy_memories_copies_global_rows_into_the_target_layout(chroma_client):
+    await chroma_store.upsert_memories(
+        [_memory(f"m{i}", i / 10, user_id=f"user-{i % 3}") for i in range(10)]
+    )
+
+    assert await chroma_store.memories_collection_names("global") == ["gaia_memories"]
+    first = await chroma_store.copy_memories("gaia_memories", "user", offset=0, limit=4)
+    rest = await chroma_store.copy_memories("gaia_memories", "user", offset=4, limit=100)
+
+    assert (first, rest) == (4, 6)
+    assert chroma_client.count("gaia_memories") == 10
+    assert len(await chroma_store.memories_collection_names("user")) == 3
+    with patch.object(chroma_store, "MEMORY_VECTOR_PARTITIONING", "user"):
+        similar = await chroma_store.query_similar("user-1", _vector(0.4), n=10)
+    assert sorted(memory_id for memory_id, _ in similar) == ["m1", "m4", "m7"]
+
+
+async def test_copying_leaves_the_live_layout_serving(chroma_client):
+    # Step 1 of the rollout runs while "global" is still the live layout.
+    await chroma_store.upsert_memories([_memory("a", 0.1), _memory("b", 0.9)])
+
+    await chroma_store.copy_memories("gaia_memories", "user", offset=0, limit=10)
+
+    similar = await chroma_store.query_similar(USER, _vector(0.1), n=5)
+    assert [memory_id for memory_id, _ in similar] == ["a", "b"]
+    await chroma_store.set_memory_flags(USER, "a", is_forgotten=True)
+    assert [m for m, _ in await chroma_store.query_similar(USER, _vector(0.1), n=5)] == ["b"]
+
+    # After the switch, the cleanup step carries that forget into the copy.
+    with patch.object(chroma_store, "MEMORY_VECTOR_PARTITIONING", "user"):
+        assert await chroma_store.retire_memories("gaia_memories", "user", offset=0, limit=10) == (
+            2,
+            0,
+        )
+        assert [m for m, _ in await chroma_store.query_similar(USER, _vector(0.1), n=5)] == ["b"]
+    assert chroma_client.count("gaia_memories") == 0
+
+
+async def test_retire_memories_merges_flags_from_both_layouts(chroma_client):
+    await chroma_store.upsert_memories(
+        [_memory("old", 0.1, is_latest=False), _memory("new", 0.5), _memory("late", 0.9)]
+    )
+    with patch.object(chroma_store, "MEMORY_VECTOR_PARTITIONING", "user"):
+        # Copied before the switch; "new" was forgotten in the new layout since,
+        # "old" was superseded in the old one, "late" was never copied.
+        await chroma_store.upsert_memories(
+            [_memory("old", 0.1), _memory("new", 0.5, is_forgotten=True)]
+        )
+
+        await chroma_store.retire_memories("gaia_memories", "user", offset=0, limit=10)
+
+        current = await chroma_store.query_similar(USER, _vector(0.1), n=5)
+        history = await chroma_store.query_similar(USER, _vector(0.1), n=5, only_latest=False)
+    assert [memory_id for memory_id, _ in current] == ["late"]
+    assert sorted(memory_id for memory_id, _ in history) == ["late", "old"]
+    assert chroma_client.count("gaia_memories") == 0
+
+
+async def test_rebucketing_keeps_rows_already_in_their_bucket(chroma_client):
+    with (
+        patch.object(chroma_store, "MEMORY_VECTOR_PARTITIONING", "bucketed"),
+        patch.object(chroma_store, "MEMORY_VECTOR_BUCKETS", 2),
+    ):
+        await chroma_store.upsert_memories(
+            [_memory(f"m{i}", i / 10, user_id=f"user-{i}") for i in range(6)]
+        )
+
+    with patch.object(chroma_store, "MEMORY_VECTOR_BUCKETS", 1):
+        for name in ("gaia_memories_b0000", "gaia_memories_b0001"):
+            await chroma_store.copy_memories(name, "bucketed", offset=0, limit=10)
+        assert chroma_client.count("gaia_memories_b0001") == 4
+        stayed = await chroma_store.retire_memories(
+            "gaia_memories_b0000", "bucketed", offset=0, limit=10
+        )
+        moved = await chroma_store.retire_memories(
+            "gaia_memories_b0001", "bucketed", offset=0, limit=10
+        )
+
+    assert (stayed, moved) == ((6, 6), (4, 0))
+    assert chroma_client.count("gaia_memories_b0000") == 6
+    assert chroma_client.count("gaia_memories_b0001") == 0
+
+
+async def test_delete_user_wipes_fact_vectors_from_every_layout(chroma_client):
+    # A half-finished migration: some of the user's facts were moved to the
+    # per-user layout, the rest still sit in the shared collection.
+    await chroma_store.upsert_memories(
+        [_memory("old", 0.1), _memory("kept", 0.2, user_id="user-2")]
+    )
+    with patch.object(chroma_store, "MEMORY_VECTOR_PARTITIONING", "bucketed"):
+        await chroma_store.upsert_memories([_memory("bucketed", 0.3)])
+    with patch.object(chroma_store, "MEMORY_VECTOR_PARTITIONING", "user"):
+        await chroma_store.upsert_memories([_memory("new", 0.4)])
+
+        await chroma_store.delete_user(USER)
+
+    for partitioning in chroma_store.MEMORY_VECTOR_PARTITIONINGS:
+        for name in await chroma_store.memories_collection_names(partitioning):
+            assert chroma_client.count(name, USER) == 0
+    assert chroma_client.count("gaia_memories", "user-2") == 1
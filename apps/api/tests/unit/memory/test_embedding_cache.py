@@ -0,0 +1,185 @@
+"""Unit tests for app.memory.embedding_cache and its use in embeddings."""
+
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import numpy as np
+import pytest
+
+from app.memory import embedding_cache as cache_module, embeddings
+from app.memory.embedding_cache import (
+    MEMORY_EMBEDDING_CACHE_REQUESTS_TOTAL,
+    EmbeddingCache,
+    normalize_text,
+)
+
+
+class _Pipeline:
+    def __init__(self, store: dict[str, str], fail: bool) -> None:
+        self._store = store
+        self._fail = fail
+        self._queued: list[tuple[str, int, str]] = []
+
+    def setex(self, key: str, ttl: int, value: str) -> None:
+        self._queued.append((key, ttl, value))
+
+    async def execute(self) -> None:
+        if self._fail:
+            raise ConnectionError("redis down")
+        for key, _ttl, value in self._queued:
+            self._store[key] = value
+
+
+class _FakeRedis:
+    """The ``mget`` / ``pipeline().setex`` surface the cache uses."""
+
+    def __init__(self, fail: bool = False) -> None:
+        self.store: dict[str, str] = {}
+        self.fail = fail
+        self.mget_calls = 0
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        self.mget_calls += 1
+        if self.fail:
+            raise ConnectionError("redis down")
+        return [self.store.get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> _Pipeline:
+        return _Pipeline(self.store, self.fail)
+
+
+@pytest.fixture
+def redis() -> Any:
+    fake = _FakeRedis()
+    with patch.object(cache_module.redis_cache, "redis", fake):
+        yield fake
+
+
+@pytest.fixture
+def no_redis() -> Any:
+    with patch.object(cache_module.redis_cache, "redis", None):
+        yield
+
+
+def _count(kind: str, outcome: str) -> float:
+    return MEMORY_EMBEDDING_CACHE_REQUESTS_TOTAL.labels(kind=kind, outcome=outcome)._value.get()
+
+
+class TestKeys:
+    def test_normalization_collapses_whitespace_and_unicode_forms(self) -> None:
+        assert normalize_text("  likes\t\n  tea ") == "likes tea"
+        assert normalize_text("café") == normalize_text("café")
+
+    def test_equivalent_texts_share_a_key(self) -> None:
+        cache = EmbeddingCache()
+        assert cache.key("passage", "likes  tea") == cache.key("passage", " likes tea")
+
+    def test_kind_and_model_are_part_of_the_key(self) -> None:
+        cache = EmbeddingCache(model="a")
+        assert cache.key("query", "x") != cache.key("passage", "x")
+        assert cache.key("query", "x") != EmbeddingCache(model="b").key("query", "x")
+        assert cache.key("query", "x") != EmbeddingCache(model="a", dim=8).key("query", "x")
+
+
+def _vectors(*rows: list[float]) -> np.ndarray:
+    return np.array(rows, dtype=np.float32)
+
+
+def _plain(found: list[np.ndarray | None]) -> list[list[float] | None]:
+    return [None if vector is None else vector.tolist() for vector in found]
+
+
+class TestEncoding:
+    def test_float32_round_trip_is_exact(self) -> None:
+        cache = EmbeddingCache(dtype="float32")
+        vector = np.random.default_rng(0).standard_normal(1024).astype(np.float32)
+        decoded = cache.decode(cache.encode(vector))
+        assert decoded.dtype == np.float32
+        assert np.array_equal(decoded, vector)
+
+    def test_float16_halves_the_payload_and_keeps_cosine(self) -> None:
+        vector = np.random.default_rng(1).standard_normal(1024).astype(np.float32)
+        vector /= np.linalg.norm(vector)
+        full, half = EmbeddingCache(dtype="float32"), EmbeddingCache(dtype="float16")
+        assert len(half.encode(vector)) * 2 <= len(full.encode(vector)) + 4
+        decoded = half.decode(half.encode(vector))
+        assert decoded.dtype == np.float32
+        assert float(decoded @ vector / np.linalg.norm(decoded)) > 0.9999
+
+
+class TestTiers:
+    async def test_local_lru_is_bounded(self, no_redis: None) -> None:
+        cache = EmbeddingCache(max_size=2)
+        await cache.put_many("passage", ["a", "b"], _vectors([1.0], [2.0]))
+        assert _plain(await cache.get_many("passage", ["a"])) == [[1.0]]
+        await cache.put_many("passage", ["c"], _vectors([3.0]))
+        # "b" was least recently used once "a" was read.
+        assert _plain(await cache.get_many("passage", ["a", "b", "c"])) == [[1.0], None, [3.0]]
+
+    async def test_stored_rows_do_not_pin_the_batch(self, no_redis: None) -> None:
+        cache = EmbeddingCache()
+        batch = _vectors([1.0], [2.0])
+        await cache.put_many("passage", ["a", "b"], batch)
+        (stored,) = await cache.get_many("passage", ["a"])
+        assert stored is not None
+        assert stored.base is None
+
+    async def test_redis_serves_what_another_process_stored(self, redis: _FakeRedis) -> None:
+        await EmbeddingCache().put_many("passage", ["a"], _vectors([0.5, 0.25]))
+        assert len(redis.store) == 1
+
+        fresh = EmbeddingCache()
+        assert _plain(await fresh.get_many("passage", ["a", "b"])) == [[0.5, 0.25], None]
+        # Promoted into the local tier: the next read does not reach Redis.
+        redis.mget_calls = 0
+        assert _plain(await fresh.get_many("passage", ["a"])) == [[0.5, 0.25]]
+        assert redis.mget_calls == 0
+
+    async def test_redis_errors_fail_open(self, redis: _FakeRedis) -> None:
+        redis.fail = True
+        cache = EmbeddingCache()
+        await cache.put_many("query", ["a"], _vectors([1.0]))
+        assert await EmbeddingCache().get_many("query", ["a"]) == [None]
+        assert _plain(await cache.get_many("query", ["a"])) == [[1.0]]
+
+    async def test_outcomes_are_counted(self, redis: _FakeRedis) -> None:
+        before = {o: _count("query", o) for o in ("local", "redis", "miss")}
+        writer = EmbeddingCache()
+        await writer.put_many("query", ["a"], _vectors([1.0]))
+        await writer.get_many("query", ["a"])
+        await EmbeddingCache().get_many("query", ["a", "b"])
+        after = {o: _count("query", o) for o in ("local", "redis", "miss")}
+        assert {o: after[o] - before[o] for o in after} == {"local": 1, "redis": 1, "miss": 1}
+
+
+class TestEmbeddingsUseTheCache:
+    @pytest.fixture(autouse=True)
+    def _enabled(self, no_redis: None) -> Any:
+        with (
+            patch.object(embeddings, "EMBEDDING_CACHE_ENABLED", True),
+            patch.object(embeddings, "embedding_cache", EmbeddingCache()),
+        ):
+            yield
+
+    async def test_embed_batch_computes_each_distinct_miss_once(self) -> None:
+        compute = AsyncMock(side_effect=lambda texts, _weight: _vectors(*[[len(t)] for t in texts]))
+        with patch.object(embeddings._embed_batcher, "submit", compute):
+            first = await embeddings.embed_batch(["ab", "abc", "ab"])
+            second = await embeddings.embed_batch(["abc", "abcd"])
+        assert first.dtype == second.dtype == np.float32
+        assert first.tolist() == [[2.0], [3.0], [2.0]]
+        assert second.tolist() == [[3.0], [4.0]]
+        assert [call.args[0] for call in compute.await_args_list] == [["ab", "abc"], ["abcd"]]
+
+    async def test_embed_query_is_cached_apart_from_passages(self) -> None:
+        query = AsyncMock(return_value=np.array([9.0], dtype=np.float32))
+        passage = AsyncMock(return_value=_vectors([1.0]))
+        with (
+            patch.object(embeddings._query_batcher, "submit", query),
+            patch.object(embeddings._embed_batcher, "submit", passage),
+        ):
+            assert (await embeddings.embed_query("tea")).tolist() == [9.0]
+            assert (await embeddings.embed_query("tea ")).tolist() == [9.0]
+            assert (await embeddings.embed_batch(["tea"])).tolist() == [[1.0]]
+        assert query.await_count == 1
+        assert passage.await_count == 1
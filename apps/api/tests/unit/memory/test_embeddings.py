@@ -14,10 +14,12 @@ from typing import Any
 from unittest.mock import MagicMock, patch
 
 import httpx
+import numpy as np
 import pytest
 
 from app.memory import embeddings
 from app.memory.embeddings import chunk_texts
+from app.memory.vectors import NPY_MEDIA_TYPE, encode_npy
 
 
 class TestChunkTexts:
@@ -84,15 +86,18 @@ class TestEmbedBatchSplitsRequests:
             observed.append((operation, backend, count))
             return await awaitable
 
-        async def fake_post(path: str, payload: dict) -> dict:
+        async def fake_post_vectors(path: str, payload: dict) -> np.ndarray:
             if path == "/embed_query":
                 assert set(payload) == {"text"}
                 calls.append({"path": path, "text": payload["text"]})
-                return {"vector": [0.0]}
+                return np.zeros(1, dtype=np.float32)
             if path == "/embed":
                 assert set(payload) == {"texts"}
                 calls.append({"path": path, "n": len(payload["texts"])})
-                return {"vectors": [[0.0]] * len(payload["texts"])}
+                return np.zeros((len(payload["texts"]), 1), dtype=np.float32)
+            raise AssertionError(f"unexpected sidecar path: {path}")
+
+        async def fake_post(path: str, payload: dict) -> dict:
             if path == "/rerank":
                 assert set(payload) == {"query", "documents"}
                 calls.append(
@@ -103,6 +108,7 @@ class TestEmbedBatchSplitsRequests:
 
         monkeypatch.setattr(embeddings, "_observed", fake_observed)
         monkeypatch.setattr(embeddings, "_sidecar_post", fake_post)
+        monkeypatch.setattr(embeddings, "_sidecar_post_vectors", fake_post_vectors)
         return calls, observed
 
     async def test_embed_query_sidecar_call_is_annotated_and_typed(
@@ -117,7 +123,8 @@ class TestEmbedBatchSplitsRequests:
 
         assert calls == [{"path": "/embed_query", "text": "what was decided"}]
         assert observed == [("embed_query", "sidecar", 1)]
-        assert vector == [0.0]
+        assert vector.dtype == np.float32
+        assert vector.tolist() == [0.0]
 
     @patch.object(embeddings, "_sidecar_url", return_value="http://sidecar:8200")
     async def test_embed_batch_splits_into_bounded_http_calls(
@@ -142,7 +149,7 @@ class TestEmbedBatchSplitsRequests:
             ("embed", "sidecar", 16),
             ("embed", "sidecar", 8),
         ]
-        assert len(vectors) == 40
+        assert vectors.shape == (40, 1)
 
     @patch.object(embeddings, "_sidecar_url", return_value="http://sidecar:8200")
     async def test_rerank_splits_documents_preserving_order_and_query(
@@ -430,3 +437,109 @@ class TestPooledClientThroughPublicApi:
         await closed.aclose()
         await embeddings.embed_query("three")
         assert len(made) == 2  # closed pools are replaced, not reused
+
+
+class TestBinaryWireFormat:
+    def _serve(self, monkeypatch: pytest.MonkeyPatch, response: httpx.Response) -> list[str]:
+        accepts: list[str] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            accepts.append(request.headers.get("accept", ""))
+            return response
+
+        transport = httpx.MockTransport(handler)
+        monkeypatch.setattr(
+            embeddings, "_get_http_client", lambda: httpx.AsyncClient(transport=transport)
+        )
+        monkeypatch.setattr(embeddings, "_sidecar_url", lambda: "http://sidecar.test")
+        return accepts
+
+    async def test_npy_frames_are_requested_and_decoded(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        sent = np.arange(6, dtype=np.float32).reshape(2, 3)
+        accepts = self._serve(
+            monkeypatch,
+            httpx.Response(200, content=encode_npy(sent), headers={"content-type": NPY_MEDIA_TYPE}),
+        )
+
+        vectors = await embeddings.embed_batch(["a", "b"])
+
+        assert accepts == [NPY_MEDIA_TYPE]
+        assert vectors.dtype == np.float32
+        assert np.array_equal(vectors, sent)
+
+    async def test_json_from_an_older_sidecar_is_still_understood(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        self._serve(monkeypatch, httpx.Response(200, json={"vectors": [[0.5, 1.5]]}))
+
+        vectors = await embeddings.embed_batch(["a"])
+
+        assert vectors.dtype == np.float32
+        assert vectors.tolist() == [[0.5, 1.5]]
+
+
+class TestMicroBatchedCalls:
+    @pytest.fixture
+    def posts(self, monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, dict]]:
+        calls: list[tuple[str, dict]] = []
+
+        async def fake_post_vectors(path: str, payload: dict) -> np.ndarray:
+            calls.append((path, payload))
+            if path in ("/embed_queries", "/embed"):
+                return np.array([[len(text)] for text in payload["texts"]], dtype=np.float32)
+            raise AssertionError(f"unexpected sidecar path: {path}")
+
+        async def fake_post(path: str, payload: dict) -> dict:
+            calls.append((path, payload))
+            if path == "/rerank_pairs":
+                return {"scores": [float(len(q + d)) for q, d in payload["pairs"]]}
+            raise AssertionError(f"unexpected sidecar path: {path}")
+
+        monkeypatch.setattr(embeddings, "_sidecar_url", lambda: "http://sidecar.test")
+        monkeypatch.setattr(embeddings, "_sidecar_post", fake_post)
+        monkeypatch.setattr(embeddings, "_sidecar_post_vectors", fake_post_vectors)
+        return calls
+
+    async def test_concurrent_queries_share_one_request(
+        self, posts: list[tuple[str, dict]]
+    ) -> None:
+        vectors = await asyncio.gather(
+            embeddings.embed_query("a"), embeddings.embed_query("bb"), embeddings.embed_query("ccc")
+        )
+
+        assert [vector.tolist() for vector in vectors] == [[1.0], [2.0], [3.0]]
+        assert posts == [("/embed_queries", {"texts": ["a", "bb", "ccc"]})]
+
+    async def test_concurrent_embed_batches_share_one_request(
+        self, posts: list[tuple[str, dict]]
+    ) -> None:
+        first, second = await asyncio.gather(
+            embeddings.embed_batch(["a", "bb"]), embeddings.embed_batch(["ccc"])
+        )
+
+        assert (first.tolist(), second.tolist()) == ([[1.0], [2.0]], [[3.0]])
+        assert posts == [("/embed", {"texts": ["a", "bb", "ccc"]})]
+
+    async def test_concurrent_reranks_score_pairs_in_one_request(
+        self, posts: list[tuple[str, dict]]
+    ) -> None:
+        first, second = await asyncio.gather(
+            embeddings.rerank("q", ["d", "dd"]), embeddings.rerank("qq", ["ddd"])
+        )
+
+        assert (first, second) == ([2.0, 3.0], [5.0])
+        assert posts == [("/rerank_pairs", {"pairs": [["q", "d"], ["q", "dd"], ["qq", "ddd"]]})]
+
+    async def test_local_queries_share_one_forward_pass(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(embeddings, "_sidecar_url", lambda: None)
+        batched = MagicMock(return_value=np.array([[1.0], [2.0]], dtype=np.float32))
+        monkeypatch.setattr(embeddings, "_embed_queries_sync", batched)
+
+        vectors = await asyncio.gather(embeddings.embed_query("a"), embeddings.embed_query("b"))
+
+        assert [vector.tolist() for vector in vectors] == [[1.0], [2.0]]
+        batched.assert_called_once_with(["a", "b"])
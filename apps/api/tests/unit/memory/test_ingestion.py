@@ -8,6 +8,7 @@ application, chunking, journaling and scheduling logic under test is real.
 does, because the Chroma vector ids are derived from it after the insert.
 """
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import UTC, date as date_type, datetime
 from typing import Any
@@ -30,7 +31,14 @@ from app.constants.memory import (
     ReconcileOutcome,
 )
 from app.memory import ingestion
-from app.memory.ingestion import RetainResult, retain, retain_single, summarize_episode
+from app.memory.ingestion import (
+    RetainResult,
+    RetainSession,
+    retain,
+    retain_many,
+    retain_single,
+    summarize_episode,
+)
 from app.memory.reconciliation import ReconciledFact
 from app.memory.schemas import (
     ExtractedEdge,
@@ -41,6 +49,7 @@ from app.memory.schemas import (
 )
 from app.models.memory_db_models import MemoryRecord
 from app.models.payment_models import PlanType
+from app.services.memory_fs import MemoryVfsChange
 
 USER = "user-1"
 
@@ -597,6 +606,18 @@ class TestSummarizeEpisode:
         assert item["embedding"] == [0.9, 0.9]
         assert item["metadata"] == {"user_id": USER, "date": "2026-01-01"}
 
+    async def test_summary_schedules_the_days_journal_page(self, boundaries: Boundaries) -> None:
+        # The backfill summarizes outside retain; nothing else would re-project the day.
+        boundaries.get_episode.return_value = make_episode(
+            entries=[{"time": "09:00", "text": "shipped it"}]
+        )
+        boundaries.summarize_episode_entries.return_value = "A productive day."
+        await summarize_episode(USER, date_type(2026, 1, 1))
+
+        boundaries.schedule_vfs_sync.assert_called_once_with(
+            USER, MemoryVfsChange(days={date_type(2026, 1, 1)})
+        )
+
     async def test_failed_summarization_writes_nothing(self, boundaries: Boundaries) -> None:
         boundaries.get_episode.return_value = make_episode(
             entries=[{"time": "09:00", "text": "shipped it"}]
@@ -606,6 +627,7 @@ class TestSummarizeEpisode:
         boundaries.set_episode_summary.assert_not_awaited()
         boundaries.upsert_episode.assert_not_awaited()
         boundaries.embed_query.assert_not_awaited()
+        boundaries.schedule_vfs_sync.assert_not_called()
 
     async def test_entries_missing_keys_do_not_crash_the_summary(
         self, boundaries: Boundaries
@@ -623,7 +645,8 @@ class TestSummarizeRolledOverDays:
             make_episode(entries=[{"time": "10:00", "text": "a"}]),
             make_episode(entries=[{"time": "10:00", "text": "b"}]),
         ]
-        await ingestion._summarize_rolled_over_days(USER, today=date_type(2026, 1, 3))
+        rolled_over = await ingestion._summarize_rolled_over_days(USER, today=date_type(2026, 1, 3))
+        assert rolled_over == days
         assert boundaries.set_episode_summary.await_count == 2
         assert [call.args[1] for call in boundaries.set_episode_summary.await_args_list] == days
 
@@ -728,7 +751,7 @@ class TestApplyReconciled:
         target_id, user_id, record, relation = boundaries.supersede_memory.await_args.args
         assert (target_id, user_id, relation) == ("old-1", USER, MemoryRelationType.UPDATES)
         assert record.content == "sam moved to berlin"
-        boundaries.set_memory_flags.assert_awaited_once_with("old-1", is_latest=False)
+        boundaries.set_memory_flags.assert_awaited_once_with(USER, "old-1", is_latest=False)
 
     async def test_updates_whose_target_vanished_is_stored_as_new(
         self, boundaries: Boundaries
@@ -981,19 +1004,29 @@ class TestApplyGraph:
 
 
 class TestSchedulePostIngest:
-    async def test_projection_sync_always_runs(self, boundaries: Boundaries) -> None:
-        await ingestion._schedule_post_ingest(USER, inserted_facts=[], agenda_updates=[])
-        boundaries.schedule_vfs_sync.assert_called_once_with(USER)
+    async def test_the_touched_pages_are_handed_to_the_projection_sync(
+        self, boundaries: Boundaries
+    ) -> None:
+        change = MemoryVfsChange(categories={"work"})
+        await ingestion._schedule_post_ingest(
+            USER, inserted_facts=[], agenda_updates=[], vfs_change=change
+        )
+        boundaries.schedule_vfs_sync.assert_called_once_with(USER, change)
 
     async def test_no_touched_documents_skips_consolidation(self, boundaries: Boundaries) -> None:
-        await ingestion._schedule_post_ingest(USER, inserted_facts=[], agenda_updates=[])
+        await ingestion._schedule_post_ingest(
+            USER, inserted_facts=[], agenda_updates=[], vfs_change=MemoryVfsChange()
+        )
         boundaries.schedule_consolidation.assert_not_awaited()
 
     async def test_agenda_updates_alone_schedule_the_agenda_document(
         self, boundaries: Boundaries
     ) -> None:
         await ingestion._schedule_post_ingest(
-            USER, inserted_facts=[], agenda_updates=["owes the user a draft"]
+            USER,
+            inserted_facts=[],
+            agenda_updates=["owes the user a draft"],
+            vfs_change=MemoryVfsChange(),
         )
         user_id, doc_types = boundaries.schedule_consolidation.await_args.args
         assert user_id == USER
@@ -1009,6 +1042,7 @@ class TestSchedulePostIngest:
             USER,
             inserted_facts=[make_fact("went to berlin", kind=MemoryKind.EXPERIENCE)],
             agenda_updates=[],
+            vfs_change=MemoryVfsChange(),
         )
         doc_types = boundaries.schedule_consolidation.await_args.args[1]
         assert MemoryDocType.INSIGHTS_MD in doc_types
@@ -1136,7 +1170,9 @@ class TestRetainSingle:
                 USER, "went to berlin", category_path="life", source_type=MemorySourceType.MANUAL
             )
         boundaries.invalidate_caches.assert_awaited_once_with(USER)
-        boundaries.schedule_vfs_sync.assert_called_once_with(USER)
+        boundaries.schedule_vfs_sync.assert_called_once_with(
+            USER, MemoryVfsChange(categories={"preferences"})
+        )
         assert MemoryDocType.INSIGHTS_MD in boundaries.schedule_consolidation.await_args.args[1]
 
     async def test_entities_are_attached_to_the_returned_entry(
@@ -1185,7 +1221,7 @@ class TestRetain:
         assert boundaries.schedule_consolidation.await_args.kwargs["agenda_updates"] == [
             "GAIA owes the user the Q3 draft"
         ]
-        boundaries.schedule_vfs_sync.assert_called_once_with(USER)
+        boundaries.schedule_vfs_sync.assert_called_once_with(USER, MemoryVfsChange())
 
     async def test_journal_only_extraction_is_persisted(self, boundaries: Boundaries) -> None:
         boundaries.extract_memories.return_value = ExtractedMemoryBatch(
@@ -1202,6 +1238,9 @@ class TestRetain:
         _, day, entries = boundaries.append_episode_entries.await_args.args
         assert day == date_type(2026, 3, 5)
         assert entries[0]["text"] == "Asked GAIA to draft an email"
+        boundaries.schedule_vfs_sync.assert_called_once_with(
+            USER, MemoryVfsChange(days={date_type(2026, 3, 5)})
+        )
 
     async def test_counts_from_apply_are_reported_on_the_result(
         self, boundaries: Boundaries
@@ -1223,6 +1262,9 @@ class TestRetain:
         assert result.facts_extracted == 2
         assert result.new == 1
         assert result.updated == 1
+        change = boundaries.schedule_vfs_sync.call_args.args[1]
+        assert change.memory_ids == {"old"}
+        assert change.categories == {"preferences"}
 
     async def test_extraction_receives_the_prior_context(self, boundaries: Boundaries) -> None:
         boundaries.get_folder_tree.return_value = [("work", 4)]
@@ -1390,3 +1432,213 @@ class TestRetain:
         assert user_id == USER
         assert reconcile_facts == facts
         assert embeddings == [[0.0, 0.5], [1.0, 0.5]]
+
+
+def _session(text: str, day: int = 1) -> RetainSession:
+    return RetainSession(
+        messages=[{"role": "user", "content": text}],
+        source_type=MemorySourceType.CONVERSATION,
+        source_id=f"conv-{text}",
+        now=datetime(2026, 1, day, tzinfo=UTC),
+    )
+
+
+async def _drain(sessions: list[RetainSession], concurrency: int) -> list[RetainSession]:
+    return [session async for session, _ in retain_many(USER, sessions, concurrency=concurrency)]
+
+
+class TestRetainMany:
+    @pytest.fixture(autouse=True)
+    def _echo_extraction(self, boundaries: Boundaries) -> None:
+        """Each transcript yields one fact carrying its text; every fact is NEW."""
+
+        async def extract(messages: list[dict[str, str]], **_: Any) -> ExtractedMemoryBatch:
+            return ExtractedMemoryBatch(facts=[make_fact(messages[0]["content"])])
+
+        async def reconcile(
+            _user_id: str, facts: list[ExtractedFact], embeddings: Any
+        ) -> list[ReconciledFact]:
+            return [
+                make_reconciled(fact, embedding=list(row))
+                for fact, row in zip(facts, embeddings, strict=True)
+            ]
+
+        boundaries.extract_memories.side_effect = extract
+        boundaries.reconcile.side_effect = reconcile
+
+    async def test_sessions_are_applied_in_input_order(self, boundaries: Boundaries) -> None:
+        sessions = [_session("a", 1), _session("b", 2), _session("c", 3)]
+
+        applied = await _drain(sessions, concurrency=3)
+
+        assert applied == sessions
+        reconciled = [call.args[1][0].content for call in boundaries.reconcile.await_args_list]
+        assert reconciled == ["a", "b", "c"]
+        assert [r.mentioned_at.day for r in boundaries.inserted_records] == [1, 2, 3]
+
+    async def test_ready_extractions_share_one_embedding_call(self, boundaries: Boundaries) -> None:
+        await _drain([_session("a"), _session("b")], concurrency=2)
+
+        [call] = boundaries.embed_batch.await_args_list
+        assert call.args[0] == ["a", "user: a", "b", "user: b"]
+        # Each session's facts and chunks get their own rows of the batch.
+        assert boundaries.reconcile.await_args_list[1].args[2] == [[2.0, 0.5]]
+        assert [
+            item["document"]
+            for item in boundaries.upsert_conversation_chunks.await_args_list[1].args[0]
+        ] == ["user: b"]
+
+    async def test_extractions_run_ahead_of_the_apply_cursor(self, boundaries: Boundaries) -> None:
+        events: list[str] = []
+        extract = boundaries.extract_memories.side_effect
+
+        async def tracked_extract(messages: list[dict[str, str]], **kwargs: Any) -> Any:
+            events.append(f"extract {messages[0]['content']}")
+            return await extract(messages, **kwargs)
+
+        reconcile = boundaries.reconcile.side_effect
+
+        async def tracked_reconcile(user_id: str, facts: Any, embeddings: Any) -> Any:
+            events.append(f"reconcile {facts[0].content}")
+            return await reconcile(user_id, facts, embeddings)
+
+        boundaries.extract_memories.side_effect = tracked_extract
+        boundaries.reconcile.side_effect = tracked_reconcile
+
+        await _drain([_session("a"), _session("b"), _session("c")], concurrency=2)
+
+        assert events.index("extract b") < events.index("reconcile a")
+        assert events.index("reconcile a") < events.index("reconcile b")
+
+    async def test_concurrency_one_embeds_each_session_on_its_own(
+        self, boundaries: Boundaries
+    ) -> None:
+        await _drain([_session("a"), _session("b")], concurrency=1)
+
+        assert [call.args[0] for call in boundaries.embed_batch.await_args_list] == [
+            ["a", "user: a"],
+            ["b", "user: b"],
+        ]
+
+    async def test_empty_extraction_is_yielded_without_applying(
+        self, boundaries: Boundaries
+    ) -> None:
+        boundaries.extract_memories.side_effect = None
+        boundaries.extract_memories.return_value = ExtractedMemoryBatch()
+
+        results = [result async for _, result in retain_many(USER, [_session("a")], concurrency=2)]
+
+        assert results == [RetainResult(facts_extracted=0)]
+        boundaries.embed_batch.assert_not_awaited()
+        boundaries.reconcile.assert_not_awaited()
+        boundaries.upsert_conversation_chunks.assert_not_awaited()
+
+    async def test_extraction_failure_propagates_and_cancels_the_rest(
+        self, boundaries: Boundaries
+    ) -> None:
+        boundaries.extract_memories.side_effect = RuntimeError("extraction down")
+
+        with pytest.raises(RuntimeError, match="extraction down"):
+            await _drain([_session("a"), _session("b")], concurrency=2)
+
+        boundaries.reconcile.assert_not_awaited()
+
+
+class TestRetainStageGraph:
+    async def test_context_reads_run_concurrently(self, boundaries: Boundaries) -> None:
+        started: list[str] = []
+        release = asyncio.Event()
+
+        def _blocking(name: str, value: Any) -> Any:
+            async def read(*_: Any, **__: Any) -> Any:
+                started.append(name)
+                await release.wait()
+                return value
+
+            return read
+
+        boundaries.get_folder_tree.side_effect = _blocking("tree", [])
+        boundaries.get_recent_facts.side_effect = _blocking("facts", [])
+        boundaries.get_episode.side_effect = _blocking("episode", None)
+
+        task = asyncio.ensure_future(
+            retain(
+                USER, [{"role": "user", "content": "hi"}], source_type=MemorySourceType.CONVERSATION
+            )
+        )
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert sorted(started) == ["episode", "facts", "tree"]
+        release.set()
+        await task
+
+    async def test_chunks_and_journal_overlap_with_fact_reconciliation(
+        self, boundaries: Boundaries
+    ) -> None:
+        fact = make_fact("first")
+        boundaries.extract_memories.return_value = ExtractedMemoryBatch(
+            facts=[fact], episode_entries=["Talked about tea"]
+        )
+        chunks_stored = asyncio.Event()
+        journaled = asyncio.Event()
+        boundaries.upsert_conversation_chunks.side_effect = lambda *_: chunks_stored.set()
+        boundaries.append_episode_entries.side_effect = lambda *_: journaled.set()
+
+        async def reconcile(*_: Any) -> list[ReconciledFact]:
+            # Serial stages would deadlock here: both land only after apply.
+            await asyncio.wait_for(asyncio.gather(chunks_stored.wait(), journaled.wait()), 1)
+            return [make_reconciled(fact)]
+
+        boundaries.reconcile.side_effect = reconcile
+
+        result = await retain(
+            USER, [{"role": "user", "content": "hi"}], source_type=MemorySourceType.CONVERSATION
+        )
+
+        assert result.new == 1
+        assert result.episode_entries == 1
+        boundaries.invalidate_caches.assert_awaited_once_with(USER)
+
+
+class TestStageClock:
+    def _clock(self, spans: dict[str, tuple[float, float]]) -> Any:
+        clock = ingestion._StageClock()
+        clock.started = 0.0
+        for name, (start, end) in spans.items():
+            clock.record(name, start, end)
+        return clock
+
+    def test_critical_path_follows_the_slowest_branch(self) -> None:
+        clock = self._clock(
+            {
+                "context": (0.0, 0.01),
+                "extract": (0.01, 1.0),
+                "embed": (1.0, 1.05),
+                "reconcile": (1.05, 1.1),
+                "apply": (1.1, 1.2),
+                "episodes": (1.0, 1.9),
+                "chunks": (1.0, 1.3),
+                "finalize": (1.9, 1.95),
+            }
+        )
+
+        assert clock.critical_path() == ["context", "extract", "episodes", "finalize"]
+
+    def test_timings_report_stage_path_and_serial_costs(self) -> None:
+        clock = self._clock(
+            {
+                "context": (0.0, 0.125),
+                "extract": (0.125, 0.5),
+                "chunks": (0.5, 0.625),
+                "embed": (0.5, 0.75),
+            }
+        )
+
+        timings = clock.timings()
+
+        assert timings["extract_ms"] == 375.0
+        assert timings["critical_path_ms"] == 750.0
+        assert timings["serial_ms"] == 875.0
+
+    def test_empty_clock_has_no_critical_path(self) -> None:
+        assert ingestion._StageClock().critical_path() == []
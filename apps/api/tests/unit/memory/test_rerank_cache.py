@@ -0,0 +1,80 @@
+"""Unit tests for app.memory.rerank_cache."""
+
+from collections.abc import Mapping
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from app.memory import rerank_cache as cache_module
+from app.memory.rerank_cache import RerankScoreCache
+
+
+class _Pipeline:
+    def __init__(self, redis: "_FakeRedis") -> None:
+        self._redis = redis
+        self._writes: list[tuple[str, Mapping[str, str]]] = []
+
+    def hset(self, name: str, *, mapping: Mapping[str, str]) -> None:
+        self._writes.append((name, mapping))
+
+    def expire(self, name: str, time: int) -> None:
+        self._redis.ttls[name] = time
+
+    async def execute(self) -> None:
+        if self._redis.fail:
+            raise ConnectionError("redis down")
+        for name, mapping in self._writes:
+            self._redis.hashes.setdefault(name, {}).update(mapping)
+
+
+class _FakeRedis:
+    """The ``hmget`` / ``pipeline().hset`` surface the cache uses."""
+
+    def __init__(self) -> None:
+        self.hashes: dict[str, dict[str, str]] = {}
+        self.ttls: dict[str, int] = {}
+        self.fail = False
+
+    async def hmget(self, name: str, keys: list[str]) -> list[str | None]:
+        if self.fail:
+            raise ConnectionError("redis down")
+        return [self.hashes.get(name, {}).get(key) for key in keys]
+
+    def pipeline(self, transaction: bool = True) -> _Pipeline:
+        return _Pipeline(self)
+
+
+@pytest.fixture
+def redis() -> Any:
+    fake = _FakeRedis()
+    with patch.object(cache_module.redis_cache, "redis", fake):
+        yield fake
+
+
+class TestRerankScoreCache:
+    async def test_one_hash_per_query_shared_across_processes(self, redis: _FakeRedis) -> None:
+        await RerankScoreCache(ttl=60).put_many("where do I work", ["m1:1", "m2:1"], [2.5, -1.25])
+        assert list(redis.ttls.values()) == [60]
+        fresh = RerankScoreCache()
+        assert await fresh.get_many("where do  I work ", ["m2:1", "m1:2", "m1:1"]) == [
+            -1.25,
+            None,
+            2.5,
+        ]
+
+    async def test_model_is_part_of_the_key(self) -> None:
+        assert RerankScoreCache(model="a").key("q") != RerankScoreCache(model="b").key("q")
+
+    async def test_local_lru_is_bounded(self) -> None:
+        cache = RerankScoreCache(max_size=2)
+        with patch.object(cache_module.redis_cache, "redis", None):
+            await cache.put_many("q", ["a:1", "b:1", "c:1"], [1.0, 2.0, 3.0])
+            assert await cache.get_many("q", ["a:1", "b:1", "c:1"]) == [None, 2.0, 3.0]
+
+    async def test_redis_errors_fail_open(self, redis: _FakeRedis) -> None:
+        redis.fail = True
+        cache = RerankScoreCache()
+        await cache.put_many("q", ["a:1"], [1.0])
+        assert await RerankScoreCache().get_many("q", ["a:1"]) == [None]
+        assert await cache.get_many("q", ["a:1"]) == [1.0]
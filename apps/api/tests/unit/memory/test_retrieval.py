@@ -7,6 +7,7 @@ is mocked; the fusion, filtering, scoring and assembly logic under test is real.
 from datetime import UTC, date as date_type, datetime, timedelta
 from fnmatch import fnmatch
 import math
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 import uuid
 
@@ -30,7 +31,8 @@ from app.constants.memory import (
     MemoryKind,
     MemoryRelationType,
 )
-from app.memory import retrieval
+from app.memory import rerank_cache as rerank_cache_module, retrieval
+from app.memory.rerank_cache import MEMORY_RERANK_PAIRS_TOTAL, RerankScoreCache
 from app.memory.retrieval import (
     EpisodeHit,
     _build_entries,
@@ -601,6 +603,79 @@ class TestRerankAndBoost:
         rerank.assert_awaited_once_with("my query", ["alpha", "beta"])
 
 
+class TestRerankScoreCacheAndCascade:
+    @pytest.fixture
+    def cache(self) -> Any:
+        with (
+            patch.object(retrieval, "RERANK_CACHE_ENABLED", True),
+            patch.object(retrieval, "rerank_cache", RerankScoreCache()) as cache,
+            patch.object(rerank_cache_module.redis_cache, "redis", None),
+        ):
+            yield cache
+
+    async def test_cached_pairs_skip_the_cross_encoder(self, cache: RerankScoreCache) -> None:
+        rows = [make_row("alpha"), make_row("beta")]
+        with patch.object(retrieval, "rerank", new=AsyncMock(return_value=[2.0, -1.0])):
+            first = await _rerank_and_boost("q", rows, ann_similarity={}, fts_ids=set())
+        newcomer = make_row("gamma")
+        rerank = AsyncMock(return_value=[0.5])
+        with patch.object(retrieval, "rerank", new=rerank):
+            second = await _rerank_and_boost(
+                "q ", [*rows, newcomer], ann_similarity={}, fts_ids=set()
+            )
+        rerank.assert_awaited_once_with("q ", ["gamma"])
+        assert [item.row.content for item in first] == ["alpha", "beta"]
+        assert [item.row.content for item in second] == ["alpha", "gamma", "beta"]
+
+    async def test_a_new_version_of_a_memory_is_rescored(self, cache: RerankScoreCache) -> None:
+        row = make_row("alpha")
+        with patch.object(retrieval, "rerank", new=AsyncMock(return_value=[2.0])):
+            await _rerank_and_boost("q", [row], ann_similarity={}, fts_ids=set())
+        row.version = 2
+        rerank = AsyncMock(return_value=[1.0])
+        with patch.object(retrieval, "rerank", new=rerank):
+            await _rerank_and_boost("q", [row], ann_similarity={}, fts_ids=set())
+        rerank.assert_awaited_once()
+
+    async def test_cascade_skips_decisive_candidates_and_caps_the_rest(self) -> None:
+        rows = [make_row(f"m{i}") for i in range(6)]
+        anchored = str(rows[0].id)
+        rerank = AsyncMock(return_value=[3.0, 1.0])
+        before = _pairs("skipped")
+        with (
+            patch.object(retrieval, "RERANK_CASCADE_BUDGET", 2),
+            patch.object(retrieval, "rerank", new=rerank),
+        ):
+            scored = await _rerank_and_boost(
+                "q",
+                rows,
+                ann_similarity={anchored: CONFIDENT_COSINE + 0.1},
+                fts_ids={anchored},
+            )
+        # rows[0] is decisive; rows[1..2] fill the budget; rows[3..5] rank on retrieval.
+        rerank.assert_awaited_once_with("q", ["m1", "m2"])
+        assert _pairs("skipped") - before == 4
+        decisive = next(item for item in scored if item.row is rows[0])
+        assert decisive.confident is True
+        assert len(scored) == len(rows)
+
+    async def test_without_a_budget_every_candidate_is_scored(self) -> None:
+        row = make_row("alpha")
+        rerank = AsyncMock(return_value=[0.0])
+        with patch.object(retrieval, "rerank", new=rerank):
+            await _rerank_and_boost(
+                "q",
+                [row],
+                ann_similarity={str(row.id): CONFIDENT_COSINE + 0.1},
+                fts_ids={str(row.id)},
+            )
+        rerank.assert_awaited_once()
+
+
+def _pairs(outcome: str) -> float:
+    return MEMORY_RERANK_PAIRS_TOTAL.labels(outcome=outcome)._value.get()
+
+
 # ---------------------------------------------------------------------------
 # _graph_siblings
 # ---------------------------------------------------------------------------
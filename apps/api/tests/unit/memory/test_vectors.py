@@ -0,0 +1,60 @@
+"""Unit tests for embedding arrays and their .npy wire format (app.memory.vectors)."""
+
+import io
+
+import numpy as np
+import pytest
+
+from app.constants.memory import EMBEDDING_DIM
+from app.memory.vectors import (
+    as_embeddings,
+    decode_npy,
+    empty_embeddings,
+    encode_npy,
+    split_rows,
+)
+
+
+def test_npy_round_trip_is_exact() -> None:
+    vectors = np.random.default_rng(0).standard_normal((4, 8)).astype(np.float32)
+
+    decoded = decode_npy(encode_npy(vectors))
+
+    assert decoded.dtype == np.float32
+    assert decoded.flags["C_CONTIGUOUS"]
+    np.testing.assert_array_equal(decoded, vectors)
+
+
+def test_encode_casts_to_float32() -> None:
+    decoded = decode_npy(encode_npy(np.array([[0.5, 1.5]], dtype=np.float64)))
+
+    assert decoded.dtype == np.float32
+    assert decoded.tolist() == [[0.5, 1.5]]
+
+
+def test_decode_refuses_pickled_frames() -> None:
+    buffer = io.BytesIO()
+    np.save(buffer, np.array([{"a": 1}], dtype=object), allow_pickle=True)
+
+    with pytest.raises(ValueError):
+        decode_npy(buffer.getvalue())
+
+
+def test_as_embeddings_keeps_an_already_contiguous_batch() -> None:
+    vectors = np.zeros((2, 3), dtype=np.float32)
+
+    assert as_embeddings(vectors) is vectors
+    assert as_embeddings(vectors[:, ::2]).flags["C_CONTIGUOUS"]
+
+
+def test_split_rows_follows_caller_sizes() -> None:
+    matrix = np.arange(12, dtype=np.float32).reshape(6, 2)
+
+    parts = split_rows(matrix, [1, 0, 3, 2])
+
+    assert [part.shape[0] for part in parts] == [1, 0, 3, 2]
+    np.testing.assert_array_equal(np.concatenate(parts), matrix)
+
+
+def test_empty_embeddings_has_the_model_width() -> None:
+    assert empty_embeddings().shape == (0, EMBEDDING_DIM)
@@ -18,15 +18,18 @@ from unittest.mock import MagicMock, patch
 
 import httpx
 from httpx import ASGITransport, AsyncClient
+import numpy as np
 import pytest
 
 from app.memory import embeddings
+from app.memory.vectors import NPY_MEDIA_TYPE, decode_npy
 from app.services.embedding_sidecar import server
 
 TEXTS = ["first passage", "second passage"]
-VECTORS = [[0.1, 0.2, 0.3], [0.4, 0.5, 0.6]]
+# Exactly representable in float32, so the JSON body matches the arrays.
+VECTORS = np.array([[0.25, 0.5, 0.75], [1.0, 1.25, 1.5]], dtype=np.float32)
 QUERY = "what is gaia"
-QUERY_VECTOR = [0.7, 0.8, 0.9]
+QUERY_VECTOR = np.array([1.75, 2.0, 2.25], dtype=np.float32)
 DOCUMENTS = ["doc one", "doc two", "doc three"]
 SCORES = [0.95, 0.62, 0.41]
 
@@ -60,9 +63,21 @@ class TestEmbed:
         response = await sidecar_client.post("/embed", json={"texts": TEXTS})
 
         assert response.status_code == 200
-        assert response.json() == {"vectors": VECTORS}
+        assert response.json() == {"vectors": VECTORS.tolist()}
         mock_embed.assert_called_once_with(TEXTS)
 
+    @patch.object(server, "_embed_sync", return_value=VECTORS)
+    async def test_npy_accept_returns_a_binary_frame(
+        self, mock_embed: MagicMock, sidecar_client: AsyncClient
+    ) -> None:
+        response = await sidecar_client.post(
+            "/embed", json={"texts": TEXTS}, headers={"Accept": NPY_MEDIA_TYPE}
+        )
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == NPY_MEDIA_TYPE
+        np.testing.assert_array_equal(decode_npy(response.content), VECTORS)
+
     @patch.object(server, "_embed_sync", return_value=VECTORS)
     async def test_empty_texts_returns_empty_without_calling_model(
         self, mock_embed: MagicMock, sidecar_client: AsyncClient
@@ -95,9 +110,19 @@ class TestEmbedQuery:
         response = await sidecar_client.post("/embed_query", json={"text": QUERY})
 
         assert response.status_code == 200
-        assert response.json() == {"vector": QUERY_VECTOR}
+        assert response.json() == {"vector": QUERY_VECTOR.tolist()}
         mock_embed_query.assert_called_once_with(QUERY)
 
+    @patch.object(server, "_embed_query_sync", return_value=QUERY_VECTOR)
+    async def test_npy_accept_returns_a_one_dimensional_frame(
+        self, mock_embed_query: MagicMock, sidecar_client: AsyncClient
+    ) -> None:
+        response = await sidecar_client.post(
+            "/embed_query", json={"text": QUERY}, headers={"Accept": NPY_MEDIA_TYPE}
+        )
+
+        np.testing.assert_array_equal(decode_npy(response.content), QUERY_VECTOR)
+
     async def test_missing_text_is_rejected(self, sidecar_client: AsyncClient) -> None:
         response = await sidecar_client.post("/embed_query", json={})
 
@@ -365,3 +390,47 @@ class TestClientRetryContract:
 
         assert response.status_code == 200
         assert len(attempts) == 2
+
+
+class TestMicroBatching:
+    async def test_concurrent_embed_requests_share_one_model_call(
+        self, sidecar_client: AsyncClient
+    ) -> None:
+        with patch.object(
+            server,
+            "_embed_sync",
+            side_effect=lambda texts: np.array([[len(t)] for t in texts], dtype=np.float32),
+        ) as mock_embed:
+            first, second = await asyncio.gather(
+                sidecar_client.post("/embed", json={"texts": ["a", "bb"]}),
+                sidecar_client.post("/embed", json={"texts": ["ccc"]}),
+            )
+
+        assert first.json() == {"vectors": [[1.0], [2.0]]}
+        assert second.json() == {"vectors": [[3.0]]}
+        mock_embed.assert_called_once_with(["a", "bb", "ccc"])
+
+    async def test_embed_queries_batches_with_the_query_instruction(
+        self, sidecar_client: AsyncClient
+    ) -> None:
+        with patch.object(server, "_embed_queries_sync", return_value=VECTORS) as batched:
+            response = await sidecar_client.post("/embed_queries", json={"texts": TEXTS})
+
+        assert response.json() == {"vectors": VECTORS.tolist()}
+        batched.assert_called_once_with(TEXTS)
+
+    async def test_rerank_pairs_with_mixed_queries_use_one_model_call(
+        self, sidecar_client: AsyncClient
+    ) -> None:
+        pairs = [["q1", "d1"], ["q2", "d2"]]
+        with patch.object(server, "_rerank_pairs_sync", return_value=[0.9, 0.1]) as batched:
+            response = await sidecar_client.post("/rerank_pairs", json={"pairs": pairs})
+
+        assert response.json() == {"scores": [0.9, 0.1]}
+        batched.assert_called_once_with([("q1", "d1"), ("q2", "d2")])
+
+    async def test_oversized_pair_rejected_with_413(self, sidecar_client: AsyncClient) -> None:
+        oversized = "x" * (server.EMBEDDING_SIDECAR_MAX_TEXT_CHARS + 1)
+        response = await sidecar_client.post("/rerank_pairs", json={"pairs": [["q", oversized]]})
+
+        assert response.status_code == 413
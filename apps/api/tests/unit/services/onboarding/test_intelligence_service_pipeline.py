@@ -178,7 +178,7 @@ class TestScanThenEnqueueMemory:
         async def scan(user_id: str, ctx: Any) -> None:
             order.append("scan")
 
-        async def enqueue(job: str, uid: str) -> None:
+        async def enqueue(job: str, uid: str, **_options: Any) -> None:
             order.append(f"enqueue:{job}")
 
         pool.enqueue_job = AsyncMock(side_effect=enqueue)
@@ -191,6 +191,7 @@ class TestScanThenEnqueueMemory:
 
         assert order == ["scan", "enqueue:process_gmail_emails_to_memory"]
         assert pool.enqueue_job.await_args.args == ("process_gmail_emails_to_memory", USER)
+        assert pool.enqueue_job.await_args.kwargs["_queue_name"] == "arq:queue:bulk"
 
     async def test_a_queue_failure_does_not_fail_the_scan(self) -> None:
         # The visible scan already succeeded; losing durable ingestion must not
@@ -0,0 +1,235 @@
+"""Unit tests for the incremental memory projection (app.services.memory_fs).
+
+The JuiceFS mount is redirected into ``tmp_path`` through the two seams
+``_vfs_scheduler`` owns, and Postgres is an in-memory stand-in, so every
+assertion is about which files a sync touches.
+"""
+
+import asyncio
+from collections.abc import Iterator
+from datetime import UTC, date, datetime, timedelta
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+import uuid
+
+import pytest
+
+from app.constants.memory import MemoryDocType
+from app.services import _vfs_scheduler, memory_fs
+from app.services.memory_fs import MemoryVfsChange, sync_user_memory_fs
+
+USER = "user-1"
+TODAY = datetime.now(UTC).date()
+
+
+class FakeStore:
+    """The slice of ``pg_store`` the projection reads, backed by lists."""
+
+    def __init__(self) -> None:
+        self.memories: list[SimpleNamespace] = []
+        self.documents: dict[str, str] = {}
+        self.episodes: dict[date, list[dict[str, str]]] = {}
+
+    def add(self, content: str, category_path: str, *, live: bool = True) -> str:
+        memory_id = str(uuid.uuid4())
+        self.memories.append(
+            SimpleNamespace(
+                id=memory_id,
+                content=content,
+                category_path=category_path,
+                importance=0.5,
+                live=live,
+            )
+        )
+        return memory_id
+
+    def forget(self, memory_id: str) -> None:
+        next(m for m in self.memories if m.id == memory_id).live = False
+
+    async def get_documents(self, _user_id: str) -> list[Any]:
+        return [
+            SimpleNamespace(doc_type=doc_type, content=content)
+            for doc_type, content in self.documents.items()
+        ]
+
+    async def get_episodes_range(self, _user_id: str, start: date, end: date) -> list[Any]:
+        return [
+            SimpleNamespace(date=day, entries=entries, summary=None)
+            for day, entries in sorted(self.episodes.items())
+            if start <= day <= end
+        ]
+
+    async def get_all_live_memories(self, _user_id: str) -> list[Any]:
+        return sorted((m for m in self.memories if m.live), key=lambda m: m.category_path)
+
+    async def get_live_memories_in_categories(
+        self, _user_id: str, category_paths: list[str]
+    ) -> list[Any]:
+        live = await self.get_all_live_memories(_user_id)
+        return [m for m in live if m.category_path in category_paths]
+
+    async def get_memories_by_ids(self, _user_id: str, memory_ids: list[str]) -> list[Any]:
+        return [m for m in self.memories if m.id in memory_ids]
+
+
+@pytest.fixture
+def store() -> Iterator[FakeStore]:
+    store = FakeStore()
+    with patch.object(memory_fs, "pg_store", store):
+        yield store
+
+
+@pytest.fixture
+def user_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    monkeypatch.setattr(_vfs_scheduler, "_is_mounted", lambda: True)
+    monkeypatch.setattr(_vfs_scheduler, "user_workspace_path", lambda _user_id: tmp_path)
+    return tmp_path
+
+
+def _page(user_root: Path, path: str) -> Path:
+    return user_root / "memory" / path
+
+
+def _reconciled_marker(user_root: Path) -> Path:
+    return user_root / ".gaia" / "memory.reconciled"
+
+
+class TestFullSync:
+    async def test_no_change_set_materializes_everything_and_stamps_the_reconcile(
+        self, store: FakeStore, user_root: Path
+    ) -> None:
+        store.add("likes tea", "preferences")
+        store.documents[MemoryDocType.USER_MD.value] = "# Sam"
+
+        assert await sync_user_memory_fs(USER) == 2
+
+        assert "likes tea" in _page(user_root, "facts/preferences.md").read_text()
+        assert _reconciled_marker(user_root).is_file()
+
+    async def test_a_stale_reconcile_turns_a_change_into_a_full_sync(
+        self, store: FakeStore, user_root: Path
+    ) -> None:
+        store.add("likes tea", "preferences")
+        store.add("works at acme", "work")
+        _reconciled_marker(user_root).parent.mkdir(parents=True)
+        yesterday = datetime.now(UTC) - timedelta(days=1)
+        _reconciled_marker(user_root).write_text(str(int(yesterday.timestamp())))
+
+        await sync_user_memory_fs(USER, MemoryVfsChange(categories={"work"}))
+
+        assert _page(user_root, "facts/preferences.md").is_file()
+
+
+class TestIncrementalSync:
+    @pytest.fixture(autouse=True)
+    async def reconciled(self, store: FakeStore, user_root: Path) -> None:
+        store.add("likes tea", "preferences")
+        store.add("works at acme", "work/acme")
+        await sync_user_memory_fs(USER)
+
+    async def test_only_the_changed_folder_is_rewritten(
+        self, store: FakeStore, user_root: Path
+    ) -> None:
+        untouched = _page(user_root, "facts/preferences.md")
+        before = untouched.stat().st_mtime_ns
+        store.add("ships the api", "work/acme")
+
+        written = await sync_user_memory_fs(USER, MemoryVfsChange(categories={"work/acme"}))
+
+        assert written == 1
+        assert "ships the api" in _page(user_root, "facts/work/acme.md").read_text()
+        assert untouched.stat().st_mtime_ns == before
+
+    async def test_the_catalog_marker_is_dropped_so_the_next_full_sync_repairs(
+        self, store: FakeStore, user_root: Path
+    ) -> None:
+        store.add("ships the api", "work/acme")
+        await sync_user_memory_fs(USER, MemoryVfsChange(categories={"work/acme"}))
+
+        assert not (user_root / ".gaia" / "memory.v").exists()
+
+    async def test_a_forgotten_memory_empties_its_folder_by_id(
+        self, store: FakeStore, user_root: Path
+    ) -> None:
+        memory_id = next(m.id for m in store.memories if m.category_path == "work/acme")
+        store.forget(memory_id)
+
+        written = await sync_user_memory_fs(USER, MemoryVfsChange(memory_ids={memory_id}))
+
+        assert written == 0
+        assert not _page(user_root, "facts/work/acme.md").exists()
+        assert not _page(user_root, "facts/work").exists()
+        assert _page(user_root, "facts/preferences.md").is_file()
+
+    async def test_journal_days_and_documents_are_projected_when_named(
+        self, store: FakeStore, user_root: Path
+    ) -> None:
+        store.episodes[TODAY] = [{"time": "09:00", "text": "planned the week"}]
+        store.documents[MemoryDocType.AGENDA_MD.value] = "# Agenda"
+        long_ago = TODAY - timedelta(days=90)
+
+        written = await sync_user_memory_fs(
+            USER,
+            MemoryVfsChange(days={TODAY, long_ago}, documents={MemoryDocType.AGENDA_MD}),
+        )
+
+        assert written == 2
+        assert "planned the week" in _page(user_root, f"journal/{TODAY}.md").read_text()
+        assert _page(user_root, "agenda.md").read_text() == "# Agenda\n"
+        assert not _page(user_root, f"journal/{long_ago}.md").exists()
+
+
+class TestCoalescingScheduler:
+    async def test_changes_scheduled_during_a_sync_are_merged_into_one_follow_up(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_vfs_scheduler, "_is_mounted", lambda: True)
+        release = asyncio.Event()
+        finished = asyncio.Event()
+        synced: list[MemoryVfsChange | None] = []
+
+        async def _sync(_user_id: str, change: MemoryVfsChange | None) -> int:
+            synced.append(change)
+            if len(synced) == 1:
+                await release.wait()
+            else:
+                finished.set()
+            return 0
+
+        schedule = _vfs_scheduler.make_coalescing_scheduler(
+            _sync, merge_fn=MemoryVfsChange.__or__, log_name="test_vfs"
+        )
+        schedule(USER, MemoryVfsChange(categories={"a"}))
+        await asyncio.sleep(0)
+        schedule(USER, MemoryVfsChange(categories={"b"}))
+        schedule(USER, MemoryVfsChange(days={TODAY}))
+        release.set()
+        await finished.wait()
+
+        assert synced == [
+            MemoryVfsChange(categories={"a"}),
+            MemoryVfsChange(categories={"b"}, days={TODAY}),
+        ]
+
+    async def test_a_full_sync_absorbs_pending_changes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(_vfs_scheduler, "_is_mounted", lambda: True)
+        finished = asyncio.Event()
+        synced: list[MemoryVfsChange | None] = []
+
+        async def _sync(_user_id: str, change: MemoryVfsChange | None) -> int:
+            synced.append(change)
+            finished.set()
+            return 0
+
+        schedule = _vfs_scheduler.make_coalescing_scheduler(
+            _sync, merge_fn=MemoryVfsChange.__or__, log_name="test_vfs"
+        )
+        schedule(USER, MemoryVfsChange(categories={"a"}))
+        schedule(USER, None)
+        await finished.wait()
+
+        assert synced == [None]
@@ -151,3 +151,66 @@ class TestSearchMessagesRegexEscaping:
         # And each repository is scoped to the caller.
         assert mock_conversation_repo.search.call_args[0][0] == FAKE_USER_ID
         assert mock_note_repo.search_by_plaintext.call_args[0][0] == FAKE_USER_ID
+
+
+class TestSearchMessagesPagination:
+    async def test_each_source_is_asked_for_one_row_past_the_page(
+        self, mock_conversation_repo, mock_note_repo, mock_get_context_window
+    ):
+        mock_conversation_repo.search.return_value = ConversationSearchResults()
+        mock_note_repo.search_by_plaintext.return_value = []
+
+        result = await search_messages("Python", FAKE_USER_ID, page=3, limit=10)
+
+        for call in (
+            mock_conversation_repo.search.call_args,
+            mock_note_repo.search_by_plaintext.call_args,
+        ):
+            assert call.kwargs["limit"] == 11
+            assert call.kwargs["skip"] == 20
+        assert result.has_more is False
+
+    async def test_an_overflowing_source_is_trimmed_and_flags_more(
+        self, mock_conversation_repo, mock_note_repo, mock_get_context_window
+    ):
+        mock_conversation_repo.search.return_value = _conversation_results()
+        mock_note_repo.search_by_plaintext.return_value = _note_hits()
+
+        result = await search_messages("Python", FAKE_USER_ID, limit=1)
+
+        assert [m.conversation_id for m in result.messages] == ["conv1"]
+        assert [n.id for n in result.notes] == ["n1"]
+        assert len(result.conversations) == 1
+        assert result.has_more is True
+
+
+class TestSearchMessagesIndexed:
+    async def test_index_path_gets_the_raw_query_and_the_escaped_pattern(
+        self, mock_conversation_repo, mock_note_repo, mock_get_context_window
+    ):
+        mock_conversation_repo.search_indexed.return_value = _conversation_results()
+        mock_note_repo.search_by_plaintext.return_value = []
+
+        with patch.object(search_service, "MESSAGE_SEARCH_INDEX_ENABLED", True):
+            result = await search_messages("a.b", FAKE_USER_ID)
+
+        kwargs = mock_conversation_repo.search_indexed.call_args.kwargs
+        assert kwargs["query"] == "a.b"
+        assert kwargs["pattern"] == re.escape("a.b")
+        mock_conversation_repo.search.assert_not_called()
+        assert len(result.messages) == 2
+
+    async def test_has_more_counts_index_hits_that_did_not_hydrate(
+        self, mock_conversation_repo, mock_note_repo, mock_get_context_window
+    ):
+        # Three hits on a page of two, one of them trimmed away: still more pages.
+        results = _conversation_results()
+        results.matched_messages = 3
+        mock_conversation_repo.search_indexed.return_value = results
+        mock_note_repo.search_by_plaintext.return_value = []
+
+        with patch.object(search_service, "MESSAGE_SEARCH_INDEX_ENABLED", True):
+            result = await search_messages("Python", FAKE_USER_ID, limit=2)
+
+        assert len(result.messages) == 2
+        assert result.has_more is True
@@ -0,0 +1,102 @@
+"""Unit tests for the debounced per-user usage-snapshot writer."""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+from prometheus_client import REGISTRY
+import pytest
+
+from app.models.payment_models import PlanType
+from app.services.usage_snapshot_writer import UsageSnapshotWriter
+
+WINDOW = 0.05
+
+
+def _count(outcome: str) -> float:
+    value = REGISTRY.get_sample_value("usage_snapshot_requests_total", {"outcome": outcome})
+    return value or 0.0
+
+
+@pytest.fixture
+def write() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def writer(write: AsyncMock) -> UsageSnapshotWriter:
+    return UsageSnapshotWriter(write, interval=WINDOW)
+
+
+async def test_burst_writes_once_per_window(writer: UsageSnapshotWriter, write: AsyncMock) -> None:
+    """An agent turn's 15 tool calls become one snapshot write."""
+    written, coalesced = _count("written"), _count("coalesced")
+
+    for _ in range(15):
+        writer.schedule("user1", "todo_operations", PlanType.FREE)
+    write.assert_not_awaited()
+    await asyncio.sleep(WINDOW * 3)
+
+    write.assert_awaited_once_with("user1", "todo_operations", PlanType.FREE)
+    assert _count("written") - written == 1
+    assert _count("coalesced") - coalesced == 14
+
+
+async def test_latest_plan_and_feature_win(writer: UsageSnapshotWriter, write: AsyncMock) -> None:
+    writer.schedule("user1", "todo_operations", PlanType.FREE)
+    writer.schedule("user1", "generate_image", PlanType.PRO)
+    await asyncio.sleep(WINDOW * 3)
+
+    write.assert_awaited_once_with("user1", "generate_image", PlanType.PRO)
+
+
+async def test_users_are_independent(writer: UsageSnapshotWriter, write: AsyncMock) -> None:
+    writer.schedule("user1", "todo_operations", PlanType.FREE)
+    writer.schedule("user2", "todo_operations", PlanType.PRO)
+    await asyncio.sleep(WINDOW * 3)
+
+    assert sorted(c.args[0] for c in write.await_args_list) == ["user1", "user2"]
+
+
+async def test_next_window_writes_again(writer: UsageSnapshotWriter, write: AsyncMock) -> None:
+    writer.schedule("user1", "todo_operations", PlanType.FREE)
+    await asyncio.sleep(WINDOW * 3)
+    writer.schedule("user1", "todo_operations", PlanType.FREE)
+    await asyncio.sleep(WINDOW * 3)
+
+    assert write.await_count == 2
+
+
+async def test_flush_writes_pending_without_waiting(write: AsyncMock) -> None:
+    """Shutdown must not drop an open window, nor wait it out."""
+    writer = UsageSnapshotWriter(write, interval=60)
+    writer.schedule("user1", "todo_operations", PlanType.FREE)
+    writer.schedule("user1", "todo_operations", PlanType.FREE)
+
+    await asyncio.wait_for(writer.flush(), timeout=1)
+
+    write.assert_awaited_once_with("user1", "todo_operations", PlanType.FREE)
+    # The cancelled window task does not write a second time.
+    await asyncio.sleep(0)
+    write.assert_awaited_once()
+
+
+async def test_flush_waits_for_running_write() -> None:
+    started, release = asyncio.Event(), asyncio.Event()
+    finished: list[str] = []
+
+    async def slow_write(user_id: str, feature_key: str, user_plan: PlanType) -> None:
+        started.set()
+        await release.wait()
+        finished.append(user_id)
+
+    writer = UsageSnapshotWriter(slow_write, interval=0)
+    writer.schedule("user1", "todo_operations", PlanType.FREE)
+    await started.wait()
+
+    flush = asyncio.create_task(writer.flush())
+    await asyncio.sleep(0)
+    assert not flush.done()
+    release.set()
+    await flush
+
+    assert finished == ["user1"]
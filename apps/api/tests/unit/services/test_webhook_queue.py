@@ -0,0 +1,271 @@
+"""Tests for the Composio webhook ingestion stream (app.services.triggers.webhook_queue).
+
+Runs the real consumer-group protocol against fakeredis: enqueue, bounded reads,
+acks, and the pending-entry replay a crashed consumer relies on.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+import json
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fakeredis.aioredis
+import pytest
+
+from app.models.webhook_models import ComposioWebhookEvent
+from app.services.triggers.webhook_queue import WebhookConsumer, enqueue_event
+
+MODULE = "app.services.triggers.webhook_queue"
+STREAM = "test:webhook:events"
+GROUP = "test-consumers"
+
+
+def _event(trigger_nano_id: str = "ti_1", **overrides: Any) -> ComposioWebhookEvent:
+    data: dict[str, Any] = {
+        "connection_id": "conn-1",
+        "connection_nano_id": "nano-1",
+        "trigger_nano_id": trigger_nano_id,
+        "trigger_id": "uuid-1",
+        "user_id": "user-1",
+        "data": {"n": 1},
+        "timestamp": "2026-08-10T05:44:33Z",
+        "type": "gmail_new_gmail_message",
+    }
+    data.update(overrides)
+    return ComposioWebhookEvent(**data)
+
+
+async def _add(client: Any, event: ComposioWebhookEvent) -> str:
+    return await client.xadd(
+        STREAM, {"event": event.model_dump_json(), "received_at": repr(time.time())}
+    )
+
+
+@pytest.fixture
+async def redis() -> AsyncIterator[Any]:
+    client = fakeredis.aioredis.FakeRedis(decode_responses=True)
+    yield client
+    await client.aclose()
+
+
+@pytest.fixture
+def repository() -> Iterator[MagicMock]:
+    """The batch prefetch seam — nothing prefetched unless a test says otherwise."""
+    with patch(f"{MODULE}.workflow_repository") as repo:
+        repo.find_active_by_composio_triggers = AsyncMock(return_value={})
+        yield repo
+
+
+@pytest.fixture
+def handler() -> MagicMock:
+    handler = MagicMock()
+    handler.process_event = AsyncMock()
+    return handler
+
+
+def _consumer(redis: Any, handler: MagicMock, **kwargs: Any) -> WebhookConsumer:
+    kwargs.setdefault("name", "c1")
+    return WebhookConsumer(
+        redis, stream=STREAM, group=GROUP, handler_for=lambda _type: handler, **kwargs
+    )
+
+
+async def _pending(redis: Any) -> int:
+    return (await redis.xpending(STREAM, GROUP))["pending"]
+
+
+class TestEnqueue:
+    async def test_the_event_lands_on_the_stream_with_its_receipt_time(self, redis: Any) -> None:
+        cache = MagicMock(redis=redis)
+        with (
+            patch(f"{MODULE}.redis_cache", cache),
+            patch(f"{MODULE}.COMPOSIO_WEBHOOK_STREAM", STREAM),
+        ):
+            assert await enqueue_event(_event()) is True
+
+        [(_id, fields)] = await redis.xrange(STREAM)
+        assert json.loads(fields["event"])["trigger_nano_id"] == "ti_1"
+        assert float(fields["received_at"]) == pytest.approx(time.time(), abs=5)
+
+    async def test_no_redis_means_the_caller_processes_it(self) -> None:
+        with patch(f"{MODULE}.redis_cache", MagicMock(redis=None)):
+            assert await enqueue_event(_event()) is False
+
+    async def test_a_failed_append_means_the_caller_processes_it(self) -> None:
+        client = MagicMock()
+        client.xadd = AsyncMock(side_effect=ConnectionError("down"))
+        with patch(f"{MODULE}.redis_cache", MagicMock(redis=client)):
+            assert await enqueue_event(_event()) is False
+
+
+@pytest.mark.usefixtures("repository")
+class TestConsume:
+    async def test_an_event_is_dispatched_by_its_nano_id_and_then_acked(
+        self, redis: Any, handler: MagicMock
+    ) -> None:
+        consumer = _consumer(redis, handler)
+        await consumer.ensure_group()
+        await _add(redis, _event("ti_nano"))
+
+        await consumer.start(await consumer.read(10, block_ms=0))
+        await consumer.drain()
+
+        handler.process_event.assert_awaited_once_with(
+            event_type="GMAIL_NEW_GMAIL_MESSAGE",
+            trigger_id="ti_nano",
+            user_id="user-1",
+            data={"n": 1},
+        )
+        assert await _pending(redis) == 0
+
+    async def test_a_failed_handler_is_acked_not_retried(
+        self, redis: Any, handler: MagicMock
+    ) -> None:
+        handler.process_event.side_effect = RuntimeError("boom")
+        consumer = _consumer(redis, handler)
+        await consumer.ensure_group()
+        await _add(redis, _event())
+
+        await consumer.start(await consumer.read(10, block_ms=0))
+        await consumer.drain()
+
+        assert await _pending(redis) == 0
+
+    async def test_an_unreadable_entry_is_acked_and_dropped(
+        self, redis: Any, handler: MagicMock
+    ) -> None:
+        consumer = _consumer(redis, handler)
+        await consumer.ensure_group()
+        await redis.xadd(STREAM, {"event": "not json", "received_at": "0"})
+
+        await consumer.start(await consumer.read(10, block_ms=0))
+
+        handler.process_event.assert_not_awaited()
+        assert await _pending(redis) == 0
+
+    async def test_creating_the_group_twice_is_harmless(
+        self, redis: Any, handler: MagicMock
+    ) -> None:
+        consumer = _consumer(redis, handler)
+        await consumer.ensure_group()
+        await consumer.ensure_group()
+
+    async def test_in_flight_events_never_exceed_the_concurrency(
+        self, redis: Any, handler: MagicMock
+    ) -> None:
+        """A burst waits in Redis: the consumer reads only into free slots."""
+        release = asyncio.Event()
+        saturated = asyncio.Event()
+        finished = asyncio.Event()
+        running = 0
+        peak = 0
+
+        async def _slow(**_kwargs: Any) -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            if running == 2:
+                saturated.set()
+            await release.wait()
+            running -= 1
+            if handler.process_event.await_count == 5 and not running:
+                finished.set()
+
+        handler.process_event.side_effect = _slow
+        consumer = _consumer(redis, handler, concurrency=2)
+        await consumer.ensure_group()
+        for _ in range(5):
+            await _add(redis, _event())
+
+        with patch(f"{MODULE}.COMPOSIO_WEBHOOK_BLOCK_MS", 10):
+            run = asyncio.create_task(consumer.run())
+            await saturated.wait()
+            await asyncio.sleep(0.05)
+            assert await _pending(redis) == 2
+            release.set()
+            await finished.wait()
+            await consumer.drain()
+            run.cancel()
+            await asyncio.gather(run, return_exceptions=True)
+
+        assert peak == 2
+        assert await _pending(redis) == 0
+
+
+class TestBatchedLookup:
+    async def test_one_read_shares_one_workflow_lookup(
+        self, redis: Any, handler: MagicMock, repository: MagicMock
+    ) -> None:
+        consumer = _consumer(redis, handler)
+        await consumer.ensure_group()
+        for trigger in ("ti_b", "ti_a", "ti_b"):
+            await _add(redis, _event(trigger))
+
+        await consumer.start(await consumer.read(10, block_ms=0))
+        await consumer.drain()
+
+        repository.find_active_by_composio_triggers.assert_awaited_once_with(["ti_a", "ti_b"])
+        repository.composio_trigger_batch.assert_called_once_with({})
+        assert handler.process_event.await_count == 3
+
+    async def test_a_failed_prefetch_leaves_each_handler_to_look_up_alone(
+        self, redis: Any, handler: MagicMock, repository: MagicMock
+    ) -> None:
+        repository.find_active_by_composio_triggers.side_effect = RuntimeError("mongo")
+        consumer = _consumer(redis, handler)
+        await consumer.ensure_group()
+        await _add(redis, _event())
+
+        await consumer.start(await consumer.read(10, block_ms=0))
+        await consumer.drain()
+
+        handler.process_event.assert_awaited_once()
+        assert await _pending(redis) == 0
+
+
+@pytest.mark.usefixtures("repository")
+class TestReplay:
+    async def test_a_dead_consumers_unacked_event_is_replayed_by_another(
+        self, redis: Any, handler: MagicMock
+    ) -> None:
+        crashed = _consumer(redis, handler, name="crashed")
+        await crashed.ensure_group()
+        await _add(redis, _event("ti_lost"))
+        assert len(await crashed.read(10, block_ms=0)) == 1  # read, never settled
+        await asyncio.sleep(0.01)  # idle past the survivor's claim window
+
+        survivor = _consumer(redis, handler, name="survivor", claim_idle_ms=1)
+        await survivor.start(await survivor.reclaim(10))
+        await survivor.drain()
+
+        assert handler.process_event.await_args.kwargs["trigger_id"] == "ti_lost"
+        assert await _pending(redis) == 0
+
+    async def test_an_entry_delivered_too_often_is_dropped_as_poison(
+        self, redis: Any, handler: MagicMock
+    ) -> None:
+        consumer = _consumer(redis, handler, claim_idle_ms=1)
+        await consumer.ensure_group()
+        await _add(redis, _event())
+        await consumer.read(10, block_ms=0)
+        await asyncio.sleep(0.01)
+
+        with patch(f"{MODULE}.COMPOSIO_WEBHOOK_MAX_DELIVERIES", 1):
+            assert await consumer.reclaim(10) == []
+
+        handler.process_event.assert_not_awaited()
+        assert await _pending(redis) == 0
+
+    async def test_entries_still_within_the_claim_window_are_left_alone(
+        self, redis: Any, handler: MagicMock
+    ) -> None:
+        owner = _consumer(redis, handler, name="owner")
+        await owner.ensure_group()
+        await _add(redis, _event())
+        await owner.read(10, block_ms=0)
+
+        other = _consumer(redis, handler, name="other", claim_idle_ms=60_000)
+        assert await other.reclaim(10) == []
+        assert await _pending(redis) == 1
@@ -216,6 +216,34 @@ class TestToolRegistry:
         registry = ToolRegistry()
         assert registry.get_category_by_space("nonexistent") is None
 
+    def test_get_category_by_space_first_registered_wins(self):
+        registry = ToolRegistry()
+        registry._add_category("todos", tools=[_make_mock_tool("t1")])
+        registry._add_category("search", tools=[_make_mock_tool("t2")])
+
+        assert registry.get_category_by_space("general").name == "todos"
+
+    def test_get_category_by_space_follows_replacement(self):
+        registry = ToolRegistry()
+        registry._add_category("gmail", tools=[_make_mock_tool("t1")], space="gmail")
+        replaced = registry.get_category_by_space("gmail")
+
+        registry._add_category("gmail", tools=[_make_mock_tool("t2")], space="gmail")
+
+        current = registry.get_category_by_space("gmail")
+        assert current is not replaced
+        assert current is registry.get_category("gmail")
+
+    def test_get_category_by_space_after_space_change(self):
+        registry = ToolRegistry()
+        registry._add_category("a", tools=[_make_mock_tool("t1")], space="email")
+        registry._add_category("b", tools=[_make_mock_tool("t2")], space="email")
+
+        registry._add_category("a", tools=[_make_mock_tool("t1")], space="mail")
+
+        assert registry.get_category_by_space("email").name == "b"
+        assert registry.get_category_by_space("mail").name == "a"
+
     def test_get_tool_names(self):
         registry = ToolRegistry()
         registry._add_category("cat1", tools=[_make_mock_tool("a"), _make_mock_tool("b")])
@@ -283,6 +311,66 @@ class TestToolRegistry:
         assert "ignore" not in result
 
 
+class TestToolDictGeneration:
+    def test_tool_dict_is_built_once_per_generation(self):
+        registry = ToolRegistry()
+        registry._add_category("cat", tools=[_make_mock_tool("a"), _make_mock_tool("b")])
+        dtd = registry.get_tool_dict()
+
+        with patch.object(
+            registry, "get_all_tools_for_search", wraps=registry.get_all_tools_for_search
+        ) as walk:
+            for _ in range(10):
+                assert "a" in dtd
+                assert dtd["b"].name == "b"
+                list(dtd.values())
+                registry.get_tool_names()
+
+        assert walk.call_count == 1
+
+    def test_add_category_bumps_generation(self):
+        registry = ToolRegistry()
+        before = registry.generation
+        registry._add_category("cat", tools=[_make_mock_tool("a")])
+
+        assert registry.generation == before + 1
+
+    def test_new_category_visible_through_existing_dict(self):
+        """Tools registered after graph compilation reach the executor."""
+        registry = ToolRegistry()
+        registry._add_category("cat", tools=[_make_mock_tool("a")])
+        dtd = registry.get_tool_dict()
+        assert set(dtd.keys()) == {"a"}
+
+        registry._add_category("gmail", tools=[_make_mock_tool("GMAIL_SEND")], is_delegated=True)
+
+        assert "GMAIL_SEND" in dtd
+        assert set(dtd.keys()) == {"a", "GMAIL_SEND"}
+        assert registry.get_tool_names() == ["a", "GMAIL_SEND"]
+
+    def test_replaced_category_drops_its_old_tools(self):
+        registry = ToolRegistry()
+        registry._add_category("cat", tools=[_make_mock_tool("old")])
+        dtd = registry.get_tool_dict()
+        assert "old" in dtd
+
+        registry._add_category("cat", tools=[_make_mock_tool("new")])
+
+        assert "old" not in dtd
+        assert [name for name, _ in dtd.items()] == ["new"]
+
+    def test_extra_tools_invalidate_merged_view(self):
+        registry = ToolRegistry()
+        registry._add_category("cat", tools=[_make_mock_tool("a")])
+        dtd = registry.get_tool_dict()
+        assert len(dtd) == 1
+
+        dtd.update({"handoff": _make_mock_tool("handoff")})
+
+        assert len(dtd) == 2
+        assert set(dtd.keys()) == {"a", "handoff"}
+
+
 class TestToolWrapper:
     def test_tool_defaults_name_from_base_tool(self):
         base = _make_mock_tool("auto_name")
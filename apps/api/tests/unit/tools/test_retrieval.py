@@ -210,6 +210,32 @@ class TestBuildSearchTasks:
             if asyncio.iscoroutine(t):
                 t.close()
 
+    async def test_chroma_store_searches_namespaces_in_one_call(self):
+        from app.agents.tools.core.retrieval import _build_search_tasks
+        from app.db.chroma.chroma_store import ChromaStore
+
+        hit = MagicMock(key="GMAIL_SEND", namespace=("gmail",))
+        store = MagicMock(spec=ChromaStore)
+        store.asearch_namespaces = AsyncMock(
+            return_value={("gmail",): [hit], ("general",): [], ("subagents",): []}
+        )
+        with patch(
+            "app.agents.tools.core.retrieval.search_public_integrations",
+            new=AsyncMock(return_value=[]),
+        ):
+            tasks = _build_search_tasks(
+                store, "email", "gmail", {"gmail"}, include_subagents=True, limit=10
+            )
+            results = await asyncio.gather(*tasks)
+
+        # one store call for every namespace + public integrations
+        assert len(tasks) == 2
+        store.asearch.assert_not_called()
+        store.asearch_namespaces.assert_awaited_once_with(
+            "email", {("gmail",): 10, ("general",): 5, ("subagents",): 15}
+        )
+        assert results[0] == [hit]
+
 
 # ---------------------------------------------------------------------------
 # _process_public_integration_result
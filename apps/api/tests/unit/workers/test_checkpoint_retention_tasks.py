@@ -1,4 +1,5 @@
 """The stale-spawn sweep: age from uuid6 checkpoint ids, prefix selection, caps.
+The streamed orphan sweep: owner candidates, batching, resume cursor.
 
 Spawn threads embed a LIVE conversation's uuid, so the orphan sweep can never
 reclaim them — this third phase is their only collector. Its two sharp edges are
@@ -17,8 +18,11 @@ import pytest
 
 from app.workers.tasks import checkpoint_retention_tasks as tasks
 from app.workers.tasks.checkpoint_retention_tasks import (
+    _ORPHAN_CURSOR_KEY,
     _checkpoint_written_at,
+    _owner_candidates,
     prune_checkpoint_versions,
+    sweep_orphan_threads,
     sweep_stale_spawn_threads,
 )
 
@@ -136,6 +140,138 @@ class TestSweepStaleSpawnThreads:
         assert result["spawn_threads_deleted"] == 1
 
 
+class ThreadTable:
+    """The `checkpoints` thread ids behind a pool, answering the orphan sweep's SQL."""
+
+    def __init__(self, thread_ids: list[str]) -> None:
+        self.thread_ids = set(thread_ids)
+        self.selects = 0
+        self.delete_batches: list[list[str]] = []
+        self.transactions = 0
+        self._result: list[tuple[Any, ...]] = []
+
+    async def __aenter__(self) -> "ThreadTable":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        return None
+
+    def connection(self) -> "ThreadTable":
+        return self
+
+    def cursor(self) -> "ThreadTable":
+        return self
+
+    def transaction(self) -> "ThreadTable":
+        self.transactions += 1
+        return self
+
+    async def execute(self, sql: str, params: Any = None) -> None:
+        if sql.startswith("SELECT DISTINCT thread_id"):
+            self.selects += 1
+            after, limit = params
+            self._result = [(t,) for t in sorted(t for t in self.thread_ids if t > after)][:limit]
+        elif "DELETE FROM checkpoints " in sql:
+            (ids,) = params
+            self.delete_batches.append(list(ids))
+            self.thread_ids -= set(ids)
+            self._result = [(len(ids), 100 * len(ids))]
+        else:
+            self._result = [(0, 0)]
+
+    async def fetchall(self) -> list[tuple[Any, ...]]:
+        return self._result
+
+    async def fetchone(self) -> tuple[Any, ...]:
+        return self._result[0]
+
+
+class FakeCache:
+    def __init__(self, **values: Any) -> None:
+        self.values = dict(values)
+
+    async def get(self, key: str) -> Any:
+        return self.values.get(key)
+
+    async def set(self, key: str, value: Any, ttl: int = 0) -> bool:
+        self.values[key] = value
+        return True
+
+    async def delete(self, key: str) -> None:
+        self.values.pop(key, None)
+
+
+LIVE = "7c9e6679-7425-40de-944b-e07fc1f90ae7"
+GONE = "0b1b8c2e-3f5a-4c1d-9a7e-5d2f8e6b4a10"
+
+
+def _live_conversations(*live: str) -> AsyncMock:
+    async def existing(ids: Any) -> set[str]:
+        return set(ids) & set(live)
+
+    return AsyncMock(side_effect=existing)
+
+
+class TestOwnerCandidates:
+    def test_derived_thread_ids_yield_their_conversation(self) -> None:
+        assert LIVE in _owner_candidates(f"gmail_executor_{LIVE}_ab12")
+        assert "dev-seed-u1-3" in _owner_candidates("workflow_dev-seed-u1-3")
+        assert "my_conv" in _owner_candidates("executor_my_conv")
+
+
+class TestSweepOrphanThreads:
+    async def test_deletes_only_threads_no_live_conversation_owns(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(tasks, "CHECKPOINT_ORPHAN_SWEEP_BATCH_SIZE", 2)
+        table = ThreadTable([LIVE, f"executor_{LIVE}", GONE, f"workflow_{GONE}", "dev-seed-1"])
+        cache = FakeCache()
+        existing = _live_conversations(LIVE, "dev-seed-1")
+
+        with (
+            patch.object(tasks, "redis_cache", cache),
+            patch.object(tasks.conversation_repository, "existing_conversation_ids", existing),
+        ):
+            result = await sweep_orphan_threads(table)
+
+        assert table.thread_ids == {LIVE, f"executor_{LIVE}", "dev-seed-1"}
+        # One Mongo lookup per page, never the whole collection.
+        assert existing.await_count == 3
+        assert result["threads_total"] == 5
+        assert result["orphan_threads_deleted"] == 2
+        assert result["orphan_bytes_freed"] == 200
+        # Each page's orphans go in one explicit transaction (the pool autocommits).
+        assert table.transactions == len(table.delete_batches) == 2
+        assert "threads_scanned_per_second" in result
+        # A run that reaches the end clears the cursor, so the next starts over.
+        assert _ORPHAN_CURSOR_KEY not in cache.values
+
+    async def test_a_capped_run_saves_its_cursor_and_the_next_resumes(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(tasks, "CHECKPOINT_ORPHAN_SWEEP_MAX_THREADS", 1)
+        orphans = [f"a_{GONE}", f"b_{GONE}", f"c_{GONE}"]
+        table = ThreadTable([*orphans, LIVE])
+        cache = FakeCache()
+
+        with (
+            patch.object(tasks, "redis_cache", cache),
+            patch.object(
+                tasks.conversation_repository,
+                "existing_conversation_ids",
+                _live_conversations(LIVE),
+            ),
+        ):
+            first = await sweep_orphan_threads(table)
+            cursor = cache.values[_ORPHAN_CURSOR_KEY]
+            second = await sweep_orphan_threads(table)
+
+        assert table.delete_batches == [[orphans[0]], [orphans[1]]]
+        assert cursor == orphans[0]
+        assert (first["orphan_sweep_resumed"], second["orphan_sweep_resumed"]) == (0, 1)
+        assert cache.values[_ORPHAN_CURSOR_KEY] == orphans[1]
+
+
 class TestNightlyJobComposition:
     async def test_the_nightly_job_runs_all_three_phases(self) -> None:
         # The cron table wires the job; this pins that the job itself still calls
@@ -146,6 +282,7 @@ class TestNightlyJobComposition:
                 "threads_total": 5,
                 "orphan_threads_deleted": 1,
                 "orphan_checkpoints_deleted": 3,
+                "orphan_bytes_freed": 4,
             }
         )
         spawn = AsyncMock(return_value={"spawn_threads_total": 4, "spawn_threads_deleted": 2})
@@ -171,3 +308,4 @@ class TestNightlyJobComposition:
         spawn.assert_awaited_once()
         prune.assert_awaited_once()
         assert "stale_spawns=2" in summary
+        assert "bytes_estimate=12" in summary
@@ -0,0 +1,139 @@
+"""Unit tests for job-class routing (app.workers.queue) and the worker lanes
+that drain each class's queue (app.workers.lanes).
+
+The lanes run against fakeredis so ARQ's real polling and job bookkeeping
+decide which lane picks a job up.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+from datetime import timedelta
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from arq.connections import ArqRedis
+from arq.worker import func
+import fakeredis.aioredis
+import pytest
+
+from app.constants.workers import (
+    ARQ_BULK_MAX_JOBS,
+    ARQ_INTERACTIVE_MAX_JOBS,
+    ARQ_WORKFLOW_MAX_JOBS,
+)
+from app.workers import lanes
+from app.workers.config.worker_settings import WorkerSettings
+from app.workers.metrics import ARQ_QUEUE_DEPTH
+from app.workers.queue import JOB_CLASS_QUEUES, JobClass, enqueue_worker_job, job_class_of
+
+
+class TestRouting:
+    async def test_interactive_jobs_keep_the_default_queue(self) -> None:
+        pool = MagicMock()
+        pool.enqueue_job = AsyncMock()
+
+        await enqueue_worker_job(pool, "process_reminder", "r-1", _job_id="reminder:r-1")
+
+        pool.enqueue_job.assert_awaited_once_with("process_reminder", "r-1", _job_id="reminder:r-1")
+
+    async def test_other_classes_go_to_their_own_queue(self) -> None:
+        pool = MagicMock()
+        pool.enqueue_job = AsyncMock()
+
+        await enqueue_worker_job(pool, "execute_workflow_by_id", "wf-1", {})
+        await enqueue_worker_job(pool, "backfill_user_memories", "user-1")
+
+        queues = [call.kwargs["_queue_name"] for call in pool.enqueue_job.await_args_list]
+        assert queues == ["arq:queue:workflow", "arq:queue:bulk"]
+
+    async def test_an_explicit_queue_wins(self) -> None:
+        pool = MagicMock()
+        pool.enqueue_job = AsyncMock()
+
+        await enqueue_worker_job(pool, "execute_workflow_by_id", "wf-1", _queue_name="arq:queue")
+
+        assert pool.enqueue_job.await_args.kwargs["_queue_name"] == "arq:queue"
+
+    def test_unlisted_tasks_are_interactive(self) -> None:
+        assert job_class_of("sweep_hil_approvals") is JobClass.INTERACTIVE
+        assert job_class_of("execute_tracked_todo") is JobClass.INTERACTIVE
+
+    def test_the_lanes_split_the_memory_bound_total(self) -> None:
+        assert WorkerSettings.max_jobs == ARQ_INTERACTIVE_MAX_JOBS
+        assert WorkerSettings.lane_max_jobs == {
+            JobClass.WORKFLOW: ARQ_WORKFLOW_MAX_JOBS,
+            JobClass.BULK: ARQ_BULK_MAX_JOBS,
+        }
+        assert WorkerSettings.max_jobs + sum(WorkerSettings.lane_max_jobs.values()) == 10
+
+
+@pytest.fixture
+async def pool() -> AsyncIterator[ArqRedis]:
+    fake = fakeredis.aioredis.FakeRedis()
+    # ARQ logs the server's INFO on start; fakeredis has no INFO command.
+    with patch("arq.worker.log_redis_info", AsyncMock()):
+        yield ArqRedis(connection_pool=fake.connection_pool)
+        await lanes.stop_job_lanes()
+    await fake.connection_pool.disconnect()
+
+
+def _depth(job_class: JobClass, state: str) -> float:
+    return ARQ_QUEUE_DEPTH.labels(job_class=job_class, state=state)._value.get()
+
+
+class TestLanes:
+    async def test_each_lane_runs_only_its_own_queue(self, pool: ArqRedis) -> None:
+        ran: list[tuple[str, str]] = []
+        done = asyncio.Event()
+
+        async def run(ctx: dict[str, Any], workflow_id: str) -> str:
+            ran.append((workflow_id, ctx["job_id"]))
+            done.set()
+            return "ok"
+
+        task = func(run, name="execute_workflow_by_id")
+        with patch.object(WorkerSettings, "functions", [task]):
+            await enqueue_worker_job(pool, "execute_workflow_by_id", "wf-1", _job_id="j-wf")
+            lanes.start_job_lanes({"redis": pool})
+            await asyncio.wait_for(done.wait(), timeout=5)
+
+        assert ran == [("wf-1", "j-wf")]
+        assert set(lanes._lanes) == {JobClass.WORKFLOW, JobClass.BULK}
+        assert lanes._lanes[JobClass.BULK].jobs_complete == 0
+
+    async def test_stopping_clears_the_lanes_and_their_health_keys(self, pool: ArqRedis) -> None:
+        async def noop(_ctx: dict[str, Any]) -> str:
+            return "ok"
+
+        with patch.object(WorkerSettings, "functions", [noop]):
+            lanes.start_job_lanes({"redis": pool})
+            worker = lanes._lanes[JobClass.WORKFLOW]
+            await pool.set(worker.health_check_key, b"alive")
+
+            await lanes.stop_job_lanes()
+
+        assert lanes._lanes == {}
+        assert await pool.exists("arq:health:workflow") == 0
+
+    async def test_without_a_pool_nothing_starts(self) -> None:
+        lanes.start_job_lanes({})
+
+        assert lanes._lanes == {}
+
+    async def test_queue_depth_splits_ready_from_deferred(self, pool: ArqRedis) -> None:
+        await pool.enqueue_job(
+            "execute_workflow_by_id", _queue_name=JOB_CLASS_QUEUES[JobClass.WORKFLOW]
+        )
+        await pool.enqueue_job(
+            "execute_workflow_by_id",
+            _queue_name=JOB_CLASS_QUEUES[JobClass.WORKFLOW],
+            _defer_by=timedelta(hours=1),
+        )
+        await pool.enqueue_job("process_reminder")
+
+        await lanes.sample_queue_depths(pool)
+
+        assert _depth(JobClass.WORKFLOW, "ready") == 1
+        assert _depth(JobClass.WORKFLOW, "deferred") == 1
+        assert _depth(JobClass.INTERACTIVE, "ready") == 1
+        assert _depth(JobClass.BULK, "ready") == 0
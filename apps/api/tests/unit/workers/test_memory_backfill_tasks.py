@@ -3,11 +3,12 @@
 The daily cron that replays pre-memory-engine conversations into long-term
 memory: ``backfill_active_users`` enqueues one deterministic job per eligible
 user, and ``backfill_user_memories`` replays that user's conversations through
-``memory_engine.retain``, consolidates inline, marks the user backfilled (the
-idempotency marker), and notifies only when facts were actually learned.
+``memory_engine.retain_many``, checkpointing each applied conversation,
+consolidates inline, marks the user backfilled (the idempotency marker), and
+notifies only when facts were actually learned.
 """
 
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator, Sequence
 from contextlib import ExitStack, contextmanager
 from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -16,11 +17,13 @@ import pytest
 
 from app.constants.memory import (
     MEMORY_BACKFILL_ACTIVE_DAYS,
+    MEMORY_BACKFILL_CONCURRENCY,
     MEMORY_BACKFILL_ELIGIBLE_BEFORE,
     MEMORY_BACKFILL_MAX_CONVERSATIONS,
     MEMORY_BACKFILL_MAX_USERS_PER_RUN,
     MemorySourceType,
 )
+from app.memory.engine import RetainSession
 from app.models.chat_models import MessageModel
 from app.models.conversation_models import ConversationDocument
 from app.models.user_models import UserDocument
@@ -64,6 +67,26 @@ def _conversation(
     )
 
 
+class _FakeRetainMany:
+    """Stands in for ``memory_engine.retain_many``: records every call and
+    yields each session with ``retain``'s result, or raises ``error``."""
+
+    def __init__(self, facts: int) -> None:
+        self.retain = AsyncMock(return_value=MagicMock(facts_extracted=facts))
+        self.calls: list[tuple[str, list[RetainSession], dict]] = []
+
+    async def __call__(
+        self, user_id: str, sessions: Sequence[RetainSession], **kwargs: object
+    ) -> AsyncIterator[tuple[RetainSession, MagicMock]]:
+        self.calls.append((user_id, list(sessions), kwargs))
+        for session in sessions:
+            yield session, await self.retain(session)
+
+    @property
+    def sessions(self) -> list[RetainSession]:
+        return [session for _, sessions, _ in self.calls for session in sessions]
+
+
 def _pool() -> MagicMock:
     pool = MagicMock()
     pool.enqueue_job = AsyncMock(return_value=MagicMock())
@@ -223,13 +246,17 @@ class TestBackfillActiveUsers:
 
 class TestBackfillUserMemories:
     @contextmanager
-    def _patches(self, *, retain_facts: int = 3) -> Iterator[dict[str, AsyncMock]]:
+    def _patches(self, *, retain_facts: int = 3) -> Iterator[dict]:
         docs = [_conversation()]
-        retain = AsyncMock(return_value=MagicMock(facts_extracted=retain_facts))
+        retain_many = _FakeRetainMany(retain_facts)
         mocks = {
             "get": AsyncMock(return_value=_user()),
             "recent": AsyncMock(return_value=docs),
-            "retain": retain,
+            "retain_many": retain_many,
+            "retain": retain_many.retain,
+            "checkpoint_get": AsyncMock(return_value=None),
+            "checkpoint_set": AsyncMock(return_value=True),
+            "checkpoint_delete": AsyncMock(),
             "cancel": AsyncMock(),
             "summarize": AsyncMock(),
             "consolidate": AsyncMock(),
@@ -239,7 +266,10 @@ class TestBackfillUserMemories:
         patches = [
             patch(f"{MODULE}.user_repository.get", mocks["get"]),
             patch(f"{MODULE}.conversation_repository.recent_for_user", mocks["recent"]),
-            patch(f"{MODULE}.memory_engine.retain", mocks["retain"]),
+            patch(f"{MODULE}.memory_engine.retain_many", retain_many),
+            patch(f"{MODULE}.redis_cache.get", mocks["checkpoint_get"]),
+            patch(f"{MODULE}.redis_cache.set", mocks["checkpoint_set"]),
+            patch(f"{MODULE}.redis_cache.delete", mocks["checkpoint_delete"]),
             patch(f"{MODULE}.cancel_consolidation", mocks["cancel"]),
             patch(f"{MODULE}.memory_engine.summarize_episode", mocks["summarize"]),
             patch(f"{MODULE}.memory_engine.consolidate", mocks["consolidate"]),
@@ -273,17 +303,18 @@ class TestBackfillUserMemories:
 
         assert result == f"backfilled {USER_ID}: 1 conversations, 3 facts"
         mocks["retain"].assert_awaited_once()
-        # The task calls retain positionally: (user_id, messages, ...).
-        assert mocks["retain"].await_args.args[0] == USER_ID
-        assert mocks["retain"].await_args.args[1] == [
+        [(user_id, _, kwargs)] = mocks["retain_many"].calls
+        assert user_id == USER_ID
+        assert kwargs == {"user_name": "Alice", "concurrency": MEMORY_BACKFILL_CONCURRENCY}
+        [session] = mocks["retain_many"].sessions
+        assert session.messages == [
             {"role": "user", "content": "Remember I prefer morning meetings"},
             {"role": "assistant", "content": "Got it."},
         ]
-        retain_kwargs = mocks["retain"].await_args.kwargs
-        assert retain_kwargs["source_type"] == MemorySourceType.CONVERSATION
-        assert retain_kwargs["source_id"] == "conv-1"
-        assert retain_kwargs["user_name"] == "Alice"
-        assert retain_kwargs["now"].tzinfo is not None
+        assert session.source_type == MemorySourceType.CONVERSATION
+        assert session.source_id == "conv-1"
+        assert session.now is not None
+        assert session.now.tzinfo is not None
         # The debounced consolidation is cancelled and run inline once.
         mocks["cancel"].assert_awaited_once_with(USER_ID)
         mocks["summarize"].assert_awaited_once_with(USER_ID, datetime(2026, 1, 1).date())
@@ -320,6 +351,56 @@ class TestBackfillUserMemories:
         mocks["mark"].assert_awaited_once()
         mocks["notify"].assert_not_awaited()
 
+    async def test_sessions_are_replayed_oldest_first(self):
+        with self._patches() as mocks:
+            mocks["recent"].return_value = [
+                _conversation("conv-new", created_at="2026-01-03T10:00:00+00:00"),
+                _conversation("conv-old", created_at="2026-01-01T10:00:00+00:00"),
+            ]
+            await backfill_user_memories({}, USER_ID)
+
+        assert [s.source_id for s in mocks["retain_many"].sessions] == ["conv-old", "conv-new"]
+
+    async def test_each_applied_conversation_is_checkpointed_then_cleared(self):
+        with self._patches(retain_facts=2) as mocks:
+            mocks["recent"].return_value = [
+                _conversation("conv-2", created_at="2026-01-02T10:00:00+00:00"),
+                _conversation("conv-1"),
+            ]
+            await backfill_user_memories({}, USER_ID)
+
+        assert mocks["checkpoint_set"].await_count == 2
+        key, checkpoint = mocks["checkpoint_set"].await_args.args
+        assert key == f"memory_backfill:{USER_ID}"
+        assert checkpoint == {"conv-1": 2, "conv-2": 2}
+        mocks["checkpoint_delete"].assert_awaited_once_with(f"memory_backfill:{USER_ID}")
+
+    async def test_restart_resumes_after_checkpointed_conversations(self):
+        with self._patches(retain_facts=1) as mocks:
+            mocks["recent"].return_value = [
+                _conversation("conv-2", created_at="2026-01-02T10:00:00+00:00"),
+                _conversation("conv-1"),
+            ]
+            mocks["checkpoint_get"].return_value = {"conv-1": 4}
+            result = await backfill_user_memories({}, USER_ID)
+
+        assert [s.source_id for s in mocks["retain_many"].sessions] == ["conv-2"]
+        assert result == f"backfilled {USER_ID}: 2 conversations, 5 facts"
+        mocks["consolidate"].assert_awaited_once_with(USER_ID)
+
+    async def test_failure_keeps_the_checkpoint_for_the_retry(self):
+        with self._patches() as mocks:
+            mocks["retain"].side_effect = [MagicMock(facts_extracted=1), RuntimeError("down")]
+            mocks["recent"].return_value = [
+                _conversation("conv-2", created_at="2026-01-02T10:00:00+00:00"),
+                _conversation("conv-1"),
+            ]
+            with pytest.raises(RuntimeError):
+                await backfill_user_memories({}, USER_ID)
+
+        assert mocks["checkpoint_set"].await_args.args[1] == {"conv-1": 1}
+        mocks["checkpoint_delete"].assert_not_awaited()
+
     async def test_retain_failure_propagates(self):
         with self._patches() as mocks:
             mocks["retain"].side_effect = RuntimeError("extraction llm down")
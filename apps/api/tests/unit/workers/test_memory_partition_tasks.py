@@ -0,0 +1,110 @@
+"""Unit tests for app.workers.tasks.memory_partition_tasks.
+
+``migrate_memory_partitions`` copies fact vectors page by page from one
+Chroma partitioning layout into another, and in its cleanup step retires
+them from the old one, checkpointing a per-collection cursor in Redis so a
+restarted job resumes instead of starting over.
+"""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from app.workers.tasks.memory_partition_tasks import _cursor_key, migrate_memory_partitions
+
+MODULE = "app.workers.tasks.memory_partition_tasks"
+
+
+class _FakeRedis:
+    def __init__(self) -> None:
+        self.data: dict[str, object] = {}
+        self.writes: list[dict] = []
+
+    async def get(self, key: str) -> object:
+        return self.data.get(key)
+
+    async def set(self, key: str, value: dict, ttl: int) -> bool:
+        self.data[key] = dict(value)
+        self.writes.append(dict(value))
+        return True
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+
+@pytest.fixture
+def redis() -> _FakeRedis:
+    fake = _FakeRedis()
+    with patch(f"{MODULE}.redis_cache", fake):
+        yield fake
+
+
+def _store(pages: dict[str, list[int]] | dict[str, list[tuple[int, int]]]):
+    """Patch chroma_store so each source collection returns the given pages:
+    rows read for the copy step, ``(read, kept)`` for the cleanup step."""
+    remaining = {name: list(sizes) for name, sizes in pages.items()}
+
+    async def page(source: str, target: str, *, offset: int, limit: int) -> object:
+        return remaining[source].pop(0)
+
+    return (
+        patch(
+            f"{MODULE}.chroma_store.memories_collection_names",
+            AsyncMock(return_value=list(pages)),
+        ),
+        patch(f"{MODULE}.chroma_store.copy_memories", AsyncMock(side_effect=page)),
+        patch(f"{MODULE}.chroma_store.retire_memories", AsyncMock(side_effect=page)),
+        patch(f"{MODULE}.MEMORY_PARTITION_MIGRATION_PAGE_SIZE", 2),
+    )
+
+
+async def test_copies_every_page_and_clears_the_cursor(redis: _FakeRedis) -> None:
+    # Copying leaves the source as it is, so each page starts past the last.
+    names, copy, retire, page_size = _store({"gaia_memories": [2, 2, 1]})
+    with names, copy as copy_mock, retire as retire_mock, page_size:
+        result = await migrate_memory_partitions({}, "user")
+
+    assert "copied 5 vectors" in result
+    assert [c.kwargs["offset"] for c in copy_mock.await_args_list] == [0, 2, 4]
+    retire_mock.assert_not_awaited()
+    assert redis.writes[-1] == {"gaia_memories": 5}
+    assert _cursor_key("global", "user") not in redis.data
+
+
+async def test_cleanup_pages_from_the_rows_left_behind(redis: _FakeRedis) -> None:
+    # Re-bucketing: retired rows leave the source, rows already in their
+    # bucket stay and are stepped over.
+    names, copy, retire, page_size = _store({"gaia_memories_b0000": [(2, 1), (2, 2), (1, 0)]})
+    with names, copy as copy_mock, retire as retire_mock, page_size:
+        result = await migrate_memory_partitions({}, "bucketed", source="bucketed", cleanup=True)
+
+    assert "retired 2 vectors" in result
+    assert [c.kwargs["offset"] for c in retire_mock.await_args_list] == [0, 1, 3]
+    copy_mock.assert_not_awaited()
+
+
+async def test_resumes_from_the_saved_cursor(redis: _FakeRedis) -> None:
+    redis.data[_cursor_key("bucketed", "user", cleanup=True)] = {"gaia_memories_b0000": 6}
+    names, copy, retire, page_size = _store(
+        {"gaia_memories_b0000": [(1, 0)], "gaia_memories_b0001": [(0, 0)]}
+    )
+    with names, copy, retire as retire_mock, page_size:
+        await migrate_memory_partitions({}, "user", source="bucketed", cleanup=True)
+
+    assert [(c.args[0], c.kwargs["offset"]) for c in retire_mock.await_args_list] == [
+        ("gaia_memories_b0000", 6),
+        ("gaia_memories_b0001", 0),
+    ]
+
+
+async def test_same_layout_is_a_no_op(redis: _FakeRedis) -> None:
+    with patch(f"{MODULE}.chroma_store.copy_memories", AsyncMock()) as copy:
+        result = await migrate_memory_partitions({}, "user", source="user")
+
+    assert "no-op" in result
+    copy.assert_not_awaited()
+
+
+async def test_unknown_layout_is_rejected(redis: _FakeRedis) -> None:
+    with pytest.raises(ValueError, match="sharded"):
+        await migrate_memory_partitions({}, "sharded")
@@ -232,8 +232,8 @@ class TestWorkerSettings:
         assert WorkerSettings.allow_abort_jobs is True
 
     def test_max_jobs_value(self):
-        """max_jobs default is 10."""
-        assert WorkerSettings.max_jobs == 10
+        """max_jobs is the interactive lane's share of the 10 slots."""
+        assert WorkerSettings.max_jobs == 5
 
     def test_health_check_interval_value(self):
         """health_check_interval default is 30 seconds."""
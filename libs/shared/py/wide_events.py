@@ -240,6 +240,7 @@ class MemoryContext(TypedDict, total=False):
     doc_types: list[str]
     outcomes: dict[str, str]  # consolidation: {doc_type: "rewritten"|"failed"}
     timings: dict[str, float]  # per-stage latency buckets (ms)
+    critical_path: list[str]  # retain: the stages that bounded total_ms, in order
 
 
 class CalendarContext(TypedDict, total=False):